@@ -3,10 +3,10 @@ from flask_cors import CORS
 from flask_compress import Compress
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from flask_caching import Cache
+from utils.metrics import InstrumentedCache, init_metrics
 from dotenv import load_dotenv
 from config.routes import initialize_routes
-from config.db import initialize_db as initialize_sqlalchemy, db
+from config.db import initialize_db as initialize_sqlalchemy, import_models, db
 from config.logging import get_logger, configure_quiet_logging
 from config.security_config import SecurityConfig, is_production, is_development
 from socketio_server import init_socketio
@@ -102,7 +102,7 @@ def create_app():
         app.config['CACHE_TYPE'] = 'simple'
         app.config['CACHE_DEFAULT_TIMEOUT'] = 300
 
-    cache = Cache(app)
+    cache = InstrumentedCache(app)  # Flask-Caching Cache + hit/miss counters for /metrics
     app.cache = cache  # Make cache accessible to routes
 
     # ✅ SECURITY: Rate Limiting (prevents brute force, DoS)
@@ -366,6 +366,46 @@ def create_app():
             return data
 
     initialize_sqlalchemy(app)  # Init SQLAlchemy ORM
+    import_models()  # Controllers load on first request, so register every mapper here
+
+    # Sampled per-request SQL profiling (Server-Timing header + N+1 detection)
+    from utils.query_profiler import init_query_profiler
+    init_query_profiler(app)
+
+    # Prometheus /metrics: latency histograms, DB pool, cache, Socket.IO and queue gauges
+    init_metrics(app)
+
+    # Keep project_members in sync with Project's JSONB membership columns
+    from utils.project_membership import register_project_member_sync
+    register_project_member_sync()
+
+    # Keep worker_skills in sync with Worker.skills for indexed availability lookups
+    from services.worker_availability import register_worker_skill_sync
+    register_worker_skill_sync()
+
+    # Maintain per-user unread notification counters and push them over Socket.IO
+    from utils.notification_counters import register_unread_counter_sync
+    register_unread_counter_sync()
+
+    # Mark precomputed PM dashboards stale when workflow rows change
+    from services.pm_dashboard_read_model import register_pm_dashboard_invalidation
+    register_pm_dashboard_invalidation()
+
+    # Record past days whose rows changed so the analytics rollups re-aggregate them
+    from services.analytics_rollups import register_analytics_rollup_tracking
+    register_analytics_rollup_tracking()
+
+    # Keep change requests' BOQ-derived cost and sub_item_names current on write
+    from services.change_request_enrichment import register_change_request_enrichment
+    register_change_request_enrichment()
+
+    # Keep the change request visibility index (role inboxes) current
+    from services.cr_visibility import register_cr_visibility_sync
+    register_cr_visibility_sync()
+
+    # Keep the payroll daily aggregates current as attendance is written and locked
+    from services.payroll_aggregates import register_payroll_aggregate_sync
+    register_payroll_aggregate_sync()
 
     # Create all tables
     # with app.app_context():
@@ -495,6 +535,10 @@ def create_app():
 
     initialize_routes(app)  # Register routes
 
+    # Storage clients are created on first use; report missing settings at startup
+    from utils.supabase_client import check_supabase_config
+    check_supabase_config()
+
     # Register notification routes
     app.register_blueprint(notification_bp, url_prefix='/api')
 
@@ -518,8 +562,12 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 5000))
     debug = environment != "production"
 
-    # Use socketio.run instead of app.run for WebSocket support
+    # Development server (Werkzeug). Production: gunicorn -c gunicorn.conf.py wsgi:app
     logger = get_logger()
     logger.info(f"Starting MeterSquare ERP Server - Environment: {environment}, Port: {port}, Debug: {debug}")
 
-    app.socketio.run(app, host="0.0.0.0", port=port, debug=debug, allow_unsafe_werkzeug=True, use_reloader=False)
+    try:
+        app.socketio.run(app, host="0.0.0.0", port=port, debug=debug, allow_unsafe_werkzeug=True, use_reloader=False)
+    finally:
+        from utils.graceful_shutdown import drain_background_work
+        drain_background_work()
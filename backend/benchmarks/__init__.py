@@ -0,0 +1,19 @@
+"""
+Benchmark / load-test harness.
+
+Seeds a local Postgres with a reproducible synthetic dataset and replays
+per-role workloads against the Flask app, reporting p50/p95/p99 latency and
+SQL query counts per endpoint. Reports are JSON so runs from two commits can
+be compared.
+
+Mail (SMTP), Supabase storage, SMS and WhatsApp are replaced by in-process
+stand-ins (benchmarks/stand_ins.py); nothing leaves the machine.
+
+Usage (from backend/):
+    export BENCHMARK_DATABASE_URL=postgresql://localhost/msq_bench
+
+    python -m benchmarks.seed --reset --projects 20 --boq-items 2000
+    python -m benchmarks.run --driver client --iterations 20 --output before.json
+    python -m benchmarks.run --driver http --concurrency 8 --duration 60 --output after.json
+    python -m benchmarks.run compare before.json after.json
+"""
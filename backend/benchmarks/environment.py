@@ -0,0 +1,40 @@
+"""
+Benchmark process setup: point the app at the benchmark database and install
+the local stand-ins before anything imports the app.
+"""
+
+import os
+import sys
+
+
+def configure_benchmark_environment():
+    """
+    Route the app to BENCHMARK_DATABASE_URL and build it with local stand-ins.
+    Returns the Flask app.
+    """
+    database_url = os.getenv('BENCHMARK_DATABASE_URL')
+    if not database_url:
+        sys.exit("BENCHMARK_DATABASE_URL is not set (use a local, disposable Postgres database)")
+    if database_url == os.getenv('DATABASE_URL'):
+        sys.exit("BENCHMARK_DATABASE_URL must not point at the production DATABASE_URL")
+
+    # Non-production environment reads DEV_DATABASE_URL (see config/db.py)
+    os.environ['ENVIRONMENT'] = 'benchmark'
+    os.environ['DEV_DATABASE_URL'] = database_url
+    os.environ.setdefault('SECRET_KEY', 'benchmark-secret-key')
+    # In-process cache unless a benchmark Redis is given explicitly
+    if os.getenv('BENCHMARK_REDIS_URL'):
+        os.environ['REDIS_URL'] = os.environ['BENCHMARK_REDIS_URL']
+    else:
+        os.environ.pop('REDIS_URL', None)
+
+    from benchmarks.stand_ins import install_local_stand_ins
+    install_local_stand_ins()
+
+    from app import create_app
+    app = create_app()
+    app.config['TESTING'] = True
+    limiter = getattr(app, 'limiter', None)
+    if limiter is not None:
+        limiter.enabled = False  # Workloads would otherwise hit per-route limits
+    return app
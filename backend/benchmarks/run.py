@@ -0,0 +1,312 @@
+"""
+Run the benchmark workloads and write / compare JSON reports.
+
+Drivers:
+- client: sequential requests through Flask's test client (no network, stable numbers)
+- http:   threaded HTTP load against a local server started in-process
+          (or --base-url to target an already running instance)
+
+--server (http driver) starts the benchmark app in a separate process under
+a production-like server instead: socketio-run (Werkzeug, as app.py) or
+gunicorn (gunicorn.conf.py), to compare the two under the same load.
+
+Usage (from backend/):
+    python -m benchmarks.run --driver client --iterations 20 --output before.json
+    python -m benchmarks.run --driver http --concurrency 8 --duration 60 --output after.json
+    python -m benchmarks.run --driver http --server socketio-run --concurrency 32 --output werkzeug.json
+    python -m benchmarks.run --driver http --server gunicorn --concurrency 32 --output gunicorn.json
+    python -m benchmarks.run compare before.json after.json --fail-on-regression 10
+"""
+
+import argparse
+import json
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+SERVER_TIMING_DB_RE = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+SERVER_START_TIMEOUT_SECONDS = 120
+
+# Benchmark app under each server, in its own process (listens on $PORT)
+SERVER_COMMANDS = {
+    'socketio-run': [
+        sys.executable, '-c',
+        "import os\n"
+        "from benchmarks.environment import configure_benchmark_environment\n"
+        "app = configure_benchmark_environment()\n"
+        "app.socketio.run(app, host='127.0.0.1', port=int(os.environ['PORT']), allow_unsafe_werkzeug=True, use_reloader=False)",
+    ],
+    'gunicorn': [
+        sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+        'benchmarks.environment:configure_benchmark_environment()',
+    ],
+}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class Recorder:
+    """Thread-safe collection of per-step samples."""
+
+    def __init__(self):
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, latency_ms, status, server_timing):
+        match = SERVER_TIMING_DB_RE.search(server_timing or '')
+        sample = {
+            'ms': latency_ms,
+            'ok': 200 <= status < 400,
+            'queries': int(match.group(2)) if match else None,
+            'db_ms': float(match.group(1)) if match else None,
+        }
+        with self._lock:
+            self._samples.setdefault(name, []).append(sample)
+
+    def summary(self):
+        results = {}
+        for name, samples in sorted(self._samples.items()):
+            latencies = sorted(s['ms'] for s in samples)
+            queries = [s['queries'] for s in samples if s['queries'] is not None]
+            db_times = [s['db_ms'] for s in samples if s['db_ms'] is not None]
+            results[name] = {
+                'requests': len(samples),
+                'errors': sum(1 for s in samples if not s['ok']),
+                'p50_ms': round(percentile(latencies, 50), 2),
+                'p95_ms': round(percentile(latencies, 95), 2),
+                'p99_ms': round(percentile(latencies, 99), 2),
+                'mean_ms': round(sum(latencies) / len(latencies), 2),
+                'queries_mean': round(sum(queries) / len(queries), 1) if queries else None,
+                'queries_max': max(queries) if queries else None,
+                'db_ms_mean': round(sum(db_times) / len(db_times), 2) if db_times else None,
+            }
+        return results
+
+
+def run_client(app, requests, iterations, warmup, recorder):
+    client = app.test_client()
+    for iteration in range(warmup + iterations):
+        for req in requests:
+            started = time.perf_counter()
+            response = client.open(req['path'], method=req['method'], headers=req['headers'], json=req.get('json'))
+            elapsed = (time.perf_counter() - started) * 1000
+            response.close()
+            if iteration >= warmup:
+                recorder.add(req['name'], elapsed, response.status_code, response.headers.get('Server-Timing'))
+
+
+def _start_local_server(app):
+    from werkzeug.serving import make_server
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, name='benchmark-server', daemon=True)
+    thread.start()
+    return server, f'http://127.0.0.1:{server.server_port}'
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _start_server_process(kind):
+    """Start SERVER_COMMANDS[kind] and wait until /api/health answers."""
+    import requests as http
+
+    port = _free_port()
+    # The child inherits the benchmark environment configured in this process
+    process = subprocess.Popen(SERVER_COMMANDS[kind], env=dict(os.environ, PORT=str(port)))
+    base_url = f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + SERVER_START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            sys.exit(f"{kind} server exited with code {process.returncode}")
+        try:
+            http.get(base_url + '/api/health', timeout=2)
+            return process, base_url
+        except http.RequestException:
+            time.sleep(0.5)
+    process.kill()
+    sys.exit(f"{kind} server did not start within {SERVER_START_TIMEOUT_SECONDS}s")
+
+
+def _stop_server_process(process):
+    """SIGTERM (graceful shutdown, queues drained) and wait for exit."""
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=90)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def run_http(base_url, requests, concurrency, duration, recorder):
+    import requests as http
+
+    deadline = time.monotonic() + duration
+
+    def worker(offset):
+        session = http.Session()
+        index = offset
+        while time.monotonic() < deadline:
+            req = requests[index % len(requests)]
+            index += 1
+            started = time.perf_counter()
+            try:
+                response = session.request(req['method'], base_url + req['path'], headers=req['headers'],
+                                           json=req.get('json'), timeout=120)
+                status, timing = response.status_code, response.headers.get('Server-Timing')
+            except http.RequestException:
+                status, timing = 599, None
+            recorder.add(req['name'], (time.perf_counter() - started) * 1000, status, timing)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(worker, range(concurrency)))
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except Exception:
+        return None
+
+
+def run(args):
+    from benchmarks.environment import configure_benchmark_environment
+    from benchmarks.stand_ins import SENT_EMAILS, SENT_MESSAGES
+    from benchmarks.workloads import build_requests
+
+    app = configure_benchmark_environment()
+    with app.app_context():
+        requests = build_requests(args.roles)
+    if not requests:
+        sys.exit("No workload steps resolved (check --roles and the seeded data)")
+
+    recorder = Recorder()
+    started = time.time()
+    if args.driver == 'client':
+        run_client(app, requests, args.iterations, args.warmup, recorder)
+    else:
+        server = process = None
+        base_url = args.base_url
+        if not base_url and args.server:
+            process, base_url = _start_server_process(args.server)
+        elif not base_url:
+            server, base_url = _start_local_server(app)
+        try:
+            run_http(base_url, requests, args.concurrency, args.duration, recorder)
+        finally:
+            if server is not None:
+                server.shutdown()
+            if process is not None:
+                _stop_server_process(process)
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': datetime.utcnow().isoformat(),
+        'driver': args.driver,
+        'options': {k: v for k, v in vars(args).items() if k not in ('output', 'command')},
+        'wall_seconds': round(time.time() - started, 2),
+        'stand_ins': {'emails': len(SENT_EMAILS), 'messages': len(SENT_MESSAGES)},
+        'results': recorder.summary(),
+    }
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+
+def print_report(report):
+    print(f"commit={report['commit']} driver={report['driver']} wall={report['wall_seconds']}s")
+    print(f"{'step':<40} {'n':>6} {'err':>4} {'p50':>9} {'p95':>9} {'p99':>9} {'queries':>8}")
+    for name, r in report['results'].items():
+        queries = '-' if r['queries_mean'] is None else r['queries_mean']
+        print(f"{name:<40} {r['requests']:>6} {r['errors']:>4} {r['p50_ms']:>9} {r['p95_ms']:>9} {r['p99_ms']:>9} {queries:>8}")
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    def delta(old, new):
+        if old in (None, 0) or new is None:
+            return None
+        return (new - old) / old * 100
+
+    print(f"baseline={baseline.get('commit')} candidate={candidate.get('commit')}")
+    print(f"{'step':<40} {'p50 old':>9} {'p50 new':>9} {'Δp50':>7} {'p95 old':>9} {'p95 new':>9} {'Δp95':>7} {'queries':>13}")
+    regressions = []
+    for name, new in candidate['results'].items():
+        old = baseline['results'].get(name)
+        if not old:
+            print(f"{name:<40} (new step)")
+            continue
+        d50, d95 = delta(old['p50_ms'], new['p50_ms']), delta(old['p95_ms'], new['p95_ms'])
+        queries = f"{old['queries_mean']}->{new['queries_mean']}"
+        print(f"{name:<40} {old['p50_ms']:>9} {new['p50_ms']:>9} {_fmt(d50):>7} "
+              f"{old['p95_ms']:>9} {new['p95_ms']:>9} {_fmt(d95):>7} {queries:>13}")
+        if args.fail_on_regression is not None and d95 is not None and d95 > args.fail_on_regression:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\np95 regressed by more than {args.fail_on_regression}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+def _fmt(value):
+    return '-' if value is None else f'{value:+.0f}%'
+
+
+def parse_args(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] == 'compare':
+        parser = argparse.ArgumentParser(prog='benchmarks.run compare', description="Compare two benchmark reports")
+        parser.add_argument('baseline')
+        parser.add_argument('candidate')
+        parser.add_argument('--fail-on-regression', type=float, default=None, metavar='PCT',
+                            help="Exit non-zero when any step's p95 regresses by more than PCT percent")
+        args = parser.parse_args(argv[1:])
+        args.command = 'compare'
+        return args
+
+    parser = argparse.ArgumentParser(prog='benchmarks.run', description="Run benchmark workloads")
+    parser.add_argument('--driver', choices=['client', 'http'], default='client')
+    parser.add_argument('--roles', nargs='*', help="Limit to these roles (default: all workloads)")
+    parser.add_argument('--iterations', type=int, default=20, help="client driver: measured passes over the workload")
+    parser.add_argument('--warmup', type=int, default=2, help="client driver: unmeasured warm-up passes")
+    parser.add_argument('--concurrency', type=int, default=8, help="http driver: concurrent clients")
+    parser.add_argument('--duration', type=float, default=60, help="http driver: seconds to run")
+    parser.add_argument('--base-url', help="http driver: target a running server instead of starting one")
+    parser.add_argument('--server', choices=sorted(SERVER_COMMANDS),
+                        help="http driver: serve the app from a separate socketio-run or gunicorn process")
+    parser.add_argument('--output', help="Write the JSON report here")
+    args = parser.parse_args(argv)
+    args.command = 'run'
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'compare':
+        compare(args)
+    else:
+        run(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,441 @@
+"""
+Seed the benchmark database with a reproducible synthetic dataset.
+
+Everything is generated from a single --seed, so two runs with the same
+arguments produce identical data (and comparable benchmark numbers).
+
+Usage (from backend/):
+    python -m benchmarks.seed --reset --projects 20 --boq-items 2000 --crs-per-project 50
+    python -m benchmarks.seed --reset --vendor-products 100000   # vendor matching at scale
+"""
+
+import argparse
+import random
+from datetime import datetime, date, timedelta, time as dt_time
+
+from sqlalchemy import insert
+
+MATERIALS = ['Cement', 'Gypsum Board', 'Steel Stud', 'Paint Emulsion', 'Ceramic Tile', 'PVC Conduit',
+             'Copper Cable 2.5mm', 'Plywood 18mm', 'Glass Wool', 'Skirting', 'Adhesive', 'Grout']
+UNITS = ['nos', 'sqm', 'm', 'bags', 'ltr', 'kg']
+PRODUCT_SPECS = ['50kg', '12mm', '18mm', '2.5mm', '600x600', 'White', 'Grey', 'Heavy Duty', 'Premium', 'Type A']
+SKILLS = ['Mason', 'Carpenter', 'Electrician', 'Plumber', 'Painter', 'Helper', 'Steel Fixer', 'Tiler']
+CR_STATUSES = ['pending', 'under_review', 'approved_by_pm', 'send_to_buyer', 'purchase_completed', 'rejected']
+ROLES = ['admin', 'technicalDirector', 'projectManager', 'siteEngineer', 'estimator', 'buyer', 'productionManager', 'mep']
+
+BENCH_USER = 'benchmark'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Seed the benchmark database with synthetic data")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--reset', action='store_true', help="Drop and recreate all tables first")
+    parser.add_argument('--projects', type=int, default=20)
+    parser.add_argument('--boq-items', type=int, default=2000, help="Material lines per BOQ")
+    parser.add_argument('--crs-per-project', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=300)
+    parser.add_argument('--attendance-days', type=int, default=30)
+    parser.add_argument('--inventory-items', type=int, default=2000)
+    parser.add_argument('--vendors', type=int, default=200)
+    parser.add_argument('--vendor-products', type=int, default=5000)
+    return parser.parse_args(argv)
+
+
+def _insert(table, rows, pk=None):
+    """Multi-row INSERT; returns generated primary keys when pk is given."""
+    from config.db import db
+    if not rows:
+        return []
+    statement = insert(table)
+    if pk is not None:
+        return list(db.session.execute(statement.returning(table.c[pk], sort_by_parameter_order=True), rows).scalars())
+    db.session.execute(statement, rows)
+    return []
+
+
+def seed_users(rng, projects):
+    from models.role import Role
+    from models.user import User
+
+    role_ids = dict(zip(ROLES, _insert(Role.__table__, [
+        {'role': role, 'description': f'{role} (benchmark)', 'is_active': True, 'is_deleted': False}
+        for role in ROLES
+    ], pk='role_id')))
+
+    counts = {role: 1 for role in ROLES}
+    counts['projectManager'] = max(1, projects // 4)
+    counts['siteEngineer'] = max(1, projects // 2)
+    counts['mep'] = max(1, projects // 5)
+
+    users = {}
+    for role, count in counts.items():
+        users[role] = _insert(User.__table__, [
+            {
+                'email': f'{role.lower()}{i}@bench.local',
+                'full_name': f'{role} {i}',
+                'phone': f'+9715{rng.randint(10000000, 99999999)}',
+                'role_id': role_ids[role],
+                'is_active': True,
+                'is_deleted': False,
+                'user_status': 'offline',
+            }
+            for i in range(count)
+        ], pk='user_id')
+    return role_ids, users
+
+
+def _boq_items(rng, material_lines):
+    items = []
+    lines_per_item = 20
+    for item_index in range(max(1, material_lines // lines_per_item)):
+        sub_items = []
+        material_total = labour_total = 0.0
+        for sub_index in range(4):
+            materials = []
+            for _ in range(lines_per_item // 4):
+                quantity = rng.randint(1, 500)
+                unit_price = round(rng.uniform(2, 400), 2)
+                materials.append({
+                    'material_name': rng.choice(MATERIALS),
+                    'quantity': quantity,
+                    'unit': rng.choice(UNITS),
+                    'unit_price': unit_price,
+                    'total_price': round(quantity * unit_price, 2),
+                    'vat_percentage': 5,
+                })
+            labour = [{
+                'labour_role': rng.choice(SKILLS),
+                'hours': rng.randint(8, 200),
+                'rate_per_hour': 25.0,
+            }]
+            labour[0]['total_cost'] = labour[0]['hours'] * labour[0]['rate_per_hour']
+            sub_material_cost = sum(m['total_price'] for m in materials)
+            material_total += sub_material_cost
+            labour_total += labour[0]['total_cost']
+            sub_items.append({
+                'sub_item_id': item_index * 10 + sub_index + 1,
+                'sub_item_name': f'Sub item {item_index + 1}.{sub_index + 1}',
+                'quantity': 1,
+                'unit': 'lot',
+                'rate': sub_material_cost,
+                'materials': materials,
+                'labour': labour,
+                'materials_cost': sub_material_cost,
+                'labour_cost': labour[0]['total_cost'],
+                'misc_percentage': 10,
+                'overhead_profit_percentage': 15,
+                'transport_percentage': 2,
+            })
+        items.append({
+            'item_id': f'item_{item_index + 1}',
+            'item_name': f'Work package {item_index + 1}',
+            'description': 'Synthetic benchmark item',
+            'has_sub_items': True,
+            'sub_items': sub_items,
+            'materials': [],
+            'labour': [],
+            'totalMaterialCost': round(material_total, 2),
+            'totalLabourCost': round(labour_total, 2),
+            'selling_price': round((material_total + labour_total) * 1.27, 2),
+        })
+    return items
+
+
+def seed_projects(rng, args, users):
+    from models.project import Project
+    from models.boq import BOQ, BOQDetails
+
+    project_ids = _insert(Project.__table__, [
+        {
+            'project_code': f'BENCH{i:04d}',
+            'project_name': f'Benchmark Project {i}',
+            'user_id': [rng.choice(users['projectManager'])],
+            'mep_supervisor_id': [rng.choice(users['mep'])],
+            'site_supervisor_id': rng.choice(users['siteEngineer']),
+            'estimator_id': users['estimator'][0],
+            'buyer_id': users['buyer'][0],
+            'location': 'Dubai',
+            'client': f'Client {i % 7}',
+            'start_date': date.today() - timedelta(days=rng.randint(10, 200)),
+            'duration_days': 180,
+            'status': 'active',
+            'is_deleted': False,
+            'created_at': datetime.utcnow(),
+            'created_by': BENCH_USER,
+        }
+        for i in range(args.projects)
+    ], pk='project_id')
+
+    boq_ids = _insert(BOQ.__table__, [
+        {
+            'project_id': project_id,
+            'boq_name': f'BOQ {project_id}',
+            'status': 'Approved',
+            'revision_number': 0,
+            'is_deleted': False,
+            'created_at': datetime.utcnow(),
+            'created_by': BENCH_USER,
+        }
+        for project_id in project_ids
+    ], pk='boq_id')
+
+    for boq_id in boq_ids:
+        items = _boq_items(rng, args.boq_items)
+        total = sum(item['selling_price'] for item in items)
+        _insert(BOQDetails.__table__, [{
+            'boq_id': boq_id,
+            'boq_details': {
+                'boq_id': boq_id,
+                'items': items,
+                'preliminaries': {'items': [], 'cost_details': {}, 'notes': ''},
+                'discount_percentage': 0,
+                'discount_amount': 0,
+                'summary': {
+                    'total_items': len(items),
+                    'total_materials': args.boq_items,
+                    'total_labour': len(items) * 4,
+                    'total_material_cost': sum(i['totalMaterialCost'] for i in items),
+                    'total_labour_cost': sum(i['totalLabourCost'] for i in items),
+                    'total_cost': total,
+                    'selling_price': total,
+                },
+            },
+            'total_cost': total,
+            'total_items': len(items),
+            'total_materials': args.boq_items,
+            'total_labour': len(items) * 4,
+            'is_deleted': False,
+            'created_at': datetime.utcnow(),
+            'created_by': BENCH_USER,
+        }])
+    return list(zip(project_ids, boq_ids))
+
+
+def seed_change_requests(rng, args, users, project_boqs):
+    from models.change_request import ChangeRequest
+    from models.po_child import POChild
+
+    rows = []
+    for project_id, boq_id in project_boqs:
+        for _ in range(args.crs_per_project):
+            materials = []
+            for _ in range(rng.randint(3, 8)):
+                quantity = rng.randint(1, 100)
+                unit_price = round(rng.uniform(5, 300), 2)
+                materials.append({
+                    'material_name': rng.choice(MATERIALS),
+                    'sub_item_name': f'Sub item {rng.randint(1, 5)}.{rng.randint(1, 4)}',
+                    'quantity': quantity,
+                    'unit': rng.choice(UNITS),
+                    'unit_price': unit_price,
+                    'total_price': round(quantity * unit_price, 2),
+                    'is_new': False,
+                })
+            requester = rng.choice(users['siteEngineer'])
+            rows.append({
+                'boq_id': boq_id,
+                'project_id': project_id,
+                'requested_by_user_id': requester,
+                'requested_by_name': f'siteEngineer {requester}',
+                'requested_by_role': 'siteEngineer',
+                'justification': 'Synthetic benchmark request',
+                'status': rng.choice(CR_STATUSES),
+                'item_id': f'item_{rng.randint(1, 5)}',
+                'item_name': 'Work package',
+                'sub_items_data': materials,
+                'materials_total_cost': sum(m['total_price'] for m in materials),
+                'assigned_to_pm_user_id': rng.choice(users['projectManager']),
+                'created_at': datetime.utcnow() - timedelta(days=rng.randint(0, 120)),
+            })
+    cr_ids = _insert(ChangeRequest.__table__, rows, pk='cr_id')
+
+    children = []
+    for cr_id, row in zip(cr_ids, rows):
+        if row['status'] not in ('send_to_buyer', 'purchase_completed'):
+            continue
+        for index in range(rng.randint(1, 2)):
+            children.append({
+                'parent_cr_id': cr_id,
+                'suffix': f'.{index + 1}',
+                'boq_id': row['boq_id'],
+                'project_id': row['project_id'],
+                'item_id': row['item_id'],
+                'item_name': row['item_name'],
+                'materials_data': row['sub_items_data'],
+                'materials_total_cost': row['materials_total_cost'],
+                'routing_type': 'vendor',
+                'vendor_name': f'Vendor {rng.randint(1, 40)}',
+                'status': 'purchase_completed' if row['status'] == 'purchase_completed' else 'pending_td_approval',
+                'is_deleted': False,
+                'created_at': row['created_at'],
+            })
+    _insert(POChild.__table__, children)
+    return len(cr_ids), len(children)
+
+
+def seed_workers(rng, args, users, project_boqs):
+    from models.worker import Worker
+    from models.worker_availability import WorkerSkill
+    from models.daily_attendance import DailyAttendance
+    from services.worker_availability import worker_skill_rows
+
+    workers = [
+        {
+            'worker_code': f'WRK-B{i:05d}',
+            'full_name': f'Worker {i}',
+            'hourly_rate': round(rng.uniform(15, 45), 2),
+            'skills': rng.sample(SKILLS, rng.randint(1, 3)),
+            'status': 'active',
+            'is_deleted': False,
+            'created_at': datetime.utcnow(),
+            'created_by': BENCH_USER,
+        }
+        for i in range(args.workers)
+    ]
+    worker_ids = _insert(Worker.__table__, workers, pk='worker_id')
+    _insert(WorkerSkill.__table__, [
+        row for worker_id, worker in zip(worker_ids, workers)
+        for row in worker_skill_rows(worker_id, worker['skills'])
+    ])
+
+    attendance = []
+    entered_by = users['siteEngineer'][0]
+    for day in range(args.attendance_days):
+        work_date = date.today() - timedelta(days=day)
+        for worker_id, worker in zip(worker_ids, workers):
+            if rng.random() < 0.3:
+                continue
+            project_id = project_boqs[worker_id % len(project_boqs)][0]
+            clock_in = datetime.combine(work_date, dt_time(7, rng.randint(0, 30)))
+            hours = rng.choice([8, 8, 9, 10])
+            attendance.append({
+                'worker_id': worker_id,
+                'project_id': project_id,
+                'attendance_date': work_date,
+                'labour_role': worker['skills'][0],
+                'clock_in_time': clock_in,
+                'clock_out_time': clock_in + timedelta(hours=hours),
+                'total_hours': hours,
+                'regular_hours': min(hours, 8),
+                'overtime_hours': max(0, hours - 8),
+                'hourly_rate': worker['hourly_rate'],
+                'total_cost': round(hours * worker['hourly_rate'], 2),
+                'attendance_status': 'present',
+                'entered_by_user_id': entered_by,
+                'entered_by_role': 'SE',
+                'approval_status': rng.choice(['pending', 'locked']),
+                'is_deleted': False,
+                'created_at': datetime.utcnow(),
+                'created_by': BENCH_USER,
+            })
+    for start in range(0, len(attendance), 5000):
+        _insert(DailyAttendance.__table__, attendance[start:start + 5000])
+    return len(worker_ids), len(attendance)
+
+
+def seed_inventory(rng, args):
+    from models.inventory import InventoryMaterial
+
+    _insert(InventoryMaterial.__table__, [
+        {
+            'material_code': f'MAT-B{i:05d}',
+            'material_name': f'{rng.choice(MATERIALS)} #{i}',
+            'category': rng.choice(['Civil', 'MEP', 'Finishes', 'Joinery']),
+            'unit': rng.choice(UNITS),
+            'current_stock': rng.randint(0, 5000),
+            'backup_stock': 0,
+            'min_stock_level': rng.randint(0, 50),
+            'unit_price': round(rng.uniform(1, 500), 2),
+            'is_active': True,
+            'created_at': datetime.utcnow(),
+            'created_by': BENCH_USER,
+            'last_modified_at': datetime.utcnow(),
+            'last_modified_by': BENCH_USER,
+        }
+        for i in range(args.inventory_items)
+    ])
+    return args.inventory_items
+
+
+def seed_vendors(rng, args):
+    from models.vendor import Vendor, VendorProduct
+
+    vendor_ids = _insert(Vendor.__table__, [
+        {
+            'company_name': f'Bench Supplier {i}',
+            'email': f'vendor{i}@bench.local',
+            'category': rng.choice(['Civil', 'MEP', 'Finishes', 'Joinery']),
+            'status': 'active' if rng.random() < 0.9 else 'inactive',
+            'is_deleted': False,
+            'created_at': datetime.utcnow(),
+            'last_modified_at': datetime.utcnow(),
+        }
+        for i in range(args.vendors)
+    ], pk='vendor_id')
+    if not vendor_ids:
+        return 0
+
+    batch = 10000
+    for start in range(0, args.vendor_products, batch):
+        _insert(VendorProduct.__table__, [
+            {
+                'vendor_id': rng.choice(vendor_ids),
+                'product_name': f'{rng.choice(MATERIALS)} {rng.choice(PRODUCT_SPECS)} #{i}',
+                'category': rng.choice(['Civil', 'MEP', 'Finishes', 'Joinery']),
+                'unit': rng.choice(UNITS),
+                'unit_price': round(rng.uniform(1, 500), 2),
+                'is_deleted': False,
+                'created_at': datetime.utcnow(),
+                'last_modified_at': datetime.utcnow(),
+            }
+            for i in range(start, min(start + batch, args.vendor_products))
+        ])
+    return args.vendor_products
+
+
+def seed(args):
+    from config.db import db
+    from utils.project_membership import backfill_project_members
+
+    rng = random.Random(args.seed)
+    if args.reset:
+        db.drop_all()
+    # Trigram indexes (vendor product matching) need the extension before create_all
+    db.session.execute(db.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    db.session.commit()
+    db.create_all()
+
+    _, users = seed_users(rng, args.projects)
+    project_boqs = seed_projects(rng, args, users)
+    crs, po_children = seed_change_requests(rng, args, users, project_boqs)
+    workers, attendance = seed_workers(rng, args, users, project_boqs)
+    inventory = seed_inventory(rng, args)
+    vendor_products = seed_vendors(rng, args)
+    db.session.commit()
+    backfill_project_members()
+
+    return {
+        'users': sum(len(ids) for ids in users.values()),
+        'projects': len(project_boqs),
+        'boq_material_lines': len(project_boqs) * args.boq_items,
+        'change_requests': crs,
+        'po_children': po_children,
+        'workers': workers,
+        'attendance_rows': attendance,
+        'inventory_items': inventory,
+        'vendor_products': vendor_products,
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    from benchmarks.environment import configure_benchmark_environment
+    app = configure_benchmark_environment()
+    with app.app_context():
+        counts = seed(args)
+    for name, count in counts.items():
+        print(f"{name:>20}: {count}")
+
+
+if __name__ == '__main__':
+    main()
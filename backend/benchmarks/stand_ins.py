@@ -0,0 +1,158 @@
+"""
+Local stand-ins for external services used by the benchmark harness.
+
+install_local_stand_ins() must run before the app is imported; Supabase
+clients are created on first use (utils/supabase_client.py) through the
+patched supabase.create_client.
+
+- smtplib.SMTP / SMTP_SSL  -> in-memory outbox (SENT_EMAILS)
+- supabase.create_client   -> in-memory storage buckets (STORAGE)
+- SMS / WhatsApp HTTP APIs -> in-memory message log (SENT_MESSAGES)
+"""
+
+import os
+import threading
+from types import SimpleNamespace
+
+SENT_EMAILS = []
+SENT_MESSAGES = []
+STORAGE = {}  # bucket -> {path: bytes}
+LOCAL_STORAGE_URL = 'http://local-storage.invalid'
+
+_lock = threading.Lock()
+_installed = False
+
+
+class LocalSMTP:
+    """Accepts everything smtplib.SMTP/SMTP_SSL is used for and records sent mail."""
+
+    def __init__(self, host='', port=0, *args, **kwargs):
+        self.host = host
+        self.port = port
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.quit()
+
+    def ehlo(self, *args, **kwargs):
+        return 250, b'OK'
+
+    def starttls(self, *args, **kwargs):
+        return 220, b'OK'
+
+    def login(self, *args, **kwargs):
+        return 235, b'OK'
+
+    def sendmail(self, from_addr, to_addrs, msg, *args, **kwargs):
+        with _lock:
+            SENT_EMAILS.append({'from': from_addr, 'to': to_addrs, 'size': len(msg)})
+        return {}
+
+    def send_message(self, msg, from_addr=None, to_addrs=None, *args, **kwargs):
+        return self.sendmail(from_addr or msg.get('From'), to_addrs or msg.get_all('To'), msg.as_string())
+
+    def quit(self):
+        return 221, b'Bye'
+
+    close = quit
+
+
+class LocalBucket:
+    """Subset of the supabase-py storage bucket API used by the controllers."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def _files(self):
+        return STORAGE.setdefault(self.name, {})
+
+    def upload(self, path, file, file_options=None):
+        data = file.read() if hasattr(file, 'read') else file
+        with _lock:
+            self._files()[path] = bytes(data) if not isinstance(data, str) else data.encode()
+        return SimpleNamespace(path=path, full_path=f'{self.name}/{path}')
+
+    def update(self, path, file, file_options=None):
+        return self.upload(path, file, file_options)
+
+    def download(self, path):
+        return self._files().get(path, b'')
+
+    def remove(self, paths):
+        with _lock:
+            for path in paths:
+                self._files().pop(path, None)
+        return [{'name': path} for path in paths]
+
+    def list(self, path=None, options=None):
+        prefix = f'{path.rstrip("/")}/' if path else ''
+        names = sorted({p[len(prefix):].split('/', 1)[0] for p in self._files() if p.startswith(prefix)})
+        return [{'name': name} for name in names]
+
+    def get_public_url(self, path, *args, **kwargs):
+        return f'{LOCAL_STORAGE_URL}/{self.name}/{path}'
+
+    def create_signed_url(self, path, expires_in, *args, **kwargs):
+        return {'signedURL': self.get_public_url(path), 'signedUrl': self.get_public_url(path)}
+
+
+class LocalSupabase:
+    def __init__(self):
+        self.storage = SimpleNamespace(from_=LocalBucket)
+
+
+def local_create_client(*args, **kwargs):
+    return LocalSupabase()
+
+
+class _LocalHTTPResponse:
+    status_code = 200
+    ok = True
+    text = '{"status": "queued"}'
+
+    def json(self):
+        return {'status': 'queued'}
+
+
+def _local_post(url, *args, **kwargs):
+    with _lock:
+        SENT_MESSAGES.append({'url': url, 'payload': kwargs.get('json') or kwargs.get('data')})
+    return _LocalHTTPResponse()
+
+
+def install_local_stand_ins():
+    """Patch SMTP, Supabase, SMS and WhatsApp clients with local stand-ins (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    import smtplib
+    import requests
+    import supabase
+
+    smtplib.SMTP = LocalSMTP
+    smtplib.SMTP_SSL = LocalSMTP
+    supabase.create_client = local_create_client
+
+    # Controllers only build clients when credentials exist; give them dummy ones
+    # (and make sure real credentials are never picked up by a benchmark run)
+    for prefix in ('', 'DEV_'):
+        os.environ[f'{prefix}SUPABASE_URL'] = LOCAL_STORAGE_URL
+        for key in ('SUPABASE_KEY', 'SUPABASE_ANON_KEY', 'SUPABASE_SERVICE_ROLE_KEY'):
+            os.environ[f'{prefix}{key}'] = 'local'
+
+    local_requests = SimpleNamespace(post=_local_post, exceptions=requests.exceptions)
+    import utils.sms_service as sms_service
+    import utils.whatsapp_service as whatsapp_service
+    sms_service.requests = local_requests
+    whatsapp_service.requests = local_requests
+
+    _installed = True
+
+
+def reset_stand_ins():
+    with _lock:
+        SENT_EMAILS.clear()
+        SENT_MESSAGES.clear()
+        STORAGE.clear()
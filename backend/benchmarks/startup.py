@@ -0,0 +1,98 @@
+"""
+Measure worker boot: create_app() time, peak RSS, which heavy libraries
+are already imported once the app is built, and how many controller modules
+(route modules import theirs on the first request, utils/lazy_module.py).
+
+Each run boots the app in a fresh interpreter (module caches make a second
+create_app() in the same process meaningless). Heavy libraries that show up
+as loaded after boot are imported by some module at import time instead of
+inside the function that needs them.
+
+Usage (from backend/):
+    python -m benchmarks.startup --runs 5 --output startup.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+from benchmarks.run import _git_commit
+
+HEAVY_MODULES = (
+    'pandas', 'numpy', 'reportlab', 'openpyxl', 'pdfplumber', 'PyPDF2', 'fitz', 'PIL', 'supabase',
+)
+
+# Runs in the child interpreter; prints one JSON line
+_CHILD = """
+import json, resource, sys, time
+from benchmarks.stand_ins import install_local_stand_ins
+install_local_stand_ins()
+already_loaded = set(sys.modules)
+started = time.perf_counter()
+from benchmarks.environment import configure_benchmark_environment
+configure_benchmark_environment()
+seconds = time.perf_counter() - started
+heavy = {heavy!r}
+print(json.dumps({{
+    'seconds': seconds,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+    'modules': len(sys.modules),
+    'heavy_loaded': [m for m in heavy if m in sys.modules and m not in already_loaded],
+    'controllers_loaded': sorted(m for m in sys.modules if m.startswith('controllers.')),
+}}))
+"""
+
+
+def boot_once():
+    output = subprocess.check_output(
+        [sys.executable, '-c', _CHILD.format(heavy=HEAVY_MODULES)], text=True
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(args):
+    runs = [boot_once() for _ in range(args.runs)]
+    seconds = sorted(r['seconds'] for r in runs)
+    report = {
+        'commit': _git_commit(),
+        'timestamp': datetime.utcnow().isoformat(),
+        'runs': args.runs,
+        'create_app_seconds': {
+            'min': round(seconds[0], 3),
+            'median': round(statistics.median(seconds), 3),
+            'max': round(seconds[-1], 3),
+        },
+        'max_rss_mb': round(max(r['max_rss_mb'] for r in runs), 1),
+        'modules': runs[-1]['modules'],
+        'heavy_loaded': runs[-1]['heavy_loaded'],
+        'controllers_loaded': runs[-1]['controllers_loaded'],
+    }
+
+    boot = report['create_app_seconds']
+    print(f"commit={report['commit']} runs={args.runs}")
+    print(f"create_app: min={boot['min']}s median={boot['median']}s max={boot['max']}s")
+    print(f"peak RSS: {report['max_rss_mb']} MB, modules loaded: {report['modules']}")
+    print(f"heavy libraries loaded at boot: {', '.join(report['heavy_loaded']) or 'none'}")
+    print(f"controller modules loaded at boot: {len(report['controllers_loaded'])}")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='benchmarks.startup', description="Measure app boot time and memory")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh-interpreter boots to measure")
+    parser.add_argument('--output', help="Write the JSON report here")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    run(parse_args(argv))
+
+
+if __name__ == '__main__':
+    main()
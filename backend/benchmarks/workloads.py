@@ -0,0 +1,114 @@
+"""
+Scripted per-role workloads.
+
+Each workload is a list of steps (name, method, path[, json body]) for one role.
+Paths are resolved against the seeded data, and every request is sent with a JWT for a
+seeded user of that role plus `X-Profile-SQL: 1`, so the SQL profiler reports
+query counts in the Server-Timing header.
+"""
+
+from datetime import datetime, timedelta
+
+import jwt
+
+# 50 material names for the alternative-vendor matching step
+MATCHING_MATERIALS = [
+    f'{material} {spec}'
+    for material in ['Cement', 'Gypsum Board', 'Steel Stud', 'Paint Emulsion', 'Ceramic Tile']
+    for spec in ['50kg', '12mm', '18mm', '2.5mm', '600x600', 'White', 'Grey', 'Heavy Duty', 'Premium', 'Type A']
+]
+
+WORKLOADS = {
+    'projectManager': [
+        ('pm_dashboard', 'GET', '/api/pm_dashboard'),
+        ('get_boq', 'GET', '/api/boq/{boq_id}'),
+        ('change_requests', 'GET', '/api/change-requests'),
+    ],
+    'estimator': [
+        ('get_boq', 'GET', '/api/boq/{boq_id}'),
+    ],
+    'siteEngineer': [
+        ('change_requests', 'GET', '/api/change-requests'),
+    ],
+    'buyer': [
+        ('change_requests', 'GET', '/api/change-requests'),
+        ('matching_vendors', 'POST', '/api/vendor/matching-vendors', {'material_names': MATCHING_MATERIALS}),
+    ],
+    'productionManager': [
+        ('inventory_items', 'GET', '/api/all_item_inventory'),
+    ],
+    'technicalDirector': [
+        ('boq_internal_pdf', 'GET', '/api/boq/download/internal/{boq_id}'),
+    ],
+}
+
+
+def _token(user, role_name):
+    from utils.authentication import SECRET_KEY
+    payload = {
+        'user_id': user.user_id,
+        'email': user.email,
+        'username': user.email,
+        'role': role_name,
+        'role_id': user.role_id,
+        'full_name': user.full_name,
+        'exp': datetime.utcnow() + timedelta(hours=10),
+    }
+    token = jwt.encode(payload, SECRET_KEY, algorithm='HS256')
+    return token.decode('utf-8') if isinstance(token, bytes) else token
+
+
+def _user_for_role(role_name, project):
+    """Pick a seeded user of the role, preferring the one assigned to the sample project."""
+    from models.role import Role
+    from models.user import User
+
+    preferred = {
+        'projectManager': (project.user_id or [None])[0],
+        'siteEngineer': project.site_supervisor_id,
+        'estimator': project.estimator_id,
+        'buyer': project.buyer_id,
+    }.get(role_name)
+    if preferred:
+        user = User.query.get(preferred)
+        if user:
+            return user
+    role = Role.query.filter_by(role=role_name).first()
+    if not role:
+        return None
+    return User.query.filter_by(role_id=role.role_id, is_deleted=False).order_by(User.user_id).first()
+
+
+def build_requests(roles=None):
+    """
+    Resolve workloads against the seeded data.
+    Returns [{'name', 'role', 'method', 'path', 'headers', 'json'}], one entry per step.
+    Must run inside an app context.
+    """
+    from models.project import Project
+    from models.boq import BOQ
+
+    project = Project.query.filter_by(is_deleted=False).order_by(Project.project_id).first()
+    if project is None:
+        raise SystemExit("No projects found - run `python -m benchmarks.seed` first")
+    boq = BOQ.query.filter_by(project_id=project.project_id, is_deleted=False).first()
+    context = {'project_id': project.project_id, 'boq_id': boq.boq_id if boq else 0}
+
+    requests = []
+    for role_name, steps in WORKLOADS.items():
+        if roles and role_name not in roles:
+            continue
+        user = _user_for_role(role_name, project)
+        if user is None:
+            continue
+        headers = {'Authorization': f'Bearer {_token(user, role_name)}', 'X-Profile-SQL': '1'}
+        for name, method, path, *body in steps:
+            requests.append({
+                'name': f'{role_name}:{name}',
+                'role': role_name,
+                'method': method,
+                'path': path.format(**context),
+                'headers': headers,
+                'json': body[0] if body else None,
+            })
+    return requests
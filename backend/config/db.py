@@ -4,29 +4,27 @@ from flask_sqlalchemy import SQLAlchemy
 from dotenv import load_dotenv
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from utils import query_profiler
 
 # Load environment variables from .env file
 load_dotenv()
 
 db = SQLAlchemy()
 
-# ✅ PERFORMANCE: Query timing for development
-# Logs slow queries (>100ms) to help identify bottlenecks
-_query_start_time = {}
-
+# ✅ PERFORMANCE: Per-request SQL profiling (see utils/query_profiler.py)
+# Statements are only timed while the current request is sampled for profiling
 @event.listens_for(Engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    """Record query start time"""
-    if os.getenv("ENVIRONMENT", "development") == "development":
-        conn.info.setdefault('query_start_time', []).append(time.time())
+    """Record query start time for profiled requests"""
+    if query_profiler.is_profiling():
+        conn.info.setdefault('query_start_time', []).append(time.perf_counter())
 
 @event.listens_for(Engine, "after_cursor_execute")
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    """Log slow queries (>100ms) in development - DISABLED"""
-    if os.getenv("ENVIRONMENT", "development") == "development":
-        start_times = conn.info.get('query_start_time', [])
-        if start_times:
-            start_times.pop()  # Clean up start times without logging
+    """Hand statement timing to the request profiler"""
+    start_times = conn.info.get('query_start_time')
+    if start_times:
+        query_profiler.record_statement(statement, time.perf_counter() - start_times.pop())
 
 def initialize_db(app):
     """
@@ -76,4 +74,19 @@ def initialize_db(app):
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = pool_config
 
     db.init_app(app)
-    # return db
\ No newline at end of file
+    # return db
+
+def import_models():
+    """
+    Import every models/ module so all mappers exist before the first query.
+
+    Controllers are imported on the first request that reaches them
+    (utils/lazy_module.py), so they no longer load every model at boot, and
+    a relationship('Model') target must be registered before mappers configure.
+    """
+    import importlib
+    import pkgutil
+    import models
+
+    for module in pkgutil.iter_modules(models.__path__):
+        importlib.import_module(f"models.{module.name}")
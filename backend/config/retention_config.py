@@ -0,0 +1,68 @@
+"""
+Retention Configuration
+Monthly partitioning and retention policies for append-only time-series tables.
+All retention periods and actions are environment-driven.
+
+Actions:
+- archive: export the expired month to a gzip'd CSV in RETENTION_ARCHIVE_DIR, then drop it
+- drop:    drop the expired month without exporting it
+- keep:    never expire (partitions are still maintained)
+
+Applied by migrations/partition_time_series_tables.py (see utils/partition_maintenance.py).
+"""
+import os
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+
+RETENTION_ARCHIVE_DIR = os.getenv(
+    'RETENTION_ARCHIVE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'archives')
+)
+
+# Partitions are created this many months ahead of the current month
+PARTITION_PREMAKE_MONTHS = int(os.getenv('PARTITION_PREMAKE_MONTHS', '3'))
+
+RETENTION_ACTIONS = ('archive', 'drop', 'keep')
+
+
+@dataclass
+class RetentionPolicy:
+    """Partitioning and retention settings for one table"""
+    table: str
+    partition_column: str
+    retention_months: int
+    action: str = 'archive'
+    # Unique indexes that cannot live on the partitioned parent (they don't include the
+    # partition column); created on every partition instead: (column, partial WHERE clause)
+    partition_unique_indexes: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def _action(env_name, default):
+    action = os.getenv(env_name, default).lower()
+    return action if action in RETENTION_ACTIONS else default
+
+
+RETENTION_POLICIES = {
+    'notifications': RetentionPolicy(
+        table='notifications',
+        partition_column='created_at',
+        retention_months=int(os.getenv('NOTIFICATION_RETENTION_MONTHS', '12')),
+        action=_action('NOTIFICATION_RETENTION_ACTION', 'archive'),
+        # Dedup keys embed a time bucket that never spans a month boundary,
+        # so a per-month unique index enforces them exactly
+        partition_unique_indexes=[('dedup_key', 'dedup_key IS NOT NULL')],
+    ),
+    'security_audit_logs': RetentionPolicy(
+        table='security_audit_logs',
+        partition_column='timestamp',
+        retention_months=int(os.getenv('SECURITY_AUDIT_RETENTION_MONTHS', '24')),
+        action=_action('SECURITY_AUDIT_RETENTION_ACTION', 'archive'),
+    ),
+    'login_history': RetentionPolicy(
+        table='login_history',
+        partition_column='login_at',
+        retention_months=int(os.getenv('LOGIN_HISTORY_RETENTION_MONTHS', '12')),
+        action=_action('LOGIN_HISTORY_RETENTION_ACTION', 'archive'),
+    ),
+}
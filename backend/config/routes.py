@@ -27,6 +27,7 @@ from routes.raw_materials_routes import raw_materials_routes
 from routes.catalog_items_routes import catalog_items_routes
 from routes.vendor_inspection_routes import vendor_inspection_routes
 from routes.email_cc_routes import email_cc_routes
+from controllers.transport_analysis_controller import transport_analysis_bp
 
 # Import and register the routes from the route blueprints
 
@@ -59,4 +60,5 @@ def initialize_routes(app):
     app.register_blueprint(raw_materials_routes)
     app.register_blueprint(catalog_items_routes)
     app.register_blueprint(vendor_inspection_routes)
-    app.register_blueprint(email_cc_routes)
\ No newline at end of file
+    app.register_blueprint(email_cc_routes)
+    app.register_blueprint(transport_analysis_bp)
\ No newline at end of file
@@ -48,6 +48,9 @@ class SecurityConfig:
     # OTP Expiry (in seconds)
     OTP_EXPIRES = 300  # 5 minutes (same for all environments)
 
+    # Failed OTP verifications allowed before the OTP is invalidated
+    OTP_MAX_ATTEMPTS = 5
+
     # ============================================
     # Rate Limiting (Production Only)
     # ============================================
@@ -1091,21 +1091,19 @@ def get_dashboard_analytics():
         # Import required models
         from models.change_request import ChangeRequest
         from models.vendor import Vendor
-        from models.inventory import (
-            InventoryMaterial, InventoryTransaction,
-            MaterialDeliveryNote, InternalMaterialRequest
-        )
-        from models.login_history import LoginHistory
+        from models.inventory import InventoryMaterial
+        from services.analytics_rollups import get_period_aggregates
+
+        # Period metrics (new rows, trends, period breakdowns) come from the daily
+        # rollups plus a live query for the days they don't cover yet
+        period = get_period_aggregates(cutoff_date)
 
         # ============================================
         # 1. USER ANALYTICS
         # ============================================
         total_users = User.query.filter_by(is_deleted=False).count()
         active_users = User.query.filter_by(is_deleted=False, is_active=True).count()
-        new_users_period = User.query.filter(
-            User.is_deleted == False,
-            User.created_at >= cutoff_date
-        ).count()
+        new_users_period = period.total('users_created')
 
         # Role distribution with counts
         role_distribution = db.session.query(
@@ -1119,13 +1117,7 @@ def get_dashboard_analytics():
         ).group_by(Role.role_id, Role.role).order_by(desc('count')).all()
 
         # User registration trend (daily for the period)
-        user_trend = db.session.query(
-            func.date(User.created_at).label('date'),
-            func.count(User.user_id).label('count')
-        ).filter(
-            User.is_deleted == False,
-            User.created_at >= cutoff_date
-        ).group_by(func.date(User.created_at)).order_by('date').all()
+        user_trend = period.trend('users_created')
 
         # ============================================
         # 2. PROJECT ANALYTICS
@@ -1142,10 +1134,7 @@ def get_dashboard_analytics():
 
         project_status_map = {s: c for s, c in project_status}
 
-        new_projects_period = Project.query.filter(
-            Project.is_deleted == False,
-            Project.created_at >= cutoff_date
-        ).count()
+        new_projects_period = period.total('projects_created')
 
         # Projects by work type
         work_type_distribution = db.session.query(
@@ -1171,13 +1160,7 @@ def get_dashboard_analytics():
         boq_status_map = {s: c for s, c in boq_status}
 
         # BOQ creation trend
-        boq_trend = db.session.query(
-            func.date(BOQ.created_at).label('date'),
-            func.count(BOQ.boq_id).label('count')
-        ).filter(
-            BOQ.is_deleted == False,
-            BOQ.created_at >= cutoff_date
-        ).group_by(func.date(BOQ.created_at)).order_by('date').all()
+        boq_trend = period.trend('boqs_created')
 
         # ============================================
         # 4. CHANGE REQUEST ANALYTICS
@@ -1212,13 +1195,7 @@ def get_dashboard_analytics():
         ).group_by(ChangeRequest.approval_required_from).all()
 
         # CR trend
-        cr_trend = db.session.query(
-            func.date(ChangeRequest.created_at).label('date'),
-            func.count(ChangeRequest.cr_id).label('count')
-        ).filter(
-            ChangeRequest.is_deleted == False,
-            ChangeRequest.created_at >= cutoff_date
-        ).group_by(func.date(ChangeRequest.created_at)).order_by('date').all()
+        cr_trend = period.trend('change_requests_created')
 
         # ============================================
         # 5. VENDOR ANALYTICS
@@ -1235,10 +1212,7 @@ def get_dashboard_analytics():
             Vendor.category.isnot(None)
         ).group_by(Vendor.category).order_by(desc('count')).limit(10).all()
 
-        new_vendors_period = Vendor.query.filter(
-            Vendor.is_deleted == False,
-            Vendor.created_at >= cutoff_date
-        ).count()
+        new_vendors_period = period.total('vendors_created')
 
         # ============================================
         # 6. INVENTORY ANALYTICS
@@ -1262,62 +1236,34 @@ def get_dashboard_analytics():
         ).count()
 
         # Inventory transactions summary
-        transaction_summary = db.session.query(
-            InventoryTransaction.transaction_type,
-            func.count(InventoryTransaction.inventory_transaction_id).label('count'),
-            func.sum(InventoryTransaction.total_amount).label('total_amount')
-        ).filter(
-            InventoryTransaction.created_at >= cutoff_date
-        ).group_by(InventoryTransaction.transaction_type).all()
+        transaction_summary = period.breakdown('inventory_transactions')
 
         transaction_map = {t: {'count': c, 'amount': float(a) if a else 0} for t, c, a in transaction_summary}
 
         # ============================================
         # 7. DELIVERY NOTES ANALYTICS
         # ============================================
-        delivery_stats = db.session.query(
-            MaterialDeliveryNote.status,
-            func.count(MaterialDeliveryNote.delivery_note_id).label('count')
-        ).filter(
-            MaterialDeliveryNote.created_at >= cutoff_date
-        ).group_by(MaterialDeliveryNote.status).all()
+        delivery_stats = [(s, c) for s, c, _ in period.breakdown('delivery_notes')]
 
         delivery_status_map = {s: c for s, c in delivery_stats}
 
         # ============================================
         # 8. MATERIAL REQUESTS ANALYTICS
         # ============================================
-        request_stats = db.session.query(
-            InternalMaterialRequest.status,
-            func.count(InternalMaterialRequest.request_id).label('count')
-        ).filter(
-            InternalMaterialRequest.created_at >= cutoff_date
-        ).group_by(InternalMaterialRequest.status).all()
+        request_stats = [(s, c) for s, c, _ in period.breakdown('material_requests')]
 
         request_status_map = {s: c for s, c in request_stats}
 
         # ============================================
         # 9. LOGIN ACTIVITY ANALYTICS
         # ============================================
-        login_count_period = LoginHistory.query.filter(
-            LoginHistory.login_at >= cutoff_date
-        ).count()
+        login_count_period = period.total('logins')
 
         # Login trend (daily)
-        login_trend = db.session.query(
-            func.date(LoginHistory.login_at).label('date'),
-            func.count(LoginHistory.id).label('count')
-        ).filter(
-            LoginHistory.login_at >= cutoff_date
-        ).group_by(func.date(LoginHistory.login_at)).order_by('date').all()
+        login_trend = period.trend('logins')
 
         # Login methods distribution
-        login_methods = db.session.query(
-            LoginHistory.login_method,
-            func.count(LoginHistory.id).label('count')
-        ).filter(
-            LoginHistory.login_at >= cutoff_date
-        ).group_by(LoginHistory.login_method).all()
+        login_methods = [(m, c) for m, c, _ in period.breakdown('logins')]
 
         # ============================================
         # 10. SYSTEM HEALTH METRICS
@@ -1524,7 +1470,7 @@ def get_top_performers():
 
         # Top Project Managers by active projects
         # Note: Project.user_id is a JSONB array storing multiple PM IDs [1, 2, 3]
-        # We need to use JSONB contains operator to check if user_id is in the array
+        # project_members mirrors that array as one row per (project, PM)
         from sqlalchemy import cast, text
         from sqlalchemy.dialects.postgresql import JSONB
 
@@ -1537,16 +1483,16 @@ def get_top_performers():
                 User.is_deleted == False
             ).all()
 
-            # ── Single query: unnest JSONB array, GROUP BY pm_id ─────────────────
+            # ── Single query: indexed project_members join, GROUP BY pm_id ──────
             # Replaces N per-PM scalar queries with one aggregate query
             _pm_count_rows = db.session.execute(text(
                 """
-                SELECT pm_id::int AS pm_id, COUNT(*) AS project_count
-                FROM projects,
-                     jsonb_array_elements_text(user_id) AS pm_id
-                WHERE is_deleted = FALSE
-                  AND user_id IS NOT NULL
-                GROUP BY pm_id
+                SELECT pm.user_id AS pm_id, COUNT(*) AS project_count
+                FROM project_members pm
+                JOIN project p ON p.project_id = pm.project_id
+                WHERE pm.role = 'pm'
+                  AND p.is_deleted = FALSE
+                GROUP BY pm.user_id
                 """
             )).fetchall()
             _pm_counts_map = {row[0]: row[1] for row in _pm_count_rows}
@@ -16,6 +16,7 @@ from config.logging import get_logger
 from utils.authentication import send_otp
 from utils.async_email import send_otp_async
 from utils.sms_service import send_sms_otp
+from utils.otp_store import get_otp_store, check_otp
 import os
 
 # Import security logging functions
@@ -167,12 +168,11 @@ def user_login():
 
         if otp:
             # Store user_id and role for verification step
-            from utils.authentication import otp_storage
-            if email in otp_storage:
-                otp_storage[email]['user_id'] = user.user_id
-                if db_role_name:
-                    # Store the DB role name for verification
-                    otp_storage[email]['role'] = db_role_name
+            otp_fields = {'user_id': user.user_id}
+            if db_role_name:
+                # Store the DB role name for verification
+                otp_fields['role'] = db_role_name
+            get_otp_store().update(email, **otp_fields)
             
             response_data = {
                 "message": "OTP sent successfully to your email",
@@ -446,12 +446,9 @@ def site_supervisor_login_sms():
             otp = send_sms_otp(phone)
             if otp:
                 # Store user_id and role for verification step
-                from utils.authentication import otp_storage
                 # Use clean_phone for consistent storage key
                 storage_key = f"phone:{clean_phone}"
-                if storage_key in otp_storage:
-                    otp_storage[storage_key]['user_id'] = user.user_id
-                    otp_storage[storage_key]['email'] = user.email
+                get_otp_store().update(storage_key, user_id=user.user_id, email=user.email)
 
                 response_data = {
                     "message": "OTP sent successfully to your phone",
@@ -469,10 +466,7 @@ def site_supervisor_login_sms():
             # Email fallback
             otp = send_otp_async(email)
             if otp:
-                from utils.authentication import otp_storage
-                if email in otp_storage:
-                    otp_storage[email]['user_id'] = user.user_id
-                    otp_storage[email]['role'] = 'siteengineer'
+                get_otp_store().update(email, user_id=user.user_id, role='siteengineer')
 
                 response_data = {
                     "message": "OTP sent successfully to your email",
@@ -517,10 +511,9 @@ def verify_sms_otp_login():
         except ValueError:
             return jsonify({"error": "OTP must be a number"}), 400
 
-        from utils.authentication import otp_storage
+        otp_store = get_otp_store()
 
-        # Get OTP data based on login method
-        otp_data = None
+        # Resolve the OTP storage key based on login method
         storage_key = None
         if login_method == "phone":
             # Try multiple storage key formats (handle phone with/without country code)
@@ -529,32 +522,17 @@ def verify_sms_otp_login():
                 f"phone:{phone}",
                 f"phone:{clean_phone}",
             ]
-            for key in possible_keys:
-                if key in otp_storage:
-                    storage_key = key
-                    otp_data = otp_storage.get(key)
-                    break
+            storage_key = next((key for key in possible_keys if otp_store.get(key)), possible_keys[-1])
         else:
             storage_key = email
-            otp_data = otp_storage.get(storage_key)
-        if not otp_data:
-            on_login_failed(email or phone)  # Security audit log
-            return jsonify({"error": "OTP not found or expired"}), 400
-
-        stored_otp = otp_data.get("otp")
-        expires_at = datetime.fromtimestamp(otp_data.get("expires_at"))
 
-        # Check OTP expiry
-        current_time = datetime.utcnow()
-        if current_time > expires_at:
-            del otp_storage[storage_key]
+        # Check OTP (expiry enforced by the store TTL, failed attempts are counted)
+        otp_data, otp_error = check_otp(storage_key, otp_input)
+        if otp_error:
             on_login_failed(email or phone)  # Security audit log
-            return jsonify({"error": "OTP expired"}), 400
+            return jsonify({"error": otp_error}), 400
 
-        # Check if OTP matches
-        if otp_input != stored_otp:
-            on_login_failed(email or phone)  # Security audit log
-            return jsonify({"error": "Invalid OTP"}), 400
+        current_time = datetime.utcnow()
 
         # Find user - for phone login, get email from storage or query
         if login_method == "phone":
@@ -565,7 +543,7 @@ def verify_sms_otp_login():
                 if user:
                     user_email = user.email
                 else:
-                    del otp_storage[storage_key]
+                    otp_store.delete(storage_key)
                     return jsonify({"error": "User not found"}), 404
         else:
             user_email = email
@@ -580,7 +558,7 @@ def verify_sms_otp_login():
         ).first()
 
         if not user:
-            del otp_storage[storage_key]
+            otp_store.delete(storage_key)
             on_login_failed(user_email)  # Security audit log
             return jsonify({"error": "User not found or inactive"}), 404
 
@@ -597,7 +575,7 @@ def verify_sms_otp_login():
         on_login_success(user.user_id)
 
         # Remove OTP from storage
-        del otp_storage[storage_key]
+        otp_store.delete(storage_key)
 
         # Get role information
         role_permissions = []
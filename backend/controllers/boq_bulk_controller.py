@@ -12,7 +12,6 @@ import time
 from config.db import db
 from models.boq import BOQ, BOQDetails, MasterItem, MasterMaterial, MasterLabour
 from models.project import Project
-from utils.excel_parser import parse_boq_excel
 from config.logging import get_logger
 
 log = get_logger()
@@ -224,6 +223,7 @@ def bulk_upload_boq():
 
         try:
             # Parse Excel file
+            from utils.excel_parser import parse_boq_excel
             success, parse_result = parse_boq_excel(temp_path)
 
             if not success:
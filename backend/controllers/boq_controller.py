@@ -1,6 +1,8 @@
 from flask import request, jsonify, g
 from config.db import db
 from models.project import Project
+from models.project_member import ROLE_PROJECT_MANAGER
+from utils.project_membership import project_member_filter
 from models.boq import *
 from models.preliminary_master import BOQPreliminary, BOQInternalRevision
 from config.logging import get_logger
@@ -10,6 +12,10 @@ from utils.boq_email_service import BOQEmailService
 from models.user import User
 from models.role import Role
 from utils.admin_viewing_context import get_effective_user_context, should_apply_role_filter
+from utils.pagination import (
+    InvalidCursorError, count_total, create_pagination_response, get_cursor_params,
+    get_total_mode, is_cursor_request, keyset_paginate,
+)
 from sqlalchemy import func, and_, or_
 from config.change_request_config import CR_CONFIG
 
@@ -17,6 +23,23 @@ from config.change_request_config import CR_CONFIG
 log = get_logger()
 
 
+def _boq_tab_cursor_page(query, sort_column, id_column):
+    """
+    Keyset page of a BOQ tab listing when the request asks for cursor
+    pagination (?cursor=, empty for the first page); None otherwise.
+    Returns (rows, pagination).
+    """
+    if not is_cursor_request(request):
+        return None
+    cursor, page_size = get_cursor_params(request, default_page_size=20)
+    rows, next_cursor = keyset_paginate(query, sort_column, id_column, cursor, page_size)
+    total, total_is_estimate = count_total(query, get_total_mode(request))
+    return rows, create_pagination_response(
+        rows, total, page_size=page_size, next_cursor=next_cursor,
+        cursor_mode=True, total_is_estimate=total_is_estimate
+    )
+
+
 def validate_negotiable_margin_formula(client_amount, materials, labour, misc, overhead_profit, transport, calculated_margin):
     """
     Validate that negotiable margin follows the correct formula:
@@ -5397,7 +5420,16 @@ def get_pending_boq():
         query = query.order_by(Project.created_at.desc())
 
         # OPTIMIZED: Use func.count() instead of .count()
-        if page is not None:
+        cursor_pagination = None
+        project_created_at = Project.created_at.label('project_created_at')
+        boq_key = func.coalesce(BOQ.boq_id, 0).label('boq_key')
+        cursor_page = _boq_tab_cursor_page(
+            query.add_columns(project_created_at, boq_key),
+            project_created_at, (Project.project_id.label('proj_id'), boq_key)
+        )
+        if cursor_page is not None:
+            rows, cursor_pagination = cursor_page
+        elif page is not None:
             total_count = query.with_entities(func.count()).scalar()
 
             if total_count == 0:
@@ -5458,7 +5490,9 @@ def get_pending_boq():
             "data": complete_boqs
         }
 
-        if page is not None:
+        if cursor_pagination is not None:
+            response["pagination"] = cursor_pagination
+        elif page is not None:
             total_pages = (total_count + page_size - 1) // page_size
             response["pagination"] = {
                 "page": page,
@@ -5471,6 +5505,8 @@ def get_pending_boq():
 
         return jsonify(response), 200
 
+    except InvalidCursorError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         log.error(f"Error retrieving BOQs: {str(e)}")
@@ -5529,7 +5565,7 @@ def get_approved_boq():
         # PERFORMANCE: Apply role filters early
         if user_role != 'admin' and should_apply_role_filter(context):
             if user_role in ['projectmanager', 'project_manager']:
-                query = query.filter(Project.user_id.contains([user_id]))
+                query = query.filter(project_member_filter(user_id, ROLE_PROJECT_MANAGER))
             elif user_role == 'estimator':
                 query = query.filter(or_(Project.estimator_id == user_id, Project.estimator_id == None))
             elif user_role in ['siteengineer', 'site_engineer', 'sitesupervisor', 'site_supervisor']:
@@ -5540,7 +5576,11 @@ def get_approved_boq():
         query = query.order_by(BOQ.created_at.desc())
 
         # OPTIMIZED: Use func.count() instead of .count()
-        if page is not None:
+        cursor_pagination = None
+        cursor_page = _boq_tab_cursor_page(query, BOQ.created_at, BOQ.boq_id)
+        if cursor_page is not None:
+            rows, cursor_pagination = cursor_page
+        elif page is not None:
             total_count = query.with_entities(func.count()).scalar()
 
             if total_count == 0:
@@ -5592,7 +5632,9 @@ def get_approved_boq():
             "data": complete_boqs
         }
 
-        if page is not None:
+        if cursor_pagination is not None:
+            response["pagination"] = cursor_pagination
+        elif page is not None:
             total_pages = (total_count + page_size - 1) // page_size
             response["pagination"] = {
                 "page": page,
@@ -5605,6 +5647,8 @@ def get_approved_boq():
 
         return jsonify(response), 200
 
+    except InvalidCursorError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         log.error(f"Error retrieving approved BOQs: {str(e)}")
@@ -5660,10 +5704,10 @@ def get_rejected_boq():
         )
 
         # Role-based filtering for BOQs
-        # Project.user_id is JSONB array, so use .contains() for array membership check
+        # PM membership via indexed project_members (mirrors the Project.user_id JSONB array)
         if user_role != 'admin' and should_apply_role_filter(context):
             if user_role in ['projectmanager', 'project_manager']:
-                query = query.filter(Project.user_id.contains([user_id]))
+                query = query.filter(project_member_filter(user_id, ROLE_PROJECT_MANAGER))
             elif user_role == 'estimator':
                 query = query.filter(
                     or_(
@@ -5678,7 +5722,11 @@ def get_rejected_boq():
 
         # OPTIMIZED: Use func.count() instead of .count()
         from sqlalchemy import func
-        if page is not None:
+        cursor_pagination = None
+        cursor_page = _boq_tab_cursor_page(query, BOQ.created_at, BOQ.boq_id)
+        if cursor_page is not None:
+            rows, cursor_pagination = cursor_page
+        elif page is not None:
             total_count = query.with_entities(func.count()).scalar()
             if total_count == 0:
                 return jsonify({"message": "Rejected BOQs retrieved successfully", "count": 0, "data": [], "pagination": {"page": page, "page_size": page_size, "total_count": 0, "total_pages": 0, "has_next": False, "has_prev": False}}), 200
@@ -5723,7 +5771,9 @@ def get_rejected_boq():
             "data": rejected_boqs
         }
 
-        if page is not None:
+        if cursor_pagination is not None:
+            response["pagination"] = cursor_pagination
+        elif page is not None:
             total_pages = (total_count + page_size - 1) // page_size
             response["pagination"] = {
                 "page": page,
@@ -5736,6 +5786,8 @@ def get_rejected_boq():
 
         return jsonify(response), 200
 
+    except InvalidCursorError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         log.error(f"[get_rejected_boq] Traceback: {traceback.format_exc()}")
@@ -5811,7 +5863,11 @@ def get_completed_boq():
 
         # OPTIMIZED: Use func.count() instead of .count()
         from sqlalchemy import func
-        if page is not None:
+        cursor_pagination = None
+        cursor_page = _boq_tab_cursor_page(query, BOQ.created_at, BOQ.boq_id)
+        if cursor_page is not None:
+            rows, cursor_pagination = cursor_page
+        elif page is not None:
             total_count = query.with_entities(func.count()).scalar()
             if total_count == 0:
                 return jsonify({"message": "Completed BOQs retrieved successfully", "count": 0, "data": [], "pagination": {"page": page, "page_size": page_size, "total_count": 0, "total_pages": 0, "has_next": False, "has_prev": False}}), 200
@@ -5856,7 +5912,9 @@ def get_completed_boq():
             "data": completed_boqs
         }
 
-        if page is not None:
+        if cursor_pagination is not None:
+            response["pagination"] = cursor_pagination
+        elif page is not None:
             total_pages = (total_count + page_size - 1) // page_size
             response["pagination"] = {
                 "page": page,
@@ -5869,6 +5927,8 @@ def get_completed_boq():
 
         return jsonify(response), 200
 
+    except InvalidCursorError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         log.error(f"[get_completed_boq] Traceback: {traceback.format_exc()}")
@@ -5928,10 +5988,10 @@ def get_send_to_client_boq():
         )
 
         # Role-based filtering for BOQs
-        # Project.user_id is JSONB array, so use .contains() for array membership check
+        # PM membership via indexed project_members (mirrors the Project.user_id JSONB array)
         if user_role != 'admin' and should_apply_role_filter(context):
             if user_role in ['projectmanager', 'project_manager']:
-                query = query.filter(Project.user_id.contains([user_id]))
+                query = query.filter(project_member_filter(user_id, ROLE_PROJECT_MANAGER))
             elif user_role == 'estimator':
                 query = query.filter(
                     or_(
@@ -5946,7 +6006,11 @@ def get_send_to_client_boq():
 
         # OPTIMIZED: Use func.count() instead of .count()
         from sqlalchemy import func
-        if page is not None:
+        cursor_pagination = None
+        cursor_page = _boq_tab_cursor_page(query, BOQ.created_at, BOQ.boq_id)
+        if cursor_page is not None:
+            rows, cursor_pagination = cursor_page
+        elif page is not None:
             total_count = query.with_entities(func.count()).scalar()
             if total_count == 0:
                 return jsonify({"message": "Send to client BOQs retrieved successfully", "count": 0, "data": [], "pagination": {"page": page, "page_size": page_size, "total_count": 0, "total_pages": 0, "has_next": False, "has_prev": False}}), 200
@@ -5991,7 +6055,9 @@ def get_send_to_client_boq():
             "data": send_to_client_boqs
         }
 
-        if page is not None:
+        if cursor_pagination is not None:
+            response["pagination"] = cursor_pagination
+        elif page is not None:
             total_pages = (total_count + page_size - 1) // page_size
             response["pagination"] = {
                 "page": page,
@@ -6004,6 +6070,8 @@ def get_send_to_client_boq():
 
         return jsonify(response), 200
 
+    except InvalidCursorError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         log.error(f"Error retrieving send to client BOQs: {str(e)}")
@@ -6078,7 +6146,11 @@ def get_cancelled_boq():
 
         # OPTIMIZED: Use func.count() instead of .count()
         from sqlalchemy import func
-        if page is not None:
+        cursor_pagination = None
+        cursor_page = _boq_tab_cursor_page(query, BOQ.created_at, BOQ.boq_id)
+        if cursor_page is not None:
+            rows, cursor_pagination = cursor_page
+        elif page is not None:
             total_count = query.with_entities(func.count()).scalar()
             if total_count == 0:
                 return jsonify({"message": "Cancelled BOQs retrieved successfully", "count": 0, "data": [], "pagination": {"page": page, "page_size": page_size, "total_count": 0, "total_pages": 0, "has_next": False, "has_prev": False}}), 200
@@ -6123,7 +6195,9 @@ def get_cancelled_boq():
             "data": cancelled_boqs
         }
 
-        if page is not None:
+        if cursor_pagination is not None:
+            response["pagination"] = cursor_pagination
+        elif page is not None:
             total_pages = (total_count + page_size - 1) // page_size
             response["pagination"] = {
                 "page": page,
@@ -6136,6 +6210,8 @@ def get_cancelled_boq():
 
         return jsonify(response), 200
 
+    except InvalidCursorError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         log.error(f"[get_cancelled_boq] Traceback: {traceback.format_exc()}")
@@ -6203,7 +6279,7 @@ def get_revisions_boq():
         # Role-based filtering for BOQs
         if user_role != 'admin' and should_apply_role_filter(context):
             if user_role in ['projectmanager', 'project_manager']:
-                query = query.filter(Project.user_id.contains([user_id]))
+                query = query.filter(project_member_filter(user_id, ROLE_PROJECT_MANAGER))
             elif user_role == 'estimator':
                 query = query.filter(
                     or_(
@@ -6218,7 +6294,11 @@ def get_revisions_boq():
 
         # OPTIMIZED: Use func.count() instead of .count()
         from sqlalchemy import func
-        if page is not None:
+        cursor_pagination = None
+        cursor_page = _boq_tab_cursor_page(query, BOQ.created_at, BOQ.boq_id)
+        if cursor_page is not None:
+            rows, cursor_pagination = cursor_page
+        elif page is not None:
             total_count = query.with_entities(func.count()).scalar()
             if total_count == 0:
                 return jsonify({"message": "Revision BOQs retrieved successfully", "count": 0, "data": [], "pagination": {"page": page, "page_size": page_size, "total_count": 0, "total_pages": 0, "has_next": False, "has_prev": False}}), 200
@@ -6263,7 +6343,9 @@ def get_revisions_boq():
             "data": revision_boqs
         }
 
-        if page is not None:
+        if cursor_pagination is not None:
+            response["pagination"] = cursor_pagination
+        elif page is not None:
             total_pages = (total_count + page_size - 1) // page_size
             response["pagination"] = {
                 "page": page,
@@ -6276,6 +6358,8 @@ def get_revisions_boq():
 
         return jsonify(response), 200
 
+    except InvalidCursorError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         log.error(f"[get_revisions_boq] Traceback: {traceback.format_exc()}")
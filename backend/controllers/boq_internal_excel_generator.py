@@ -2,8 +2,6 @@
 Internal BOQ Excel Generator
 Generates detailed internal BOQ with materials, labour, and cost breakdowns
 """
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from io import BytesIO
 from datetime import date
 
@@ -13,6 +11,9 @@ def generate_internal_excel(project, items, total_material_cost, total_labour_co
     Generate Internal Excel file with DETAILED cost breakdown
     Shows materials, labour, internal costs, and profit analysis
     """
+    import openpyxl
+    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "Internal BOQ"
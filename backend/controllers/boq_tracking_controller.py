@@ -2,6 +2,7 @@ from flask import request, jsonify, g
 from config.db import db
 from models.boq import *
 from models.project import Project
+from utils.transport_fee_analysis import planned_sub_item_transport
 from config.logging import get_logger
 from datetime import datetime
 from decimal import Decimal
@@ -3453,40 +3454,8 @@ def get_profit_report(boq_id):
             item_planned_transport = Decimal('0')
 
             for sub_item in item.get('sub_items', []):
-                # Mirror the purchase-comparison calculation exactly:
-                # 1. Use stored transport_amount if present (> 0).
-                # 2. Otherwise derive base_total: qty×rate → boq fields → internal cost fallback.
-                # 3. transport = base_total × transport_percentage / 100.
-                sub_transport_pct = Decimal(str(sub_item.get('transport_percentage', 5) or 5))
-                stored_transport = sub_item.get('transport_amount', 0) or 0
-                if stored_transport:
-                    transport_amt = Decimal(str(stored_transport))
-                else:
-                    sub_qty = Decimal(str(sub_item.get('quantity', 0) or 0))
-                    sub_rate = Decimal(str(sub_item.get('rate', 0) or 0))
-                    if sub_qty > 0 and sub_rate > 0:
-                        sub_base_total = sub_qty * sub_rate
-                    else:
-                        sub_base_total = Decimal(str(
-                            sub_item.get('base_total') or
-                            sub_item.get('per_unit_cost') or
-                            sub_item.get('client_rate') or
-                            0
-                        ))
-                        if sub_base_total == 0:
-                            # Fall back to internal cost: sum of materials + labour
-                            mat_cost = sum(
-                                Decimal(str(m.get('total', 0) or
-                                           float(m.get('quantity', 0)) * float(m.get('unit_price', 0))))
-                                for m in sub_item.get('materials', [])
-                            )
-                            lab_cost = sum(
-                                Decimal(str(l.get('total_cost', 0) or
-                                           float(l.get('hours', 0)) * float(l.get('rate_per_hour', 0))))
-                                for l in sub_item.get('labour', [])
-                            )
-                            sub_base_total = mat_cost + lab_cost
-                    transport_amt = sub_base_total * (sub_transport_pct / 100)
+                # Mirror the purchase-comparison calculation exactly (shared with transport analysis)
+                transport_amt = planned_sub_item_transport(sub_item)
                 planned_transport += transport_amt
                 item_planned_transport += transport_amt
 
@@ -4,17 +4,13 @@ from datetime import datetime
 import os
 import hashlib
 import uuid
-import pandas as pd
-import pdfplumber
-import PyPDF2
 import json
 import re
 from config.db import db
 from config.logging import get_logger
 from models.boq import BOQ, BOQDetails, MasterItem, MasterMaterial, MasterLabour
 from models.project import Project
-from utils.pdf_extractor import PDFExtractor, extract_boq_from_pdf
-from supabase import create_client, Client
+from utils.supabase_client import LazySupabaseClient
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -30,7 +26,7 @@ if environment == 'development':
 else:
     SUPABASE_URL = os.getenv('SUPABASE_URL')
     SUPABASE_KEY = os.getenv('SUPABASE_ANON_KEY')
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY) if SUPABASE_URL and SUPABASE_KEY else None
+supabase = LazySupabaseClient(anon=True)  # Created on first upload
 
 # File upload configuration
 ALLOWED_EXTENSIONS = {'pdf', 'xlsx', 'xls', 'csv'}
@@ -50,6 +46,7 @@ def extract_text_from_pdf(file_path):
     """Extract text from PDF file using enhanced PDF extractor"""
     try:
         # Use the enhanced PDF extractor
+        from utils.pdf_extractor import PDFExtractor
         extractor = PDFExtractor(file_path)
         result = extractor.extract()
 
@@ -78,6 +75,7 @@ def extract_text_from_pdf_fallback(file_path):
 
     try:
         # Method 1: pdfplumber for text and tables
+        import pdfplumber
         with pdfplumber.open(file_path) as pdf:
             for i, page in enumerate(pdf.pages):
                 # Extract text
@@ -128,6 +126,7 @@ def extract_text_from_pdf_fallback(file_path):
         log.error(f"pdfplumber extraction failed: {e}")
         # Fallback: PyPDF2
         try:
+            import PyPDF2
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 for i, page in enumerate(pdf_reader.pages):
@@ -145,6 +144,7 @@ def extract_text_from_excel(file_path):
     tables = []
 
     try:
+        import pandas as pd
         # Read Excel file with openpyxl engine (for .xlsx files)
         # For .xls files, we'll need xlrd but xlrd doesn't work with Python 3.12+
         file_ext = file_path.rsplit('.', 1)[1].lower()
@@ -11,7 +11,7 @@ from models.vendor import Vendor
 from models.inventory import *
 from config.logging import get_logger
 from datetime import datetime
-from supabase import create_client, Client
+from utils.supabase_client import LazySupabaseClient
 import json
 import os
 
@@ -41,8 +41,8 @@ else:
     supabase_url = os.environ.get('SUPABASE_URL')
     supabase_key = os.environ.get('SUPABASE_ANON_KEY')
 SUPABASE_BUCKET = "file_upload"
-# Initialize Supabase client
-supabase: Client = create_client(supabase_url, supabase_key) if supabase_url and supabase_key else None
+# Supabase client, created on first use
+supabase = LazySupabaseClient(anon=True)
 
 
 def preview_vendor_email(cr_id):
@@ -866,8 +866,8 @@ def send_vendor_whatsapp(cr_id):
         }
 
         # Get system settings for company phone (used in WhatsApp message)
-        from models.system_settings import SystemSettings
-        settings = SystemSettings.query.first()
+        from utils.settings_cache import get_system_settings
+        settings = get_system_settings()
         company_phone = settings.company_phone if settings and settings.company_phone else ''
 
         buyer_data = {
@@ -888,7 +888,7 @@ def send_vendor_whatsapp(cr_id):
         if include_lpo_pdf:
             try:
                 from utils.lpo_pdf_generator import LPOPDFGenerator
-                from models.system_settings import SystemSettings
+                from utils.settings_cache import get_system_settings
                 from models.lpo_customization import LPOCustomization
                 log.info("Step 1: Starting PDF generation...")
 
@@ -909,7 +909,7 @@ def send_vendor_whatsapp(cr_id):
                         db.session.rollback()  # Rollback to clear any failed transaction
 
                     # Get system settings
-                    settings = SystemSettings.query.first()
+                    settings = get_system_settings()
 
                     # Calculate items with proper structure
                     subtotal = 0
@@ -112,12 +112,12 @@ def _parse_custom_terms(saved_customization, default_template=None):
 
     Returns: Array of {text: string, selected: boolean}
     """
-    from models.system_settings import SystemSettings
+    from utils.settings_cache import get_system_settings
 
     # Step 1: Get master list of terms from system settings (like boq_terms table)
     master_terms = []
     try:
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
         if settings:
             # Get payment terms list from system settings
             payment_terms_str = getattr(settings, 'lpo_payment_terms_list', None)
@@ -29,9 +29,9 @@ from controllers.buyer.helpers import _parse_custom_terms
 def get_lpo_settings():
     """Get LPO settings (signatures, company info) for PDF generation"""
     try:
-        from models.system_settings import SystemSettings
+        from utils.settings_cache import get_system_settings
 
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
         if not settings:
             return jsonify({
                 "success": True,
@@ -79,7 +79,7 @@ def get_lpo_settings():
 def preview_lpo_pdf(cr_id):
     """Preview LPO PDF data before generation - returns editable data"""
     try:
-        from models.system_settings import SystemSettings
+        from utils.settings_cache import get_system_settings
         from models.vendor import Vendor
         from models.lpo_customization import LPOCustomization
         from models.po_child import POChild
@@ -160,7 +160,7 @@ def preview_lpo_pdf(cr_id):
         buyer = User.query.filter_by(user_id=buyer_id).first()
 
         # Get system settings
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
 
         # Process materials - use POChild materials if available
         if po_child and po_child.materials_data:
@@ -571,9 +571,9 @@ def generate_lpo_pdf(cr_id):
         if not lpo_data:
             return jsonify({"error": "LPO data is required"}), 400
 
-        # Always fetch fresh signature names from database (don't rely on frontend cache)
-        from models.system_settings import SystemSettings
-        settings = SystemSettings.query.first()
+        # Always use stored signature names (cached settings, invalidated on update) - don't rely on frontend cache
+        from utils.settings_cache import get_system_settings
+        settings = get_system_settings()
         if settings and 'signatures' in lpo_data:
             lpo_data['signatures']['md_name'] = settings.md_name or 'Managing Director'
             lpo_data['signatures']['td_name'] = settings.td_name or 'Technical Director'
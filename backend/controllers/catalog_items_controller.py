@@ -19,12 +19,13 @@ Endpoints:
 - DELETE /api/catalog-items/sub-items/<sub_id>/materials/<material_id> - Unlink material
 """
 
-from flask import request, jsonify, g
+from flask import request, jsonify, g, current_app
 from sqlalchemy import or_, func
 from sqlalchemy.orm import joinedload
 from config.db import db
 from models.catalog_item import CatalogItem, CatalogSubItem, CatalogSubItemMaterial
 from models.raw_materials_catalog import RawMaterialsCatalog
+from utils.catalog_tree_cache import get_catalog_tree, invalidate_catalog_tree
 from config.logging import get_logger
 
 log = get_logger()
@@ -225,24 +226,26 @@ def search_catalog_items():
 
 
 def get_full_tree():
-    """GET /api/catalog-items/full-tree - Complete hierarchy for estimator import."""
+    """
+    GET /api/catalog-items/full-tree - Complete hierarchy for estimator import.
+    Served from the versioned tree cache; honours If-None-Match and gzip.
+    """
     try:
-        items = CatalogItem.query.filter(
-            CatalogItem.is_active == True
-        ).options(
-            joinedload(CatalogItem.creator),
-            joinedload(CatalogItem.sub_items)
-            .joinedload(CatalogSubItem.creator),
-            joinedload(CatalogItem.sub_items)
-            .joinedload(CatalogSubItem.material_links)
-            .joinedload(CatalogSubItemMaterial.raw_material)
-        ).order_by(CatalogItem.item_name.asc()).all()
+        tree = get_catalog_tree()
+        etag = f'"{tree.etag}"'
+
+        if etag in request.headers.get('If-None-Match', ''):
+            response = current_app.response_class(status=304)
+        elif 'gzip' in request.headers.get('Accept-Encoding', '').lower():
+            response = current_app.response_class(tree.gzip_body, status=200, mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = current_app.response_class(tree.body, status=200, mimetype='application/json')
 
-        return jsonify({
-            'success': True,
-            'items': [item.to_dict_full() for item in items],
-            'total_count': len(items)
-        }), 200
+        response.headers['ETag'] = etag
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = 'private, no-cache'  # Revalidate with the ETag
+        return response
 
     except Exception as e:
         log.error(f"Error fetching catalog full tree: {str(e)}")
@@ -286,6 +289,7 @@ def create_catalog_item():
 
         db.session.add(new_item)
         db.session.commit()
+        invalidate_catalog_tree()
         db.session.refresh(new_item)
 
         log.info(f"Catalog item created: {new_item.id} - {new_item.item_name} by user {user_id}")
@@ -344,6 +348,7 @@ def update_catalog_item(item_id):
             item.category = data['category'].strip() if data['category'] else None
 
         db.session.commit()
+        invalidate_catalog_tree()
         db.session.refresh(item)
 
         log.info(f"Catalog item updated: {item.id} - {item.item_name} by user {user_id}")
@@ -387,6 +392,7 @@ def delete_catalog_item(item_id):
                 link.is_active = False
 
         db.session.commit()
+        invalidate_catalog_tree()
 
         log.info(f"Catalog item soft deleted: {item.id} - {item.item_name} by user {user_id}")
 
@@ -454,6 +460,7 @@ def create_catalog_sub_item(item_id):
 
         db.session.add(new_sub)
         db.session.commit()
+        invalidate_catalog_tree()
         db.session.refresh(new_sub)
 
         log.info(f"Catalog sub-item created: {new_sub.id} - {new_sub.sub_item_name} under item {item_id} by user {user_id}")
@@ -518,6 +525,7 @@ def update_catalog_sub_item(sub_item_id):
             sub.unit = data['unit'].strip() if data['unit'] else None
 
         db.session.commit()
+        invalidate_catalog_tree()
         db.session.refresh(sub)
 
         log.info(f"Catalog sub-item updated: {sub.id} - {sub.sub_item_name} by user {user_id}")
@@ -558,6 +566,7 @@ def delete_catalog_sub_item(sub_item_id):
             link.is_active = False
 
         db.session.commit()
+        invalidate_catalog_tree()
 
         log.info(f"Catalog sub-item soft deleted: {sub.id} - {sub.sub_item_name} by user {user_id}")
 
@@ -645,6 +654,7 @@ def link_material_to_sub_item(sub_item_id):
             # Update quantity instead of creating duplicate
             existing.quantity = quantity
             db.session.commit()
+            invalidate_catalog_tree()
             db.session.refresh(existing)
             return jsonify({
                 'success': True,
@@ -663,6 +673,7 @@ def link_material_to_sub_item(sub_item_id):
             inactive.is_active = True
             inactive.quantity = quantity
             db.session.commit()
+            invalidate_catalog_tree()
             db.session.refresh(inactive)
             return jsonify({
                 'success': True,
@@ -679,6 +690,7 @@ def link_material_to_sub_item(sub_item_id):
 
         db.session.add(new_link)
         db.session.commit()
+        invalidate_catalog_tree()
         db.session.refresh(new_link)
 
         log.info(f"Material {raw_material_id} linked to sub-item {sub_item_id} by user {user_id}")
@@ -721,6 +733,7 @@ def unlink_material_from_sub_item(sub_item_id, material_id):
 
         link.is_active = False
         db.session.commit()
+        invalidate_catalog_tree()
 
         log.info(f"Material {material_id} unlinked from sub-item {sub_item_id} by user {user_id}")
 
@@ -12,12 +12,18 @@ from config.logging import get_logger
 from config.change_request_config import CR_CONFIG
 from services.change_request_workflow import workflow_service
 from services.negotiable_profit_calculator import negotiable_profit_calculator
+from services.change_request_enrichment import apply_change_request_enrichment
+from services.cr_visibility import inbox_filter
 from datetime import datetime
 from sqlalchemy.orm.attributes import flag_modified
 from utils.boq_email_service import BOQEmailService
 from utils.admin_viewing_context import get_effective_user_context
 from utils.comprehensive_notification_service import notification_service
 from utils.po_helpers import CR_COMPLETED_STATUSES
+from utils.pagination import (
+    InvalidCursorError, is_cursor_request, get_cursor_params, get_total_mode, keyset_paginate,
+    count_total, create_pagination_response
+)
 
 log = get_logger()
 
@@ -997,6 +1003,8 @@ def get_all_change_requests():
     Optional query params for pagination (backward compatible):
     - page: Page number (1-indexed), default None (returns all)
     - page_size: Items per page, default 20, max 100
+    - cursor: Opt-in keyset pagination (empty for the first page, then next_cursor)
+    - total: exact|estimate|cached|none - how total_count is computed in cursor mode
     - status: Filter by status (e.g., 'purchase_completed', 'pending', etc.)
     """
     try:
@@ -1040,111 +1048,22 @@ def get_all_change_requests():
         if actual_user_role == 'admin' and not is_admin_viewing:
             pass
         elif user_role in ['siteengineer', 'site_engineer', 'sitesupervisor', 'site_supervisor']:
-            # NEW FLOW: SE sees requests from projects with item-level assignments via pm_assign_ss
-            # OR their own requests (to see pending drafts before items are assigned)
-            # PURCHASE LIST VIEW: SE only sees requests where requested_by_role is 'siteengineer' and status is 'pending'
-            # NEW FLOW: Get projects where SE has item assignments via pm_assign_ss
-            from models.pm_assign_ss import PMAssignSS
-
-            # Get unique project IDs where SE has item assignments
-            se_assigned_project_ids = db.session.query(PMAssignSS.project_id).filter(
-                PMAssignSS.assigned_to_se_id == user_id,
-                PMAssignSS.is_deleted == False
-            ).distinct().all()
-            se_assigned_project_ids = [p[0] for p in se_assigned_project_ids] if se_assigned_project_ids else []
-
-            # SE sees:
-            # 1. Requests where requested_by_role is 'siteengineer'/'sitesupervisor' and status is 'pending'
-            # 2. Their own requests (to see pending drafts)
-            from sqlalchemy import or_, and_
-
-            # Filter for SE: only show pending requests from site engineers
-            se_role_filter = and_(
-                ChangeRequest.requested_by_role.in_(['siteengineer', 'site_engineer', 'sitesupervisor', 'site_supervisor']),
-                ChangeRequest.status == 'pending'
-            )
-
-            # Filter for approved/completed requests (to show in Accepted/Completed tabs)
-            # SE should ONLY see their own approved requests, NOT PM/MEP created requests
-            se_approved_status_filter = and_(
-                ChangeRequest.status.in_(CR_CONFIG.APPROVED_WORKFLOW_STATUSES),
-                ChangeRequest.requested_by_role.in_(['siteengineer', 'site_engineer', 'sitesupervisor', 'site_supervisor'])  # Only SE created requests
-            )
-
-            # Admin raised requests as SE role - show to SE assigned to that project
-            admin_as_se_filter = and_(
-                ChangeRequest.requested_by_role == 'admin',
-            )
-
+            # SE sees (precomputed in cr_visibility):
+            # 1. Pending SE requests, admin-raised requests and approved/completed SE requests
+            #    from projects where the SE has item assignments via pm_assign_ss
+            # 2. Their own requests (to see pending drafts before items are assigned)
             if is_admin_viewing:
                 # Admin viewing as SE - show ALL requests (no filtering)
-                # Admin should see everything when viewing as any role
-                pass  # No additional filtering - admin sees everything
-            elif se_assigned_project_ids:
-                # Regular SE - sees pending requests from SEs in their assigned projects + own requests
-                query = query.filter(
-                    or_(
-                        and_(
-                            ChangeRequest.project_id.in_(se_assigned_project_ids),  # Requests from assigned projects
-                            se_role_filter  # Only pending requests from site engineers
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(se_assigned_project_ids),  # Requests from assigned projects
-                            admin_as_se_filter  # Admin raised as SE role
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(se_assigned_project_ids),  # Requests from assigned projects
-                            se_approved_status_filter  # Approved/completed/rejected requests (SE created only)
-                        ),
-                        ChangeRequest.requested_by_user_id == user_id  # Own requests
-                    )
-                )
+                pass
             else:
-                # No item assignments found - show only own requests
-                query = query.filter(ChangeRequest.requested_by_user_id == user_id)
+                query = query.filter(inbox_filter(user_role, user_id))
         elif user_role in ['projectmanager', 'project_manager']:
-            # PM sees:
+            # PM sees (precomputed in cr_visibility):
             # 1. Requests where requested_by_role is 'projectmanager' and status is 'pending' or 'pm_request'
-            # 2. Requests with status 'send_to_pm' (sent by SS/SE for PM approval)
-            # 3. Their own requests
-            # 4. Admin raised requests as PM role
-            from sqlalchemy import or_, and_
-
-            # Get projects where this PM is assigned
-            pm_projects = Project.query.filter(
-                Project.user_id.contains([user_id]),
-                Project.is_deleted == False
-            ).all()
-            pm_project_ids = [p.project_id for p in pm_projects]
-
-            # Filter for PM: show pending/pm_request requests from project managers
-            pm_role_filter = and_(
-                ChangeRequest.requested_by_role.in_(['projectmanager', 'project_manager', 'pm']),
-                ChangeRequest.status.in_(['pending', 'pm_request'])
-            )
-
-            # Filter for SS/SE requests sent to THIS specific PM (status = 'send_to_pm' AND assigned_to_pm_user_id = this PM)
-            # Only show requests where this PM was specifically assigned via pm_assign_ss
-            send_to_pm_filter = and_(
-                ChangeRequest.status == CR_CONFIG.STATUS_SEND_TO_PM,
-                ChangeRequest.assigned_to_pm_user_id == user_id  # Only show to the assigned PM
-            )
-
-            # Filter for approved/completed requests that were assigned to this PM (to show in Accepted/Completed tabs)
-            # For SE-originated requests, only show to the PM who was originally assigned
-            approved_status_filter = ChangeRequest.status.in_(CR_CONFIG.APPROVED_WORKFLOW_STATUSES)
-
-            # Filter for SE-originated requests that were assigned to this PM and have been processed
-            se_originated_assigned_to_this_pm = and_(
-                ChangeRequest.assigned_to_pm_user_id == user_id,  # Assigned to this PM
-                approved_status_filter
-            )
-
-            # Admin raised requests as PM role - show to PM assigned to that project
-            admin_as_pm_filter = and_(
-                ChangeRequest.requested_by_role == 'admin',
-            )
-
+            # 2. Requests with status 'send_to_pm' assigned to this PM (sent by SS/SE for PM approval)
+            # 3. Admin raised requests, SE requests assigned to this PM and PM/admin approved requests
+            #    from their projects
+            # 4. Requests they approved and their own requests (only own requests without projects)
             if is_admin_viewing:
                 # Admin viewing as PM - show requests only from projects where a PM is assigned
                 # This simulates what a PM would see - only their assigned projects
@@ -1188,109 +1107,21 @@ def get_all_change_requests():
                     # No projects with PM, show nothing
                     query = query.filter(ChangeRequest.cr_id == -1)
 
-            elif pm_project_ids:
-                # Regular PM - sees requests from their assigned projects
-                # IMPORTANT: For SE-originated requests, only show to the PM who was assigned
-                # Admin-created requests (any status) from PM's projects
-                admin_created_filter = func.lower(ChangeRequest.requested_by_role) == 'admin'
-
-                # PM-originated requests (not from SE) - show to all PMs on project
-                pm_originated_approved = and_(
-                    approved_status_filter,
-                    func.lower(ChangeRequest.requested_by_role).in_(['projectmanager', 'project_manager', 'pm', 'admin']),
-                    ChangeRequest.assigned_to_pm_user_id.is_(None)  # Not SE-originated
-                )
-                # Requests approved by this PM - show all requests this PM has approved
-                pm_approved_by_this_user = ChangeRequest.pm_approved_by_user_id == user_id
-                query = query.filter(
-                    or_(
-                        and_(
-                            ChangeRequest.project_id.in_(pm_project_ids),  # Requests from assigned projects
-                            pm_role_filter  # Pending requests from project managers
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(pm_project_ids),  # Requests from assigned projects
-                            admin_created_filter  # Admin created requests (any status)
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(pm_project_ids),  # Requests from assigned projects
-                            send_to_pm_filter  # SS/SE requests sent to THIS PM specifically
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(pm_project_ids),  # Requests from assigned projects
-                            se_originated_assigned_to_this_pm  # SE-originated requests assigned to this PM
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(pm_project_ids),  # Requests from assigned projects
-                            pm_originated_approved  # PM/Admin originated approved requests
-                        ),
-                        pm_approved_by_this_user,  # Requests approved by this PM
-                        ChangeRequest.requested_by_user_id == user_id  # Own requests
-                    )
-                )
             else:
-                # No projects assigned, show only own requests
-                log.warning(f"PM {user_id} has no assigned projects")
-                query = query.filter(ChangeRequest.requested_by_user_id == user_id)
+                query = query.filter(inbox_filter(user_role, user_id))
 
         elif user_role in ['mep', 'mepsupervisor']:
-            # MEP sees:
+            # MEP sees (precomputed in cr_visibility), from projects where they are MEP supervisor:
             # 1. Requests where requested_by_role is 'mep'/'mepsupervisor' and status is 'pending'
-            # 2. Requests with status 'send_to_mep' (sent by SS/SE for MEP approval)
-            # 3. Admin raised requests as MEP role
-            # 4. Their own requests
-            # 5. Approved/completed requests from their projects
+            # 2. Requests with status 'send_to_mep' assigned to this MEP (sent by SS/SE for MEP approval)
+            # 3. Admin raised requests
+            # 4. Approved/completed requests assigned to this MEP or MEP/admin originated
+            # 5. Their own requests
             from sqlalchemy import or_, and_
 
-            # Get projects where this user is the MEP supervisor (mep_supervisor_id field in Project table)
-            # Use JSONB contains operator since mep_supervisor_id is a JSONB array
-            mep_projects = Project.query.filter(
-                Project.mep_supervisor_id.contains([user_id]),
-                Project.is_deleted == False
-            ).all()
-            mep_project_ids = [p.project_id for p in mep_projects]
-
-            # Filter for MEP: only show pending requests from MEP
-            mep_role_filter = and_(
-                ChangeRequest.requested_by_role.in_(['mep', 'mepsupervisor']),
-                ChangeRequest.status == 'pending'
-            )
-
-            # Filter for approved/completed requests (to show in Accepted/Completed tabs)
-            mep_approved_status_filter = and_(
-                ChangeRequest.status.in_(CR_CONFIG.APPROVED_WORKFLOW_STATUSES),
-                ChangeRequest.requested_by_role.in_(['mep', 'mepsupervisor'])  # Only MEP created requests
-            )
-
-            # Filter for requests sent by SE to THIS specific MEP for approval
-            # Only show requests where this MEP was specifically assigned
-            se_to_mep_filter = and_(
-                ChangeRequest.status == CR_CONFIG.STATUS_SEND_TO_MEP,
-                ChangeRequest.current_approver_role == CR_CONFIG.ROLE_MEP,
-                ChangeRequest.assigned_to_pm_user_id == user_id  # Only show to the assigned MEP
-            )
-
-            # Admin raised requests as MEP role - show to MEP assigned to that project
-            admin_as_mep_filter = and_(
-                ChangeRequest.requested_by_role == 'admin',
-            )
-
             # Approved/completed requests status filter
             mep_approved_statuses = ChangeRequest.status.in_(CR_CONFIG.MEP_APPROVED_STATUSES)
 
-            # SE-originated requests assigned to this MEP
-            se_originated_assigned_to_this_mep = and_(
-                ChangeRequest.assigned_to_pm_user_id == user_id,  # Assigned to this MEP
-                mep_approved_statuses
-            )
-
-            # MEP-originated approved requests (not from SE) - show to all MEPs on project
-            mep_originated_approved = and_(
-                mep_approved_statuses,
-                func.lower(ChangeRequest.requested_by_role).in_(['mep', 'mepsupervisor', 'admin']),
-                ChangeRequest.assigned_to_pm_user_id.is_(None)  # Not SE-originated
-            )
-
             if is_admin_viewing:
                 # Admin viewing as MEP - show only MEP-assigned projects' requests
                 # Get ALL projects that have MEP supervisors assigned
@@ -1329,39 +1160,8 @@ def get_all_change_requests():
                     # No MEP-assigned projects exist
                     log.warning(f"No MEP-assigned projects found for admin view")
                     query = query.filter(False)  # Return empty result
-            elif mep_project_ids:
-                # Regular MEP - sees pending requests from MEPs + SE requests sent to THIS MEP + approved/completed + own requests
-                query = query.filter(
-                    or_(
-                        and_(
-                            ChangeRequest.project_id.in_(mep_project_ids),  # Requests from assigned projects
-                            mep_role_filter  # Only pending requests from MEP
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(mep_project_ids),  # Requests from assigned projects
-                            se_to_mep_filter  # SE sent requests for THIS MEP specifically
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(mep_project_ids),  # Requests from assigned projects
-                            admin_as_mep_filter  # Admin raised as MEP role
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(mep_project_ids),  # Requests from assigned projects
-                            se_originated_assigned_to_this_mep  # SE-originated requests assigned to this MEP
-                        ),
-                        and_(
-                            ChangeRequest.project_id.in_(mep_project_ids),  # Requests from assigned projects
-                            mep_originated_approved  # MEP/Admin originated approved requests
-                        ),
-                        ChangeRequest.requested_by_user_id == user_id  # Own requests
-                    )
-                )
             else:
-                # If MEP has no assigned projects, show only their own requests
-                log.warning(f"MEP {user_id} has no assigned projects, showing only their own requests")
-                query = query.filter(
-                    ChangeRequest.requested_by_user_id == user_id  # MEP's own requests only
-                )
+                query = query.filter(inbox_filter(user_role, user_id))
 
         elif user_role == 'estimator':
             # Estimator sees ONLY CRs they are involved in:
@@ -1380,30 +1180,9 @@ def get_all_change_requests():
                     )
                 )
             else:
-                # Regular estimator: filter by assigned projects
-                estimator_projects = Project.query.filter_by(estimator_id=user_id, is_deleted=False).all()
-                estimator_project_ids = [p.project_id for p in estimator_projects]
-
-                if estimator_project_ids:
-                    # Estimator only sees CRs they are involved in:
-                    # 1. CRs pending their approval (approval_required_from='estimator')
-                    # 2. CRs they already approved (tracks their approval history)
-                    # CRs that went directly PM→Buyer (bypassing estimator) are NOT shown
-                    query = query.filter(
-                        or_(
-                            and_(
-                                ChangeRequest.approval_required_from == 'estimator',
-                                ChangeRequest.project_id.in_(estimator_project_ids)
-                            ),
-                            ChangeRequest.approved_by_user_id == user_id
-                        )
-                    )
-                else:
-                    # If estimator has no assigned projects, show only their own requests
-                    log.warning(f"Estimator {user_id} has no assigned projects, showing only their own requests")
-                    query = query.filter(
-                        ChangeRequest.requested_by_user_id == user_id
-                    )
+                # Regular estimator: CRs pending their approval on their projects and CRs
+                # they already approved (own requests only when they have no projects)
+                query = query.filter(inbox_filter(user_role, user_id))
         elif user_role in ['technical_director', 'technicaldirector']:
             # TD sees:
             # 1. Requests where approval_required_from = 'technical_director' (pending TD approval)
@@ -1468,9 +1247,19 @@ def get_all_change_requests():
 
         # Execute query with optional pagination
         ordered_query = query.order_by(ChangeRequest.created_at.desc())
+        cursor_mode = is_cursor_request(request)
+        cursor = next_cursor = None
+        total_is_estimate = False
 
         # PERFORMANCE: Apply pagination if requested, otherwise return all (backward compatible)
-        if page is not None:
+        if cursor_mode:
+            # Keyset pagination: cost of a page does not grow with its depth
+            cursor, page_size = get_cursor_params(request, default_page_size=20)
+            change_requests, next_cursor = keyset_paginate(
+                query, ChangeRequest.created_at, ChangeRequest.cr_id, cursor, page_size
+            )
+            total_count, total_is_estimate = count_total(query, get_total_mode(request))
+        elif page is not None:
             total_count = ordered_query.count()
             offset = (page - 1) * page_size
             change_requests = ordered_query.offset(offset).limit(page_size).all()
@@ -1487,21 +1276,6 @@ def get_all_change_requests():
 
         # Overhead tracking columns removed - negotiable margin calculated on-the-fly
 
-        # PERFORMANCE: Batch load BOQ details for enriching materials_total_cost
-        # This prevents N+1 queries when SE-created requests have 0 cost
-        boq_ids_needing_enrichment = set()
-        for cr in change_requests:
-            if (not cr.materials_total_cost or cr.materials_total_cost == 0) and cr.boq_id:
-                boq_ids_needing_enrichment.add(cr.boq_id)
-
-        boq_details_map = {}
-        if boq_ids_needing_enrichment:
-            boq_details_list = BOQDetails.query.filter(
-                BOQDetails.boq_id.in_(list(boq_ids_needing_enrichment)),
-                BOQDetails.is_deleted == False
-            ).all()
-            boq_details_map = {bd.boq_id: bd for bd in boq_details_list}
-
         # PERFORMANCE: Batch pre-fetch all POChildren for all CRs to eliminate N+1
         # Without this, one SQL query fires per CR in the loop below (~100ms each on Supabase)
         _all_cr_ids_for_po = [cr.cr_id for cr in change_requests]
@@ -1537,101 +1311,8 @@ def get_all_change_requests():
                 cr_dict['boq_status'] = cr.boq.status
 
             # Enrich materials_total_cost if it's 0 (SE-created requests have no prices)
-            # This calculates the cost from BOQ prices for display in cards
-            if (not cr_dict.get('materials_total_cost') or cr_dict.get('materials_total_cost') == 0) and cr.boq_id:
-                try:
-                    # Use batch-loaded BOQ details (no N+1 query)
-                    boq_details = boq_details_map.get(cr.boq_id)
-                    if boq_details and boq_details.boq_details:
-                        # Build material price and sub_item_name lookup from BOQ
-                        material_prices = {}
-                        material_sub_items = {}  # Map material_id -> sub_item_name
-                        boq_items = boq_details.boq_details.get('items', [])
-                        for item_idx, item in enumerate(boq_items):
-                            for sub_item_idx, sub_item in enumerate(item.get('sub_items', [])):
-                                sub_item_name = sub_item.get('sub_item_name')
-                                for mat_idx, boq_material in enumerate(sub_item.get('materials', [])):
-                                    material_id = f"mat_{cr.boq_id}_{item_idx+1}_{sub_item_idx+1}_{mat_idx+1}"
-                                    material_prices[material_id] = boq_material.get('unit_price', 0)
-                                    material_sub_items[material_id] = sub_item_name  # Store sub_item_name
-                                    # Also store by material name for fallback lookup
-                                    mat_name = boq_material.get('material_name', '').lower().strip()
-                                    if mat_name:
-                                        material_prices[f"name:{mat_name}"] = boq_material.get('unit_price', 0)
-                                        material_sub_items[f"name:{mat_name}"] = sub_item_name  # Store sub_item_name by name
-
-                        # Calculate total cost from materials and enrich with sub_item_name
-                        total_cost = 0.0
-                        for mat in cr_dict.get('materials_data', []):
-                            try:
-                                quantity = float(mat.get('quantity', 0) or 0)
-                                unit_price = float(mat.get('unit_price', 0) or 0)
-                            except (ValueError, TypeError):
-                                quantity = 0
-                                unit_price = 0
-
-                            # If unit_price is 0, try to get from BOQ lookup
-                            if not unit_price:
-                                mat_id = mat.get('master_material_id')
-                                if mat_id and mat_id in material_prices:
-                                    unit_price = float(material_prices[mat_id] or 0)
-                                else:
-                                    # Fallback to name lookup
-                                    mat_name = mat.get('material_name', '').lower().strip()
-                                    if mat_name and f"name:{mat_name}" in material_prices:
-                                        unit_price = float(material_prices[f"name:{mat_name}"] or 0)
-
-                            # Enrich sub_item_name if missing
-                            if not mat.get('sub_item_name'):
-                                mat_id = mat.get('master_material_id')
-                                if mat_id and mat_id in material_sub_items:
-                                    mat['sub_item_name'] = material_sub_items[mat_id]
-                                else:
-                                    # Fallback to name lookup
-                                    mat_name = mat.get('material_name', '').lower().strip()
-                                    if mat_name and f"name:{mat_name}" in material_sub_items:
-                                        mat['sub_item_name'] = material_sub_items[f"name:{mat_name}"]
-
-                            total_cost += quantity * unit_price
-
-                        # Also check sub_items_data if materials_data total is 0, and enrich sub_item_name
-                        if total_cost == 0:
-                            for sub in cr_dict.get('sub_items_data', []):
-                                try:
-                                    quantity = float(sub.get('quantity', 0) or 0)
-                                    unit_price = float(sub.get('unit_price', 0) or 0)
-                                except (ValueError, TypeError):
-                                    quantity = 0
-                                    unit_price = 0
-
-                                if not unit_price:
-                                    mat_id = sub.get('master_material_id')
-                                    if mat_id and mat_id in material_prices:
-                                        unit_price = float(material_prices[mat_id] or 0)
-                                    else:
-                                        # Fallback to name lookup (consistent with materials_data)
-                                        mat_name = sub.get('material_name', '').lower().strip()
-                                        if mat_name and f"name:{mat_name}" in material_prices:
-                                            unit_price = float(material_prices[f"name:{mat_name}"] or 0)
-
-                                # Enrich sub_item_name if missing
-                                if not sub.get('sub_item_name'):
-                                    mat_id = sub.get('master_material_id')
-                                    if mat_id and mat_id in material_sub_items:
-                                        sub['sub_item_name'] = material_sub_items[mat_id]
-                                    else:
-                                        # Fallback to name lookup
-                                        mat_name = sub.get('material_name', '').lower().strip()
-                                        if mat_name and f"name:{mat_name}" in material_sub_items:
-                                            sub['sub_item_name'] = material_sub_items[f"name:{mat_name}"]
-
-                                total_cost += quantity * unit_price
-
-                        if total_cost > 0:
-                            cr_dict['materials_total_cost'] = round(total_cost, 2)
-                except Exception as e:
-                    log.error(f"Failed to enrich materials_total_cost for CR {cr.cr_id}: {e}")
-                    # Continue processing - don't crash the whole request
+            # and fill missing sub_item_names - precomputed from BOQ prices on write
+            apply_change_request_enrichment(cr_dict, cr)
 
             # Overhead analysis removed - columns dropped from database
             # Negotiable margin is now calculated on-the-fly by negotiable_profit_calculator
@@ -1686,7 +1367,8 @@ def get_all_change_requests():
 
         # For completed filter: also include POChild records that are purchase-completed
         # POChildren are vendor-split purchases with their own status lifecycle
-        if status_filter == 'purchase_completed':
+        # (in cursor mode they are returned with the first page only)
+        if status_filter == 'purchase_completed' and not (cursor_mode and cursor is not None):
             po_children_completed = POChild.query.options(
                 joinedload(POChild.vendor),
                 joinedload(POChild.parent_cr)
@@ -1741,7 +1423,8 @@ def get_all_change_requests():
 
             # Add POChild count to total_count for accurate pagination
             po_child_count = len(po_children_completed)
-            total_count = total_count + po_child_count
+            if total_count is not None:
+                total_count = total_count + po_child_count
         else:
             po_child_count = 0
 
@@ -1778,7 +1461,12 @@ def get_all_change_requests():
             "status_counts": status_counts_summary
         }
 
-        if page is not None:
+        if cursor_mode:
+            response["pagination"] = create_pagination_response(
+                result, total_count, page_size=page_size, next_cursor=next_cursor,
+                cursor_mode=True, total_is_estimate=total_is_estimate
+            )
+        elif page is not None:
             # Add pagination metadata
             total_pages = (total_count + page_size - 1) // page_size  # Ceiling division
             response["pagination"] = {
@@ -1792,6 +1480,8 @@ def get_all_change_requests():
 
         return jsonify(response), 200
 
+    except InvalidCursorError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         log.error(f"Error fetching change requests: {str(e)}")
         import traceback
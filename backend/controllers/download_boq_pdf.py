@@ -5,9 +5,6 @@ Provides endpoints for downloading BOQ PDFs and Excel files (Internal and Client
 from flask import request, jsonify, send_file
 from models.boq import *
 from models.project import Project
-from utils.modern_boq_pdf_generator import ModernBOQPDFGenerator
-from controllers.boq_internal_excel_generator import generate_internal_excel
-from controllers.send_boq_client import generate_client_excel
 from utils.boq_calculation_helper import calculate_boq_values
 from config.logging import get_logger
 from io import BytesIO
@@ -105,6 +102,7 @@ def download_internal_pdf():
             return jsonify({"success": False, "error": "Project not found"}), 404
 
         # Generate PDF with images
+        from utils.modern_boq_pdf_generator import ModernBOQPDFGenerator
         generator = ModernBOQPDFGenerator()
         pdf_data = generator.generate_internal_pdf(
             project, items, total_material_cost, total_labour_cost, grand_total, boq_json
@@ -220,6 +218,7 @@ def download_client_pdf():
             log.error(f"Error fetching terms for BOQ {boq_id}: {str(e)}")
 
         # Generate PDF with selected terms from database, optional cover page, and optional signatures
+        from utils.modern_boq_pdf_generator import ModernBOQPDFGenerator
         generator = ModernBOQPDFGenerator()
         pdf_data = generator.generate_client_pdf(
             project, items, total_material_cost, total_labour_cost, grand_total, boq_json,
@@ -287,6 +286,7 @@ def download_internal_excel():
             return jsonify({"success": False, "error": "Project not found"}), 404
 
         # Generate Excel with images
+        from controllers.boq_internal_excel_generator import generate_internal_excel
         excel_data = generate_internal_excel(
             project, items, total_material_cost, total_labour_cost, grand_total, boq_json
         )
@@ -394,6 +394,7 @@ def preview_client_pdf():
             log.error(f"Error fetching terms for BOQ {boq_id}: {str(e)}")
 
         # Generate PDF with cover page and optional signatures
+        from utils.modern_boq_pdf_generator import ModernBOQPDFGenerator
         generator = ModernBOQPDFGenerator()
         pdf_data = generator.generate_client_pdf(
             project, items, total_material_cost, total_labour_cost, grand_total, boq_json,
@@ -489,6 +490,7 @@ def download_client_excel():
             log.error(f"Error fetching terms for BOQ {boq_id}: {str(e)}")
 
         # Generate Excel with selected terms from database
+        from controllers.send_boq_client import generate_client_excel
         excel_data = generate_client_excel(
             project, items, total_material_cost, total_labour_cost, grand_total, boq_json, selected_terms
         )
@@ -5,11 +5,14 @@ from config.db import db
 from models.inventory import *
 from models.project import Project
 from models.user import User
-from models.system_settings import SystemSettings
+from utils.settings_cache import get_system_settings
+from utils.pagination import (
+    InvalidCursorError, is_cursor_request, get_cursor_params, get_total_mode,
+    keyset_paginate, count_total, create_pagination_response
+)
 from models.change_request import ChangeRequest
 from datetime import datetime
 from utils.comprehensive_notification_service import ComprehensiveNotificationService
-from utils.rdn_pdf_generator import RDNPDFGenerator
 
 # Import shared helpers (these can also be used by other controllers)
 from controllers.inventory_helpers import (
@@ -122,7 +125,7 @@ def validate_quantity(value, field_name='quantity'):
 def get_store_name():
     """Get store name from system settings"""
     try:
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
         if settings and settings.store_name:
             return settings.store_name
         return 'M2 Store'  # Fallback default
@@ -133,7 +136,7 @@ def get_store_name():
 def get_inventory_config():
     """Get inventory configuration for frontend"""
     try:
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
         store_name = settings.store_name if settings and settings.store_name else 'M2 Store'
         company_name = settings.company_name if settings and settings.company_name else 'MeterSquare ERP'
         currency = settings.currency if settings and settings.currency else 'AED'
@@ -432,6 +435,26 @@ def get_all_inventory_items():
                 )
             )
 
+        # Opt-in keyset pagination (?cursor=), ordered by id like the offset listing
+        if is_cursor_request(request):
+            try:
+                cursor, page_size = get_cursor_params(request, max_page_size=MAX_PAGINATION_LIMIT)
+                materials, next_cursor = keyset_paginate(
+                    query, InventoryMaterial.inventory_material_id, InventoryMaterial.inventory_material_id,
+                    cursor, page_size
+                )
+            except InvalidCursorError as e:
+                return jsonify({'error': str(e)}), 400
+            total, total_is_estimate = count_total(query, get_total_mode(request))
+            return jsonify({
+                'materials': [material.to_dict() for material in materials],
+                'total': total,
+                'pagination': create_pagination_response(
+                    materials, total, page_size=page_size, next_cursor=next_cursor,
+                    cursor_mode=True, total_is_estimate=total_is_estimate
+                )
+            }), 200
+
         # Order by latest first
         query = query.order_by(InventoryMaterial.inventory_material_id.desc())
 
@@ -6725,7 +6748,7 @@ def download_dn_pdf(delivery_note_id):
                 return jsonify({'error': f'Role {user_role} is not authorized to access delivery notes'}), 403
 
         # Get company name from system settings using centralized default
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
         company_name = getattr(settings, 'company_name', None) or DefaultValues.DEFAULT_COMPANY_NAME
 
         # If this DN has a batch reference and transport_fee is 0, lookup the batch's original transport fee
@@ -6884,7 +6907,7 @@ def download_rdn_pdf(return_note_id):
 
         # Get company name from system settings
         try:
-            settings = SystemSettings.query.first()
+            settings = get_system_settings()
             company_name = settings.company_name if settings and settings.company_name else "MeterSquare"
         except Exception as e:
             print(f"Warning: Failed to load company name from settings: {e}")
@@ -6945,6 +6968,7 @@ def download_rdn_pdf(return_note_id):
             })
 
         # Generate PDF
+        from utils.rdn_pdf_generator import RDNPDFGenerator
         pdf_generator = RDNPDFGenerator()
         pdf_buffer = pdf_generator.generate_pdf(rdn_data, project_data, items_data, company_name)
 
@@ -8,7 +8,7 @@ from config.db import db
 from models.inventory import *
 from models.project import Project
 from models.user import User
-from models.system_settings import SystemSettings
+from utils.settings_cache import get_system_settings
 from datetime import datetime
 
 
@@ -93,7 +93,7 @@ def validate_quantity(value, field_name='quantity'):
 def get_store_name():
     """Get the store name from system settings"""
     try:
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
         return settings.company_name if settings else 'M2 Store'
     except:
         return 'M2 Store'
@@ -102,7 +102,7 @@ def get_store_name():
 def get_inventory_config():
     """Get inventory configuration (store name, currency, etc.)"""
     try:
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
         return jsonify({
             'store_name': settings.company_name if settings else 'M2 Store',
             'company_name': settings.company_name if settings else 'MeterSquare ERP',
@@ -8,6 +8,7 @@ __all__ = [
     'assign_workers_to_requisition', 'retain_workers_for_next_day',
     'get_arrivals_for_date', 'confirm_arrival', 'mark_no_show', 'mark_departure',
     'clock_in_worker', 'clock_out_worker', 'get_daily_attendance', 'update_attendance',
+    'bulk_confirm_worker_arrivals', 'bulk_clock_in_workers', 'bulk_clock_out_workers',
 ]
 from datetime import datetime, date, timedelta
 from flask import request, jsonify, g
@@ -20,7 +21,14 @@ from models.daily_attendance import DailyAttendance
 from models.project import Project
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy import func, and_, or_
-from utils.skill_matcher import skill_matches
+from services.worker_availability import (
+    matching_workers_query, available_workers_query, find_booking_conflicts,
+    book_workers, release_worker_booking
+)
+from services.attendance_batch import (
+    normalize_batch_entries, bulk_clock_in, bulk_clock_out, bulk_confirm_arrivals,
+    load_attendance_records
+)
 from utils.comprehensive_notification_service import notification_service
 from controllers.labour_helpers import (
     log, whatsapp_service, normalize_role, get_user_assigned_project_ids,
@@ -104,85 +112,60 @@ def get_available_workers():
         date_str = request.args.get('date', date.today().isoformat())
         target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
         requisition_id = request.args.get('requisition_id', type=int)
+        available_only = request.args.get('available_only', 'false').lower() == 'true'
 
         # Get requisition to check time range if provided
         target_requisition = None
         if requisition_id:
             target_requisition = LabourRequisition.query.get(requisition_id)
 
-        # Get all active workers
-        query = Worker.query.filter(
-            Worker.is_deleted == False,
-            Worker.status == 'active'
-        )
-
-        all_workers = query.all()
-
-        # Filter by skill using flexible matching
-        workers = []
-        if skill:
-            for worker in all_workers:
-                if skill_matches(skill, worker.skills or []):
-                    workers.append(worker)
-        else:
-            workers = all_workers
-
-        # Check which workers have active assignments on the target date
-        # We need to check both WorkerAssignment AND LabourArrival tables
-        # to determine if worker is truly unavailable
+        start_time = target_requisition.start_time if target_requisition else None
+        end_time = target_requisition.end_time if target_requisition else None
 
         today = datetime.utcnow().date()
-        assigned_workers = {}
-
         # Only check for assignments on today or past dates
         # Future dates don't need conflict checking
-        if target_date <= today:
-            # Find requisitions assigned for the target date
-            requisitions_on_date = db.session.query(LabourRequisition).filter(
-                LabourRequisition.required_date == target_date,
-                LabourRequisition.is_deleted == False,
-                LabourRequisition.assignment_status == 'assigned'
-            ).all()
+        check_conflicts = target_date <= today
 
-            # Batch pre-fetch all LabourArrival records for these requisitions on this date
-            _req_ids_on_date = [req.requisition_id for req in requisitions_on_date]
-            _batch_arrivals = {}  # key: (requisition_id, worker_id)
-            if _req_ids_on_date:
-                _arrival_rows = LabourArrival.query.filter(
-                    LabourArrival.requisition_id.in_(_req_ids_on_date),
-                    LabourArrival.arrival_date == target_date,
-                    LabourArrival.is_deleted == False
-                ).all()
-                for _a in _arrival_rows:
-                    _batch_arrivals[(_a.requisition_id, _a.worker_id)] = _a
-
-            for req in requisitions_on_date:
-                if req.assigned_worker_ids:
-                    for worker_id in req.assigned_worker_ids:
-                        # Use pre-fetched arrival record (no DB query)
-                        arrival = _batch_arrivals.get((req.requisition_id, worker_id))
-
-                        # If target requisition has time range, check for time overlap
-                        is_unavailable = False
-                        if target_requisition and target_requisition.start_time and target_requisition.end_time and req.start_time and req.end_time:
-                            # Check time overlap: new_start < existing_end AND new_end > existing_start
-                            if (target_requisition.start_time < req.end_time and
-                                target_requisition.end_time > req.start_time):
-                                is_unavailable = True
-                        else:
-                            # No time info available, use departure status
-                            # Worker is unavailable if:
-                            # 1. No arrival record exists yet (assigned but not processed)
-                            # 2. Arrival exists but status is not 'departed'
-                            if not arrival or (arrival and arrival.arrival_status != 'departed'):
-                                is_unavailable = True
-
-                        if is_unavailable:
-                            # Worker is currently assigned and hasn't departed (or has time conflict)
-                            assigned_workers[worker_id] = {
-                                'requisition_code': req.requisition_code,
-                                'status': arrival.arrival_status if arrival else 'assigned'
-                            }
+        if available_only:
+            # Single indexed query: skill via worker_skills, conflicts via worker_bookings
+            if check_conflicts:
+                workers = available_workers_query(skill, target_date, start_time, end_time).all()
+            else:
+                workers = matching_workers_query(skill).all()
+            workers_response = [dict(w.to_dict_minimal(), is_assigned=False) for w in workers]
+            return jsonify({
+                "success": True,
+                "workers": workers_response,
+                "total_available": len(workers_response),
+                "total_matching": len(workers_response)
+            }), 200
+
+        # Active workers matching the skill (indexed worker_skills lookup)
+        workers = matching_workers_query(skill).all()
+
+        # Workers booked on another requisition that conflicts with the date/time window
+        assigned_workers = {}
+        if check_conflicts and workers:
+            conflicts = find_booking_conflicts(
+                [w.worker_id for w in workers], target_date, start_time, end_time
+            )
+            if conflicts:
+                # Batch pre-fetch arrival status for the conflicting bookings only
+                _arrival_status = {
+                    (a.requisition_id, a.worker_id): a.arrival_status
+                    for a in LabourArrival.query.filter(
+                        LabourArrival.requisition_id.in_({c['requisition_id'] for c in conflicts.values()}),
+                        LabourArrival.worker_id.in_(list(conflicts.keys())),
+                        LabourArrival.arrival_date == target_date,
+                        LabourArrival.is_deleted == False
+                    ).all()
+                }
+                for worker_id, conflict in conflicts.items():
+                    assigned_workers[worker_id] = {
+                        'requisition_code': conflict['requisition_code'],
+                        'status': _arrival_status.get((conflict['requisition_id'], worker_id), 'assigned')
+                    }
 
         # Build response with ALL workers, marking assignment status
         workers_response = []
@@ -254,68 +237,16 @@ def assign_workers_to_requisition(requisition_id):
         # Only check for conflicts if assignment is for today
         # Future dates are allowed without restriction
         if target_date <= today:
-            # Check for existing assignments on the target date
+            # Check for existing bookings on the target date (indexed worker_bookings lookup)
             conflicting_workers = []
-
-            # Batch pre-fetch all arrival records for this date and these workers upfront
-            _assign_arrival_cache = {}  # key: (requisition_id, worker_id)
-            _existing_req_ids_for_date = db.session.query(LabourRequisition.requisition_id).filter(
-                LabourRequisition.required_date == target_date,
-                LabourRequisition.is_deleted == False,
-                LabourRequisition.assignment_status == 'assigned',
-                LabourRequisition.requisition_id != requisition_id
-            ).all()
-            _existing_req_id_list = [r.requisition_id for r in _existing_req_ids_for_date]
-            if _existing_req_id_list:
-                _batch_assign_arrivals = LabourArrival.query.filter(
-                    LabourArrival.requisition_id.in_(_existing_req_id_list),
-                    LabourArrival.arrival_date == target_date,
-                    LabourArrival.is_deleted == False
-                ).all()
-                for _a in _batch_assign_arrivals:
-                    _assign_arrival_cache[(_a.requisition_id, _a.worker_id)] = _a
-
-            for worker_id in worker_ids:
-                # Find all requisitions this worker is assigned to on the target date
-                existing_requisitions = db.session.query(LabourRequisition).filter(
-                    LabourRequisition.assigned_worker_ids.contains([worker_id]),
-                    LabourRequisition.required_date == target_date,
-                    LabourRequisition.is_deleted == False,
-                    LabourRequisition.assignment_status == 'assigned',
-                    LabourRequisition.requisition_id != requisition_id  # Exclude current requisition
-                ).all()
-
-                if existing_requisitions:
-                    # For each existing assignment, check if worker has departed
-                    has_active_assignment = False
-
-                    for existing_req in existing_requisitions:
-                        # Use pre-fetched arrival record (no DB query)
-                        arrival = _assign_arrival_cache.get((existing_req.requisition_id, worker_id))
-
-                        # Check if times overlap when both requisitions have start/end times
-                        if requisition.start_time and requisition.end_time and existing_req.start_time and existing_req.end_time:
-                            # Time overlap exists if: new_start < existing_end AND new_end > existing_start
-                            # Example: 11AM-6PM vs 6PM-10PM -> 6PM < 6PM (FALSE) -> NO OVERLAP ✓
-                            # Example: 11AM-6PM vs 5PM-10PM -> 5PM < 6PM (TRUE) AND 10PM > 11AM (TRUE) -> OVERLAP ✗
-                            if (requisition.start_time < existing_req.end_time and
-                                requisition.end_time > existing_req.start_time):
-                                has_active_assignment = True
-                                break
-                            # No time overlap, worker is available for non-overlapping shift
-                        else:
-                            # If times not specified, check departure status
-                            if arrival and arrival.arrival_status != 'departed':
-                                # No departure recorded and no time info, assume full day conflict
-                                has_active_assignment = True
-                                break
-
-                    if has_active_assignment:
-                        worker = next((w for w in workers if w.worker_id == worker_id), None)
-                        if worker:
-                            # Get the conflicting requisition code for better error message
-                            conflict_req_code = existing_req.requisition_code if existing_req else 'unknown'
-                            conflicting_workers.append(f"{worker.full_name} (currently on {conflict_req_code})")
+            conflicts = find_booking_conflicts(
+                worker_ids, target_date, requisition.start_time, requisition.end_time,
+                exclude_requisition_id=requisition_id
+            )
+            for worker_id, conflict in conflicts.items():
+                worker = next((w for w in workers if w.worker_id == worker_id), None)
+                if worker:
+                    conflicting_workers.append(f"{worker.full_name} (currently on {conflict['requisition_code']})")
 
             if conflicting_workers:
                 worker_details = '\n• '.join(conflicting_workers)
@@ -371,6 +302,8 @@ def assign_workers_to_requisition(requisition_id):
         requisition.assignment_status = 'assigned'
         requisition.work_status = 'assigned'  # Update work status when workers are assigned
         requisition.assigned_worker_ids = worker_ids
+        # Mirror the assignment into worker_bookings for availability lookups
+        book_workers(requisition, worker_ids)
         requisition.assigned_by_user_id = current_user.get('user_id')
         requisition.assigned_by_name = current_user.get('full_name', 'Unknown')
         requisition.assignment_date = datetime.utcnow()
@@ -871,6 +804,7 @@ def mark_departure():
         arrival.arrival_status = 'departed'
         arrival.departure_time = final_departure_time
         arrival.departed_at = datetime.utcnow()
+        release_worker_booking(arrival.requisition_id, arrival.worker_id, arrival.departed_at)
 
         # Auto-create DailyAttendance record for payroll processing
         # Check if attendance record already exists
@@ -926,6 +860,27 @@ def mark_departure():
         return jsonify({"error": str(e)}), 500
 
 
+def bulk_confirm_worker_arrivals():
+    """Site Engineer confirms arrival of a crew (list of workers) for a project/date"""
+    try:
+        current_user = g.user
+        data = request.get_json() or {}
+
+        project_id, target_date, entries, early = _parse_batch_request(data, ('arrival_time',), 'arrival_date')
+        results = bulk_confirm_arrivals(project_id, target_date, entries, current_user)
+        db.session.commit()
+
+        return jsonify(_batch_response(early + results, target_date)), 200
+
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        log.error(f"Error confirming arrivals in bulk: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+
 # =============================================================================
 # STEP 6: ATTENDANCE LOGS (Site Engineer)
 # =============================================================================
@@ -1082,6 +1037,83 @@ def clock_out_worker():
         return jsonify({"error": str(e)}), 500
 
 
+def _parse_batch_request(data, defaults, date_key='attendance_date'):
+    """project_id, date and worker entries of a batch request (raises ValueError when invalid)"""
+    project_id = data.get('project_id')
+    if not project_id:
+        raise ValueError("project_id is required")
+    try:
+        target_date = datetime.strptime(data.get(date_key) or date.today().isoformat(), '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f"Invalid {date_key}. Use YYYY-MM-DD")
+    entries, early = normalize_batch_entries(data, defaults)
+    if not entries and not early:
+        raise ValueError("workers is required")
+    return int(project_id), target_date, entries, early
+
+
+def _batch_response(results, target_date, records=None):
+    """Per-worker outcomes plus status counts"""
+    summary = {}
+    for result in results:
+        summary[result['status']] = summary.get(result['status'], 0) + 1
+    response = {
+        "success": True,
+        "date": target_date.isoformat(),
+        "results": results,
+        "summary": summary
+    }
+    if records is not None:
+        response["attendance"] = [r.to_dict() for r in records]
+    return response
+
+
+def bulk_clock_in_workers():
+    """Site Engineer clocks in a crew (list of workers) for a project/date in one transaction"""
+    try:
+        current_user = g.user
+        data = request.get_json() or {}
+
+        project_id, target_date, entries, early = _parse_batch_request(data, ('clock_in_time', 'labour_role'))
+        results = bulk_clock_in(project_id, target_date, entries, current_user)
+        db.session.commit()
+
+        records = load_attendance_records([r['attendance_id'] for r in results if r['status'] == 'clocked_in'])
+        return jsonify(_batch_response(early + results, target_date, records)), 200
+
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        log.error(f"Error clocking in workers in bulk: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+
+def bulk_clock_out_workers():
+    """Site Engineer clocks out a crew (list of workers) for a project/date in one transaction"""
+    try:
+        current_user = g.user
+        data = request.get_json() or {}
+
+        project_id, target_date, entries, early = _parse_batch_request(
+            data, ('clock_out_time', 'break_duration_minutes')
+        )
+        results = bulk_clock_out(project_id, target_date, entries, current_user)
+        db.session.commit()
+
+        records = load_attendance_records([r['attendance_id'] for r in results if r['status'] == 'clocked_out'])
+        return jsonify(_batch_response(early + results, target_date, records)), 200
+
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        log.error(f"Error clocking out workers in bulk: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+
 def get_daily_attendance(project_id, date_str):
     """Get daily attendance records for a project"""
     try:
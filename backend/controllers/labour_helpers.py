@@ -11,7 +11,6 @@ __all__ = [
 ]
 from config.logging import get_logger
 from utils.whatsapp_service import WhatsAppService
-from sqlalchemy import or_
 
 log = get_logger()
 
@@ -39,21 +38,13 @@ def get_user_assigned_project_ids(user_id: int) -> list:
         return []
 
     from models.project import Project
+    from utils.project_membership import project_member_filter
 
+    # project_members mirrors PM/MEP (JSONB arrays) and SE/estimator/buyer columns,
+    # so "assigned in any role" is a single indexed lookup
     assigned_projects = Project.query.filter(
         Project.is_deleted == False,
-        or_(
-            # PM: user_id is JSONB array, check if user_id is in the array
-            Project.user_id.contains([user_id]),
-            # Site Supervisor/SE
-            Project.site_supervisor_id == user_id,
-            # MEP Supervisor: mep_supervisor_id is JSONB array
-            Project.mep_supervisor_id.contains([user_id]),
-            # Estimator
-            Project.estimator_id == user_id,
-            # Buyer
-            Project.buyer_id == user_id
-        )
+        project_member_filter(user_id)
     ).with_entities(Project.project_id).all()
 
     return [p.project_id for p in assigned_projects]
@@ -17,10 +17,13 @@ from models.labour_requisition import LabourRequisition
 from models.worker_assignment import WorkerAssignment
 from models.daily_attendance import DailyAttendance, AttendanceApprovalHistory
 from models.project import Project
+from models.project_member import ROLE_PROJECT_MANAGER, ROLE_MEP_SUPERVISOR
+from utils.project_membership import project_member_filter
 from models.labour_arrival import LabourArrival
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy import func, and_, or_
 from utils.comprehensive_notification_service import notification_service
+from services.payroll_aggregates import payroll_summary_rows
 from controllers.labour_helpers import (
     log, normalize_role, get_user_assigned_project_ids,
     SUPER_ADMIN_ROLES, LABOUR_ADMIN_ROLES
@@ -72,25 +75,17 @@ def get_attendance_to_lock():
             pm_project_ids = [proj.project_id for proj in all_projects]
         # Role-based project filtering for regular users
         elif user_role in ['mep', 'mepsupervisor', 'mep_supervisor']:
-            # MEP: Get projects where mep_supervisor_id contains this user
-            all_projects = Project.query.filter(
+            # MEP: Get projects where this user is an MEP member (indexed project_members lookup)
+            pm_project_ids = [row.project_id for row in db.session.query(Project.project_id).filter(
                 Project.is_deleted == False,
-                Project.mep_supervisor_id.isnot(None)
-            ).all()
-
-            for proj in all_projects:
-                if proj.mep_supervisor_id and isinstance(proj.mep_supervisor_id, list) and user_id in proj.mep_supervisor_id:
-                    pm_project_ids.append(proj.project_id)
+                project_member_filter(user_id, ROLE_MEP_SUPERVISOR)
+            ).all()]
         else:
-            # PM: Get projects where user_id contains this user
-            all_projects = Project.query.filter(
+            # PM: Get projects where this user is a PM member (indexed project_members lookup)
+            pm_project_ids = [row.project_id for row in db.session.query(Project.project_id).filter(
                 Project.is_deleted == False,
-                Project.user_id.isnot(None)
-            ).all()
-
-            for proj in all_projects:
-                if proj.user_id and isinstance(proj.user_id, list) and user_id in proj.user_id:
-                    pm_project_ids.append(proj.project_id)
+                project_member_filter(user_id, ROLE_PROJECT_MANAGER)
+            ).all()]
         # If no projects assigned, return empty list
         if not pm_project_ids:
             return jsonify({
@@ -454,61 +449,8 @@ def get_payroll_summary():
         start = datetime.strptime(start_date, '%Y-%m-%d').date()
         end = datetime.strptime(end_date, '%Y-%m-%d').date()
 
-        # Import Project model
-        from models.project import Project
-        from models.labour_requisition import LabourRequisition
-
-        # Aggregate by project, requisition, and worker
-        query = db.session.query(
-            DailyAttendance.project_id,
-            Project.project_name,
-            Project.project_code,
-            DailyAttendance.requisition_id,
-            LabourRequisition.requisition_code,
-            LabourRequisition.work_description,
-            LabourRequisition.skill_required,
-            LabourRequisition.site_name,
-            LabourRequisition.workers_count,
-            LabourRequisition.transport_fee,
-            DailyAttendance.worker_id,
-            Worker.worker_code,
-            Worker.full_name,
-            Worker.hourly_rate,
-            func.count(DailyAttendance.attendance_id).label('days_worked'),
-            func.sum(DailyAttendance.total_hours).label('total_hours'),
-            func.sum(DailyAttendance.regular_hours).label('regular_hours'),
-            func.sum(DailyAttendance.overtime_hours).label('overtime_hours'),
-            func.sum(DailyAttendance.total_cost).label('total_cost')
-        ).join(Worker).join(Project).outerjoin(
-            LabourRequisition,
-            DailyAttendance.requisition_id == LabourRequisition.requisition_id
-        ).filter(
-            DailyAttendance.approval_status == 'locked',
-            DailyAttendance.is_deleted == False,
-            DailyAttendance.attendance_date >= start,
-            DailyAttendance.attendance_date <= end
-        )
-
-        # Filter by project if specified
-        if project_id:
-            query = query.filter(DailyAttendance.project_id == project_id)
-
-        results = query.group_by(
-            DailyAttendance.project_id,
-            Project.project_name,
-            Project.project_code,
-            DailyAttendance.requisition_id,
-            LabourRequisition.requisition_code,
-            LabourRequisition.work_description,
-            LabourRequisition.skill_required,
-            LabourRequisition.site_name,
-            LabourRequisition.workers_count,
-            LabourRequisition.transport_fee,
-            DailyAttendance.worker_id,
-            Worker.worker_code,
-            Worker.full_name,
-            Worker.hourly_rate
-        ).order_by(Project.project_name, LabourRequisition.requisition_code, Worker.full_name).all()
+        # Sum the pre-aggregated day rows (services/payroll_aggregates.py)
+        results = payroll_summary_rows(start, end, project_id)
 
         # Group by project -> requisition -> workers (nested structure)
         projects_dict = {}
@@ -789,7 +731,7 @@ def get_user_projects():
             projects_query = db.session.query(Project).filter(
                 Project.is_deleted == False,
                 func.lower(Project.status) != 'completed',
-                Project.user_id.contains([user_id])
+                project_member_filter(user_id, ROLE_PROJECT_MANAGER)
             ).join(
                 BOQ, Project.project_id == BOQ.project_id
             ).filter(
@@ -819,7 +761,7 @@ def get_user_projects():
             projects_query = Project.query.filter(
                 Project.is_deleted == False,
                 func.lower(Project.status) != 'completed',
-                Project.mep_supervisor_id.contains([user_id])
+                project_member_filter(user_id, ROLE_MEP_SUPERVISOR)
             ).order_by(Project.project_name)
         # Other roles: Check all possible assignments
         else:
@@ -827,9 +769,9 @@ def get_user_projects():
                 Project.is_deleted == False,
                 func.lower(Project.status) != 'completed',
                 or_(
-                    Project.user_id.contains([user_id]),
+                    project_member_filter(user_id, ROLE_PROJECT_MANAGER),
                     Project.site_supervisor_id == user_id,
-                    Project.mep_supervisor_id.contains([user_id]),
+                    project_member_filter(user_id, ROLE_MEP_SUPERVISOR),
                     Project.estimator_id == user_id,
                     Project.buyer_id == user_id
                 )
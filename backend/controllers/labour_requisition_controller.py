@@ -18,6 +18,9 @@ from models.worker import Worker
 from models.labour_requisition import LabourRequisition
 from models.worker_assignment import WorkerAssignment
 from models.project import Project
+from models.project_member import ROLE_MEP_SUPERVISOR
+from utils.project_membership import project_member_filter
+from services.worker_availability import REQUISITION_SLOT_FIELDS, rebook_requisition
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy import func, and_, or_
 from utils.skill_matcher import skill_matches
@@ -720,6 +723,10 @@ def update_requisition(requisition_id):
             if end_minutes <= start_minutes:
                 return jsonify({"error": "End time must be after start time"}), 400
 
+        # Move existing worker bookings to the new date/window
+        if any(field in data for field in REQUISITION_SLOT_FIELDS):
+            rebook_requisition(requisition)
+
         requisition.last_modified_by = current_user.get('full_name', 'System')
 
         db.session.commit()
@@ -858,6 +865,10 @@ def resubmit_requisition(requisition_id):
                     return jsonify({"error": "workers_count must be between 1 and 500"}), 400
                 requisition.workers_count = count
 
+        # Move existing worker bookings to the new date/window
+        if any(field in data for field in REQUISITION_SLOT_FIELDS):
+            rebook_requisition(requisition)
+
         # Keep status unchanged - just update the data
         # User must manually click "Resend to PM" to send
         requisition.last_modified_by = current_user.get('full_name', 'System')
@@ -1177,16 +1188,10 @@ def get_pending_requisitions():
                 # For APPROVED/REJECTED tabs: filter by approved_by_user_id
                 if status == 'pending':
 
-                    from models.project import Project
-                    all_projects = Project.query.filter(
+                    assigned_project_ids = [row.project_id for row in db.session.query(Project.project_id).filter(
                         Project.is_deleted == False,
-                        Project.mep_supervisor_id.isnot(None)
-                    ).all()
-
-                    assigned_project_ids = []
-                    for proj in all_projects:
-                        if proj.mep_supervisor_id and isinstance(proj.mep_supervisor_id, list) and user_id in proj.mep_supervisor_id:
-                            assigned_project_ids.append(proj.project_id)
+                        project_member_filter(user_id, ROLE_MEP_SUPERVISOR)
+                    ).all()]
 
                     if assigned_project_ids:
                         query = query.filter(LabourRequisition.project_id.in_(assigned_project_ids))
@@ -1,6 +1,8 @@
 from flask import request, jsonify, g
 from config.db import db
 from models.project import Project
+from models.project_member import ROLE_PROJECT_MANAGER, ROLE_MEP_SUPERVISOR
+from utils.project_membership import project_member_filter
 from models.boq import *
 from config.logging import get_logger
 from models.user import User
@@ -133,7 +135,7 @@ def get_mep_approval_boq():
             # MEP sees only projects assigned to them
             mep_user_id = int(user_id) if user_id else None
             if mep_user_id:
-                query = query.filter(Project.mep_supervisor_id.contains([mep_user_id]))
+                query = query.filter(project_member_filter(mep_user_id, ROLE_MEP_SUPERVISOR))
         elif user_role in ['projectmanager', 'project_manager']:
             # PM sees only BOQs assigned to them via last_pm_user_id
             query = query.filter(BOQ.last_pm_user_id == user_id)
@@ -450,7 +452,7 @@ def get_mep_approved_boq():
             # MEP sees only projects where their user_id is in mep_supervisor_id JSONB array
             mep_user_id = int(user_id) if user_id else None
             if mep_user_id:
-                query = query.filter(Project.mep_supervisor_id.contains([mep_user_id]))
+                query = query.filter(project_member_filter(mep_user_id, ROLE_MEP_SUPERVISOR))
         else:
             # PM sees only BOQs where they are the last PM
             query = query.filter(BOQ.last_pm_user_id == user_id)
@@ -551,13 +553,13 @@ def get_mep_pending_boq():
             # PM sees only projects where their user_id is in Project.user_id JSONB array
             pm_user_id = int(user_id) if user_id else None
             if pm_user_id:
-                query = query.filter(Project.user_id.contains([pm_user_id]))
+                query = query.filter(project_member_filter(pm_user_id, ROLE_PROJECT_MANAGER))
                 query = query.filter(BOQ.status.in_(['approved', 'Approved']))
         elif user_role in MEP_ROLES:
             # MEP sees only projects where their user_id is in mep_supervisor_id JSONB array
             mep_user_id = int(user_id) if user_id else None
             if mep_user_id:
-                query = query.filter(Project.mep_supervisor_id.contains([mep_user_id]))
+                query = query.filter(project_member_filter(mep_user_id, ROLE_MEP_SUPERVISOR))
 
                 # Create a subquery to check if MEP has made ANY assignments for this BOQ
                 mep_has_assignments = exists().where(
@@ -694,7 +696,7 @@ def get_mep_rejected_boq():
             # MEP sees only rejected BOQs for projects where their user_id is in mep_supervisor_id
             mep_user_id = int(user_id) if user_id else None
             if mep_user_id:
-                query = query.filter(Project.mep_supervisor_id.contains([mep_user_id]))
+                query = query.filter(project_member_filter(mep_user_id, ROLE_MEP_SUPERVISOR))
         else:
             # PM sees only rejected BOQs where they are the last PM
             query = query.filter(BOQ.last_pm_user_id == user_id)
@@ -807,12 +809,12 @@ def get_mep_completed_project():
             )
         elif user_role in ['projectmanager', 'project_manager']:
             # PM sees only completed projects where their user_id is in Project.user_id JSONB array
-            query = query.filter(Project.user_id.contains([user_id]))
+            query = query.filter(project_member_filter(user_id, ROLE_PROJECT_MANAGER))
         elif user_role in MEP_ROLES:
             # MEP sees only completed projects where their user_id is in mep_supervisor_id JSONB array
             mep_user_id = int(user_id) if user_id else None
             if mep_user_id:
-                query = query.filter(Project.mep_supervisor_id.contains([mep_user_id]))
+                query = query.filter(project_member_filter(mep_user_id, ROLE_MEP_SUPERVISOR))
 
         # Pagination
         if page is not None:
@@ -917,7 +919,7 @@ def get_mep_dashboard():
             if mep_user_id:
                 assigned_projects = Project.query.filter(
                     Project.is_deleted == False,
-                    Project.mep_supervisor_id.contains([mep_user_id])
+                    project_member_filter(mep_user_id, ROLE_MEP_SUPERVISOR)
                 ).all()
                 log.info(f"MEP Dashboard: Found {len(assigned_projects)} projects for MEP user_id={mep_user_id}")
             else:
@@ -928,7 +930,7 @@ def get_mep_dashboard():
             if pm_user_id:
                 assigned_projects = Project.query.filter(
                     Project.is_deleted == False,
-                    Project.user_id.contains([pm_user_id])
+                    project_member_filter(pm_user_id, ROLE_PROJECT_MANAGER)
                 ).all()
             else:
                 assigned_projects = []
@@ -10,7 +10,12 @@ from datetime import datetime
 from sqlalchemy import and_
 from models.notification import Notification
 from config.db import db
+from utils.notification_counters import get_unread_count
 from config.logging import get_logger
+from utils.pagination import (
+    is_cursor_request, get_cursor_params, get_total_mode, keyset_paginate,
+    count_total, create_pagination_response
+)
 import os
 
 log = get_logger()
@@ -66,6 +71,8 @@ def get_notifications(current_user_id, current_user_role):
         - category: string (filter by category)
         - limit: integer (default: 100)
         - offset: integer (default: 0)
+        - cursor: opt-in keyset pagination (empty for the first page, then next_cursor)
+        - total: exact|estimate|cached|none - how the total is computed in cursor mode
     """
     try:
         unread_only = request.args.get('unread_only', 'false').lower() == 'true'
@@ -88,6 +95,26 @@ def get_notifications(current_user_id, current_user_role):
         if category:
             query = query.filter(Notification.category == category)
 
+        # Get unread count - only for this specific user (maintained counter row)
+        unread_count = get_unread_count(current_user_id)
+
+        if is_cursor_request(request):
+            cursor, page_size = get_cursor_params(request, default_page_size=100, max_page_size=500)
+            notifications, next_cursor = keyset_paginate(
+                query, Notification.created_at, Notification.id, cursor, page_size
+            )
+            total_count, total_is_estimate = count_total(query, get_total_mode(request))
+            return jsonify({
+                'success': True,
+                'notifications': [n.to_dict() for n in notifications],
+                'total': total_count,
+                'unread_count': unread_count,
+                'pagination': create_pagination_response(
+                    notifications, total_count, page_size=page_size, next_cursor=next_cursor,
+                    cursor_mode=True, total_is_estimate=total_is_estimate
+                )
+            }), 200
+
         # Order by created_at descending
         query = query.order_by(Notification.created_at.desc())
 
@@ -97,15 +124,6 @@ def get_notifications(current_user_id, current_user_role):
         # Apply pagination
         notifications = query.limit(limit).offset(offset).all()
 
-        # Get unread count - only for this specific user
-        unread_count = Notification.query.filter(
-            and_(
-                Notification.user_id == current_user_id,
-                Notification.read == False,
-                Notification.deleted_at.is_(None)
-            )
-        ).count()
-
         return jsonify({
             'success': True,
             'notifications': [n.to_dict() for n in notifications],
@@ -332,13 +350,7 @@ def unsubscribe_from_push(current_user_id, current_user_role):
 def get_notification_count(current_user_id, current_user_role):
     """Get unread notification count"""
     try:
-        unread_count = Notification.query.filter(
-            and_(
-                Notification.user_id == current_user_id,
-                Notification.read == False,
-                Notification.deleted_at.is_(None)
-            )
-        ).count()
+        unread_count = get_unread_count(current_user_id)
 
         return jsonify({
             'success': True,
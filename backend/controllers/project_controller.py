@@ -11,6 +11,8 @@ from models.boq import *
 from models.pm_assign_ss import PMAssignSS
 from config.db import db
 from models.project import Project
+from models.project_member import ROLE_PROJECT_MANAGER, ROLE_MEP_SUPERVISOR
+from utils.project_membership import project_member_filter
 from models.user import User
 from controllers.auth_controller import jwt_required
 from config.logging import get_logger
@@ -650,7 +652,7 @@ def get_assigned_projects():
             else:
                 # Regular PM: Show only THEIR projects
                 projects = Project.query.options(*eager_load_options).filter(
-                    Project.user_id.contains([user_id]),
+                    project_member_filter(user_id, ROLE_PROJECT_MANAGER),
                     Project.is_deleted == False,
                     Project.status != 'completed'
                 ).all()
@@ -669,7 +671,7 @@ def get_assigned_projects():
             else:
                 # Regular MEP: Show only THEIR projects
                 projects = Project.query.options(*eager_load_options).filter(
-                    Project.mep_supervisor_id.contains([user_id]),
+                    project_member_filter(user_id, ROLE_MEP_SUPERVISOR),
                     Project.is_deleted == False,
                     Project.status != 'completed'
                 ).all()
@@ -24,6 +24,9 @@ from flask import request, jsonify, g
 from sqlalchemy.orm import selectinload, joinedload, defer
 from config.db import db
 from models.project import Project
+from models.project_member import ROLE_PROJECT_MANAGER
+from utils.project_membership import project_member_filter
+from services.pm_dashboard_read_model import get_dashboard_snapshot
 from models.boq import *
 from models.po_child import POChild
 from models.change_request import ChangeRequest
@@ -265,8 +268,11 @@ def update_pm(user_id):
 
         # Reassign projects if provided
         if "assigned_projects" in data:
-            # First remove PM from all current projects
-            Project.query.filter_by(user_id=user_id).update({"user_id": None})
+            # First remove PM from all current projects (ORM writes keep project_members in sync)
+            for project in Project.query.filter(project_member_filter(user_id, ROLE_PROJECT_MANAGER)).all():
+                pm_ids = project.user_id if isinstance(project.user_id, list) else [project.user_id]
+                remaining = [pm_id for pm_id in pm_ids if str(pm_id) != str(user_id)]
+                project.user_id = remaining or None
 
             # Batch pre-fetch all assigned projects in one query (reused for both update + notification)
             _assigned_proj_ids = data["assigned_projects"]
@@ -2145,7 +2151,7 @@ def get_pm_assign_project():
             if pm_user_id:
                 query = query.filter(
                     and_(
-                        Project.user_id.contains([pm_user_id]),  # PM must be assigned to project
+                        project_member_filter(pm_user_id, ROLE_PROJECT_MANAGER),  # PM must be assigned to project
                         PMAssignSS.assigned_by_pm_id == pm_user_id  # PM must have made assignments
                     )
                 )
@@ -2455,7 +2461,7 @@ def get_pm_pending_boq():
             # Ensure user_id is integer for JSONB array comparison
             pm_user_id = int(user_id) if user_id else None
             if pm_user_id:
-                query = query.filter(Project.user_id.contains([pm_user_id]))
+                query = query.filter(project_member_filter(pm_user_id, ROLE_PROJECT_MANAGER))
 
                 # Create a subquery to check if PM has made ANY assignments for this BOQ
                 pm_has_assignments = exists().where(
@@ -2736,7 +2742,7 @@ def get_pm_completed_project():
 
         # PERFORMANCE: Apply role filter early
         if user_role in ['projectmanager', 'project_manager']:
-            query = query.filter(Project.user_id.contains([user_id]))
+            query = query.filter(project_member_filter(user_id, ROLE_PROJECT_MANAGER))
 
         query = query.order_by(Project.created_at.desc())
 
@@ -2815,910 +2821,925 @@ def get_pm_completed_project():
         log.error(f"Error retrieving PM completed projects: {str(e)}")
         return jsonify({'error': 'Failed to retrieve PM completed projects', 'details': str(e)}), 500
 
-def get_pm_dashboard():
+def build_pm_dashboard(filter_user_id, all_projects):
     """
-    Get COMPREHENSIVE dashboard statistics for the current user's projects
-    - Shows data based on BOQs where the PM is assigned (via last_pm_user_id)
-    - Each PM sees only their own BOQ statuses (approved, pending, rejected, completed)
-    - Admins can view all data or filter by specific PM
+    Compute the PM dashboard document (served from the read model by get_pm_dashboard)
+    - filter_user_id: PM whose BOQs, CRs and labour approvals are counted
+    - all_projects: admin general view over all projects
     """
-    try:
-        from models.pm_assign_ss import PMAssignSS
-        from models.boq import BOQ, BOQDetails
-        from models.project import Project
-        from sqlalchemy import func, case, and_, or_
-        from sqlalchemy.dialects.postgresql import JSONB
-        from sqlalchemy import cast
+    from models.pm_assign_ss import PMAssignSS
+    from models.boq import BOQ, BOQDetails
+    from models.project import Project
+    from sqlalchemy import func, case, and_, or_
+
+    # Get projects where current user is assigned as PM
+    if all_projects:
+        # Admin viewing general dashboard - show ALL projects
+        project_ids_query = db.session.query(Project.project_id).filter(
+            Project.is_deleted == False
+        )
+    else:
+        # Regular PM or admin viewing as specific PM - filter by PM's projects
+        project_ids_query = db.session.query(Project.project_id).filter(
+            Project.is_deleted == False,
+            project_member_filter(filter_user_id, ROLE_PROJECT_MANAGER)
+        )
 
-        current_user = g.user
-        user_id = current_user['user_id']
-        user_role = current_user.get('role', '').lower()
+    project_ids = [row[0] for row in project_ids_query.all()]
 
-        # Check if admin is viewing as a specific PM (from query params or context)
-        viewing_as_pm_id = request.args.get('viewing_as_pm_id', type=int)
+    # For admin viewing general PM dashboard, include ALL projects with PM-assigned BOQs
+    if all_projects:
+        # Admin: Find ALL projects that have ANY BOQs with last_pm_user_id set
+        # EVEN IF PROJECT IS DELETED - we still want to count those BOQs
+        projects_with_any_pm_boqs = db.session.query(
+            Project.project_id, Project.project_name, Project.is_deleted
+        ).join(BOQ, Project.project_id == BOQ.project_id).filter(
+            BOQ.last_pm_user_id.isnot(None),
+            BOQ.is_deleted == False
+        ).distinct().all()
+
+        missing_projects = []
+        for p in projects_with_any_pm_boqs:
+            in_list = p.project_id in project_ids
+            if not in_list:
+                missing_projects.append(p.project_id)
+
+        if missing_projects:
+            project_ids.extend(missing_projects)
+    else:
+        # Regular PM: Find projects that have BOQs assigned to this specific PM
+        projects_with_pm_boqs = db.session.query(
+            Project.project_id, Project.project_name, Project.user_id, Project.is_deleted
+        ).join(BOQ, Project.project_id == BOQ.project_id).filter(
+            BOQ.last_pm_user_id == filter_user_id,
+            BOQ.is_deleted == False
+        ).distinct().all()
 
-        # Determine the filter user ID
-        filter_user_id = viewing_as_pm_id if (user_role == 'admin' and viewing_as_pm_id) else user_id
+        missing_projects = []
+        for p in projects_with_pm_boqs:
+            in_list = p.project_id in project_ids
+            if not in_list and not p.is_deleted:
+                missing_projects.append(p.project_id)
 
-        # Get projects where current user is assigned as PM
-        if user_role == 'admin' and not viewing_as_pm_id:
-            # Admin viewing general dashboard - show ALL projects
-            project_ids_query = db.session.query(Project.project_id).filter(
-                Project.is_deleted == False
-            )
-        else:
-            # Regular PM or admin viewing as specific PM - filter by PM's projects
-            project_ids_query = db.session.query(Project.project_id).filter(
-                Project.is_deleted == False,
-                Project.user_id.op('@>')(cast([filter_user_id], JSONB))
-            )
+        if missing_projects:
+            project_ids.extend(missing_projects)
 
-        project_ids = [row[0] for row in project_ids_query.all()]
-
-        # For admin viewing general PM dashboard, include ALL projects with PM-assigned BOQs
-        if user_role == 'admin' and not viewing_as_pm_id:
-            # Admin: Find ALL projects that have ANY BOQs with last_pm_user_id set
-            # EVEN IF PROJECT IS DELETED - we still want to count those BOQs
-            projects_with_any_pm_boqs = db.session.query(
-                Project.project_id, Project.project_name, Project.is_deleted
-            ).join(BOQ, Project.project_id == BOQ.project_id).filter(
-                BOQ.last_pm_user_id.isnot(None),
-                BOQ.is_deleted == False
-            ).distinct().all()
-
-            missing_projects = []
-            for p in projects_with_any_pm_boqs:
-                in_list = p.project_id in project_ids
-                if not in_list:
-                    missing_projects.append(p.project_id)
-
-            if missing_projects:
-                project_ids.extend(missing_projects)
-        else:
-            # Regular PM: Find projects that have BOQs assigned to this specific PM
-            projects_with_pm_boqs = db.session.query(
-                Project.project_id, Project.project_name, Project.user_id, Project.is_deleted
-            ).join(BOQ, Project.project_id == BOQ.project_id).filter(
-                BOQ.last_pm_user_id == filter_user_id,
-                BOQ.is_deleted == False
-            ).distinct().all()
-
-            missing_projects = []
-            for p in projects_with_pm_boqs:
-                in_list = p.project_id in project_ids
-                if not in_list and not p.is_deleted:
-                    missing_projects.append(p.project_id)
-
-            if missing_projects:
-                project_ids.extend(missing_projects)
-
-        if not project_ids:
-            return jsonify({
-                "success": True,
-                "stats": {
-                    "total_boq_items": 0,
-                    "items_assigned": 0,
-                    "pending_assignment": 0,
-                    "total_project_value": 0
-                },
-                "boq_status": {
-                    "for_approval": 0,
-                    "pending": 0,
-                    "assigned": 0,
-                    "approved": 0,
-                    "rejected": 0,
-                    "completed": 0
-                },
-                "items_breakdown": {
-                    "materials": 0,
-                    "labour": 0
-                },
-                "recent_activities": [],
-                "projects": []
-            }), 200
+    if not project_ids:
+        return {
+            "success": True,
+            "stats": {
+                "total_boq_items": 0,
+                "items_assigned": 0,
+                "pending_assignment": 0,
+                "total_project_value": 0
+            },
+            "boq_status": {
+                "for_approval": 0,
+                "pending": 0,
+                "assigned": 0,
+                "approved": 0,
+                "rejected": 0,
+                "completed": 0
+            },
+            "items_breakdown": {
+                "materials": 0,
+                "labour": 0
+            },
+            "recent_activities": [],
+            "projects": []
+        }
 
-        # OPTIMIZED: Single aggregated query for BOQ details statistics
-        # PM sees ALL BOQs in their assigned projects (not just BOQs where they are last_pm_user_id)
-        # This gives the PM a complete view of all work in their projects
-        boq_stats = db.session.query(
-            func.coalesce(func.sum(BOQDetails.total_items), 0).label('total_items'),
-            func.coalesce(func.sum(BOQDetails.total_materials), 0).label('total_materials'),
-            func.coalesce(func.sum(BOQDetails.total_labour), 0).label('total_labour'),
-            func.coalesce(func.sum(BOQDetails.total_cost), 0).label('total_cost')
-        ).join(BOQ, BOQDetails.boq_id == BOQ.boq_id).filter(
+    # OPTIMIZED: Single aggregated query for BOQ details statistics
+    # PM sees ALL BOQs in their assigned projects (not just BOQs where they are last_pm_user_id)
+    # This gives the PM a complete view of all work in their projects
+    boq_stats = db.session.query(
+        func.coalesce(func.sum(BOQDetails.total_items), 0).label('total_items'),
+        func.coalesce(func.sum(BOQDetails.total_materials), 0).label('total_materials'),
+        func.coalesce(func.sum(BOQDetails.total_labour), 0).label('total_labour'),
+        func.coalesce(func.sum(BOQDetails.total_cost), 0).label('total_cost')
+    ).join(BOQ, BOQDetails.boq_id == BOQ.boq_id).filter(
+        BOQ.project_id.in_(project_ids),
+        BOQ.is_deleted == False,
+        BOQDetails.is_deleted == False
+    ).first()
+
+    total_boq_items = int(boq_stats.total_items) if boq_stats else 0
+    total_materials = int(boq_stats.total_materials) if boq_stats else 0
+    total_labour = int(boq_stats.total_labour) if boq_stats else 0
+    total_project_value = float(boq_stats.total_cost) if boq_stats else 0.0
+
+    # OPTIMIZED: Single query for BOQ status counts
+    # Status categorization matching the tab logic EXACTLY:
+    # - for_approval: BOQs with status = 'Pending_PM_Approval' where last_pm_user_id = current PM
+    # - pending: BOQs with status in ['approved', 'Approved'] OR (status='items_assigned' AND PM has no assignments)
+    # - assigned: BOQs with status = 'items_assigned' where PM has made assignments (count from PMAssignSS)
+    # - approved: BOQs where last_pm_user_id = current PM (all BOQs assigned to this PM)
+    # - rejected: BOQs with status = 'PM_Rejected' where last_pm_user_id = current PM
+    # - completed: Projects with status containing 'completed'
+
+    if all_projects:
+        # Admin sees all BOQs across all projects
+        status_counts = db.session.query(
+            # For Approval: BOQs with Pending_PM_Approval status
+            func.sum(case(
+                (BOQ.status == 'Pending_PM_Approval', 1),
+                else_=0
+            )).label('for_approval'),
+            # Pending: BOQs with approved/Approved status
+            func.sum(case(
+                (BOQ.status.in_(['approved', 'Approved']), 1),
+                else_=0
+            )).label('pending'),
+            # Assigned: BOQs with items_assigned status
+            func.sum(case(
+                (BOQ.status == 'items_assigned', 1),
+                else_=0
+            )).label('assigned'),
+            # Approved: For admin, count ALL BOQs (matches "Approved" tab logic at line 2196)
+            # The /pm_approve_boq endpoint returns ALL BOQs for admin (no filter)
+            func.count(BOQ.boq_id).label('approved'),
+            # Rejected: BOQs with PM_Rejected status
+            func.sum(case(
+                (BOQ.status == 'PM_Rejected', 1),
+                else_=0
+            )).label('rejected'),
+            # Completed: BOQs with completed status
+            func.sum(case(
+                (BOQ.status.ilike('%completed%'), 1),
+                else_=0
+            )).label('completed')
+        ).filter(
             BOQ.project_id.in_(project_ids),
-            BOQ.is_deleted == False,
-            BOQDetails.is_deleted == False
+            BOQ.is_deleted == False
         ).first()
+    else:
+        # Regular PM sees only their assigned BOQs
+        # Count BOQs where PM has made assignments using PMAssignSS
+        from models.pm_assign_ss import PMAssignSS
 
-        total_boq_items = int(boq_stats.total_items) if boq_stats else 0
-        total_materials = int(boq_stats.total_materials) if boq_stats else 0
-        total_labour = int(boq_stats.total_labour) if boq_stats else 0
-        total_project_value = float(boq_stats.total_cost) if boq_stats else 0.0
-
-        # OPTIMIZED: Single query for BOQ status counts
-        # Status categorization matching the tab logic EXACTLY:
-        # - for_approval: BOQs with status = 'Pending_PM_Approval' where last_pm_user_id = current PM
-        # - pending: BOQs with status in ['approved', 'Approved'] OR (status='items_assigned' AND PM has no assignments)
-        # - assigned: BOQs with status = 'items_assigned' where PM has made assignments (count from PMAssignSS)
-        # - approved: BOQs where last_pm_user_id = current PM (all BOQs assigned to this PM)
-        # - rejected: BOQs with status = 'PM_Rejected' where last_pm_user_id = current PM
-        # - completed: Projects with status containing 'completed'
-
-        if user_role == 'admin' and not viewing_as_pm_id:
-            # Admin sees all BOQs across all projects
-            status_counts = db.session.query(
-                # For Approval: BOQs with Pending_PM_Approval status
-                func.sum(case(
-                    (BOQ.status == 'Pending_PM_Approval', 1),
-                    else_=0
-                )).label('for_approval'),
-                # Pending: BOQs with approved/Approved status
-                func.sum(case(
-                    (BOQ.status.in_(['approved', 'Approved']), 1),
-                    else_=0
-                )).label('pending'),
-                # Assigned: BOQs with items_assigned status
-                func.sum(case(
-                    (BOQ.status == 'items_assigned', 1),
-                    else_=0
-                )).label('assigned'),
-                # Approved: For admin, count ALL BOQs (matches "Approved" tab logic at line 2196)
-                # The /pm_approve_boq endpoint returns ALL BOQs for admin (no filter)
-                func.count(BOQ.boq_id).label('approved'),
-                # Rejected: BOQs with PM_Rejected status
-                func.sum(case(
-                    (BOQ.status == 'PM_Rejected', 1),
-                    else_=0
-                )).label('rejected'),
-                # Completed: BOQs with completed status
-                func.sum(case(
-                    (BOQ.status.ilike('%completed%'), 1),
-                    else_=0
-                )).label('completed')
-            ).filter(
-                BOQ.project_id.in_(project_ids),
-                BOQ.is_deleted == False
-            ).first()
-        else:
-            # Regular PM sees only their assigned BOQs
-            # Count BOQs where PM has made assignments using PMAssignSS
-            from models.pm_assign_ss import PMAssignSS
-
-            # Subquery to check if PM has assignments for a BOQ
-            pm_has_assignments_subquery = (
-                db.session.query(PMAssignSS.boq_id)
-                .filter(
-                    PMAssignSS.assigned_by_pm_id == filter_user_id,
-                    PMAssignSS.is_deleted == False
-                )
-                .distinct()
-                .subquery()
+        # Subquery to check if PM has assignments for a BOQ
+        pm_has_assignments_subquery = (
+            db.session.query(PMAssignSS.boq_id)
+            .filter(
+                PMAssignSS.assigned_by_pm_id == filter_user_id,
+                PMAssignSS.is_deleted == False
             )
+            .distinct()
+            .subquery()
+        )
 
-            status_counts = db.session.query(
-                # For Approval: BOQs with Pending_PM_Approval status assigned to this PM
-                func.sum(case(
-                    (and_(
-                        BOQ.status == 'Pending_PM_Approval',
-                        BOQ.last_pm_user_id == filter_user_id
-                    ), 1),
-                    else_=0
-                )).label('for_approval'),
-                # Pending: BOQs with status 'approved/Approved' in PM's projects
-                # OR status 'items_assigned' where PM has NOT made assignments yet
-                func.sum(case(
-                    (or_(
-                        BOQ.status.in_(['approved', 'Approved']),
-                        and_(
-                            BOQ.status == 'items_assigned',
-                            BOQ.boq_id.notin_(db.session.query(pm_has_assignments_subquery.c.boq_id))
-                        )
-                    ), 1),
-                    else_=0
-                )).label('pending'),
-                # Assigned: BOQs with status 'items_assigned' where PM HAS made assignments
-                func.sum(case(
-                    (and_(
+        status_counts = db.session.query(
+            # For Approval: BOQs with Pending_PM_Approval status assigned to this PM
+            func.sum(case(
+                (and_(
+                    BOQ.status == 'Pending_PM_Approval',
+                    BOQ.last_pm_user_id == filter_user_id
+                ), 1),
+                else_=0
+            )).label('for_approval'),
+            # Pending: BOQs with status 'approved/Approved' in PM's projects
+            # OR status 'items_assigned' where PM has NOT made assignments yet
+            func.sum(case(
+                (or_(
+                    BOQ.status.in_(['approved', 'Approved']),
+                    and_(
                         BOQ.status == 'items_assigned',
-                        BOQ.boq_id.in_(db.session.query(pm_has_assignments_subquery.c.boq_id))
-                    ), 1),
-                    else_=0
-                )).label('assigned'),
-                # Approved: ALL BOQs where last_pm_user_id = current PM (matches "Approved" tab)
-                func.sum(case(
-                    (BOQ.last_pm_user_id == filter_user_id, 1),
-                    else_=0
-                )).label('approved'),
-                # Rejected: BOQs with PM_Rejected status where last_pm_user_id = current PM
-                func.sum(case(
-                    (and_(
-                        BOQ.status == 'PM_Rejected',
-                        BOQ.last_pm_user_id == filter_user_id
-                    ), 1),
-                    else_=0
-                )).label('rejected'),
-                # Completed: Projects with completed status (checked at project level)
-                func.sum(case(
-                    (and_(
-                        BOQ.status.ilike('%completed%'),
-                        or_(
-                            BOQ.last_pm_user_id == filter_user_id,
-                            BOQ.last_pm_user_id == None
-                        )
-                    ), 1),
-                    else_=0
-                )).label('completed')
-            ).filter(
-                BOQ.project_id.in_(project_ids),
-                BOQ.is_deleted == False
-            ).first()
-
-        boq_status_counts = {
-            "for_approval": int(status_counts.for_approval) if status_counts.for_approval else 0,
-            "pending": int(status_counts.pending) if status_counts.pending else 0,
-            "assigned": int(status_counts.assigned) if status_counts.assigned else 0,
-            "approved": int(status_counts.approved) if status_counts.approved else 0,
-            "rejected": int(status_counts.rejected) if status_counts.rejected else 0,
-            "completed": int(status_counts.completed) if status_counts.completed else 0
-        }
-
-        # OPTIMIZED: Count assigned items using sum of cardinality (array length)
-        # Count ALL items assigned to Site Engineers in PM's projects
-        items_assigned_result = db.session.query(
-            func.coalesce(func.sum(func.cardinality(PMAssignSS.item_indices)), 0)
-        ).join(BOQ, PMAssignSS.boq_id == BOQ.boq_id).filter(
-            BOQ.project_id.in_(project_ids),
-            PMAssignSS.is_deleted == False
-        ).scalar()
-
-        items_assigned = int(items_assigned_result) if items_assigned_result else 0
-        pending_assignment = max(0, total_boq_items - items_assigned)
-
-        # OPTIMIZED: Single query for recent activities with join
-        # Show all recent BOQ activities in PM's projects
-        recent_activities_data = db.session.query(
-            BOQ.boq_id,
-            BOQ.boq_name,
-            BOQ.status,
-            BOQ.last_modified_at,
-            Project.project_name
-        ).join(Project, BOQ.project_id == Project.project_id).filter(
+                        BOQ.boq_id.notin_(db.session.query(pm_has_assignments_subquery.c.boq_id))
+                    )
+                ), 1),
+                else_=0
+            )).label('pending'),
+            # Assigned: BOQs with status 'items_assigned' where PM HAS made assignments
+            func.sum(case(
+                (and_(
+                    BOQ.status == 'items_assigned',
+                    BOQ.boq_id.in_(db.session.query(pm_has_assignments_subquery.c.boq_id))
+                ), 1),
+                else_=0
+            )).label('assigned'),
+            # Approved: ALL BOQs where last_pm_user_id = current PM (matches "Approved" tab)
+            func.sum(case(
+                (BOQ.last_pm_user_id == filter_user_id, 1),
+                else_=0
+            )).label('approved'),
+            # Rejected: BOQs with PM_Rejected status where last_pm_user_id = current PM
+            func.sum(case(
+                (and_(
+                    BOQ.status == 'PM_Rejected',
+                    BOQ.last_pm_user_id == filter_user_id
+                ), 1),
+                else_=0
+            )).label('rejected'),
+            # Completed: Projects with completed status (checked at project level)
+            func.sum(case(
+                (and_(
+                    BOQ.status.ilike('%completed%'),
+                    or_(
+                        BOQ.last_pm_user_id == filter_user_id,
+                        BOQ.last_pm_user_id == None
+                    )
+                ), 1),
+                else_=0
+            )).label('completed')
+        ).filter(
             BOQ.project_id.in_(project_ids),
             BOQ.is_deleted == False
-        ).order_by(BOQ.last_modified_at.desc()).limit(10).all()
-
-        recent_activities = [
-            {
-                "boq_id": row.boq_id,
-                "boq_name": row.boq_name,
-                "project_name": row.project_name,
-                "status": row.status,
-                "last_modified": row.last_modified_at.isoformat() if row.last_modified_at else None
-            }
-            for row in recent_activities_data
-        ]
+        ).first()
 
-        # Get projects with progress calculation
-        projects_data = []
-        if project_ids:
-            projects_query = Project.query.filter(
-                Project.project_id.in_(project_ids),
-                Project.is_deleted == False
-            ).all()
+    boq_status_counts = {
+        "for_approval": int(status_counts.for_approval) if status_counts.for_approval else 0,
+        "pending": int(status_counts.pending) if status_counts.pending else 0,
+        "assigned": int(status_counts.assigned) if status_counts.assigned else 0,
+        "approved": int(status_counts.approved) if status_counts.approved else 0,
+        "rejected": int(status_counts.rejected) if status_counts.rejected else 0,
+        "completed": int(status_counts.completed) if status_counts.completed else 0
+    }
+
+    # OPTIMIZED: Count assigned items using sum of cardinality (array length)
+    # Count ALL items assigned to Site Engineers in PM's projects
+    items_assigned_result = db.session.query(
+        func.coalesce(func.sum(func.cardinality(PMAssignSS.item_indices)), 0)
+    ).join(BOQ, PMAssignSS.boq_id == BOQ.boq_id).filter(
+        BOQ.project_id.in_(project_ids),
+        PMAssignSS.is_deleted == False
+    ).scalar()
+
+    items_assigned = int(items_assigned_result) if items_assigned_result else 0
+    pending_assignment = max(0, total_boq_items - items_assigned)
+
+    # OPTIMIZED: Single query for recent activities with join
+    # Show all recent BOQ activities in PM's projects
+    recent_activities_data = db.session.query(
+        BOQ.boq_id,
+        BOQ.boq_name,
+        BOQ.status,
+        BOQ.last_modified_at,
+        Project.project_name
+    ).join(Project, BOQ.project_id == Project.project_id).filter(
+        BOQ.project_id.in_(project_ids),
+        BOQ.is_deleted == False
+    ).order_by(BOQ.last_modified_at.desc()).limit(10).all()
+
+    recent_activities = [
+        {
+            "boq_id": row.boq_id,
+            "boq_name": row.boq_name,
+            "project_name": row.project_name,
+            "status": row.status,
+            "last_modified": row.last_modified_at.isoformat() if row.last_modified_at else None
+        }
+        for row in recent_activities_data
+    ]
 
-            # Batch pre-fetch all BOQs for all projects — avoid N+1 (one query per project)
-            _progress_project_ids = [p.project_id for p in projects_query]
-            _all_progress_boqs = BOQ.query.filter(
-                BOQ.project_id.in_(_progress_project_ids),
-                BOQ.is_deleted == False
-            ).all() if _progress_project_ids else []
-            _boqs_by_project = {}
-            for _b in _all_progress_boqs:
-                _boqs_by_project.setdefault(_b.project_id, []).append(_b)
-
-            for project in projects_query:
-                # Calculate progress based on ALL BOQs in the project (pre-fetched)
-                project_boqs = _boqs_by_project.get(project.project_id, [])
-
-                total_boqs = len(project_boqs)
-                if total_boqs > 0:
-                    # Count BOQs by progress stage
-                    # completed: 100%
-                    # items_assigned: 75% (work in progress)
-                    # approved/sent_for_confirmation/revision_approved: 50% (approved but not started)
-                    # pending/revision: 25%
-                    # draft: 0%
-                    progress_sum = 0
-                    for b in project_boqs:
-                        status_lower = (b.status or '').lower()
-                        if 'completed' in status_lower:
-                            progress_sum += 100
-                        elif 'items_assigned' in status_lower:
-                            progress_sum += 75
-                        elif 'approved' in status_lower or 'sent_for_confirmation' in status_lower:
-                            progress_sum += 50
-                        elif 'pending' in status_lower or 'revision' in status_lower:
-                            progress_sum += 25
-                        # draft = 0, no addition needed
-                    progress = int(progress_sum / total_boqs)
-                    progress = min(progress, 100)  # Cap at 100%
-                else:
-                    progress = 0
+    # Get projects with progress calculation
+    projects_data = []
+    if project_ids:
+        projects_query = Project.query.filter(
+            Project.project_id.in_(project_ids),
+            Project.is_deleted == False
+        ).all()
 
-                projects_data.append({
-                    "project_id": project.project_id,
-                    "project_name": project.project_name,
-                    "status": project.status,
-                    "progress": progress
-                })
+        # Batch pre-fetch all BOQs for all projects — avoid N+1 (one query per project)
+        _progress_project_ids = [p.project_id for p in projects_query]
+        _all_progress_boqs = BOQ.query.filter(
+            BOQ.project_id.in_(_progress_project_ids),
+            BOQ.is_deleted == False
+        ).all() if _progress_project_ids else []
+        _boqs_by_project = {}
+        for _b in _all_progress_boqs:
+            _boqs_by_project.setdefault(_b.project_id, []).append(_b)
+
+        for project in projects_query:
+            # Calculate progress based on ALL BOQs in the project (pre-fetched)
+            project_boqs = _boqs_by_project.get(project.project_id, [])
+
+            total_boqs = len(project_boqs)
+            if total_boqs > 0:
+                # Count BOQs by progress stage
+                # completed: 100%
+                # items_assigned: 75% (work in progress)
+                # approved/sent_for_confirmation/revision_approved: 50% (approved but not started)
+                # pending/revision: 25%
+                # draft: 0%
+                progress_sum = 0
+                for b in project_boqs:
+                    status_lower = (b.status or '').lower()
+                    if 'completed' in status_lower:
+                        progress_sum += 100
+                    elif 'items_assigned' in status_lower:
+                        progress_sum += 75
+                    elif 'approved' in status_lower or 'sent_for_confirmation' in status_lower:
+                        progress_sum += 50
+                    elif 'pending' in status_lower or 'revision' in status_lower:
+                        progress_sum += 25
+                    # draft = 0, no addition needed
+                progress = int(progress_sum / total_boqs)
+                progress = min(progress, 100)  # Cap at 100%
+            else:
+                progress = 0
 
-        # Build base query filters for ChangeRequests
-        cr_filters = [
-            ChangeRequest.project_id.in_(project_ids),
-            ChangeRequest.is_deleted == False
-        ]
+            projects_data.append({
+                "project_id": project.project_id,
+                "project_name": project.project_name,
+                "status": project.status,
+                "progress": progress
+            })
 
-        # Get PM's own projects for filtering
-        pm_project_ids = project_ids
-
-        # Filter logic matching get_all_change_requests() controller
-        if user_role == 'admin' and not viewing_as_pm_id:
-            # Admin viewing general dashboard - show all PM-created requests in all projects
-            # Include: Admin/PM created requests OR SE/SS requests that are NOT pending
-            from sqlalchemy import func as sql_func
-            cr_filters.append(
-                or_(
-                    # Admin or PM created (any status)
-                    sql_func.lower(ChangeRequest.requested_by_role).in_(['admin', 'projectmanager', 'project_manager', 'pm']),
-                    # SE/SS created but sent for review (not pending drafts)
-                    and_(
-                        sql_func.lower(ChangeRequest.requested_by_role).in_(['siteengineer', 'site_engineer', 'sitesupervisor', 'site_supervisor']),
-                        ChangeRequest.status != 'pending'
-                    )
+    # Build base query filters for ChangeRequests
+    cr_filters = [
+        ChangeRequest.project_id.in_(project_ids),
+        ChangeRequest.is_deleted == False
+    ]
+
+    # Get PM's own projects for filtering
+    pm_project_ids = project_ids
+
+    # Filter logic matching get_all_change_requests() controller
+    if all_projects:
+        # Admin viewing general dashboard - show all PM-created requests in all projects
+        # Include: Admin/PM created requests OR SE/SS requests that are NOT pending
+        from sqlalchemy import func as sql_func
+        cr_filters.append(
+            or_(
+                # Admin or PM created (any status)
+                sql_func.lower(ChangeRequest.requested_by_role).in_(['admin', 'projectmanager', 'project_manager', 'pm']),
+                # SE/SS created but sent for review (not pending drafts)
+                and_(
+                    sql_func.lower(ChangeRequest.requested_by_role).in_(['siteengineer', 'site_engineer', 'sitesupervisor', 'site_supervisor']),
+                    ChangeRequest.status != 'pending'
                 )
             )
-        else:
-            # Regular PM or admin viewing as specific PM
-            # Match the EXACT logic from get_all_change_requests() controller (lines 1143-1186)
-            from sqlalchemy import func as sql_func
-
-            # Define status filters - use CR_CONFIG to include 'rejected' status
-            approved_status_filter = ChangeRequest.status.in_(CR_CONFIG.APPROVED_WORKFLOW_STATUSES)
-
-            # PM role filter (pending/pm_request requests)
-            pm_role_filter = and_(
-                sql_func.lower(ChangeRequest.requested_by_role).in_(['projectmanager', 'project_manager', 'pm']),
-                ChangeRequest.status.in_(['pending', 'pm_request'])
-            )
-
-            # Admin-created requests
-            admin_created_filter = sql_func.lower(ChangeRequest.requested_by_role) == 'admin'
+        )
+    else:
+        # Regular PM or admin viewing as specific PM
+        # Match the EXACT logic from get_all_change_requests() controller (lines 1143-1186)
+        from sqlalchemy import func as sql_func
+
+        # Define status filters - use CR_CONFIG to include 'rejected' status
+        approved_status_filter = ChangeRequest.status.in_(CR_CONFIG.APPROVED_WORKFLOW_STATUSES)
+
+        # PM role filter (pending/pm_request requests)
+        pm_role_filter = and_(
+            sql_func.lower(ChangeRequest.requested_by_role).in_(['projectmanager', 'project_manager', 'pm']),
+            ChangeRequest.status.in_(['pending', 'pm_request'])
+        )
 
-            # SE requests sent to this PM
-            send_to_pm_filter = and_(
-                ChangeRequest.status == 'send_to_pm',
-                ChangeRequest.assigned_to_pm_user_id == filter_user_id
-            )
+        # Admin-created requests
+        admin_created_filter = sql_func.lower(ChangeRequest.requested_by_role) == 'admin'
 
-            # SE-originated requests assigned to this PM (approved/completed)
-            se_originated_assigned_to_this_pm = and_(
-                ChangeRequest.assigned_to_pm_user_id == filter_user_id,
-                approved_status_filter
-            )
+        # SE requests sent to this PM
+        send_to_pm_filter = and_(
+            ChangeRequest.status == 'send_to_pm',
+            ChangeRequest.assigned_to_pm_user_id == filter_user_id
+        )
 
-            # PM/Admin originated approved requests (not SE-originated)
-            pm_originated_approved = and_(
-                approved_status_filter,
-                sql_func.lower(ChangeRequest.requested_by_role).in_(['projectmanager', 'project_manager', 'pm', 'admin']),
-                ChangeRequest.assigned_to_pm_user_id.is_(None)
-            )
+        # SE-originated requests assigned to this PM (approved/completed)
+        se_originated_assigned_to_this_pm = and_(
+            ChangeRequest.assigned_to_pm_user_id == filter_user_id,
+            approved_status_filter
+        )
 
-            # Requests approved by this PM
-            pm_approved_by_this_user = ChangeRequest.pm_approved_by_user_id == filter_user_id
+        # PM/Admin originated approved requests (not SE-originated)
+        pm_originated_approved = and_(
+            approved_status_filter,
+            sql_func.lower(ChangeRequest.requested_by_role).in_(['projectmanager', 'project_manager', 'pm', 'admin']),
+            ChangeRequest.assigned_to_pm_user_id.is_(None)
+        )
 
-            cr_filters.append(
-                or_(
-                    # 1. PM's pending requests from their projects
-                    and_(
-                        ChangeRequest.project_id.in_(pm_project_ids),
-                        pm_role_filter
-                    ),
-                    # 2. Admin-created requests from PM's projects (any status)
-                    and_(
-                        ChangeRequest.project_id.in_(pm_project_ids),
-                        admin_created_filter
-                    ),
-                    # 3. SE requests sent to this PM
-                    and_(
-                        ChangeRequest.project_id.in_(pm_project_ids),
-                        send_to_pm_filter
-                    ),
-                    # 4. SE-originated approved requests assigned to this PM
-                    and_(
-                        ChangeRequest.project_id.in_(pm_project_ids),
-                        se_originated_assigned_to_this_pm
-                    ),
-                    # 5. PM/Admin originated approved requests from PM's projects
-                    and_(
-                        ChangeRequest.project_id.in_(pm_project_ids),
-                        pm_originated_approved
-                    ),
-                    # 6. Requests approved by this PM
-                    pm_approved_by_this_user,
-                    # 7. Own requests (any status, any project)
-                    ChangeRequest.requested_by_user_id == filter_user_id
-                )
+        # Requests approved by this PM
+        pm_approved_by_this_user = ChangeRequest.pm_approved_by_user_id == filter_user_id
+
+        cr_filters.append(
+            or_(
+                # 1. PM's pending requests from their projects
+                and_(
+                    ChangeRequest.project_id.in_(pm_project_ids),
+                    pm_role_filter
+                ),
+                # 2. Admin-created requests from PM's projects (any status)
+                and_(
+                    ChangeRequest.project_id.in_(pm_project_ids),
+                    admin_created_filter
+                ),
+                # 3. SE requests sent to this PM
+                and_(
+                    ChangeRequest.project_id.in_(pm_project_ids),
+                    send_to_pm_filter
+                ),
+                # 4. SE-originated approved requests assigned to this PM
+                and_(
+                    ChangeRequest.project_id.in_(pm_project_ids),
+                    se_originated_assigned_to_this_pm
+                ),
+                # 5. PM/Admin originated approved requests from PM's projects
+                and_(
+                    ChangeRequest.project_id.in_(pm_project_ids),
+                    pm_originated_approved
+                ),
+                # 6. Requests approved by this PM
+                pm_approved_by_this_user,
+                # 7. Own requests (any status, any project)
+                ChangeRequest.requested_by_user_id == filter_user_id
             )
+        )
 
-        # Count unique ChangeRequests by status (matching frontend tabs)
-        po_status_counts = db.session.query(
-            # Sent to Buyer: 'under_review' with approval_required_from='buyer' OR 'assigned_to_buyer'
-            func.count(func.distinct(case(
-                (or_(
-                    and_(ChangeRequest.status == 'under_review', ChangeRequest.approval_required_from == 'buyer'),
-                    ChangeRequest.status == 'assigned_to_buyer'
-                ), ChangeRequest.cr_id),
-                else_=None
-            ))).label('sent_to_buyer'),
-            # SE Requested: send_to_pm, send_to_mep (SE-initiated requests waiting for approval)
-            func.count(func.distinct(case(
-                (ChangeRequest.status.in_(['send_to_pm', 'send_to_mep']), ChangeRequest.cr_id),
-                else_=None
-            ))).label('se_requested'),
-            # Completed: purchase_completed OR routed_to_store
-            func.count(func.distinct(case(
-                (ChangeRequest.status.in_(['purchase_completed', 'routed_to_store']), ChangeRequest.cr_id),
-                else_=None
-            ))).label('completed'),
-            # Rejected: status = 'rejected'
-            func.count(func.distinct(case(
-                (ChangeRequest.status == 'rejected', ChangeRequest.cr_id),
-                else_=None
-            ))).label('rejected')
+    # Count unique ChangeRequests by status (matching frontend tabs)
+    po_status_counts = db.session.query(
+        # Sent to Buyer: 'under_review' with approval_required_from='buyer' OR 'assigned_to_buyer'
+        func.count(func.distinct(case(
+            (or_(
+                and_(ChangeRequest.status == 'under_review', ChangeRequest.approval_required_from == 'buyer'),
+                ChangeRequest.status == 'assigned_to_buyer'
+            ), ChangeRequest.cr_id),
+            else_=None
+        ))).label('sent_to_buyer'),
+        # SE Requested: send_to_pm, send_to_mep (SE-initiated requests waiting for approval)
+        func.count(func.distinct(case(
+            (ChangeRequest.status.in_(['send_to_pm', 'send_to_mep']), ChangeRequest.cr_id),
+            else_=None
+        ))).label('se_requested'),
+        # Completed: purchase_completed OR routed_to_store
+        func.count(func.distinct(case(
+            (ChangeRequest.status.in_(['purchase_completed', 'routed_to_store']), ChangeRequest.cr_id),
+            else_=None
+        ))).label('completed'),
+        # Rejected: status = 'rejected'
+        func.count(func.distinct(case(
+            (ChangeRequest.status == 'rejected', ChangeRequest.cr_id),
+            else_=None
+        ))).label('rejected')
+    ).filter(
+        *cr_filters
+    ).first()
+
+    purchase_order_status = {
+        "sent_to_buyer": int(po_status_counts.sent_to_buyer) if po_status_counts.sent_to_buyer else 0,
+        "se_requested": int(po_status_counts.se_requested) if po_status_counts.se_requested else 0,
+        "completed": int(po_status_counts.completed) if po_status_counts.completed else 0,
+        "rejected": int(po_status_counts.rejected) if po_status_counts.rejected else 0
+    }
+
+    is_admin_general_view = all_projects
+
+    if is_admin_general_view:
+        # Admin viewing general dashboard - show ALL labour data
+        labour_req_counts = db.session.query(
+            func.sum(case((LabourRequisition.status == 'send_to_pm', 1), else_=0)).label('req_pending'),
+            func.sum(case((LabourRequisition.status == 'approved', 1), else_=0)).label('req_approved'),
+            func.sum(case((LabourRequisition.status == 'rejected', 1), else_=0)).label('req_rejected')
         ).filter(
-            *cr_filters
+            LabourRequisition.is_deleted == False
         ).first()
+    else:
+        # Regular PM or admin viewing as specific PM - filter by PM's context
+        # Pending: Requisitions awaiting this PM's action (send_to_pm status in their projects)
+        req_pending_count = db.session.query(func.count(LabourRequisition.requisition_id)).filter(
+            LabourRequisition.project_id.in_(project_ids) if project_ids else LabourRequisition.project_id == -1,
+            LabourRequisition.status == 'send_to_pm',
+            LabourRequisition.is_deleted == False
+        ).scalar() or 0
 
-        purchase_order_status = {
-            "sent_to_buyer": int(po_status_counts.sent_to_buyer) if po_status_counts.sent_to_buyer else 0,
-            "se_requested": int(po_status_counts.se_requested) if po_status_counts.se_requested else 0,
-            "completed": int(po_status_counts.completed) if po_status_counts.completed else 0,
-            "rejected": int(po_status_counts.rejected) if po_status_counts.rejected else 0
-        }
-
-        is_admin_general_view = user_role == 'admin' and not viewing_as_pm_id
-
-        if is_admin_general_view:
-            # Admin viewing general dashboard - show ALL labour data
-            labour_req_counts = db.session.query(
-                func.sum(case((LabourRequisition.status == 'send_to_pm', 1), else_=0)).label('req_pending'),
-                func.sum(case((LabourRequisition.status == 'approved', 1), else_=0)).label('req_approved'),
-                func.sum(case((LabourRequisition.status == 'rejected', 1), else_=0)).label('req_rejected')
-            ).filter(
-                LabourRequisition.is_deleted == False
-            ).first()
-        else:
-            # Regular PM or admin viewing as specific PM - filter by PM's context
-            # Pending: Requisitions awaiting this PM's action (send_to_pm status in their projects)
-            req_pending_count = db.session.query(func.count(LabourRequisition.requisition_id)).filter(
-                LabourRequisition.project_id.in_(project_ids) if project_ids else LabourRequisition.project_id == -1,
-                LabourRequisition.status == 'send_to_pm',
-                LabourRequisition.is_deleted == False
-            ).scalar() or 0
-
-            # Approved/Rejected: Only requisitions actioned BY this PM
-            req_approved_count = db.session.query(func.count(LabourRequisition.requisition_id)).filter(
-                LabourRequisition.approved_by_user_id == filter_user_id,
-                LabourRequisition.status == 'approved',
-                LabourRequisition.is_deleted == False
-            ).scalar() or 0
-
-            req_rejected_count = db.session.query(func.count(LabourRequisition.requisition_id)).filter(
-                LabourRequisition.approved_by_user_id == filter_user_id,
-                LabourRequisition.status == 'rejected',
-                LabourRequisition.is_deleted == False
-            ).scalar() or 0
-
-            # Create a named tuple-like object for consistency
-            class LabourReqCounts:
-                def __init__(self, pending, approved, rejected):
-                    self.req_pending = pending
-                    self.req_approved = approved
-                    self.req_rejected = rejected
-
-            labour_req_counts = LabourReqCounts(req_pending_count, req_approved_count, req_rejected_count)
-
-        # Attendance Lock status counts (Pending = 'pending', Locked = 'locked')
-        # Must match the Attendance Lock page logic: only attendance from requisitions approved BY this PM
-
-        if is_admin_general_view:
-            # Admin viewing general dashboard - show ALL attendance data
-            attendance_lock_counts = db.session.query(
-                func.sum(case((DailyAttendance.approval_status == 'pending', 1), else_=0)).label('pending_lock'),
-                func.sum(case((DailyAttendance.approval_status == 'locked', 1), else_=0)).label('locked')
-            ).first()
-        else:
-            # Regular PM or admin viewing as specific PM
-            # Join with LabourRequisition to filter by requisitions approved BY this PM
-            pending_lock_count = db.session.query(func.count(DailyAttendance.attendance_id)).join(
-                LabourRequisition,
-                DailyAttendance.requisition_id == LabourRequisition.requisition_id
-            ).filter(
-                DailyAttendance.project_id.in_(project_ids) if project_ids else DailyAttendance.project_id == -1,
-                DailyAttendance.is_deleted == False,
-                LabourRequisition.approved_by_user_id == filter_user_id,
-                or_(
-                    DailyAttendance.approval_status == 'pending',
-                    and_(
-                        DailyAttendance.approval_status.is_(None),
-                        DailyAttendance.attendance_status == 'completed',
-                        DailyAttendance.clock_out_time.isnot(None)
-                    )
-                )
-            ).scalar() or 0
-
-            locked_count = db.session.query(func.count(DailyAttendance.attendance_id)).join(
-                LabourRequisition,
-                DailyAttendance.requisition_id == LabourRequisition.requisition_id
-            ).filter(
-                DailyAttendance.project_id.in_(project_ids) if project_ids else DailyAttendance.project_id == -1,
-                DailyAttendance.is_deleted == False,
-                LabourRequisition.approved_by_user_id == filter_user_id,
-                DailyAttendance.approval_status == 'locked'
-            ).scalar() or 0
-
-            # Create a named tuple-like object for consistency
-            class AttendanceLockCounts:
-                def __init__(self, pending, locked):
-                    self.pending_lock = pending
-                    self.locked = locked
-
-            attendance_lock_counts = AttendanceLockCounts(pending_lock_count, locked_count)
-
-        # Combine into labour data array for chart
-        labour_data = [
-            {
-                "labour_type": "Requisition - Pending",
-                "quantity": int(labour_req_counts.req_pending) if labour_req_counts.req_pending else 0
-            },
-            {
-                "labour_type": "Requisition - Approved",
-                "quantity": int(labour_req_counts.req_approved) if labour_req_counts.req_approved else 0
-            },
-            {
-                "labour_type": "Requisition - Rejected",
-                "quantity": int(labour_req_counts.req_rejected) if labour_req_counts.req_rejected else 0
-            },
-            {
-                "labour_type": "Attendance - Pending Lock",
-                "quantity": int(attendance_lock_counts.pending_lock) if attendance_lock_counts.pending_lock else 0
-            },
-            {
-                "labour_type": "Attendance - Locked",
-                "quantity": int(attendance_lock_counts.locked) if attendance_lock_counts.locked else 0
-            }
-        ]
-
-        # Top 5 High Budget Projects - Calculate Grand Total from JSONB
-        # Grand Total = Items Subtotal + Preliminary - Discount (stored in summary)
-        project_budgets = {}
-
-        # Query all BOQ details for PM's projects
-        boq_details_query = db.session.query(
-            BOQ.project_id,
-            BOQDetails.boq_details
-        ).join(
-            BOQDetails, BOQ.boq_id == BOQDetails.boq_id
-        ).filter(
-            BOQ.project_id.in_(project_ids),
-            BOQ.is_deleted == False,
-            BOQDetails.is_deleted == False
-        ).all()
-
-        # Extract grand total from each BOQ's summary
-        for row in boq_details_query:
-            project_id = row.project_id
-            boq_json = row.boq_details or {}
-
-            # Try to get grand total from summary
-            summary = boq_json.get('summary', {}) or boq_json.get('combined_summary', {}) or {}
-            grand_total = summary.get('total_cost') or summary.get('selling_price') or 0
-
-            # If not found in summary, calculate from items + preliminary - discount
-            if not grand_total:
-                items = boq_json.get('items', [])
-                subtotal = sum(
-                    float(item.get('amount', 0) or item.get('total', 0) or item.get('item_total', 0) or 0)
-                    for item in items
-                )
-
-                # Get preliminary amount
-                preliminaries = boq_json.get('preliminaries', {})
-                preliminary_amount = float(
-                    preliminaries.get('cost_details', {}).get('amount', 0) or
-                    preliminaries.get('amount', 0) or
-                    summary.get('preliminary_amount', 0) or 0
-                )
-
-                combined_subtotal = subtotal + preliminary_amount
-
-                # Apply discount
-                discount_percentage = float(summary.get('discount_percentage', 0) or boq_json.get('discount_percentage', 0) or 0)
-                discount_amount = float(summary.get('discount_amount', 0) or boq_json.get('discount_amount', 0) or 0)
+        # Approved/Rejected: Only requisitions actioned BY this PM
+        req_approved_count = db.session.query(func.count(LabourRequisition.requisition_id)).filter(
+            LabourRequisition.approved_by_user_id == filter_user_id,
+            LabourRequisition.status == 'approved',
+            LabourRequisition.is_deleted == False
+        ).scalar() or 0
 
-                if discount_percentage > 0 and discount_amount == 0:
-                    discount_amount = (combined_subtotal * discount_percentage) / 100
+        req_rejected_count = db.session.query(func.count(LabourRequisition.requisition_id)).filter(
+            LabourRequisition.approved_by_user_id == filter_user_id,
+            LabourRequisition.status == 'rejected',
+            LabourRequisition.is_deleted == False
+        ).scalar() or 0
 
-                grand_total = combined_subtotal - discount_amount
+        # Create a named tuple-like object for consistency
+        class LabourReqCounts:
+            def __init__(self, pending, approved, rejected):
+                self.req_pending = pending
+                self.req_approved = approved
+                self.req_rejected = rejected
 
-            # Accumulate per project
-            if project_id not in project_budgets:
-                project_budgets[project_id] = 0
-            project_budgets[project_id] += float(grand_total or 0)
+        labour_req_counts = LabourReqCounts(req_pending_count, req_approved_count, req_rejected_count)
 
-        # Get project details and sort by budget
-        top_projects_query = db.session.query(
-            Project.project_id,
-            Project.project_name,
-            Project.location,
-            Project.client
-        ).filter(
-            Project.project_id.in_(project_ids),
-            Project.is_deleted == False
-        ).all()
+    # Attendance Lock status counts (Pending = 'pending', Locked = 'locked')
+    # Must match the Attendance Lock page logic: only attendance from requisitions approved BY this PM
 
-        top_budget_projects = [
-            {
-                "project_id": p.project_id,
-                "project_name": p.project_name,
-                "location": p.location,
-                "client": p.client,
-                "budget": round(project_budgets.get(p.project_id, 0), 2)
-            }
-            for p in top_projects_query
-        ]
-
-        # Sort by budget descending and take top 5
-        top_budget_projects = sorted(top_budget_projects, key=lambda x: x['budget'], reverse=True)[:5]
-
-        # Asset Requisition Stats - Detailed status breakdown for PM's projects
-        asset_stats = db.session.query(
-            func.count(func.distinct(AssetRequisition.requisition_id)).label('total'),
-            func.count(func.distinct(case(
-                (AssetRequisition.status == 'pending_pm', AssetRequisition.requisition_id),
-                else_=None
-            ))).label('pending_pm'),
-            func.count(func.distinct(case(
-                (AssetRequisition.status == 'pm_approved', AssetRequisition.requisition_id),
-                else_=None
-            ))).label('pm_approved'),
-            func.count(func.distinct(case(
-                (AssetRequisition.status == 'pm_rejected', AssetRequisition.requisition_id),
-                else_=None
-            ))).label('pm_rejected'),
-            func.count(func.distinct(case(
-                (AssetRequisition.status == 'pending_prod_mgr', AssetRequisition.requisition_id),
-                else_=None
-            ))).label('pending_prod_mgr'),
-            func.count(func.distinct(case(
-                (AssetRequisition.status == 'prod_mgr_approved', AssetRequisition.requisition_id),
-                else_=None
-            ))).label('prod_mgr_approved'),
-            func.count(func.distinct(case(
-                (AssetRequisition.status == 'dispatched', AssetRequisition.requisition_id),
-                else_=None
-            ))).label('dispatched'),
-            func.count(func.distinct(case(
-                (AssetRequisition.status == 'completed', AssetRequisition.requisition_id),
-                else_=None
-            ))).label('completed')
-        ).filter(
-            AssetRequisition.project_id.in_(project_ids),
-            AssetRequisition.is_deleted == False
+    if is_admin_general_view:
+        # Admin viewing general dashboard - show ALL attendance data
+        attendance_lock_counts = db.session.query(
+            func.sum(case((DailyAttendance.approval_status == 'pending', 1), else_=0)).label('pending_lock'),
+            func.sum(case((DailyAttendance.approval_status == 'locked', 1), else_=0)).label('locked')
         ).first()
-
-        asset_details = {
-            "total": int(asset_stats.total) if asset_stats.total else 0,
-            "pending_pm": int(asset_stats.pending_pm) if asset_stats.pending_pm else 0,
-            "pm_approved": int(asset_stats.pm_approved) if asset_stats.pm_approved else 0,
-            "pm_rejected": int(asset_stats.pm_rejected) if asset_stats.pm_rejected else 0,
-            "pending_prod_mgr": int(asset_stats.pending_prod_mgr) if asset_stats.pending_prod_mgr else 0,
-            "prod_mgr_approved": int(asset_stats.prod_mgr_approved) if asset_stats.prod_mgr_approved else 0,
-            "dispatched": int(asset_stats.dispatched) if asset_stats.dispatched else 0,
-            "completed": int(asset_stats.completed) if asset_stats.completed else 0,
-            "total_approved": (int(asset_stats.pm_approved or 0) + int(asset_stats.prod_mgr_approved or 0) +
-                             int(asset_stats.dispatched or 0) + int(asset_stats.completed or 0))
-        }
-
-        # Change Request Stats for PM's projects
-        cr_stats = db.session.query(
-            func.count(func.distinct(ChangeRequest.cr_id)).label('total'),
-            func.count(func.distinct(case(
-                (ChangeRequest.status == 'pending_pm_approval', ChangeRequest.cr_id),
-                else_=None
-            ))).label('pending_pm'),
-            func.count(func.distinct(case(
-                (ChangeRequest.status == 'pending_td_approval', ChangeRequest.cr_id),
-                else_=None
-            ))).label('pending_td'),
-            func.count(func.distinct(case(
-                (ChangeRequest.status.in_(['approved', 'vendor_approved', 'purchase_completed']), ChangeRequest.cr_id),
-                else_=None
-            ))).label('approved'),
-            func.count(func.distinct(case(
-                (ChangeRequest.status == 'rejected', ChangeRequest.cr_id),
-                else_=None
-            ))).label('rejected'),
-            func.count(func.distinct(case(
-                (ChangeRequest.status == 'purchase_completed', ChangeRequest.cr_id),
-                else_=None
-            ))).label('completed')
+    else:
+        # Regular PM or admin viewing as specific PM
+        # Join with LabourRequisition to filter by requisitions approved BY this PM
+        pending_lock_count = db.session.query(func.count(DailyAttendance.attendance_id)).join(
+            LabourRequisition,
+            DailyAttendance.requisition_id == LabourRequisition.requisition_id
         ).filter(
-            ChangeRequest.project_id.in_(project_ids),
-            ChangeRequest.is_deleted == False
-        ).first()
+            DailyAttendance.project_id.in_(project_ids) if project_ids else DailyAttendance.project_id == -1,
+            DailyAttendance.is_deleted == False,
+            LabourRequisition.approved_by_user_id == filter_user_id,
+            or_(
+                DailyAttendance.approval_status == 'pending',
+                and_(
+                    DailyAttendance.approval_status.is_(None),
+                    DailyAttendance.attendance_status == 'completed',
+                    DailyAttendance.clock_out_time.isnot(None)
+                )
+            )
+        ).scalar() or 0
 
-        change_request_stats = {
-            "total": int(cr_stats.total) if cr_stats.total else 0,
-            "pending_pm": int(cr_stats.pending_pm) if cr_stats.pending_pm else 0,
-            "pending_td": int(cr_stats.pending_td) if cr_stats.pending_td else 0,
-            "approved": int(cr_stats.approved) if cr_stats.approved else 0,
-            "rejected": int(cr_stats.rejected) if cr_stats.rejected else 0,
-            "completed": int(cr_stats.completed) if cr_stats.completed else 0
+        locked_count = db.session.query(func.count(DailyAttendance.attendance_id)).join(
+            LabourRequisition,
+            DailyAttendance.requisition_id == LabourRequisition.requisition_id
+        ).filter(
+            DailyAttendance.project_id.in_(project_ids) if project_ids else DailyAttendance.project_id == -1,
+            DailyAttendance.is_deleted == False,
+            LabourRequisition.approved_by_user_id == filter_user_id,
+            DailyAttendance.approval_status == 'locked'
+        ).scalar() or 0
+
+        # Create a named tuple-like object for consistency
+        class AttendanceLockCounts:
+            def __init__(self, pending, locked):
+                self.pending_lock = pending
+                self.locked = locked
+
+        attendance_lock_counts = AttendanceLockCounts(pending_lock_count, locked_count)
+
+    # Combine into labour data array for chart
+    labour_data = [
+        {
+            "labour_type": "Requisition - Pending",
+            "quantity": int(labour_req_counts.req_pending) if labour_req_counts.req_pending else 0
+        },
+        {
+            "labour_type": "Requisition - Approved",
+            "quantity": int(labour_req_counts.req_approved) if labour_req_counts.req_approved else 0
+        },
+        {
+            "labour_type": "Requisition - Rejected",
+            "quantity": int(labour_req_counts.req_rejected) if labour_req_counts.req_rejected else 0
+        },
+        {
+            "labour_type": "Attendance - Pending Lock",
+            "quantity": int(attendance_lock_counts.pending_lock) if attendance_lock_counts.pending_lock else 0
+        },
+        {
+            "labour_type": "Attendance - Locked",
+            "quantity": int(attendance_lock_counts.locked) if attendance_lock_counts.locked else 0
         }
+    ]
+
+    # Top 5 High Budget Projects - Calculate Grand Total from JSONB
+    # Grand Total = Items Subtotal + Preliminary - Discount (stored in summary)
+    project_budgets = {}
+
+    # Query all BOQ details for PM's projects
+    boq_details_query = db.session.query(
+        BOQ.project_id,
+        BOQDetails.boq_details
+    ).join(
+        BOQDetails, BOQ.boq_id == BOQDetails.boq_id
+    ).filter(
+        BOQ.project_id.in_(project_ids),
+        BOQ.is_deleted == False,
+        BOQDetails.is_deleted == False
+    ).all()
+
+    # Extract grand total from each BOQ's summary
+    for row in boq_details_query:
+        project_id = row.project_id
+        boq_json = row.boq_details or {}
+
+        # Try to get grand total from summary
+        summary = boq_json.get('summary', {}) or boq_json.get('combined_summary', {}) or {}
+        grand_total = summary.get('total_cost') or summary.get('selling_price') or 0
+
+        # If not found in summary, calculate from items + preliminary - discount
+        if not grand_total:
+            items = boq_json.get('items', [])
+            subtotal = sum(
+                float(item.get('amount', 0) or item.get('total', 0) or item.get('item_total', 0) or 0)
+                for item in items
+            )
 
-        # Project Progress Stats - count projects by status
-        project_status_counts = db.session.query(
-            func.count(func.distinct(case(
-                (Project.status == 'active', Project.project_id),
-                else_=None
-            ))).label('active'),
-            func.count(func.distinct(case(
-                (Project.status == 'in_progress', Project.project_id),
-                else_=None
-            ))).label('in_progress'),
-            func.count(func.distinct(case(
-                (Project.status == 'completed', Project.project_id),
-                else_=None
-            ))).label('completed'),
-            func.count(func.distinct(case(
-                (Project.status == 'on_hold', Project.project_id),
-                else_=None
-            ))).label('on_hold'),
-            func.count(func.distinct(Project.project_id)).label('total')
-        ).filter(
-            Project.project_id.in_(project_ids),
-            Project.is_deleted == False
-        ).first()
+            # Get preliminary amount
+            preliminaries = boq_json.get('preliminaries', {})
+            preliminary_amount = float(
+                preliminaries.get('cost_details', {}).get('amount', 0) or
+                preliminaries.get('amount', 0) or
+                summary.get('preliminary_amount', 0) or 0
+            )
 
-        project_stats = {
-            "total": int(project_status_counts.total) if project_status_counts.total else 0,
-            "active": int(project_status_counts.active) if project_status_counts.active else 0,
-            "in_progress": int(project_status_counts.in_progress) if project_status_counts.in_progress else 0,
-            "completed": int(project_status_counts.completed) if project_status_counts.completed else 0,
-            "on_hold": int(project_status_counts.on_hold) if project_status_counts.on_hold else 0
+            combined_subtotal = subtotal + preliminary_amount
+
+            # Apply discount
+            discount_percentage = float(summary.get('discount_percentage', 0) or boq_json.get('discount_percentage', 0) or 0)
+            discount_amount = float(summary.get('discount_amount', 0) or boq_json.get('discount_amount', 0) or 0)
+
+            if discount_percentage > 0 and discount_amount == 0:
+                discount_amount = (combined_subtotal * discount_percentage) / 100
+
+            grand_total = combined_subtotal - discount_amount
+
+        # Accumulate per project
+        if project_id not in project_budgets:
+            project_budgets[project_id] = 0
+        project_budgets[project_id] += float(grand_total or 0)
+
+    # Get project details and sort by budget
+    top_projects_query = db.session.query(
+        Project.project_id,
+        Project.project_name,
+        Project.location,
+        Project.client
+    ).filter(
+        Project.project_id.in_(project_ids),
+        Project.is_deleted == False
+    ).all()
+
+    top_budget_projects = [
+        {
+            "project_id": p.project_id,
+            "project_name": p.project_name,
+            "location": p.location,
+            "client": p.client,
+            "budget": round(project_budgets.get(p.project_id, 0), 2)
         }
+        for p in top_projects_query
+    ]
+
+    # Sort by budget descending and take top 5
+    top_budget_projects = sorted(top_budget_projects, key=lambda x: x['budget'], reverse=True)[:5]
+
+    # Asset Requisition Stats - Detailed status breakdown for PM's projects
+    asset_stats = db.session.query(
+        func.count(func.distinct(AssetRequisition.requisition_id)).label('total'),
+        func.count(func.distinct(case(
+            (AssetRequisition.status == 'pending_pm', AssetRequisition.requisition_id),
+            else_=None
+        ))).label('pending_pm'),
+        func.count(func.distinct(case(
+            (AssetRequisition.status == 'pm_approved', AssetRequisition.requisition_id),
+            else_=None
+        ))).label('pm_approved'),
+        func.count(func.distinct(case(
+            (AssetRequisition.status == 'pm_rejected', AssetRequisition.requisition_id),
+            else_=None
+        ))).label('pm_rejected'),
+        func.count(func.distinct(case(
+            (AssetRequisition.status == 'pending_prod_mgr', AssetRequisition.requisition_id),
+            else_=None
+        ))).label('pending_prod_mgr'),
+        func.count(func.distinct(case(
+            (AssetRequisition.status == 'prod_mgr_approved', AssetRequisition.requisition_id),
+            else_=None
+        ))).label('prod_mgr_approved'),
+        func.count(func.distinct(case(
+            (AssetRequisition.status == 'dispatched', AssetRequisition.requisition_id),
+            else_=None
+        ))).label('dispatched'),
+        func.count(func.distinct(case(
+            (AssetRequisition.status == 'completed', AssetRequisition.requisition_id),
+            else_=None
+        ))).label('completed')
+    ).filter(
+        AssetRequisition.project_id.in_(project_ids),
+        AssetRequisition.is_deleted == False
+    ).first()
+
+    asset_details = {
+        "total": int(asset_stats.total) if asset_stats.total else 0,
+        "pending_pm": int(asset_stats.pending_pm) if asset_stats.pending_pm else 0,
+        "pm_approved": int(asset_stats.pm_approved) if asset_stats.pm_approved else 0,
+        "pm_rejected": int(asset_stats.pm_rejected) if asset_stats.pm_rejected else 0,
+        "pending_prod_mgr": int(asset_stats.pending_prod_mgr) if asset_stats.pending_prod_mgr else 0,
+        "prod_mgr_approved": int(asset_stats.prod_mgr_approved) if asset_stats.prod_mgr_approved else 0,
+        "dispatched": int(asset_stats.dispatched) if asset_stats.dispatched else 0,
+        "completed": int(asset_stats.completed) if asset_stats.completed else 0,
+        "total_approved": (int(asset_stats.pm_approved or 0) + int(asset_stats.prod_mgr_approved or 0) +
+                         int(asset_stats.dispatched or 0) + int(asset_stats.completed or 0))
+    }
+
+    # Change Request Stats for PM's projects
+    cr_stats = db.session.query(
+        func.count(func.distinct(ChangeRequest.cr_id)).label('total'),
+        func.count(func.distinct(case(
+            (ChangeRequest.status == 'pending_pm_approval', ChangeRequest.cr_id),
+            else_=None
+        ))).label('pending_pm'),
+        func.count(func.distinct(case(
+            (ChangeRequest.status == 'pending_td_approval', ChangeRequest.cr_id),
+            else_=None
+        ))).label('pending_td'),
+        func.count(func.distinct(case(
+            (ChangeRequest.status.in_(['approved', 'vendor_approved', 'purchase_completed']), ChangeRequest.cr_id),
+            else_=None
+        ))).label('approved'),
+        func.count(func.distinct(case(
+            (ChangeRequest.status == 'rejected', ChangeRequest.cr_id),
+            else_=None
+        ))).label('rejected'),
+        func.count(func.distinct(case(
+            (ChangeRequest.status == 'purchase_completed', ChangeRequest.cr_id),
+            else_=None
+        ))).label('completed')
+    ).filter(
+        ChangeRequest.project_id.in_(project_ids),
+        ChangeRequest.is_deleted == False
+    ).first()
+
+    change_request_stats = {
+        "total": int(cr_stats.total) if cr_stats.total else 0,
+        "pending_pm": int(cr_stats.pending_pm) if cr_stats.pending_pm else 0,
+        "pending_td": int(cr_stats.pending_td) if cr_stats.pending_td else 0,
+        "approved": int(cr_stats.approved) if cr_stats.approved else 0,
+        "rejected": int(cr_stats.rejected) if cr_stats.rejected else 0,
+        "completed": int(cr_stats.completed) if cr_stats.completed else 0
+    }
+
+    # Project Progress Stats - count projects by status
+    project_status_counts = db.session.query(
+        func.count(func.distinct(case(
+            (Project.status == 'active', Project.project_id),
+            else_=None
+        ))).label('active'),
+        func.count(func.distinct(case(
+            (Project.status == 'in_progress', Project.project_id),
+            else_=None
+        ))).label('in_progress'),
+        func.count(func.distinct(case(
+            (Project.status == 'completed', Project.project_id),
+            else_=None
+        ))).label('completed'),
+        func.count(func.distinct(case(
+            (Project.status == 'on_hold', Project.project_id),
+            else_=None
+        ))).label('on_hold'),
+        func.count(func.distinct(Project.project_id)).label('total')
+    ).filter(
+        Project.project_id.in_(project_ids),
+        Project.is_deleted == False
+    ).first()
+
+    project_stats = {
+        "total": int(project_status_counts.total) if project_status_counts.total else 0,
+        "active": int(project_status_counts.active) if project_status_counts.active else 0,
+        "in_progress": int(project_status_counts.in_progress) if project_status_counts.in_progress else 0,
+        "completed": int(project_status_counts.completed) if project_status_counts.completed else 0,
+        "on_hold": int(project_status_counts.on_hold) if project_status_counts.on_hold else 0
+    }
+
+    # Recent SE Requests - Latest 5 requests from Site Engineers needing PM attention
+    recent_se_requests = []
+
+    # 1. Recent SE Change Requests (send_to_pm status)
+    se_crs = db.session.query(
+        ChangeRequest.cr_id,
+        ChangeRequest.status,
+        ChangeRequest.created_at,
+        ChangeRequest.requested_by_name,
+        ChangeRequest.requested_by_role,
+        Project.project_name
+    ).join(
+        Project, ChangeRequest.project_id == Project.project_id
+    ).filter(
+        ChangeRequest.project_id.in_(project_ids),
+        ChangeRequest.is_deleted == False,
+        func.lower(ChangeRequest.requested_by_role).in_(['siteengineer', 'sitesupervisor', 'site_engineer', 'site_supervisor'])
+    ).order_by(ChangeRequest.created_at.desc()).limit(5).all()
+
+    for cr in se_crs:
+        recent_se_requests.append({
+            "id": f"cr_{cr.cr_id}",
+            "type": "cr",
+            "code": f"PO-{cr.cr_id}",
+            "project_name": cr.project_name,
+            "status": cr.status,
+            "requested_by": cr.requested_by_name,
+            "date": cr.created_at.isoformat() if cr.created_at else None,
+            "timestamp": cr.created_at
+        })
+
+    # 2. Recent SE Labour Requisitions
+    se_labour = db.session.query(
+        LabourRequisition.requisition_id,
+        LabourRequisition.requisition_code,
+        LabourRequisition.status,
+        LabourRequisition.created_at,
+        LabourRequisition.requested_by_name,
+        Project.project_name
+    ).join(
+        Project, LabourRequisition.project_id == Project.project_id
+    ).filter(
+        LabourRequisition.project_id.in_(project_ids),
+        LabourRequisition.is_deleted == False
+    ).order_by(LabourRequisition.created_at.desc()).limit(5).all()
+
+    for lr in se_labour:
+        recent_se_requests.append({
+            "id": f"labour_{lr.requisition_id}",
+            "type": "labour",
+            "code": lr.requisition_code,
+            "project_name": lr.project_name,
+            "status": lr.status,
+            "requested_by": lr.requested_by_name,
+            "date": lr.created_at.isoformat() if lr.created_at else None,
+            "timestamp": lr.created_at
+        })
+
+    # 3. Recent SE Asset Requisitions
+    se_assets = db.session.query(
+        AssetRequisition.requisition_id,
+        AssetRequisition.requisition_code,
+        AssetRequisition.status,
+        AssetRequisition.created_at,
+        AssetRequisition.requested_by_name,
+        Project.project_name
+    ).join(
+        Project, AssetRequisition.project_id == Project.project_id
+    ).filter(
+        AssetRequisition.project_id.in_(project_ids),
+        AssetRequisition.is_deleted == False
+    ).order_by(AssetRequisition.created_at.desc()).limit(5).all()
+
+    for ar in se_assets:
+        recent_se_requests.append({
+            "id": f"asset_{ar.requisition_id}",
+            "type": "asset",
+            "code": ar.requisition_code,
+            "project_name": ar.project_name,
+            "status": ar.status,
+            "requested_by": ar.requested_by_name,
+            "date": ar.created_at.isoformat() if ar.created_at else None,
+            "timestamp": ar.created_at
+        })
+
+    # Sort by timestamp and take top 5
+    recent_se_requests = sorted(
+        [r for r in recent_se_requests if r.get('timestamp')],
+        key=lambda x: x['timestamp'],
+        reverse=True
+    )[:5]
+
+    # Remove timestamp from response
+    for item in recent_se_requests:
+        item.pop('timestamp', None)
+
+    return {
+        "success": True,
+        "stats": {
+            "total_boq_items": total_boq_items,
+            "items_assigned": items_assigned,
+            "pending_assignment": pending_assignment,
+            "total_project_value": round(total_project_value, 2)
+        },
+        "boq_status": boq_status_counts,
+        "items_breakdown": {
+            "materials": total_materials,
+            "labour": total_labour
+        },
+        "purchase_order_status": purchase_order_status,
+        "labour_data": labour_data,
+        "top_budget_projects": top_budget_projects,
+        "recent_activities": recent_activities,
+        "projects": projects_data,
+        "asset_details": asset_details,
+        "change_request_stats": change_request_stats,
+        "project_stats": project_stats,
+        "recent_se_requests": recent_se_requests
+    }
 
-        # Recent SE Requests - Latest 5 requests from Site Engineers needing PM attention
-        recent_se_requests = []
-
-        # 1. Recent SE Change Requests (send_to_pm status)
-        se_crs = db.session.query(
-            ChangeRequest.cr_id,
-            ChangeRequest.status,
-            ChangeRequest.created_at,
-            ChangeRequest.requested_by_name,
-            ChangeRequest.requested_by_role,
-            Project.project_name
-        ).join(
-            Project, ChangeRequest.project_id == Project.project_id
-        ).filter(
-            ChangeRequest.project_id.in_(project_ids),
-            ChangeRequest.is_deleted == False,
-            func.lower(ChangeRequest.requested_by_role).in_(['siteengineer', 'sitesupervisor', 'site_engineer', 'site_supervisor'])
-        ).order_by(ChangeRequest.created_at.desc()).limit(5).all()
-
-        for cr in se_crs:
-            recent_se_requests.append({
-                "id": f"cr_{cr.cr_id}",
-                "type": "cr",
-                "code": f"PO-{cr.cr_id}",
-                "project_name": cr.project_name,
-                "status": cr.status,
-                "requested_by": cr.requested_by_name,
-                "date": cr.created_at.isoformat() if cr.created_at else None,
-                "timestamp": cr.created_at
-            })
-
-        # 2. Recent SE Labour Requisitions
-        se_labour = db.session.query(
-            LabourRequisition.requisition_id,
-            LabourRequisition.requisition_code,
-            LabourRequisition.status,
-            LabourRequisition.created_at,
-            LabourRequisition.requested_by_name,
-            Project.project_name
-        ).join(
-            Project, LabourRequisition.project_id == Project.project_id
-        ).filter(
-            LabourRequisition.project_id.in_(project_ids),
-            LabourRequisition.is_deleted == False
-        ).order_by(LabourRequisition.created_at.desc()).limit(5).all()
-
-        for lr in se_labour:
-            recent_se_requests.append({
-                "id": f"labour_{lr.requisition_id}",
-                "type": "labour",
-                "code": lr.requisition_code,
-                "project_name": lr.project_name,
-                "status": lr.status,
-                "requested_by": lr.requested_by_name,
-                "date": lr.created_at.isoformat() if lr.created_at else None,
-                "timestamp": lr.created_at
-            })
 
-        # 3. Recent SE Asset Requisitions
-        se_assets = db.session.query(
-            AssetRequisition.requisition_id,
-            AssetRequisition.requisition_code,
-            AssetRequisition.status,
-            AssetRequisition.created_at,
-            AssetRequisition.requested_by_name,
-            Project.project_name
-        ).join(
-            Project, AssetRequisition.project_id == Project.project_id
-        ).filter(
-            AssetRequisition.project_id.in_(project_ids),
-            AssetRequisition.is_deleted == False
-        ).order_by(AssetRequisition.created_at.desc()).limit(5).all()
-
-        for ar in se_assets:
-            recent_se_requests.append({
-                "id": f"asset_{ar.requisition_id}",
-                "type": "asset",
-                "code": ar.requisition_code,
-                "project_name": ar.project_name,
-                "status": ar.status,
-                "requested_by": ar.requested_by_name,
-                "date": ar.created_at.isoformat() if ar.created_at else None,
-                "timestamp": ar.created_at
-            })
+def get_pm_dashboard():
+    """
+    Get COMPREHENSIVE dashboard statistics for the current user's projects
+    - Shows data based on BOQs where the PM is assigned (via last_pm_user_id)
+    - Each PM sees only their own BOQ statuses (approved, pending, rejected, completed)
+    - Admins can view all data or filter by specific PM
+    - Served from the per-PM read model (services/pm_dashboard_read_model.py);
+      ?refresh=true forces a rebuild
+    """
+    try:
+        current_user = g.user
+        user_id = current_user['user_id']
+        user_role = current_user.get('role', '').lower()
 
-        # Sort by timestamp and take top 5
-        recent_se_requests = sorted(
-            [r for r in recent_se_requests if r.get('timestamp')],
-            key=lambda x: x['timestamp'],
-            reverse=True
-        )[:5]
+        # Check if admin is viewing as a specific PM (from query params or context)
+        viewing_as_pm_id = request.args.get('viewing_as_pm_id', type=int)
 
-        # Remove timestamp from response
-        for item in recent_se_requests:
-            item.pop('timestamp', None)
+        # Determine the filter user ID
+        filter_user_id = viewing_as_pm_id if (user_role == 'admin' and viewing_as_pm_id) else user_id
 
-        return jsonify({
-            "success": True,
-            "stats": {
-                "total_boq_items": total_boq_items,
-                "items_assigned": items_assigned,
-                "pending_assignment": pending_assignment,
-                "total_project_value": round(total_project_value, 2)
-            },
-            "boq_status": boq_status_counts,
-            "items_breakdown": {
-                "materials": total_materials,
-                "labour": total_labour
-            },
-            "purchase_order_status": purchase_order_status,
-            "labour_data": labour_data,
-            "top_budget_projects": top_budget_projects,
-            "recent_activities": recent_activities,
-            "projects": projects_data,
-            "asset_details": asset_details,
-            "change_request_stats": change_request_stats,
-            "project_stats": project_stats,
-            "recent_se_requests": recent_se_requests
-        }), 200
+        dashboard = get_dashboard_snapshot(
+            filter_user_id,
+            all_projects=(user_role == 'admin' and not viewing_as_pm_id),
+            builder=build_pm_dashboard,
+            force_rebuild=request.args.get('refresh', 'false').lower() == 'true'
+        )
+        return jsonify(dashboard), 200
 
     except Exception as e:
         log.error(f"Error getting PM dashboard stats: {str(e)}")
@@ -3734,8 +3755,6 @@ def get_pm_production_management_boqs():
     """
     try:
         from sqlalchemy import func
-        from sqlalchemy.dialects.postgresql import JSONB
-        from sqlalchemy import cast
 
         page = request.args.get('page', type=int)
         page_size = request.args.get('page_size', default=20, type=int)
@@ -3786,7 +3805,7 @@ def get_pm_production_management_boqs():
         # IMPORTANT: Admin sees ALL BOQs, regular PM sees only BOQs for projects assigned to them
         if user_role != 'admin':
             # Regular PM: Filter by Project.user_id array (show BOQs where PM is assigned to the project)
-            query = query.filter(Project.user_id.op('@>')(cast([user_id], JSONB)))
+            query = query.filter(project_member_filter(user_id, ROLE_PROJECT_MANAGER))
 
         query = query.order_by(BOQ.created_at.desc())
 
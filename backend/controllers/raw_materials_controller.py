@@ -17,6 +17,7 @@ from sqlalchemy import or_, and_, func
 from config.db import db
 from models.raw_materials_catalog import RawMaterialsCatalog
 from models.user import User
+from utils.catalog_tree_cache import invalidate_catalog_tree
 from config.logging import get_logger
 
 log = get_logger()
@@ -290,6 +291,7 @@ def create_raw_material():
 
         db.session.add(new_material)
         db.session.commit()
+        invalidate_catalog_tree()
 
         # Refresh the object to load relationships
         db.session.refresh(new_material)
@@ -396,6 +398,7 @@ def update_raw_material(material_id):
             material.is_active = data['is_active']
 
         db.session.commit()
+        invalidate_catalog_tree()
 
         # Refresh the object to load relationships
         db.session.refresh(material)
@@ -475,6 +478,7 @@ def delete_raw_material(material_id):
         # Soft delete by setting is_active to False
         material.is_active = False
         db.session.commit()
+        invalidate_catalog_tree()
 
         log.info(f"Raw material soft deleted: {material.id} - {material.material_name} by user {user_id}")
 
@@ -5,10 +5,7 @@ from config.db import db
 from datetime import datetime, date
 from config.logging import get_logger
 from utils.boq_email_service import BOQEmailService
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from io import BytesIO
-from utils.modern_boq_pdf_generator import ModernBOQPDFGenerator
 from utils.boq_calculation_helper import calculate_boq_values
 from sqlalchemy import text
 import os
@@ -368,6 +365,9 @@ def generate_client_excel(project, items, total_material_cost, total_labour_cost
     Args:
         selected_terms: List of selected terms from database. Each dict should have {'terms_text': '...'}
     """
+    import openpyxl
+    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "Quotation"
@@ -816,5 +816,6 @@ def generate_client_pdf(project, items, total_material_cost, total_labour_cost,
     if boq_json is None:
         boq_json = {}
 
+    from utils.modern_boq_pdf_generator import ModernBOQPDFGenerator
     generator = ModernBOQPDFGenerator()
     return generator.generate_client_pdf(project, items, total_material_cost, total_labour_cost, grand_total, boq_json, terms_text=None, selected_terms=selected_terms, include_images=include_images, cover_page=cover_page, md_signature_image=md_signature_image, authorized_signature_image=authorized_signature_image, company_seal_image=company_seal_image)
@@ -8,6 +8,7 @@ from models import db
 from models.system_settings import SystemSettings
 from models.user import User
 from utils.authentication import jwt_required
+from utils.settings_cache import get_system_settings, invalidate_settings_cache
 import logging
 from datetime import datetime
 import base64
@@ -62,6 +63,7 @@ def get_settings():
             )
             db.session.add(settings)
             db.session.commit()
+            invalidate_settings_cache()
 
         return jsonify({
             "settings": {
@@ -227,6 +229,7 @@ def update_settings():
 
         settings.updated_at = datetime.utcnow()
         db.session.commit()
+        invalidate_settings_cache()
 
         log.info(f"Settings updated by admin user {current_user.get('user_id')}")
 
@@ -347,6 +350,7 @@ def upload_signature():
         settings.signature_enabled = True  # Auto-enable when uploading
         settings.updated_at = datetime.utcnow()
         db.session.commit()
+        invalidate_settings_cache()
 
         log.info(f"Signature uploaded by admin user {current_user.get('user_id')}")
 
@@ -384,6 +388,7 @@ def delete_signature():
         settings.signature_enabled = False
         settings.updated_at = datetime.utcnow()
         db.session.commit()
+        invalidate_settings_cache()
 
         log.info(f"Signature deleted by admin user {current_user.get('user_id')}")
 
@@ -404,7 +409,7 @@ def get_signature_for_pdf():
     Returns the signature image data if enabled, None otherwise
     """
     try:
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
         if not settings:
             return None
 
@@ -424,7 +429,7 @@ def get_signatures_for_pdf():
     Returns dict with md_signature, authorized_signature, and company_seal if enabled, None values otherwise
     """
     try:
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
         if not settings:
             return {'md_signature': None, 'authorized_signature': None, 'company_seal': None}
 
@@ -276,8 +276,9 @@ def update_sitesupervisor(site_supervisor_id):
 
         # Reassign projects if provided
         if "assigned_projects" in data:
-            # Remove current supervisor assignments from all projects
-            Project.query.filter_by(site_supervisor_id=site_supervisor_id).update({"site_supervisor_id": None})
+            # Remove current supervisor assignments from all projects (ORM writes keep project_members in sync)
+            for project in Project.query.filter_by(site_supervisor_id=site_supervisor_id).all():
+                project.site_supervisor_id = None
             db.session.commit()  # commit after unassigning to ensure DB update
 
             # Batch pre-fetch all new projects in one query
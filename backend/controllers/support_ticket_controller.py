@@ -14,7 +14,7 @@ from sqlalchemy import or_
 import os
 import uuid
 from werkzeug.utils import secure_filename
-from supabase import create_client, Client
+from utils.supabase_client import LazySupabaseClient
 from utils.comprehensive_notification_service import ComprehensiveNotificationService
 from socketio_server import emit_support_ticket_event
 
@@ -34,19 +34,9 @@ SUPABASE_BUCKET = "file_upload"
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'pdf', 'doc', 'docx', 'txt', 'xlsx', 'xls'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
-# Initialize Supabase client
-supabase: Client = None
-PUBLIC_URL_BASE = None
-
-if supabase_url and supabase_key:
-    try:
-        supabase = create_client(supabase_url, supabase_key)
-        PUBLIC_URL_BASE = f"{supabase_url}/storage/v1/object/public/{SUPABASE_BUCKET}/"
-        log.info("Supabase client initialized for support tickets")
-    except Exception as e:
-        log.error(f"Failed to initialize Supabase client: {str(e)}")
-else:
-    log.warning("Supabase not configured - file uploads will be disabled")
+# Supabase client, created on first upload (falsy when not configured)
+supabase = LazySupabaseClient(anon=True)
+PUBLIC_URL_BASE = f"{supabase_url}/storage/v1/object/public/{SUPABASE_BUCKET}/" if supabase else None
 
 
 def allowed_file(filename):
@@ -4,6 +4,7 @@ API endpoints for comparing BOQ estimated vs actual transport fees
 """
 
 from flask import Blueprint, jsonify, request
+from utils.authentication import jwt_required
 from utils.transport_fee_analysis import (
     get_project_transport_comparison,
     get_all_projects_transport_comparison
@@ -13,6 +14,7 @@ transport_analysis_bp = Blueprint('transport_analysis', __name__)
 
 
 @transport_analysis_bp.route('/api/transport-analysis/project/<int:project_id>', methods=['GET'])
+@jwt_required
 def get_project_transport_analysis(project_id):
     """
     Get transport fee comparison for a specific project
@@ -60,10 +62,14 @@ def get_project_transport_analysis(project_id):
 
 
 @transport_analysis_bp.route('/api/transport-analysis/all-projects', methods=['GET'])
+@jwt_required
 def get_all_projects_transport_analysis():
     """
     Get transport fee comparison for all projects
 
+    Query params:
+        refresh: 'true' to recompute instead of using the cached result
+
     Returns:
         {
             "success": true,
@@ -89,7 +95,9 @@ def get_all_projects_transport_analysis():
         }
     """
     try:
-        projects = get_all_projects_transport_comparison()
+        projects = get_all_projects_transport_comparison(
+            use_cache=request.args.get('refresh', 'false').lower() != 'true'
+        )
 
         # Calculate summary
         total_estimated = sum(p['boq_estimated_transport'] for p in projects)
@@ -117,10 +125,14 @@ def get_all_projects_transport_analysis():
 
 
 @transport_analysis_bp.route('/api/transport-analysis/summary', methods=['GET'])
+@jwt_required
 def get_transport_summary():
     """
     Get high-level transport fee summary across all projects
 
+    Query params:
+        refresh: 'true' to recompute instead of using the cached result
+
     Returns:
         {
             "success": true,
@@ -136,7 +148,9 @@ def get_transport_summary():
         }
     """
     try:
-        projects = get_all_projects_transport_comparison()
+        projects = get_all_projects_transport_comparison(
+            use_cache=request.args.get('refresh', 'false').lower() != 'true'
+        )
 
         total_estimated = sum(p['boq_estimated_transport'] for p in projects)
         total_actual = sum(p['actual_transport_spent'] for p in projects)
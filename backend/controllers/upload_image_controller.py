@@ -1,27 +1,20 @@
 from flask import request, jsonify
 import os
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import uuid
 from config.db import db
 from config.logging import get_logger
 from werkzeug.utils import secure_filename
-from supabase import create_client, Client
 from models.change_request import ChangeRequest
 from models.boq import *
-from PIL import Image
-import io
+from utils.supabase_client import LazySupabaseClient, supabase_settings
 
 log = get_logger()
 
 # Configuration constants from environment variables based on ENVIRONMENT
-environment = os.environ.get('ENVIRONMENT', 'production')
-if environment == 'development':
-    supabase_url = os.environ.get('DEV_SUPABASE_URL')
-    supabase_key = os.environ.get('DEV_SUPABASE_KEY')  # Use SERVICE_ROLE key for backend operations
-else:
-    supabase_url = os.environ.get('SUPABASE_URL')
-    supabase_key = os.environ.get('SUPABASE_KEY')  # Use SERVICE_ROLE key for backend operations
+supabase_url, supabase_key = supabase_settings()  # Use SERVICE_ROLE key for backend operations
 SUPABASE_BUCKET = "file_upload"
 ITEM_SUPABASE_BUCKET = "boq_file"
 ALLOWED_EXTENSIONS = {
@@ -40,100 +33,45 @@ MAX_WORKERS = 12
 MAX_FILE_SIZE = 200 * 1024 * 1024  # 200MB max file size (increased for CAD files)
 MAX_IMAGE_SIZE = 50 * 1024 * 1024  # 50MB max image size
 
-# Validate Supabase configuration
-if not supabase_url or not supabase_key:
-    log.error("Supabase URL or Key not configured in environment variables")
-    raise ValueError("Missing Supabase configuration. Please set SUPABASE_URL and SUPABASE_KEY environment variables")
-
-# Initialize Supabase client
-try:
-    supabase: Client = create_client(supabase_url, supabase_key)
-    log.info(f"Supabase client initialized successfully")
-    log.info(f"Using bucket: {SUPABASE_BUCKET}")
-except Exception as e:
-    log.error(f"Failed to initialize Supabase client: {str(e)}")
-    raise
+# Supabase client, created on the first storage call (config is checked in create_app)
+supabase = LazySupabaseClient()
 
 # Pre-build base URL for public files
 PUBLIC_URL_BASE = f"{supabase_url}/storage/v1/object/public/{SUPABASE_BUCKET}/"
 IMAGE_PUBLIC_URL_BASE = f"{supabase_url}/storage/v1/object/public/{ITEM_SUPABASE_BUCKET}/"
 
-# Global executor for better resource management
-global_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
-
-
-def allowed_file(filename):
-    """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
-
-
-def compress_image(file_content, max_size=MAX_IMAGE_SIZE, quality=95):
-    """
-    Compress image to ensure it's under max_size (default 50MB)
-
-    Args:
-        file_content: Raw image file content
-        max_size: Maximum size in bytes (default 50MB)
-        quality: Initial JPEG quality (1-100, default 95)
-
-    Returns:
-        tuple: (compressed_content, content_type)
-    """
-    try:
-        # Open image
-        img = Image.open(io.BytesIO(file_content))
-
-        # Convert RGBA to RGB if necessary (for JPEG compatibility)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-            img = background
-
-        # If image is already under max size, return original
-        if len(file_content) <= max_size:
-            return file_content, "image/jpeg"
-
-        # Compress image iteratively
-        output = io.BytesIO()
-        current_quality = quality
-
-        while current_quality > 10:
-            output.seek(0)
-            output.truncate(0)
+# Shared upload executor, created on first upload
+_executor_lock = threading.Lock()
+_upload_executor = None
 
-            # Save with current quality
-            img.save(output, format='JPEG', quality=current_quality, optimize=True)
 
-            # Check size
-            compressed_size = output.tell()
-            if compressed_size <= max_size:
-                log.info(f"Image compressed from {len(file_content)} to {compressed_size} bytes (quality: {current_quality})")
-                return output.getvalue(), "image/jpeg"
+def get_upload_executor():
+    """Process-wide executor for storage uploads."""
+    global _upload_executor
+    with _executor_lock:
+        if _upload_executor is None:
+            _upload_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='upload')
+        return _upload_executor
 
-            # Reduce quality for next iteration
-            current_quality -= 5
 
-        # If still too large, resize image
-        output.seek(0)
-        output.truncate(0)
+def shutdown_upload_executor(wait=True):
+    """Finish (wait=True) or drop queued uploads and stop the executor threads."""
+    global _upload_executor
+    with _executor_lock:
+        executor, _upload_executor = _upload_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
 
-        # Calculate new dimensions (reduce by 20%)
-        new_width = int(img.width * 0.8)
-        new_height = int(img.height * 0.8)
-        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-        # Try compression again with resized image
-        img.save(output, format='JPEG', quality=85, optimize=True)
-        compressed_size = output.tell()
+def allowed_file(filename):
+    """Check if file extension is allowed"""
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-        log.info(f"Image resized and compressed from {len(file_content)} to {compressed_size} bytes")
-        return output.getvalue(), "image/jpeg"
 
-    except Exception as e:
-        log.error(f"Image compression failed: {str(e)}")
-        raise Exception(f"Failed to compress image: {str(e)}")
+def variant_path(path, variant):
+    """Storage path of an image variant: items/<id>/<variant>/<name>.jpg"""
+    folder, filename = path.rsplit('/', 1)
+    return f"{folder}/{variant}/{os.path.splitext(filename)[0]}.jpg"
 
 
 def upload_single_file(path, content, content_type):
@@ -272,7 +210,7 @@ def process_file_batch(files, cr_id):
             content_type = file.content_type or "application/octet-stream"
 
             # Submit upload task
-            future = global_executor.submit(
+            future = get_upload_executor().submit(
                 upload_single_file,
                 supabase_path,
                 file_content,
@@ -312,12 +250,21 @@ def process_file_batch(files, cr_id):
 
 
 def process_image_batch(files, item_id):
-    """Process multiple images for upload with compression in parallel"""
+    """
+    Process multiple images for upload in parallel.
+
+    Images are validated, size-capped and rendered into display variants
+    (thumb/preview) in the image process pool (utils/image_pipeline.py);
+    the original and its variants are then uploaded concurrently.
+    """
+    from utils.image_pipeline import submit_image, IMAGE_JOB_TIMEOUT_SECONDS
+
     if not files:
         return [], []
 
     uploaded_files = []
     errors = []
+    jobs = []
     futures = []
 
     # Image extensions
@@ -343,14 +290,6 @@ def process_image_batch(files, item_id):
                 errors.append(f"{file.filename}: Invalid image type. Allowed: {', '.join(IMAGE_EXTENSIONS)}")
                 continue
 
-            # Create unique filename
-            name_part, ext_part = os.path.splitext(filename)
-            unique_id = str(uuid.uuid4())[:8]
-            unique_filename = f"{name_part}_{unique_id}.jpg"  # Always save as JPEG after compression
-
-            # Build storage path for item images
-            supabase_path = f"items/{item_id}/{unique_filename}"
-
             # Read file content
             file_content = file.read()
             file_size = len(file_content)
@@ -359,53 +298,72 @@ def process_image_batch(files, item_id):
                 errors.append(f"{file.filename}: File is empty")
                 continue
 
-            # Compress image to max 50MB
-            try:
-                compressed_content, content_type = compress_image(file_content, MAX_IMAGE_SIZE)
-                compressed_size = len(compressed_content)
-                log.info(f"Original size: {file_size} bytes, Compressed size: {compressed_size} bytes")
-            except Exception as e:
-                errors.append(f"{file.filename}: Compression failed - {str(e)}")
-                continue
-
-            # Submit upload task
-            future = global_executor.submit(
-                upload_single_image,
-                supabase_path,
-                compressed_content,
-                content_type
-            )
-
-            futures.append((future, {
-                "filename": unique_filename,
-                "original": filename,
-                "path": supabase_path,
-                "original_size": file_size,
-                "compressed_size": compressed_size,
-                "type": content_type
-            }))
+            # Cap at 50MB and render variants in the image process pool
+            jobs.append((submit_image(file_content, MAX_IMAGE_SIZE), filename, file_size))
 
         except Exception as e:
             errors.append(f"Error processing {file.filename}: {str(e)}")
 
+    for job, filename, file_size in jobs:
+        try:
+            processed = job.result(timeout=IMAGE_JOB_TIMEOUT_SECONDS)
+        except Exception as e:
+            errors.append(f"{filename}: Compression failed - {str(e)}")
+            continue
+
+        # Create unique filename (extension of the stored format)
+        name_part = os.path.splitext(filename)[0]
+        unique_id = str(uuid.uuid4())[:8]
+        unique_filename = f"{name_part}_{unique_id}.{processed['ext']}"
+
+        # Build storage path for item images
+        supabase_path = f"items/{item_id}/{unique_filename}"
+        compressed_size = len(processed['content'])
+        log.info(f"Original size: {file_size} bytes, Stored size: {compressed_size} bytes")
+
+        # Submit upload tasks: original + variants
+        future = get_upload_executor().submit(
+            upload_single_image,
+            supabase_path,
+            processed['content'],
+            processed['content_type']
+        )
+        variant_futures = {}
+        for variant, content in processed['variants'].items():
+            path = variant_path(supabase_path, variant)
+            variant_futures[variant] = (path, get_upload_executor().submit(upload_single_image, path, content, "image/jpeg"))
+
+        futures.append((future, variant_futures, {
+            "filename": unique_filename,
+            "original": filename,
+            "path": supabase_path,
+            "original_size": file_size,
+            "compressed_size": compressed_size,
+            "type": processed['content_type'],
+            "width": processed['width'],
+            "height": processed['height']
+        }))
+
     # Collect results
-    for future, file_info in futures:
+    for future, variant_futures, file_info in futures:
         try:
             public_url = future.result(timeout=30)
-            uploaded_files.append({
-                "filename": file_info["filename"],
-                "original": file_info["original"],
-                "path": file_info["path"],
-                "original_size": file_info["original_size"],
-                "compressed_size": file_info["compressed_size"],
-                "type": file_info["type"],
-                "url": public_url
-            })
-            log.info(f"Successfully processed upload for {file_info['original']}")
         except Exception as e:
             error_msg = str(e) if str(e) else "Upload failed"
             errors.append(f"{file_info['original']}: {error_msg}")
             log.error(f"Failed to upload {file_info['original']}: {error_msg}")
+            continue
+
+        uploaded = dict(file_info, url=public_url, variant_paths=[])
+        for variant, (path, variant_future) in variant_futures.items():
+            try:
+                uploaded[f"{variant}_url"] = variant_future.result(timeout=30)
+                uploaded["variant_paths"].append(path)
+            except Exception as e:
+                # The original is stored; clients fall back to it
+                log.warning(f"Failed to upload {variant} for {file_info['original']}: {str(e)}")
+        uploaded_files.append(uploaded)
+        log.info(f"Successfully processed upload for {file_info['original']}")
 
     return uploaded_files, errors
 
@@ -717,6 +675,9 @@ def item_upload_image(id):
                 "url": f["url"],
                 "path": f["path"],
                 "size": f["compressed_size"],
+                "thumbnail_url": f.get("thumb_url"),
+                "preview_url": f.get("preview_url"),
+                "variant_paths": f["variant_paths"],
                 "uploaded_at": time.strftime("%Y-%m-%d %H:%M:%S")
             } for f in uploaded_files]
 
@@ -780,6 +741,7 @@ def get_item_images(id):
 
         # Also check Supabase storage for any files not in database
         try:
+            from utils.image_pipeline import VARIANT_SIZES
             storage_path = f"items/{id}"
             entries = supabase.storage.from_(ITEM_SUPABASE_BUCKET).list(path=storage_path)
 
@@ -788,7 +750,7 @@ def get_item_images(id):
                 db_filenames = set([img.get("filename") for img in images_list if isinstance(img, dict)])
 
                 for entry in entries:
-                    if isinstance(entry, dict) and entry.get('name'):
+                    if isinstance(entry, dict) and entry.get('name') and entry['name'] not in VARIANT_SIZES:
                         if entry['name'] not in db_filenames:
                             file_path = f"{storage_path}/{entry['name']}"
                             images_list.append({
@@ -841,19 +803,18 @@ def delete_item_images(id):
         current_images = sub_item.sub_item_image if sub_item.sub_item_image and isinstance(sub_item.sub_item_image, list) else []
 
         # Check if image exists in database
-        image_found = False
-        for img in current_images:
-            if isinstance(img, dict) and img.get("filename") == filename:
-                image_found = True
-                break
+        image = next(
+            (img for img in current_images if isinstance(img, dict) and img.get("filename") == filename),
+            None
+        )
 
-        if not image_found:
+        if not image:
             return jsonify({"error": f"Image '{filename}' not found for this item"}), 404
 
-        # Delete file from storage
+        # Delete file (and its thumb/preview variants) from storage
         file_path = f"items/{id}/{filename}"
         try:
-            supabase.storage.from_(ITEM_SUPABASE_BUCKET).remove([file_path])
+            supabase.storage.from_(ITEM_SUPABASE_BUCKET).remove([file_path] + (image.get("variant_paths") or []))
             log.info(f"Deleted image from storage: {file_path}")
         except Exception as e:
             log.error(f"Failed to delete {file_path} from storage: {str(e)}")
@@ -909,7 +870,7 @@ def delete_all_item_images(id):
                     filename = img.get("filename")
                     file_path = f"items/{id}/{filename}"
                     try:
-                        supabase.storage.from_(ITEM_SUPABASE_BUCKET).remove([file_path])
+                        supabase.storage.from_(ITEM_SUPABASE_BUCKET).remove([file_path] + (img.get("variant_paths") or []))
                         deleted_count += 1
                         log.info(f"Deleted image: {file_path}")
                     except Exception as e:
@@ -2,9 +2,14 @@ from flask import request, jsonify, g
 from config.db import db
 from models.vendor import Vendor, VendorProduct, VendorCategory
 from models.user import User
+from utils.vendor_product_matching import match_vendor_products
 from config.logging import get_logger
 from datetime import datetime
 from sqlalchemy import or_, and_, func
+from utils.pagination import (
+    InvalidCursorError, is_cursor_request, get_cursor_params, get_total_mode,
+    keyset_paginate, count_total, create_pagination_response
+)
 
 log = get_logger()
 
@@ -139,13 +144,38 @@ def get_all_vendors():
                 )
             )
 
-        # Order by most recent first
-        query = query.order_by(Vendor.created_at.desc())
+        cursor_mode = is_cursor_request(request)
+        if cursor_mode:
+            # Keyset pagination on (created_at, vendor_id), served by idx_vendors_created_at_vendor_id
+            try:
+                cursor, per_page = get_cursor_params(request, default_page_size=per_page)
+                vendors, next_cursor = keyset_paginate(
+                    query, Vendor.created_at, Vendor.vendor_id, cursor, per_page
+                )
+            except InvalidCursorError as e:
+                return jsonify({"success": False, "error": str(e)}), 400
+            total, total_is_estimate = count_total(query, get_total_mode(request))
+            pagination = create_pagination_response(
+                vendors, total, page_size=per_page, next_cursor=next_cursor,
+                cursor_mode=True, total_is_estimate=total_is_estimate
+            )
+        else:
+            # Order by most recent first
+            query = query.order_by(Vendor.created_at.desc())
 
-        # Paginate results
-        paginated_vendors = query.paginate(page=page, per_page=per_page, error_out=False)
+            # Paginate results
+            paginated_vendors = query.paginate(page=page, per_page=per_page, error_out=False)
+            vendors = paginated_vendors.items
+            pagination = {
+                "page": page,
+                "per_page": per_page,
+                "total": paginated_vendors.total,
+                "pages": paginated_vendors.pages,
+                "has_next": paginated_vendors.has_next,
+                "has_prev": paginated_vendors.has_prev
+            }
 
-        vendors_list = [vendor.to_dict() for vendor in paginated_vendors.items]
+        vendors_list = [vendor.to_dict() for vendor in vendors]
 
         # Get statistics — single GROUP BY query instead of 2 separate COUNTs
         from sqlalchemy import func
@@ -161,14 +191,7 @@ def get_all_vendors():
         return jsonify({
             "success": True,
             "vendors": vendors_list,
-            "pagination": {
-                "page": page,
-                "per_page": per_page,
-                "total": paginated_vendors.total,
-                "pages": paginated_vendors.pages,
-                "has_next": paginated_vendors.has_next,
-                "has_prev": paginated_vendors.has_prev
-            },
+            "pagination": pagination,
             "statistics": {
                 "total_active": total_active,
                 "total_inactive": total_inactive,
@@ -726,7 +749,8 @@ def get_vendors_matching_materials():
     POST /api/vendor/matching-vendors
     Find vendors whose products match the given material names.
     Returns only vendors that supply at least one of the requested materials,
-    with matching product details (including unit_price).
+    with matching product details (including unit_price), ranked by the number
+    of requested materials they cover, then by name similarity.
 
     Request body:
     {
@@ -742,58 +766,37 @@ def get_vendors_matching_materials():
         material_names = data['material_names']
         exclude_vendor_id = data.get('exclude_vendor_id')
 
-        # Build ILIKE conditions for fuzzy matching on product_name
-        product_conditions = []
-        for name in material_names:
-            clean_name = name.strip()
-            if clean_name:
-                product_conditions.append(
-                    func.lower(VendorProduct.product_name).contains(clean_name.lower())
-                )
-
-        if not product_conditions:
+        if not any(isinstance(name, str) and name.strip() for name in material_names):
             return jsonify({"success": True, "vendors": []}), 200
 
-        # Find all matching products with their vendors
-        matching_products = VendorProduct.query.join(
-            Vendor, VendorProduct.vendor_id == Vendor.vendor_id
-        ).filter(
-            Vendor.is_deleted == False,
-            Vendor.status == 'active',
-            VendorProduct.is_deleted == False,
-            db.or_(*product_conditions)
-        )
-
-        if exclude_vendor_id:
-            matching_products = matching_products.filter(
-                Vendor.vendor_id != exclude_vendor_id
-            )
-
-        matching_products = matching_products.all()
-
-        if not matching_products:
+        # One indexed (pg_trgm) query: vendors ranked by matched materials, then similarity
+        matches = match_vendor_products(material_names, exclude_vendor_id)
+        if not matches:
             return jsonify({"success": True, "vendors": [], "total": 0}), 200
 
-        # Group products by vendor_id
-        vendor_ids = set()
-        products_by_vendor = {}
-        for product in matching_products:
-            vendor_ids.add(product.vendor_id)
-            if product.vendor_id not in products_by_vendor:
-                products_by_vendor[product.vendor_id] = []
-            products_by_vendor[product.vendor_id].append(product.to_dict())
-
-        # Fetch vendor details
-        vendors = Vendor.query.filter(
-            Vendor.vendor_id.in_(vendor_ids)
-        ).order_by(Vendor.company_name.asc()).all()
+        product_ids = [product_id for match in matches for product_id in match.product_ids]
+        products = {
+            p.product_id: p
+            for p in VendorProduct.query.filter(VendorProduct.product_id.in_(product_ids)).all()
+        }
+        vendors = {
+            v.vendor_id: v
+            for v in Vendor.query.filter(Vendor.vendor_id.in_([match.vendor_id for match in matches])).all()
+        }
 
         vendors_list = []
-        for vendor in vendors:
+        for match in matches:
+            vendor = vendors.get(match.vendor_id)
+            if not vendor:
+                continue
             vendor_data = vendor.to_dict()
             vendor_data['vendor_name'] = vendor.company_name
-            vendor_data['matching_products'] = products_by_vendor.get(vendor.vendor_id, [])
+            vendor_data['matching_products'] = [
+                products[product_id].to_dict() for product_id in match.product_ids if product_id in products
+            ]
             vendor_data['matching_products_count'] = len(vendor_data['matching_products'])
+            vendor_data['matched_materials_count'] = match.matched_materials
+            vendor_data['match_score'] = match.match_score
             vendors_list.append(vendor_data)
 
         return jsonify({
@@ -25,6 +25,7 @@ from models.change_request import ChangeRequest
 from models.po_child import POChild
 from models.vendor import Vendor
 from models.lpo_customization import LPOCustomization
+from utils.inspection_evidence import get_inspections_evidence, clear_storage_listing
 
 import logging
 
@@ -109,93 +110,6 @@ def _enrich_vrr_rejected_value(rr, data):
                 data['total_rejected_value'] = round(total, 2)
 
 
-def _detect_file_type(ext):
-    """Return MIME type from file extension."""
-    type_map = {
-        'jpg': 'image/jpeg', 'jpeg': 'image/jpeg', 'png': 'image/png',
-        'webp': 'image/webp', 'gif': 'image/gif', 'pdf': 'application/pdf',
-        'mp4': 'video/mp4', 'mov': 'video/quicktime', 'webm': 'video/webm',
-        'avi': 'video/x-msvideo', 'mkv': 'video/x-matroska',
-    }
-    return type_map.get(ext, 'image/jpeg')
-
-
-def _heal_evidence_from_storage(cr_id, expected_count, inspection_created_at):
-    """
-    Fallback: list files from Supabase Storage under inspections/{cr_id}/
-    and return the ones uploaded within 2 minutes before the inspection was created.
-    Used when evidence_urls contains only empty/broken objects.
-    """
-    try:
-        import os
-        from supabase import create_client
-        environment = os.environ.get('ENVIRONMENT', 'production')
-        supabase_url = os.environ.get('DEV_SUPABASE_URL' if environment == 'development' else 'SUPABASE_URL')
-        supabase_key = os.environ.get('DEV_SUPABASE_KEY' if environment == 'development' else 'SUPABASE_KEY')
-        if not supabase_url or not supabase_key:
-            return []
-
-        supabase = create_client(supabase_url, supabase_key)
-        BUCKET = 'file_upload'
-        files = supabase.storage.from_(BUCKET).list(f'inspections/{cr_id}') or []
-
-        candidate = []
-        for f in files:
-            name = f.get('name', '')
-            if not name:
-                continue
-            try:
-                # Filename format: YYYYMMDD_HHMMSS_uuid.ext
-                parts = name.split('_')
-                file_ts = datetime.strptime(f'{parts[0]}_{parts[1]}', '%Y%m%d_%H%M%S')
-                # Keep files uploaded up to 2 minutes before the inspection was created
-                delta = (inspection_created_at.replace(tzinfo=None) - file_ts).total_seconds()
-                if 0 <= delta <= 120:
-                    candidate.append((file_ts, name))
-            except (ValueError, IndexError):
-                continue
-
-        candidate.sort(key=lambda x: x[0])
-        selected = candidate[-expected_count:] if len(candidate) >= expected_count else candidate
-
-        base = f'{supabase_url}/storage/v1/object/public/{BUCKET}'
-        results = []
-        for _, name in selected:
-            ext = name.rsplit('.', 1)[-1].lower() if '.' in name else ''
-            ft = _detect_file_type(ext)
-            results.append({'url': f'{base}/inspections/{cr_id}/{name}', 'file_name': name, 'file_type': ft})
-        return results
-    except Exception as e:
-        log.warning(f'Failed to heal evidence from storage for CR {cr_id}: {e}')
-        return []
-
-
-def _normalize_evidence(raw, cr_id=None, inspection_created_at=None):
-    """
-    Normalize evidence items to {url, file_name, file_type} objects.
-    Handles both plain URL strings and dict objects.
-    If all items are empty/broken, auto-heals by listing files from Supabase storage.
-    """
-    valid = []
-    broken_count = 0
-
-    for item in (raw or []):
-        if isinstance(item, str) and item:
-            file_name = item.split('/')[-1].split('?')[0]
-            ext = file_name.rsplit('.', 1)[-1].lower() if '.' in file_name else ''
-            valid.append({'url': item, 'file_name': file_name, 'file_type': _detect_file_type(ext)})
-        elif isinstance(item, dict) and item.get('url'):
-            valid.append(item)
-        else:
-            broken_count += 1
-
-    # If everything is broken and we have enough context, heal from storage
-    if broken_count > 0 and not valid and cr_id and inspection_created_at:
-        return _heal_evidence_from_storage(cr_id, broken_count, inspection_created_at)
-
-    return valid
-
-
 def _generate_return_request_number():
     """Generate sequential return request number: VRR-2026-001
     Uses MAX() aggregate to avoid row-level locking.
@@ -1133,24 +1047,8 @@ def get_inspection_history():
             joinedload(VendorDeliveryInspection.po_child)
         ).order_by(VendorDeliveryInspection.created_at.desc()).offset((page - 1) * per_page).limit(per_page).all()
 
-        # Parallelize evidence normalization — each broken record requires a
-        # Supabase Storage network call; running them concurrently cuts total
-        # latency from N×latency down to ~1×latency.
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        def _fetch_evidence(insp):
-            return insp.id, _normalize_evidence(
-                insp.evidence_urls,
-                cr_id=insp.cr_id,
-                inspection_created_at=insp.created_at,
-            )
-
-        evidence_map = {}
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {executor.submit(_fetch_evidence, insp): insp for insp in inspections}
-            for future in as_completed(futures):
-                insp_id, normalized = future.result()
-                evidence_map[insp_id] = normalized
+        # Normalised evidence; broken records are healed from storage once and persisted
+        evidence_map = get_inspections_evidence(inspections)
 
         records = []
         for insp in inspections:
@@ -1311,6 +1209,7 @@ def upload_inspection_evidence():
             file=file_content,
             file_options={"content-type": content_type, "upsert": "true"}
         )
+        clear_storage_listing(f"inspections/{cr_id}")
 
         public_url = f"{supabase_url}/storage/v1/object/public/{BUCKET}/{path}"
 
@@ -1821,26 +1720,12 @@ def get_return_requests():
             ).all()
             new_po_child_map = {pc.id: pc for pc in new_po_children}
 
-        # Parallel evidence normalization for VRRs that have inspections
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        def _fetch_vrr_evidence(rr):
-            if not rr.inspection:
-                return rr.id, []
-            return rr.id, _normalize_evidence(
-                rr.inspection.evidence_urls,
-                cr_id=rr.cr_id,
-                inspection_created_at=rr.inspection.created_at,
-            )
-
-        evidence_map = {}
-        vrrs_with_inspection = [rr for rr in requests if rr.inspection]
-        if vrrs_with_inspection:
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {executor.submit(_fetch_vrr_evidence, rr): rr for rr in vrrs_with_inspection}
-                for future in as_completed(futures):
-                    rr_id, normalized = future.result()
-                    evidence_map[rr_id] = normalized
+        # Normalised inspection evidence; broken records are healed from storage once and persisted
+        inspection_evidence = get_inspections_evidence([rr.inspection for rr in requests if rr.inspection])
+        evidence_map = {
+            rr.id: inspection_evidence.get(rr.inspection.id, [])
+            for rr in requests if rr.inspection
+        }
 
         results = []
         for rr in requests:
@@ -2512,26 +2397,12 @@ def get_pending_return_approvals():
             VendorReturnRequest.created_at.desc()
         ).offset((page - 1) * per_page).limit(per_page).all()
 
-        # Parallel evidence normalization
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        def _fetch_evidence_td(rr):
-            if not rr.inspection:
-                return rr.id, []
-            return rr.id, _normalize_evidence(
-                rr.inspection.evidence_urls,
-                cr_id=rr.cr_id,
-                inspection_created_at=rr.inspection.created_at,
-            )
-
-        evidence_map = {}
-        vrrs_with_insp = [rr for rr in requests if rr.inspection]
-        if vrrs_with_insp:
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {executor.submit(_fetch_evidence_td, rr): rr for rr in vrrs_with_insp}
-                for future in as_completed(futures):
-                    rr_id, normalized = future.result()
-                    evidence_map[rr_id] = normalized
+        # Normalised inspection evidence; broken records are healed from storage once and persisted
+        inspection_evidence = get_inspections_evidence([rr.inspection for rr in requests if rr.inspection])
+        evidence_map = {
+            rr.id: inspection_evidence.get(rr.inspection.id, [])
+            for rr in requests if rr.inspection
+        }
 
         results = []
         for rr in requests:
@@ -2613,26 +2484,12 @@ def get_all_td_return_requests():
             VendorReturnRequest.created_at.desc()
         ).offset((page - 1) * per_page).limit(per_page).all()
 
-        # Parallel evidence normalization
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        def _fetch_evidence_all(rr):
-            if not rr.inspection:
-                return rr.id, []
-            return rr.id, _normalize_evidence(
-                rr.inspection.evidence_urls,
-                cr_id=rr.cr_id,
-                inspection_created_at=rr.inspection.created_at,
-            )
-
-        evidence_map = {}
-        vrrs_with_insp = [rr for rr in requests_list if rr.inspection]
-        if vrrs_with_insp:
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {executor.submit(_fetch_evidence_all, rr): rr for rr in vrrs_with_insp}
-                for future in as_completed(futures):
-                    rr_id, normalized = future.result()
-                    evidence_map[rr_id] = normalized
+        # Normalised inspection evidence; broken records are healed from storage once and persisted
+        inspection_evidence = get_inspections_evidence([rr.inspection for rr in requests_list if rr.inspection])
+        evidence_map = {
+            rr.id: inspection_evidence.get(rr.inspection.id, [])
+            for rr in requests_list if rr.inspection
+        }
 
         results = []
         for rr in requests_list:
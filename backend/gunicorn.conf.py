@@ -0,0 +1,58 @@
+"""
+Gunicorn configuration for production (replaces socketio.run / Werkzeug).
+
+Run (from backend/):
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Socket.IO runs in threading mode, so the worker class is gthread: each
+worker process serves HTTP requests and Socket.IO connections from a thread
+pool (WebSockets through simple-websocket, one thread per open socket).
+eventlet/gevent are not used: monkey-patching would break psycopg2 and the
+image ProcessPoolExecutor.
+
+Several workers need Socket.IO to share state across processes: set
+SOCKETIO_MESSAGE_QUEUE (e.g. redis://...) so emits from one worker reach
+clients connected to another. Without it a single worker is started.
+Long-polling clients additionally need sticky sessions in front of several
+workers; the frontend connects over WebSocket first.
+
+Environment:
+    PORT                    listen port (default 5000)
+    WEB_CONCURRENCY         worker processes
+    GUNICORN_THREADS        threads per worker (default 100)
+    GUNICORN_TIMEOUT        seconds before a stuck worker is restarted (default 120)
+    GUNICORN_MAX_REQUESTS   recycle workers after N requests (default 0 = never)
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+worker_class = 'gthread'
+_default_workers = min(4, multiprocessing.cpu_count()) if os.getenv('SOCKETIO_MESSAGE_QUEUE') else 1
+workers = int(os.getenv('WEB_CONCURRENCY', str(_default_workers)))
+# Open WebSockets each hold a thread; PDF exports and API calls share the rest
+threads = int(os.getenv('GUNICORN_THREADS', '100'))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+# SIGTERM: stop accepting, finish in-flight requests, then drain background queues
+graceful_timeout = 60
+keepalive = 5
+
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '0'))
+max_requests_jitter = max_requests // 10
+
+# Each worker builds its own app (no preload): DB pools, Socket.IO and
+# background threads are never shared across a fork
+preload_app = False
+
+accesslog = None
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+def worker_exit(server, worker):
+    """Drain upload / image / email / login-history queues before the worker exits."""
+    from utils.graceful_shutdown import drain_background_work
+    drain_background_work()
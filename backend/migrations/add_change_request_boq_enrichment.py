@@ -0,0 +1,61 @@
+"""
+Migration: Add persisted BOQ enrichment to change_requests
+Purpose: Store the BOQ-derived cost estimate and sub_item_name enrichment on
+         each change request (services/change_request_enrichment.py) so the
+         CR list endpoint no longer loads and walks BOQ JSON per request.
+
+Adds the columns and backfills every existing CR. New and edited CRs are
+kept current by the before_flush listener registered in app.py.
+
+Re-run the backfill only (e.g. after BOQ JSON was edited outside the ORM):
+  python backend/migrations/add_change_request_boq_enrichment.py --backfill
+
+Run:
+  python backend/migrations/add_change_request_boq_enrichment.py
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db import db
+from app import create_app
+from services.change_request_enrichment import backfill_change_request_enrichment
+
+
+def add_columns():
+    db.session.execute(db.text("""
+        ALTER TABLE change_requests
+        ADD COLUMN IF NOT EXISTS boq_estimated_cost DOUBLE PRECISION,
+        ADD COLUMN IF NOT EXISTS boq_sub_item_names JSONB
+    """))
+    db.session.commit()
+
+
+def run_migration(argv):
+    app = create_app()
+
+    with app.app_context():
+        try:
+            if '--backfill' not in argv:
+                print("Adding boq_estimated_cost / boq_sub_item_names to change_requests...")
+                add_columns()
+
+            print("Backfilling change request enrichment...")
+            updated = backfill_change_request_enrichment()
+            print(f"✓ {updated} change request(s) enriched")
+            return True
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = run_migration(sys.argv[1:])
+    sys.exit(0 if success else 1)
@@ -0,0 +1,81 @@
+"""
+Migration: Add notifications.dedup_key with a partial unique index
+Purpose: Duplicate notification suppression becomes a single
+         INSERT ... ON CONFLICT (dedup_key) WHERE dedup_key IS NOT NULL DO NOTHING
+         instead of an ILIKE title scan over the user's recent notifications.
+
+The key is built by utils/notification_dedup.notification_dedup_key()
+(event + entity + recipient + time bucket). Existing rows keep NULL and are
+not covered by the index.
+
+The index is built CONCURRENTLY so the notifications table stays writable.
+
+Run:
+  python backend/migrations/add_notification_dedup_key.py
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+import psycopg2
+from dotenv import load_dotenv
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+load_dotenv()
+
+
+def get_db_connection():
+    """Get database connection from environment variables"""
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        raise Exception("DATABASE_URL not found in environment variables")
+    return psycopg2.connect(database_url)
+
+
+def run_migration():
+    conn = get_db_connection()
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    conn.autocommit = True
+    cursor = conn.cursor()
+
+    try:
+        print("Adding notifications.dedup_key...")
+        cursor.execute("""
+            ALTER TABLE notifications
+            ADD COLUMN IF NOT EXISTS dedup_key VARCHAR(255)
+        """)
+
+        # A failed concurrent build leaves an INVALID index behind; drop it so it is rebuilt
+        cursor.execute("""
+            SELECT i.indisvalid
+            FROM pg_class c
+            JOIN pg_index i ON i.indexrelid = c.oid
+            WHERE c.relname = 'uq_notification_dedup_key'
+        """)
+        row = cursor.fetchone()
+        if row and not row[0]:
+            print("  Dropping invalid uq_notification_dedup_key from a previous run...")
+            cursor.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_notification_dedup_key")
+
+        print("Creating partial unique index uq_notification_dedup_key...")
+        cursor.execute("""
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_notification_dedup_key
+            ON notifications (dedup_key)
+            WHERE dedup_key IS NOT NULL
+        """)
+
+        print("✓ Migration completed successfully!")
+        return True
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        return False
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == '__main__':
+    success = run_migration()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,62 @@
+"""
+Migration: NOT NULL vendors.created_at for keyset pagination
+Purpose: The vendor list pages on (created_at, vendor_id). While created_at was
+         nullable the keyset had to COALESCE it, which no index can serve.
+         Backfill legacy NULLs, make the column NOT NULL and index the
+         (created_at, vendor_id) key the listing orders and compares on.
+
+Run:
+  python backend/migrations/add_vendor_created_at_not_null.py
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db import db
+from app import create_app
+
+
+def run_migration():
+    app = create_app()
+
+    with app.app_context():
+        try:
+            print("Backfilling vendors without created_at...")
+            result = db.session.execute(db.text("""
+                UPDATE vendors
+                SET created_at = COALESCE(last_modified_at, NOW())
+                WHERE created_at IS NULL
+            """))
+            print(f"  {result.rowcount} vendor(s) backfilled")
+
+            print("Making vendors.created_at NOT NULL...")
+            db.session.execute(db.text("""
+                ALTER TABLE vendors
+                ALTER COLUMN created_at SET DEFAULT NOW(),
+                ALTER COLUMN created_at SET NOT NULL
+            """))
+
+            print("Creating keyset index...")
+            db.session.execute(db.text("""
+                CREATE INDEX IF NOT EXISTS idx_vendors_created_at_vendor_id
+                ON vendors (created_at DESC, vendor_id DESC)
+            """))
+            db.session.execute(db.text("ANALYZE vendors"))
+            db.session.commit()
+            print("✓ Done")
+            return True
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = run_migration()
+    sys.exit(0 if success else 1)
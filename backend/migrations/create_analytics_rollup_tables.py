@@ -0,0 +1,85 @@
+"""
+Migration: Create analytics rollup tables
+Purpose: Daily pre-aggregates for the admin dashboard analytics
+         (services/analytics_rollups.py): users/projects/BOQs/CRs/vendors
+         created, inventory transactions, delivery notes, material requests
+         and logins per day.
+
+Creates the tables and runs the first refresh (aggregates all history).
+
+Incremental refresh job - schedule it hourly:
+  cd backend && python migrations/create_analytics_rollup_tables.py --refresh
+
+Run:
+  python backend/migrations/create_analytics_rollup_tables.py
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db import db
+from app import create_app
+from services.analytics_rollups import refresh_analytics_rollups
+
+
+def create_tables():
+    db.session.execute(db.text("""
+        CREATE TABLE IF NOT EXISTS analytics_daily_rollups (
+            day DATE NOT NULL,
+            metric VARCHAR(50) NOT NULL,
+            dimension VARCHAR(100) NOT NULL DEFAULT '',
+            count INTEGER NOT NULL DEFAULT 0,
+            amount DOUBLE PRECISION NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, metric, dimension)
+        )
+    """))
+    db.session.execute(db.text("""
+        CREATE INDEX IF NOT EXISTS idx_analytics_rollups_metric_day
+        ON analytics_daily_rollups (metric, day)
+    """))
+    db.session.execute(db.text("""
+        CREATE TABLE IF NOT EXISTS analytics_rollup_state (
+            metric VARCHAR(50) PRIMARY KEY,
+            rolled_up_through DATE NOT NULL,
+            refreshed_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+        )
+    """))
+    db.session.execute(db.text("""
+        CREATE TABLE IF NOT EXISTS analytics_rollup_dirty_days (
+            metric VARCHAR(50) NOT NULL,
+            day DATE NOT NULL,
+            PRIMARY KEY (metric, day)
+        )
+    """))
+    db.session.commit()
+
+
+def run_migration(argv):
+    app = create_app()
+
+    with app.app_context():
+        try:
+            if '--refresh' not in argv:
+                print("Creating analytics rollup tables...")
+                create_tables()
+
+            print("Refreshing analytics rollups...")
+            for metric, days in refresh_analytics_rollups().items():
+                print(f"  {metric}: {days} day(s) aggregated")
+            print("✓ Done")
+            return True
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = run_migration(sys.argv[1:])
+    sys.exit(0 if success else 1)
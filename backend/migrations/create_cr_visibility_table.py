@@ -0,0 +1,84 @@
+"""
+Migration: Create cr_visibility table
+Purpose: Precomputed change request visibility (services/cr_visibility.py) -
+         the SE / PM / MEP / estimator inboxes of the CR list become one
+         indexed join instead of per-request project lookups and IN filters.
+
+Creates the table and builds it for all change requests. Rows are kept
+current by the after_flush listener registered in app.py; rebuild after
+bulk changes made outside the ORM:
+  python backend/migrations/create_cr_visibility_table.py --rebuild
+
+Parity check against the previous per-request filters:
+  python backend/migrations/create_cr_visibility_table.py --verify [user_id ...]
+
+Run:
+  python backend/migrations/create_cr_visibility_table.py
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db import db
+from app import create_app
+from services.cr_visibility import refresh_cr_visibility, verify_visibility_index
+
+
+def create_table():
+    db.session.execute(db.text("""
+        CREATE TABLE IF NOT EXISTS cr_visibility (
+            user_id INTEGER NOT NULL,
+            reason VARCHAR(20) NOT NULL,
+            cr_id INTEGER NOT NULL REFERENCES change_requests(cr_id) ON DELETE CASCADE,
+            PRIMARY KEY (user_id, reason, cr_id)
+        )
+    """))
+    db.session.execute(db.text("""
+        CREATE INDEX IF NOT EXISTS idx_cr_visibility_cr
+        ON cr_visibility (cr_id)
+    """))
+    db.session.commit()
+
+
+def run_migration(argv):
+    app = create_app()
+
+    with app.app_context():
+        try:
+            if '--verify' in argv:
+                user_ids = [int(arg) for arg in argv[argv.index('--verify') + 1:]]
+                print("Comparing indexed inboxes with the per-request filters...")
+                mismatches = verify_visibility_index(user_ids or None)
+                for mismatch in mismatches:
+                    print(f"  ✗ {mismatch}")
+                if mismatches:
+                    print(f"✗ {len(mismatches)} mismatch(es)")
+                    return False
+                print("✓ Visibility index matches the per-request filters")
+                return True
+
+            if '--rebuild' not in argv:
+                print("Creating cr_visibility table...")
+                create_table()
+
+            print("Building change request visibility...")
+            refresh_cr_visibility(rebuild_all=True)
+            db.session.commit()
+            count = db.session.execute(db.text("SELECT count(*) FROM cr_visibility")).scalar()
+            print(f"✓ {count} visibility row(s)")
+            return True
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = run_migration(sys.argv[1:])
+    sys.exit(0 if success else 1)
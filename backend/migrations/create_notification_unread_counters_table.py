@@ -0,0 +1,62 @@
+"""
+Migration: Create notification_unread_counters table
+Purpose: Per-user unread notification counts maintained on write
+         (utils/notification_counters.py), so /notifications/count and the
+         unread badge read one row instead of counting notifications.
+
+Also the reconciliation job: --reconcile recomputes every counter from the
+notifications table and corrects drifted rows. Schedule it (e.g. hourly cron):
+  cd backend && python migrations/create_notification_unread_counters_table.py --reconcile
+
+Run:
+  python backend/migrations/create_notification_unread_counters_table.py              # create + backfill
+  python backend/migrations/create_notification_unread_counters_table.py --reconcile  # reconcile only
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db import db
+from app import create_app
+from utils.notification_counters import reconcile_unread_counters
+
+
+def create_table():
+    db.session.execute(db.text("""
+        CREATE TABLE IF NOT EXISTS notification_unread_counters (
+            user_id INTEGER PRIMARY KEY REFERENCES users(user_id) ON DELETE CASCADE,
+            unread_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+        )
+    """))
+    db.session.commit()
+
+
+def run_migration(reconcile_only=False):
+    app = create_app()
+
+    with app.app_context():
+        try:
+            if not reconcile_only:
+                print("Creating notification_unread_counters...")
+                create_table()
+
+            print("Reconciling counters from notifications...")
+            corrected = reconcile_unread_counters(push=False)
+            print(f"✓ {len(corrected)} counter(s) written")
+            return True
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = run_migration(reconcile_only='--reconcile' in sys.argv[1:])
+    sys.exit(0 if success else 1)
@@ -0,0 +1,81 @@
+"""
+Migration: Create payroll daily aggregates
+Purpose: Per (day, project, worker) totals of locked attendance behind the
+         payroll summary (services/payroll_aggregates.py).
+
+Creates the table and aggregates all locked attendance. Afterwards the
+table is kept current by the attendance write/lock listener.
+
+Recompute a date range (e.g. after manual SQL on daily_attendance):
+  python backend/migrations/create_payroll_daily_aggregates.py --rebuild [YYYY-MM-DD YYYY-MM-DD]
+
+Run:
+  python backend/migrations/create_payroll_daily_aggregates.py
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+from datetime import datetime
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db import db
+from app import create_app
+from services.payroll_aggregates import rebuild_payroll_aggregates
+
+
+def create_table():
+    db.session.execute(db.text("""
+        CREATE TABLE IF NOT EXISTS payroll_daily_aggregates (
+            attendance_date DATE NOT NULL,
+            project_id INTEGER NOT NULL,
+            worker_id INTEGER NOT NULL,
+            requisition_id INTEGER,
+            days_worked INTEGER NOT NULL DEFAULT 0,
+            total_hours DOUBLE PRECISION NOT NULL DEFAULT 0,
+            regular_hours DOUBLE PRECISION NOT NULL DEFAULT 0,
+            overtime_hours DOUBLE PRECISION NOT NULL DEFAULT 0,
+            total_cost DOUBLE PRECISION NOT NULL DEFAULT 0,
+            PRIMARY KEY (attendance_date, project_id, worker_id)
+        )
+    """))
+    db.session.execute(db.text("""
+        CREATE INDEX IF NOT EXISTS idx_payroll_aggregates_project_date
+        ON payroll_daily_aggregates (project_id, attendance_date)
+    """))
+    db.session.commit()
+
+
+def _date_args(argv, flag):
+    index = argv.index(flag)
+    values = [datetime.strptime(v, '%Y-%m-%d').date() for v in argv[index + 1:index + 3]]
+    return (values + [None, None])[:2]
+
+
+def run_migration(argv):
+    app = create_app()
+
+    with app.app_context():
+        try:
+            start, end = _date_args(argv, '--rebuild') if '--rebuild' in argv else (None, None)
+            if '--rebuild' not in argv:
+                print("Creating payroll_daily_aggregates table...")
+                create_table()
+
+            print(f"Aggregating locked attendance ({start or 'all'} .. {end or 'all'})...")
+            rows = rebuild_payroll_aggregates(start, end)
+            print(f"✓ {rows} day row(s) written")
+            return True
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = run_migration(sys.argv[1:])
+    sys.exit(0 if success else 1)
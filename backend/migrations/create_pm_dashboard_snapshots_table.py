@@ -0,0 +1,71 @@
+"""
+Migration: Create pm_dashboard_snapshots table
+Purpose: Read model for the PM dashboard (services/pm_dashboard_read_model.py).
+         GET /pm_dashboard reads one precomputed row per PM (or 'all' for the
+         admin view); workflow writes mark PM rows stale and the next read
+         rebuilds, the 'all' row is refreshed in the background. version is
+         bumped by every invalidation so a rebuild racing a write stays stale.
+
+--invalidate marks every snapshot stale so all dashboards are rebuilt on their
+next read (use after bulk data fixes made outside the application).
+
+Run:
+  python backend/migrations/create_pm_dashboard_snapshots_table.py
+  python backend/migrations/create_pm_dashboard_snapshots_table.py --invalidate
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db import db
+from app import create_app
+from services.pm_dashboard_read_model import invalidate_pm_dashboards
+
+
+def create_table():
+    db.session.execute(db.text("""
+        CREATE TABLE IF NOT EXISTS pm_dashboard_snapshots (
+            scope_key VARCHAR(32) PRIMARY KEY,
+            payload JSONB NOT NULL,
+            computed_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+            stale_since TIMESTAMP,
+            version BIGINT NOT NULL DEFAULT 0,
+            build_ms INTEGER
+        )
+    """))
+    # Tables created before invalidations were versioned
+    db.session.execute(db.text(
+        "ALTER TABLE pm_dashboard_snapshots ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 0"
+    ))
+    db.session.commit()
+
+
+def run_migration(invalidate_only=False):
+    app = create_app()
+
+    with app.app_context():
+        try:
+            if invalidate_only:
+                print("Marking all PM dashboard snapshots stale...")
+                invalidate_pm_dashboards(all_scopes=True)
+                db.session.commit()
+            else:
+                print("Creating pm_dashboard_snapshots...")
+                create_table()
+            print("✓ Migration completed successfully!")
+            return True
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = run_migration(invalidate_only='--invalidate' in sys.argv[1:])
+    sys.exit(0 if success else 1)
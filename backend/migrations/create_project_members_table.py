@@ -0,0 +1,164 @@
+"""
+Migration: Create project_members table
+Purpose: Normalised project membership (project_id, user_id, role) so that
+         "projects for user X in role Y" is an indexed join instead of a
+         JSONB containment scan over project.user_id / project.mep_supervisor_id.
+
+Roles mirrored from the project table:
+  pm        -> project.user_id            (JSONB array)
+  mep       -> project.mep_supervisor_id  (JSONB array)
+  se        -> project.site_supervisor_id
+  estimator -> project.estimator_id
+  buyer     -> project.buyer_id
+
+The JSON columns remain the source of truth during the transition; the app
+keeps project_members in sync on every Project flush
+(utils/project_membership.py).
+
+Run:
+  python backend/migrations/create_project_members_table.py           # create + backfill
+  python backend/migrations/create_project_members_table.py --check   # drift report only
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+import psycopg2
+from dotenv import load_dotenv
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+load_dotenv()
+
+
+# Expected membership derived from the project columns.
+# jsonb_typeof guards against legacy rows that stored a scalar instead of an array.
+EXPECTED_MEMBERS_SQL = """
+    SELECT p.project_id, (e.value)::int AS user_id, 'pm' AS role
+    FROM project p
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(p.user_id) = 'array' THEN p.user_id
+             WHEN p.user_id IS NULL OR jsonb_typeof(p.user_id) = 'null' THEN '[]'::jsonb
+             ELSE jsonb_build_array(p.user_id) END
+    ) AS e(value)
+    WHERE e.value ~ '^[0-9]+$'
+    UNION
+    SELECT p.project_id, (e.value)::int, 'mep'
+    FROM project p
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(p.mep_supervisor_id) = 'array' THEN p.mep_supervisor_id
+             WHEN p.mep_supervisor_id IS NULL OR jsonb_typeof(p.mep_supervisor_id) = 'null' THEN '[]'::jsonb
+             ELSE jsonb_build_array(p.mep_supervisor_id) END
+    ) AS e(value)
+    WHERE e.value ~ '^[0-9]+$'
+    UNION
+    SELECT project_id, site_supervisor_id, 'se' FROM project WHERE site_supervisor_id IS NOT NULL
+    UNION
+    SELECT project_id, estimator_id, 'estimator' FROM project WHERE estimator_id IS NOT NULL
+    UNION
+    SELECT project_id, buyer_id, 'buyer' FROM project WHERE buyer_id IS NOT NULL
+"""
+
+
+def get_db_connection():
+    """Get database connection from environment variables"""
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        raise Exception("DATABASE_URL not found in environment variables")
+    return psycopg2.connect(database_url)
+
+
+def check_drift(cursor):
+    """Print and return the number of rows that differ between project and project_members"""
+    cursor.execute(f"""
+        WITH expected AS ({EXPECTED_MEMBERS_SQL}),
+        missing AS (
+            SELECT project_id, user_id, role FROM expected
+            EXCEPT
+            SELECT project_id, user_id, role FROM project_members
+        ),
+        extra AS (
+            SELECT project_id, user_id, role FROM project_members
+            EXCEPT
+            SELECT project_id, user_id, role FROM expected
+        )
+        SELECT 'missing', project_id, user_id, role FROM missing
+        UNION ALL
+        SELECT 'extra', project_id, user_id, role FROM extra
+        ORDER BY 2, 1
+    """)
+    rows = cursor.fetchall()
+    if not rows:
+        print("✓ No drift: project_members matches project columns")
+        return 0
+
+    print(f"⚠️  {len(rows)} drifted membership rows:")
+    for kind, project_id, user_id, role in rows[:200]:
+        print(f"   {kind:<8} project={project_id} user={user_id} role={role}")
+    if len(rows) > 200:
+        print(f"   ... and {len(rows) - 200} more")
+    return len(rows)
+
+
+def run_migration():
+    """Create project_members and backfill it from the project table"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        print("\n" + "=" * 60)
+        print("PROJECT MEMBERS MIGRATION")
+        print("=" * 60)
+
+        print("1/3 Creating project_members table...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS project_members (
+                project_id INTEGER NOT NULL REFERENCES project(project_id) ON DELETE CASCADE,
+                user_id INTEGER NOT NULL,
+                role VARCHAR(20) NOT NULL,
+                created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                PRIMARY KEY (project_id, user_id, role)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_project_members_user_role
+                ON project_members(user_id, role, project_id);
+            CREATE INDEX IF NOT EXISTS idx_project_members_project_role
+                ON project_members(project_id, role);
+
+            COMMENT ON TABLE project_members IS
+                'Normalised mirror of project.user_id / mep_supervisor_id / site_supervisor_id / estimator_id / buyer_id';
+        """)
+
+        print("2/3 Backfilling from project columns...")
+        cursor.execute(f"""
+            INSERT INTO project_members (project_id, user_id, role)
+            {EXPECTED_MEMBERS_SQL}
+            ON CONFLICT DO NOTHING
+        """)
+        print(f"   ✓ Inserted {cursor.rowcount} membership rows")
+
+        conn.commit()
+
+        print("3/3 Checking drift...")
+        check_drift(cursor)
+
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    if '--check' in sys.argv:
+        connection = get_db_connection()
+        try:
+            drifted = check_drift(connection.cursor())
+        finally:
+            connection.close()
+        sys.exit(1 if drifted else 0)
+    run_migration()
@@ -0,0 +1,128 @@
+"""
+Migration: Create worker availability tables
+Purpose: Indexed worker availability lookups for labour assignment
+         (services/worker_availability.py)
+
+Tables Created:
+  1. worker_skills   - (skill_key, worker_id) canonical skill keys from workers.skills
+  2. worker_bookings - (worker_id, work_date, start_time, end_time) per assigned requisition
+
+Backfill:
+  - worker_skills from workers.skills using utils.skill_matcher.canonical_skill_key
+  - worker_bookings from labour_requisitions.assigned_worker_ids, released where
+    the worker's arrival for that requisition/day is 'departed'
+
+Run: python backend/migrations/create_worker_availability_tables.py
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+import psycopg2
+from psycopg2.extras import execute_values
+from dotenv import load_dotenv
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+load_dotenv()
+
+from utils.skill_matcher import canonical_skill_key
+
+
+def get_db_connection():
+    """Get database connection from environment variables"""
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        raise Exception("DATABASE_URL not found in environment variables")
+    return psycopg2.connect(database_url)
+
+
+def run_migration():
+    """Create worker_skills / worker_bookings and backfill them"""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        print("\n" + "=" * 60)
+        print("WORKER AVAILABILITY MIGRATION")
+        print("=" * 60)
+
+        print("1/4 Creating worker_skills table...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS worker_skills (
+                skill_key VARCHAR(100) NOT NULL,
+                worker_id INTEGER NOT NULL REFERENCES workers(worker_id) ON DELETE CASCADE,
+                skill_name VARCHAR(255) NOT NULL,
+                PRIMARY KEY (skill_key, worker_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_worker_skills_worker ON worker_skills(worker_id);
+        """)
+
+        print("2/4 Creating worker_bookings table...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS worker_bookings (
+                booking_id SERIAL PRIMARY KEY,
+                worker_id INTEGER NOT NULL REFERENCES workers(worker_id) ON DELETE CASCADE,
+                requisition_id INTEGER NOT NULL REFERENCES labour_requisitions(requisition_id) ON DELETE CASCADE,
+                work_date DATE NOT NULL,
+                start_time TIME,
+                end_time TIME,
+                released_at TIMESTAMP,
+                created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                CONSTRAINT unique_worker_booking_requisition UNIQUE (requisition_id, worker_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_worker_bookings_date_worker ON worker_bookings(work_date, worker_id);
+        """)
+
+        print("3/4 Backfilling worker_skills...")
+        cursor.execute("SELECT worker_id, skills FROM workers WHERE skills IS NOT NULL")
+        rows = []
+        for worker_id, skills in cursor.fetchall():
+            seen = set()
+            for skill in (skills if isinstance(skills, list) else []):
+                key = canonical_skill_key(skill)
+                if key and key not in seen:
+                    seen.add(key)
+                    rows.append((key[:100], worker_id, str(skill).strip()[:255]))
+        if rows:
+            execute_values(cursor, """
+                INSERT INTO worker_skills (skill_key, worker_id, skill_name) VALUES %s
+                ON CONFLICT DO NOTHING
+            """, rows, page_size=1000)
+        print(f"   ✓ {len(rows)} worker skill rows")
+
+        print("4/4 Backfilling worker_bookings...")
+        cursor.execute("""
+            INSERT INTO worker_bookings (worker_id, requisition_id, work_date, start_time, end_time, released_at)
+            SELECT w.worker_id, lr.requisition_id, lr.required_date, lr.start_time, lr.end_time,
+                   CASE WHEN la.arrival_status = 'departed' THEN COALESCE(la.departed_at, NOW()) END
+            FROM labour_requisitions lr
+            CROSS JOIN LATERAL jsonb_array_elements_text(lr.assigned_worker_ids) AS e(value)
+            JOIN workers w ON w.worker_id = (e.value)::int
+            LEFT JOIN labour_arrivals la
+                   ON la.requisition_id = lr.requisition_id
+                  AND la.worker_id = w.worker_id
+                  AND la.arrival_date = lr.required_date
+                  AND la.is_deleted = FALSE
+            WHERE lr.assignment_status = 'assigned'
+              AND lr.is_deleted = FALSE
+              AND jsonb_typeof(lr.assigned_worker_ids) = 'array'
+              AND e.value ~ '^[0-9]+$'
+            ON CONFLICT (requisition_id, worker_id) DO NOTHING
+        """)
+        print(f"   ✓ {cursor.rowcount} worker booking rows")
+
+        conn.commit()
+        print("\n✅ Migration completed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,136 @@
+"""
+Migration: Monthly partitioning, retention and archival for time-series tables
+Purpose: notifications, security_audit_logs and login_history are append-only
+         and grow without bound. They become RANGE-partitioned by month on
+         their timestamp column; expired months are archived to gzip'd CSV
+         files under RETENTION_ARCHIVE_DIR and/or dropped per
+         config/retention_config.py. Queries that filter on the timestamp
+         are pruned to the matching partitions with no controller changes.
+
+Subcommands:
+  convert   Rebuild each table as a partitioned table (one-off). Holds an
+            ACCESS EXCLUSIVE lock while rows are copied - run it in a
+            maintenance window. The old table is kept as <table>_unpartitioned;
+            drop it manually once verified. The primary key becomes
+            (id, <partition column>).
+  maintain  Create upcoming monthly partitions and apply retention. Safe to
+            run repeatedly; schedule it daily, e.g.:
+              0 3 * * * cd backend && python migrations/partition_time_series_tables.py maintain
+            Tables that are not converted yet still get retention applied
+            (archive + batched delete).
+  status    Show partitions and the retention cutoff for each table.
+
+Options:
+  --table <name>  Limit to one table
+  --dry-run       (maintain) report what would be archived/dropped
+
+After retention removes notifications, run
+  python migrations/create_notification_unread_counters_table.py --reconcile
+so unread counters match.
+
+Run:
+  python backend/migrations/partition_time_series_tables.py convert
+  python backend/migrations/partition_time_series_tables.py maintain [--dry-run]
+  python backend/migrations/partition_time_series_tables.py status
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+import psycopg2
+from dotenv import load_dotenv
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+load_dotenv()
+
+from config.retention_config import RETENTION_POLICIES, RETENTION_ARCHIVE_DIR, PARTITION_PREMAKE_MONTHS
+from utils.partition_maintenance import (
+    apply_retention,
+    convert_to_partitioned,
+    ensure_future_partitions,
+    is_partitioned,
+    list_partitions,
+    retention_cutoff,
+)
+
+
+def get_db_connection():
+    """Get database connection from environment variables"""
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        raise Exception("DATABASE_URL not found in environment variables")
+    return psycopg2.connect(database_url)
+
+
+def convert(conn, policies):
+    for policy in policies:
+        print(f"Converting {policy.table} (partitioned by {policy.partition_column})...")
+        if convert_to_partitioned(conn, policy, PARTITION_PREMAKE_MONTHS):
+            print(f"  ✓ {policy.table} partitioned; previous data kept in {policy.table}_unpartitioned")
+        else:
+            print(f"  - {policy.table} is already partitioned")
+
+
+def maintain(conn, policies, dry_run=False):
+    for policy in policies:
+        print(f"Maintaining {policy.table} (retention {policy.retention_months} months, {policy.action})...")
+        with conn.cursor() as cur:
+            partitioned = is_partitioned(cur, policy.table)
+        if partitioned and not dry_run:
+            for name in ensure_future_partitions(conn, policy, PARTITION_PREMAKE_MONTHS):
+                print(f"  + created {name}")
+        for action in apply_retention(conn, policy, RETENTION_ARCHIVE_DIR, dry_run=dry_run):
+            print(f"  {action}")
+
+
+def status(conn, policies):
+    for policy in policies:
+        with conn.cursor() as cur:
+            partitioned = is_partitioned(cur, policy.table)
+            partitions = list_partitions(cur, policy.table) if partitioned else []
+        print(f"{policy.table}: {'partitioned' if partitioned else 'not partitioned'}, "
+              f"retention {policy.retention_months} months ({policy.action}), "
+              f"cutoff {retention_cutoff(policy):%Y-%m-%d}")
+        for month, name in partitions:
+            print(f"  {name}")
+
+
+COMMANDS = {'convert': convert, 'maintain': maintain, 'status': status}
+
+
+def run_migration(argv):
+    command = argv[0] if argv and argv[0] in COMMANDS else None
+    if not command:
+        print(f"Usage: partition_time_series_tables.py {{{'|'.join(COMMANDS)}}} [--table <name>] [--dry-run]")
+        return False
+
+    policies = list(RETENTION_POLICIES.values())
+    if '--table' in argv:
+        index = argv.index('--table')
+        name = argv[index + 1] if index + 1 < len(argv) else None
+        if name not in RETENTION_POLICIES:
+            print(f"✗ Unknown table: {name} (expected one of {', '.join(RETENTION_POLICIES)})")
+            return False
+        policies = [RETENTION_POLICIES[name]]
+
+    conn = get_db_connection()
+    try:
+        if command == 'maintain':
+            maintain(conn, policies, dry_run='--dry-run' in argv)
+        else:
+            COMMANDS[command](conn, policies)
+        print("✓ Done")
+        return True
+
+    except Exception as e:
+        conn.rollback()
+        print(f"✗ Migration failed: {e}")
+        return False
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    success = run_migration(sys.argv[1:])
+    sys.exit(0 if success else 1)
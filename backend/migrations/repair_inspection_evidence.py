@@ -0,0 +1,46 @@
+"""
+Migration: Repair broken vendor inspection evidence
+Purpose: Heal inspections whose evidence_urls contain only empty/broken
+         objects from Supabase Storage (inspections/{cr_id}/) and persist the
+         result (utils/inspection_evidence.py), so listings stop re-listing
+         storage for them.
+
+Listings also heal and persist on first read; this one-off pass fixes the
+whole table up front. Safe to re-run.
+
+Run:
+  python backend/migrations/repair_inspection_evidence.py
+
+Date: 2026-10-18
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.db import db
+from app import create_app
+from utils.inspection_evidence import repair_inspection_evidence
+
+
+def run_migration():
+    app = create_app()
+
+    with app.app_context():
+        try:
+            print("Repairing inspection evidence from storage...")
+            checked, repaired = repair_inspection_evidence()
+            print(f"✓ {checked} inspection(s) with broken evidence, {repaired} repaired")
+            return True
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Migration failed: {e}")
+            return False
+
+
+if __name__ == '__main__':
+    success = run_migration()
+    sys.exit(0 if success else 1)
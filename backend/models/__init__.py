@@ -2,10 +2,11 @@ from config.db import db
 from models.user import User
 from models.role import Role
 from models.project import Project
+from models.project_member import ProjectMember
 from models.boq import BOQ
 from models.change_request import ChangeRequest
 from models.system_settings import SystemSettings
 from models.po_child import POChild
 from models.login_history import LoginHistory
 
-__all__ = ['db', 'User', 'Role', 'Project', 'BOQ', 'ChangeRequest', 'SystemSettings', 'POChild', 'LoginHistory']
+__all__ = ['db', 'User', 'Role', 'Project', 'ProjectMember', 'BOQ', 'ChangeRequest', 'SystemSettings', 'POChild', 'LoginHistory']
@@ -0,0 +1,41 @@
+"""
+Analytics Rollup Models
+Daily pre-aggregated counts behind the admin dashboard analytics.
+
+- analytics_daily_rollups:     (day, metric, dimension) -> count, amount
+- analytics_rollup_state:      last fully rolled-up day per metric
+- analytics_rollup_dirty_days: days whose source rows changed after being rolled up
+
+Filled by services/analytics_rollups.py.
+"""
+from datetime import datetime
+from config.db import db
+
+
+class AnalyticsDailyRollup(db.Model):
+    __tablename__ = 'analytics_daily_rollups'
+
+    day = db.Column(db.Date, primary_key=True)
+    metric = db.Column(db.String(50), primary_key=True)
+    dimension = db.Column(db.String(100), primary_key=True, default='')  # '' when the source value is NULL
+    count = db.Column(db.Integer, nullable=False, default=0)
+    amount = db.Column(db.Float, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('idx_analytics_rollups_metric_day', 'metric', 'day'),  # For: WHERE metric=X AND day BETWEEN ...
+    )
+
+
+class AnalyticsRollupState(db.Model):
+    __tablename__ = 'analytics_rollup_state'
+
+    metric = db.Column(db.String(50), primary_key=True)
+    rolled_up_through = db.Column(db.Date, nullable=False)
+    refreshed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+
+class AnalyticsRollupDirtyDay(db.Model):
+    __tablename__ = 'analytics_rollup_dirty_days'
+
+    metric = db.Column(db.String(50), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
@@ -60,6 +60,9 @@ class ChangeRequest(db.Model):
 
     # Financial tracking - Request impact
     materials_total_cost = db.Column(db.Float, default=0.0)  # Sum of all materials
+    # BOQ-derived enrichment, kept current by services/change_request_enrichment.py
+    boq_estimated_cost = db.Column(db.Float, nullable=True)  # materials × BOQ unit price when materials_total_cost is 0
+    boq_sub_item_names = db.Column(JSONB, nullable=True)  # {'materials_data'|'sub_items_data': {material key: sub_item_name}}
 
     # Approval workflow - Multi-stage
     approval_required_from = db.Column(db.String(50), nullable=True, index=True)  # ✅ PERFORMANCE: Added index
@@ -0,0 +1,36 @@
+"""
+Change Request Visibility Model
+Precomputed "who sees which change request, and why" for role inboxes.
+
+One row per (user, reason, CR): e.g. a PM of the CR's project for whom the
+CR's status/origin makes it visible, the SE assigned to items of the project,
+the estimator of the project, the requester. Rows are rebuilt for the
+affected CRs whenever a CR, project membership or SE assignment changes
+(services/cr_visibility.py).
+"""
+from config.db import db
+
+
+# Reasons a CR is visible to a user
+REASON_OWN = 'own'                                 # requested_by_user_id
+REASON_SE_PROJECT = 'se_project'                   # SE with item assignments on the CR's project
+REASON_PM_PROJECT = 'pm_project'                   # PM of the CR's project
+REASON_PM_APPROVED = 'pm_approved'                 # pm_approved_by_user_id
+REASON_MEP_PROJECT = 'mep_project'                 # MEP supervisor of the CR's project
+REASON_ESTIMATOR_PROJECT = 'estimator_project'     # estimator of the CR's project, approval pending from estimator
+REASON_ESTIMATOR_APPROVED = 'estimator_approved'   # approved_by_user_id
+
+
+class ChangeRequestVisibility(db.Model):
+    __tablename__ = 'cr_visibility'
+
+    user_id = db.Column(db.Integer, primary_key=True)
+    reason = db.Column(db.String(20), primary_key=True)
+    cr_id = db.Column(db.Integer, db.ForeignKey('change_requests.cr_id', ondelete='CASCADE'), primary_key=True)
+
+    __table_args__ = (
+        db.Index('idx_cr_visibility_cr', 'cr_id'),  # For refreshes by CR
+    )
+
+    def __repr__(self):
+        return f"<ChangeRequestVisibility cr={self.cr_id} user={self.user_id} reason={self.reason}>"
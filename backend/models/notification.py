@@ -44,11 +44,19 @@ class Notification(db.Model):
     read_at = Column(TIMESTAMP, nullable=True)
     deleted_at = Column(TIMESTAMP, nullable=True, index=True)  # ✅ Index for soft-delete filtering
 
+    # Deterministic key (event + entity + recipient + time bucket) for duplicate suppression,
+    # see utils/notification_dedup.py. NULL for notifications that are never deduplicated.
+    dedup_key = Column(String(255), nullable=True)
+
     # ✅ PERFORMANCE: Composite indexes for common query patterns
     __table_args__ = (
         db.Index('idx_notification_user_read', 'user_id', 'read'),  # For: WHERE user_id=X AND read=false
         db.Index('idx_notification_user_deleted', 'user_id', 'deleted_at'),  # For: WHERE user_id=X AND deleted_at IS NULL
         db.Index('idx_notification_user_created', 'user_id', 'created_at'),  # For: WHERE user_id=X ORDER BY created_at
+        db.Index('uq_notification_dedup_key', 'dedup_key', unique=True,
+                 postgresql_where=db.text('dedup_key IS NOT NULL')),  # For: INSERT ... ON CONFLICT DO NOTHING
+        # Once partitioned by month (migrations/partition_time_series_tables.py) the table's
+        # primary key is (id, created_at) and the dedup index exists on each partition
     )
 
     # Relationships
@@ -109,7 +117,8 @@ class Notification(db.Model):
             action_label=kwargs.get('action_label'),
             meta_data=kwargs.get('metadata'),
             sender_id=kwargs.get('sender_id'),
-            sender_name=kwargs.get('sender_name')
+            sender_name=kwargs.get('sender_name'),
+            dedup_key=kwargs.get('dedup_key')
         )
 
     def mark_as_read(self):
@@ -120,3 +129,23 @@ class Notification(db.Model):
     def mark_as_deleted(self):
         """Soft delete notification"""
         self.deleted_at = datetime.utcnow()
+
+
+class NotificationUnreadCounter(db.Model):
+    """
+    Per-user unread notification count.
+
+    Maintained incrementally on create / mark-read / delete by
+    utils/notification_counters.py so badge polls read one row instead of
+    counting the notifications table. Reconciled from notifications by
+    migrations/create_notification_unread_counters_table.py --reconcile.
+    """
+
+    __tablename__ = 'notification_unread_counters'
+
+    user_id = Column(Integer, ForeignKey('users.user_id', ondelete='CASCADE'), primary_key=True)
+    unread_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<NotificationUnreadCounter user={self.user_id} unread={self.unread_count}>"
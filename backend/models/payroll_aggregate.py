@@ -0,0 +1,29 @@
+"""
+Payroll Aggregate Model
+Daily pre-aggregated payroll figures for locked attendance.
+
+- payroll_daily_aggregates: (attendance_date, project_id, worker_id) -> days worked,
+  hours (total/regular/overtime) and cost of the locked, non-deleted attendance
+
+Kept current by services/payroll_aggregates.py when attendance is created,
+updated or locked; payroll range summaries sum these rows.
+"""
+from config.db import db
+
+
+class PayrollDailyAggregate(db.Model):
+    __tablename__ = 'payroll_daily_aggregates'
+
+    attendance_date = db.Column(db.Date, primary_key=True)
+    project_id = db.Column(db.Integer, primary_key=True)
+    worker_id = db.Column(db.Integer, primary_key=True)
+    requisition_id = db.Column(db.Integer, nullable=True)
+    days_worked = db.Column(db.Integer, nullable=False, default=0)
+    total_hours = db.Column(db.Float, nullable=False, default=0)
+    regular_hours = db.Column(db.Float, nullable=False, default=0)
+    overtime_hours = db.Column(db.Float, nullable=False, default=0)
+    total_cost = db.Column(db.Float, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('idx_payroll_aggregates_project_date', 'project_id', 'attendance_date'),  # For: project payroll ranges
+    )
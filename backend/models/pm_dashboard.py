@@ -0,0 +1,34 @@
+"""
+PM Dashboard Snapshot Model
+Read model for the PM dashboard: one precomputed document per scope.
+
+scope_key is 'pm:<user_id>' for a PM (or an admin viewing as that PM) and
+'all' for the admin general view. Rows are marked stale (and their version
+bumped) by workflow writes and rebuilt by services/pm_dashboard_read_model.py.
+"""
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import JSONB
+from config.db import db
+
+
+class PMDashboardSnapshot(db.Model):
+    __tablename__ = 'pm_dashboard_snapshots'
+
+    scope_key = db.Column(db.String(32), primary_key=True)
+    payload = db.Column(JSONB, nullable=False)
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    stale_since = db.Column(db.DateTime, nullable=True)  # Set by invalidation, cleared by rebuild
+    version = db.Column(db.BigInteger, default=0, server_default='0', nullable=False)  # Bumped by every invalidation
+    build_ms = db.Column(db.Integer, nullable=True)
+
+    def to_dict(self):
+        return {
+            'scope_key': self.scope_key,
+            'computed_at': self.computed_at.isoformat() if self.computed_at else None,
+            'stale_since': self.stale_since.isoformat() if self.stale_since else None,
+            'version': self.version,
+            'build_ms': self.build_ms
+        }
+
+    def __repr__(self):
+        return f"<PMDashboardSnapshot {self.scope_key} computed_at={self.computed_at}>"
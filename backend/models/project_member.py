@@ -0,0 +1,53 @@
+"""
+Project Member Model
+Normalised project membership (project_id, user_id, role).
+
+Project.user_id and Project.mep_supervisor_id are JSONB arrays, which makes
+"projects for user X in role Y" a containment scan. This table mirrors those
+columns (plus the scalar assignment columns) so the lookup becomes an indexed
+join. During the transition the JSON columns stay the source of truth and
+rows here are kept in sync by utils/project_membership.py.
+"""
+from datetime import datetime
+from config.db import db
+
+
+# Membership roles and the Project column each one mirrors
+ROLE_PROJECT_MANAGER = 'pm'
+ROLE_MEP_SUPERVISOR = 'mep'
+ROLE_SITE_SUPERVISOR = 'se'
+ROLE_ESTIMATOR = 'estimator'
+ROLE_BUYER = 'buyer'
+
+PROJECT_MEMBER_ROLE_COLUMNS = {
+    ROLE_PROJECT_MANAGER: 'user_id',             # JSONB array
+    ROLE_MEP_SUPERVISOR: 'mep_supervisor_id',    # JSONB array
+    ROLE_SITE_SUPERVISOR: 'site_supervisor_id',  # Integer
+    ROLE_ESTIMATOR: 'estimator_id',              # Integer
+    ROLE_BUYER: 'buyer_id',                      # Integer
+}
+
+
+class ProjectMember(db.Model):
+    __tablename__ = 'project_members'
+
+    project_id = db.Column(db.Integer, db.ForeignKey('project.project_id', ondelete='CASCADE'), primary_key=True)
+    user_id = db.Column(db.Integer, primary_key=True)
+    role = db.Column(db.String(20), primary_key=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.Index('idx_project_members_user_role', 'user_id', 'role', 'project_id'),  # projects for user X in role Y
+        db.Index('idx_project_members_project_role', 'project_id', 'role'),         # members of project P in role Y
+    )
+
+    def to_dict(self):
+        return {
+            'project_id': self.project_id,
+            'user_id': self.user_id,
+            'role': self.role,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+    def __repr__(self):
+        return f"<ProjectMember project={self.project_id} user={self.user_id} role={self.role}>"
@@ -1,10 +1,15 @@
 """
 System Settings Model
 Single-row table for system-wide configuration
+
+Image columns (base64 signatures/stamp/header) are deferred in one load group,
+so text lookups never pull the blobs. Read-only callers should use
+utils.settings_cache instead of querying this table directly.
 """
 
 from config.db import db
 from datetime import datetime
+from sqlalchemy.orm import deferred
 
 
 class SystemSettings(db.Model):
@@ -49,22 +54,22 @@ class SystemSettings(db.Model):
     budget_alert_threshold = db.Column(db.Integer, default=80)  # percentage
 
     # PDF Signature Settings (Admin uploads, Estimator selects to include)
-    signature_image = db.Column(db.Text)  # Base64 encoded signature image
+    signature_image = deferred(db.Column(db.Text), group='images')  # Base64 encoded signature image
     signature_enabled = db.Column(db.Boolean, default=False)  # Whether signature is available
 
     # LPO PDF Settings - Signatures (for Purchase Orders)
-    md_signature_image = db.Column(db.Text)  # Managing Director signature (base64)
+    md_signature_image = deferred(db.Column(db.Text), group='images')  # Managing Director signature (base64)
     md_name = db.Column(db.String(255), default='Managing Director')
-    td_signature_image = db.Column(db.Text)  # Technical Director signature (base64)
+    td_signature_image = deferred(db.Column(db.Text), group='images')  # Technical Director signature (base64)
     td_name = db.Column(db.String(255), default='Technical Director')
-    company_stamp_image = db.Column(db.Text)  # Company stamp/seal image (base64)
+    company_stamp_image = deferred(db.Column(db.Text), group='images')  # Company stamp/seal image (base64)
 
     # LPO PDF Settings - Company Info
     company_contact_person = db.Column(db.String(255), default='Mr. Mohammed Sabir')  # Contact person for LPO
     company_trn = db.Column(db.String(50))  # Company TRN number
     company_fax = db.Column(db.String(50))  # Company fax number
     default_payment_terms = db.Column(db.Text, default='100% after delivery')
-    lpo_header_image = db.Column(db.Text)  # Custom LPO header image (base64)
+    lpo_header_image = deferred(db.Column(db.Text), group='images')  # Custom LPO header image (base64)
 
     # LPO Terms and Conditions (stored as JSON)
     lpo_general_terms = db.Column(db.Text)  # JSON array of general terms
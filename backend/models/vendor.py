@@ -1,6 +1,9 @@
 from config.db import db
 from datetime import datetime
 
+# Lowercased, trimmed, single-spaced product name (generated column expression)
+NORMALIZED_PRODUCT_NAME_SQL = r"lower(btrim(regexp_replace(product_name, '\s+', ' ', 'g')))"
+
 
 class VendorCategory(db.Model):
     """Vendor category model for dynamic category management"""
@@ -52,7 +55,7 @@ class Vendor(db.Model):
     status = db.Column(db.Enum('active', 'inactive', name='vendor_status_enum'), default='active')
     is_deleted = db.Column(db.Boolean, default=False)
     created_by = db.Column(db.Integer, db.ForeignKey('users.user_id'), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     last_modified_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_modified_by = db.Column(db.Integer, db.ForeignKey('users.user_id'), nullable=True)
 
@@ -104,6 +107,16 @@ class VendorProduct(db.Model):
     is_deleted = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_modified_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Matching key for alternative-vendor suggestions (utils/vendor_product_matching.py)
+    normalized_name = db.Column(db.Text, db.Computed(NORMALIZED_PRODUCT_NAME_SQL, persisted=True))
+
+    __table_args__ = (
+        # pg_trgm index: serves substring (LIKE '%term%') matching and similarity()
+        db.Index(
+            'idx_vendor_products_normalized_trgm', 'normalized_name',
+            postgresql_using='gin', postgresql_ops={'normalized_name': 'gin_trgm_ops'}
+        ),
+    )
 
     def to_dict(self):
         """Convert product object to dictionary"""
@@ -0,0 +1,67 @@
+"""
+Worker Availability Models for Labour Management System
+Normalised, indexed tables behind the worker availability engine
+(services/worker_availability.py).
+
+- WorkerSkill: one row per (worker, canonical skill key), precomputed with
+  utils.skill_matcher.canonical_skill_key from Worker.skills (JSONB).
+- WorkerBooking: one row per worker per assigned requisition day, mirrored
+  from LabourRequisition.assigned_worker_ids (JSONB). Named worker_bookings
+  because worker_assignments already holds project-level assignments.
+"""
+from datetime import datetime
+from config.db import db
+
+
+class WorkerSkill(db.Model):
+    """Canonical skill keys per worker for indexed skill lookups"""
+    __tablename__ = "worker_skills"
+
+    skill_key = db.Column(db.String(100), primary_key=True)  # canonical_skill_key("Carpenter - Pro") → "carpenter"
+    worker_id = db.Column(db.Integer, db.ForeignKey("workers.worker_id", ondelete="CASCADE"), primary_key=True)
+    skill_name = db.Column(db.String(255), nullable=False)  # Original skill label from Worker.skills
+
+    __table_args__ = (
+        db.Index('idx_worker_skills_worker', 'worker_id'),
+    )
+
+    def __repr__(self):
+        return f"<WorkerSkill {self.worker_id}: {self.skill_key}>"
+
+
+class WorkerBooking(db.Model):
+    """
+    A worker booked on a requisition for a day (and optional time window).
+    released_at is set when the worker departs; released bookings without a
+    time window no longer block the worker, timed bookings keep blocking
+    their window.
+    """
+    __tablename__ = "worker_bookings"
+
+    booking_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    worker_id = db.Column(db.Integer, db.ForeignKey("workers.worker_id", ondelete="CASCADE"), nullable=False)
+    requisition_id = db.Column(db.Integer, db.ForeignKey("labour_requisitions.requisition_id", ondelete="CASCADE"), nullable=False)
+    work_date = db.Column(db.Date, nullable=False)
+    start_time = db.Column(db.Time, nullable=True)
+    end_time = db.Column(db.Time, nullable=True)
+    released_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('requisition_id', 'worker_id', name='unique_worker_booking_requisition'),
+        db.Index('idx_worker_bookings_date_worker', 'work_date', 'worker_id'),
+    )
+
+    def to_dict(self):
+        return {
+            'booking_id': self.booking_id,
+            'worker_id': self.worker_id,
+            'requisition_id': self.requisition_id,
+            'work_date': self.work_date.isoformat() if self.work_date else None,
+            'start_time': self.start_time.strftime('%H:%M') if self.start_time else None,
+            'end_time': self.end_time.strftime('%H:%M') if self.end_time else None,
+            'released_at': self.released_at.isoformat() if self.released_at else None
+        }
+
+    def __repr__(self):
+        return f"<WorkerBooking worker={self.worker_id} req={self.requisition_id} date={self.work_date}>"
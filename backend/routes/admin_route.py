@@ -3,17 +3,12 @@ Admin Routes - Comprehensive system administration endpoints
 """
 
 from flask import Blueprint
-from controllers.admin_controller import *
-from controllers.settings_controller import get_settings, update_settings, upload_signature, delete_signature
-from controllers.auth_controller import jwt_required
-from controllers.admin_controller import (
-    get_all_boqs_admin,
-    approve_boq_admin,
-    get_all_project_managers,
-    get_all_site_engineers,
-    get_user_login_history,
-    get_all_login_history
-)
+from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+admin_controller = LazyModule('controllers.admin_controller')
+settings_controller = LazyModule('controllers.settings_controller')
 
 admin_routes = Blueprint("admin_routes", __name__, url_prefix='/api/admin')
 
@@ -25,31 +20,31 @@ admin_routes = Blueprint("admin_routes", __name__, url_prefix='/api/admin')
 @jwt_required
 def get_users_route():
     """Get all users with filtering and pagination"""
-    return get_all_users()
+    return admin_controller.get_all_users()
 
 @admin_routes.route('/users', methods=['POST'])
 @jwt_required
 def create_user_route():
     """Create a new user"""
-    return create_user()
+    return admin_controller.create_user()
 
 @admin_routes.route('/users/<int:user_id>', methods=['PUT'])
 @jwt_required
 def update_user_route(user_id):
     """Update user information"""
-    return update_user(user_id)
+    return admin_controller.update_user(user_id)
 
 @admin_routes.route('/users/<int:user_id>', methods=['DELETE'])
 @jwt_required
 def delete_user_route(user_id):
     """Delete user (soft delete)"""
-    return delete_user(user_id)
+    return admin_controller.delete_user(user_id)
 
 @admin_routes.route('/users/<int:user_id>/status', methods=['POST'])
 @jwt_required
 def toggle_user_status_route(user_id):
     """Activate/Deactivate user"""
-    return toggle_user_status(user_id)
+    return admin_controller.toggle_user_status(user_id)
 
 # ============================================
 # ROLE MANAGEMENT ROUTES
@@ -59,7 +54,7 @@ def toggle_user_status_route(user_id):
 @jwt_required
 def get_roles_route():
     """Get all roles"""
-    return get_all_roles()
+    return admin_controller.get_all_roles()
 
 # ============================================
 # PROJECT MANAGEMENT ROUTES (Admin Override)
@@ -69,13 +64,13 @@ def get_roles_route():
 @jwt_required
 def get_projects_admin_route():
     """Get all projects (admin view - no restrictions)"""
-    return get_all_projects_admin()
+    return admin_controller.get_all_projects_admin()
 
 @admin_routes.route('/projects/<int:project_id>/assign-pm', methods=['POST'])
 @jwt_required
 def assign_pm_route(project_id):
     """Assign/reassign project manager"""
-    return assign_project_manager(project_id)
+    return admin_controller.assign_project_manager(project_id)
 
 # ============================================
 # RECENT ACTIVITY ROUTES
@@ -85,7 +80,7 @@ def assign_pm_route(project_id):
 @jwt_required
 def get_activity_route():
     """Get recent system activity"""
-    return get_recent_activity()
+    return admin_controller.get_recent_activity()
 
 # ============================================
 # SETTINGS MANAGEMENT ROUTES
@@ -95,25 +90,25 @@ def get_activity_route():
 @jwt_required
 def get_settings_route():
     """Get system settings"""
-    return get_settings()
+    return settings_controller.get_settings()
 
 @admin_routes.route('/settings', methods=['PUT'])
 @jwt_required
 def update_settings_route():
     """Update system settings"""
-    return update_settings()
+    return settings_controller.update_settings()
 
 @admin_routes.route('/settings/signature', methods=['POST'])
 @jwt_required
 def upload_signature_route():
     """Upload signature image for PDF generation"""
-    return upload_signature()
+    return settings_controller.upload_signature()
 
 @admin_routes.route('/settings/signature', methods=['DELETE'])
 @jwt_required
 def delete_signature_route():
     """Delete signature image"""
-    return delete_signature()
+    return settings_controller.delete_signature()
 
 # ============================================
 # BOQ MANAGEMENT ROUTES
@@ -123,13 +118,13 @@ def delete_signature_route():
 @jwt_required
 def get_boqs_route():
     """Get all BOQs with filtering"""
-    return get_all_boqs_admin()
+    return admin_controller.get_all_boqs_admin()
 
 @admin_routes.route('/boqs/<int:boq_id>/approve', methods=['POST'])
 @jwt_required
 def approve_boq_route(boq_id):
     """Approve/Reject BOQ"""
-    return approve_boq_admin(boq_id)
+    return admin_controller.approve_boq_admin(boq_id)
 
 # ============================================
 # PROJECT MANAGER & SITE ENGINEER ROUTES
@@ -139,13 +134,13 @@ def approve_boq_route(boq_id):
 @jwt_required
 def get_project_managers_route():
     """Get all project managers with project counts"""
-    return get_all_project_managers()
+    return admin_controller.get_all_project_managers()
 
 @admin_routes.route('/site-engineers', methods=['GET'])
 @jwt_required
 def get_site_engineers_route():
     """Get all site engineers with project counts"""
-    return get_all_site_engineers()
+    return admin_controller.get_all_site_engineers()
 
 
 # ============================================
@@ -156,14 +151,14 @@ def get_site_engineers_route():
 @jwt_required
 def get_user_login_history_route(user_id):
     """Get login history for a specific user"""
-    return get_user_login_history(user_id)
+    return admin_controller.get_user_login_history(user_id)
 
 
 @admin_routes.route('/login-history', methods=['GET'])
 @jwt_required
 def get_all_login_history_route():
     """Get login history for all users (recent overview)"""
-    return get_all_login_history()
+    return admin_controller.get_all_login_history()
 
 
 # ============================================
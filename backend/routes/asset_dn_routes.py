@@ -4,9 +4,11 @@ Blueprint for the proper DN/RDN flow for returnable assets.
 """
 
 from flask import Blueprint
-from controllers.asset_dn_controller import *
-from controllers.asset_dn_controller import *
-from controllers.auth_controller import jwt_required
+from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+asset_dn_controller = LazyModule('controllers.asset_dn_controller')
 
 # Create blueprint
 asset_dn_routes = Blueprint('asset_dn', __name__)
@@ -18,13 +20,13 @@ asset_dn_routes = Blueprint('asset_dn', __name__)
 @jwt_required
 def create_stock_in_route():
     """Create a stock in record for new assets"""
-    return create_stock_in()
+    return asset_dn_controller.create_stock_in()
 
 
 @asset_dn_routes.route('/api/assets/stock-in', methods=['GET'])
 def get_stock_in_list_route():
     """Get list of stock in records"""
-    return get_stock_in_list()
+    return asset_dn_controller.get_stock_in_list()
 
 
 # ==================== ASSET DELIVERY NOTE (ADN) ROUTES ====================
@@ -33,33 +35,33 @@ def get_stock_in_list_route():
 @jwt_required
 def create_delivery_note_route():
     """Create a new Asset Delivery Note (ADN) - Dispatch assets to site"""
-    return create_delivery_note()
+    return asset_dn_controller.create_delivery_note()
 
 
 @asset_dn_routes.route('/api/assets/delivery-notes', methods=['GET'])
 def get_delivery_notes_route():
     """Get list of Asset Delivery Notes"""
-    return get_delivery_notes()
+    return asset_dn_controller.get_delivery_notes()
 
 
 @asset_dn_routes.route('/api/assets/delivery-notes/<int:adn_id>', methods=['GET'])
 def get_delivery_note_route(adn_id):
     """Get single Asset Delivery Note with details"""
-    return get_delivery_note(adn_id)
+    return asset_dn_controller.get_delivery_note(adn_id)
 
 
 @asset_dn_routes.route('/api/assets/delivery-notes/<int:adn_id>/dispatch', methods=['PUT'])
 @jwt_required
 def dispatch_delivery_note_route(adn_id):
     """Dispatch the delivery note - deduct from inventory and mark as dispatched"""
-    return dispatch_delivery_note(adn_id)
+    return asset_dn_controller.dispatch_delivery_note(adn_id)
 
 
 @asset_dn_routes.route('/api/assets/delivery-notes/<int:adn_id>/receive', methods=['PUT'])
 @jwt_required
 def receive_delivery_note_route(adn_id):
     """Mark delivery note as received at site"""
-    return receive_delivery_note(adn_id)
+    return asset_dn_controller.receive_delivery_note(adn_id)
 
 
 # ==================== ASSET RETURN DELIVERY NOTE (ARDN) ROUTES ====================
@@ -68,60 +70,60 @@ def receive_delivery_note_route(adn_id):
 @jwt_required
 def create_return_note_route():
     """Create a new Asset Return Delivery Note (ARDN)"""
-    return create_return_note()
+    return asset_dn_controller.create_return_note()
 
 
 @asset_dn_routes.route('/api/assets/return-notes', methods=['GET'])
 def get_return_notes_route():
     """Get list of Asset Return Delivery Notes"""
-    return get_return_notes()
+    return asset_dn_controller.get_return_notes()
 
 
 @asset_dn_routes.route('/api/assets/return-notes/<int:ardn_id>', methods=['GET'])
 def get_return_note_route(ardn_id):
     """Get single Asset Return Delivery Note with details"""
-    return get_return_note(ardn_id)
+    return asset_dn_controller.get_return_note(ardn_id)
 
 
 @asset_dn_routes.route('/api/assets/return-notes/<int:ardn_id>/issue', methods=['PUT'])
 @jwt_required
 def issue_return_note_route(ardn_id):
     """Issue return note - formally prepare it for dispatch"""
-    return issue_return_note(ardn_id)
+    return asset_dn_controller.issue_return_note(ardn_id)
 
 
 @asset_dn_routes.route('/api/assets/return-notes/<int:ardn_id>/update', methods=['PUT'])
 @jwt_required
 def update_return_note_route(ardn_id):
     """Update return note details (driver info, notes, etc.) - only for DRAFT/ISSUED status"""
-    return update_return_note(ardn_id)
+    return asset_dn_controller.update_return_note(ardn_id)
 
 
 @asset_dn_routes.route('/api/assets/return-notes/<int:ardn_id>/dispatch', methods=['PUT'])
 @jwt_required
 def dispatch_return_note_route(ardn_id):
     """Mark return note as dispatched from site - can also update driver details"""
-    return dispatch_return_note(ardn_id)
+    return asset_dn_controller.dispatch_return_note(ardn_id)
 
 
 @asset_dn_routes.route('/api/assets/return-notes/<int:ardn_id>/receive', methods=['PUT'])
 @jwt_required
 def receive_return_note_route(ardn_id):
     """Mark return note as received at store"""
-    return receive_return_note(ardn_id)
+    return asset_dn_controller.receive_return_note(ardn_id)
 
 
 @asset_dn_routes.route('/api/assets/return-notes/<int:ardn_id>/process', methods=['PUT'])
 @jwt_required
 def process_return_note_route(ardn_id):
     """Process return note - verify each item and decide fate"""
-    return process_return_note(ardn_id)
+    return asset_dn_controller.process_return_note(ardn_id)
 
 
 @asset_dn_routes.route('/api/assets/return-notes/upload-delivery-note', methods=['POST'])
 def upload_return_note_delivery_note_route():
     """Upload delivery note document for ARDN (from vendor/transporter)"""
-    return upload_return_note_delivery_note()
+    return asset_dn_controller.upload_return_note_delivery_note()
 
 
 # ==================== DASHBOARD & UTILITY ROUTES ====================
@@ -129,19 +131,19 @@ def upload_return_note_delivery_note_route():
 @asset_dn_routes.route('/api/assets/dn-dashboard', methods=['GET'])
 def get_dn_dashboard_route():
     """Get dashboard stats for asset DN/RDN flow"""
-    return get_dn_dashboard()
+    return asset_dn_controller.get_dn_dashboard()
 
 
 @asset_dn_routes.route('/api/assets/available-for-dispatch', methods=['GET'])
 def get_available_for_dispatch_route():
     """Get assets available for dispatch"""
-    return get_available_for_dispatch()
+    return asset_dn_controller.get_available_for_dispatch()
 
 
 @asset_dn_routes.route('/api/assets/project/<int:project_id>/dispatched', methods=['GET'])
 def get_project_dispatched_assets_route(project_id):
     """Get assets dispatched to a specific project (for creating return notes)"""
-    return get_project_dispatched_assets(project_id)
+    return asset_dn_controller.get_project_dispatched_assets(project_id)
 
 
 # ==================== STOCK IN DOCUMENT UPLOAD ROUTES ====================
@@ -149,19 +151,19 @@ def get_project_dispatched_assets_route(project_id):
 @asset_dn_routes.route('/api/assets/stock-in/<int:stock_in_id>/upload', methods=['POST'])
 def upload_stock_in_document_route(stock_in_id):
     """Upload a document (DN/invoice/receipt) for a stock in record to inventory-files bucket"""
-    return upload_stock_in_document(stock_in_id)
+    return asset_dn_controller.upload_stock_in_document(stock_in_id)
 
 
 @asset_dn_routes.route('/api/assets/stock-in/<int:stock_in_id>/document', methods=['GET'])
 def get_stock_in_document_route(stock_in_id):
     """Get document URL for a stock in record"""
-    return get_stock_in_document(stock_in_id)
+    return asset_dn_controller.get_stock_in_document(stock_in_id)
 
 
 @asset_dn_routes.route('/api/assets/stock-in/<int:stock_in_id>/document', methods=['DELETE'])
 def delete_stock_in_document_route(stock_in_id):
     """Delete document for a stock in record"""
-    return delete_stock_in_document(stock_in_id)
+    return asset_dn_controller.delete_stock_in_document(stock_in_id)
 
 
 # ==================== PDF DOWNLOAD ROUTES ====================
@@ -169,13 +171,13 @@ def delete_stock_in_document_route(stock_in_id):
 @asset_dn_routes.route('/api/assets/delivery-notes/<int:adn_id>/download', methods=['GET'])
 def download_asset_delivery_note_route(adn_id):
     """Generate and download Asset Delivery Note PDF"""
-    return download_asset_delivery_note(adn_id)
+    return asset_dn_controller.download_asset_delivery_note(adn_id)
 
 
 @asset_dn_routes.route('/api/assets/return-notes/<int:ardn_id>/download', methods=['GET'])
 def download_asset_return_note_route(ardn_id):
     """Generate and download Asset Return Delivery Note (ARDN) PDF"""
-    return download_asset_return_note(ardn_id)
+    return asset_dn_controller.download_asset_return_note(ardn_id)
 
 
 # ==================== SITE ENGINEER ROUTES ====================
@@ -184,21 +186,21 @@ def download_asset_return_note_route(ardn_id):
 @jwt_required
 def get_se_dispatched_assets_route():
     """Get all dispatched assets for the Site Engineer's projects from ADN flow"""
-    return get_se_dispatched_assets()
+    return asset_dn_controller.get_se_dispatched_assets()
 
 
 @asset_dn_routes.route('/api/assets/se/receive-adn/<int:adn_id>', methods=['PUT'])
 @jwt_required
 def se_receive_adn_route(adn_id):
     """SE marks an entire ADN as received (all items)"""
-    return se_receive_adn(adn_id)
+    return asset_dn_controller.se_receive_adn(adn_id)
 
 
 @asset_dn_routes.route('/api/assets/se/receive-items', methods=['PUT'])
 @jwt_required
 def se_receive_selected_items_route():
     """SE marks selected ADN items as received (selective receive)"""
-    return se_receive_selected_items()
+    return asset_dn_controller.se_receive_selected_items()
 
 
 # ==================== ASSET REPAIR MANAGEMENT ROUTES ====================
@@ -207,21 +209,21 @@ def se_receive_selected_items_route():
 @jwt_required
 def get_asset_repair_items_route():
     """Get all asset items sent for repair from ARDNs"""
-    return get_asset_repair_items()
+    return asset_dn_controller.get_asset_repair_items()
 
 
 @asset_dn_routes.route('/api/assets/repairs/<int:return_item_id>/complete', methods=['PUT'])
 @jwt_required
 def complete_asset_repair_route(return_item_id):
     """Mark asset repair as complete and return to stock"""
-    return complete_asset_repair(return_item_id)
+    return asset_dn_controller.complete_asset_repair(return_item_id)
 
 
 @asset_dn_routes.route('/api/assets/repairs/<int:return_item_id>/dispose', methods=['PUT'])
 @jwt_required
 def dispose_unrepairable_asset_route(return_item_id):
     """Mark unrepairable asset for disposal - creates disposal request for TD approval"""
-    return dispose_unrepairable_asset(return_item_id)
+    return asset_dn_controller.dispose_unrepairable_asset(return_item_id)
 
 
 # ==================== SE MOVEMENT HISTORY ROUTE ====================
@@ -230,10 +232,10 @@ def dispose_unrepairable_asset_route(return_item_id):
 @jwt_required
 def get_se_movement_history_route():
     """Get ADN/ARDN movement history for SE's assigned projects"""
-    return get_se_movement_history()
+    return asset_dn_controller.get_se_movement_history()
 
 @asset_dn_routes.route('/api/assets/ss_return_notes', methods=['GET'])
 @jwt_required
 def get_ss_return_notes_route():
     """Get list of Asset Return Delivery Notes for Site Supervisor"""
-    return get_ss_return_notes()
+    return asset_dn_controller.get_ss_return_notes()
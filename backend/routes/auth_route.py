@@ -1,8 +1,11 @@
 # routes/auth_route.py
 
 from flask import Blueprint, current_app
-from controllers.auth_controller import *
 from utils.authentication import *
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+auth_controller = LazyModule('controllers.auth_controller')
 
 auth_routes = Blueprint("auth_routes", __name__, url_prefix='/api')
 
@@ -19,7 +22,7 @@ def register_route():
     # 5 registrations per hour per IP
     @limiter.limit("5 per hour")
     def _register():
-        return user_register()
+        return auth_controller.user_register()
     return _register()
 
 @auth_routes.route('/login', methods=['POST'])
@@ -29,7 +32,7 @@ def login_route():
     # 30 login attempts per 15 minutes per IP
     @limiter.limit("30 per 15 minutes")
     def _login():
-        return user_login()
+        return auth_controller.user_login()
     return _login()
 
 @auth_routes.route('/send_otp', methods=['POST'])
@@ -39,7 +42,7 @@ def send_otp_route():
     # 30 OTP requests per 15 minutes per IP
     @limiter.limit("30 per 15 minutes")
     def _send_otp():
-        return send_email()
+        return auth_controller.send_email()
     return _send_otp()
 
 @auth_routes.route('/verification_otp', methods=['POST'])
@@ -55,26 +58,26 @@ def verification_otp_route():
 @auth_routes.route('/logout', methods=['POST'])
 def logout_route():
     """Logout user"""
-    return logout()
+    return auth_controller.logout()
 
 # Protected routes (authentication required)
 @auth_routes.route('/self', methods=['GET'])
 @jwt_required
 def self_route():
     """Get current logged-in user"""
-    return handle_get_logged_in_user()
+    return auth_controller.handle_get_logged_in_user()
 
 @auth_routes.route('/profile', methods=['PUT'])
 @jwt_required
 def update_profile_route():
     """Update user profile"""
-    return update_user_profile()
+    return auth_controller.update_user_profile()
 
 #User status changes
 @auth_routes.route('/user_status', methods=['POST'])
 @jwt_required
 def user_status_route():
-    return user_status()
+    return auth_controller.user_status()
 
 # Note: Password-related endpoints removed - using OTP-only authentication
 
@@ -4,6 +4,15 @@ BOQ Routes - API endpoints for Bill of Quantities management
 from flask import Blueprint, g, jsonify, current_app
 from utils.authentication import jwt_required
 from utils.response_cache import cached_response
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+boq_bulk_controller = LazyModule('controllers.boq_bulk_controller')
+boq_controller = LazyModule('controllers.boq_controller')
+boq_internal_revisions_controller = LazyModule('controllers.boq_internal_revisions_controller')
+boq_revisions = LazyModule('controllers.boq_revisions')
+boq_upload_controller = LazyModule('controllers.boq_upload_controller')
+download_boq_pdf = LazyModule('controllers.download_boq_pdf')
 
 # Rate limit decorator helper for heavy endpoints
 def rate_limit(limit_string):
@@ -21,12 +30,6 @@ def rate_limit(limit_string):
             return f(*args, **kwargs)
         return decorated_function
     return decorator
-from controllers.boq_controller import *
-from controllers.boq_upload_controller import *
-from controllers.boq_bulk_controller import bulk_upload_boq
-from controllers.boq_revisions import *
-from controllers.boq_internal_revisions_controller import *
-from controllers.download_boq_pdf import *
 
 boq_routes = Blueprint('boq_routes', __name__, url_prefix='/api')
 
@@ -48,7 +51,7 @@ def create_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return create_boq()
+    return boq_controller.create_boq()
 
 
 @boq_routes.route('/boq/<int:boq_id>', methods=['GET'])
@@ -58,7 +61,7 @@ def get_boq_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_boq(boq_id)
+    return boq_controller.get_boq(boq_id)
 
 @boq_routes.route('/boq/update_boq/<int:boq_id>', methods=['PUT'])
 @jwt_required
@@ -67,7 +70,7 @@ def update_boq_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return update_boq(boq_id)
+    return boq_controller.update_boq(boq_id)
 
 @boq_routes.route('/revision_boq/<int:boq_id>', methods=['PUT'])
 @jwt_required
@@ -76,7 +79,7 @@ def revision_boq_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return revision_boq(boq_id)
+    return boq_controller.revision_boq(boq_id)
 
 @boq_routes.route('/delete_boq/<int:boq_id>', methods=['DELETE'])
 @jwt_required
@@ -85,7 +88,7 @@ def delete_boq_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return delete_boq(boq_id)
+    return boq_controller.delete_boq(boq_id)
 
 @boq_routes.route('/sub_item/<int:item_id>', methods=['GET'])
 @jwt_required
@@ -94,7 +97,7 @@ def get_sub_item_route(item_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_sub_item(item_id)
+    return boq_controller.get_sub_item(item_id)
 
 @boq_routes.route('/item_labour/<int:item_id>', methods=['GET'])
 @jwt_required
@@ -103,7 +106,7 @@ def get_sub_item_labours_route(item_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_sub_item_labours(item_id)
+    return boq_controller.get_sub_item_labours(item_id)
 
 @boq_routes.route('/all_item', methods=['GET'])
 @jwt_required
@@ -112,7 +115,7 @@ def get_all_item_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_all_item()
+    return boq_controller.get_all_item()
 
 @boq_routes.route('/all_sub_item_names', methods=['GET'])
 @jwt_required
@@ -121,7 +124,7 @@ def get_all_sub_item_names_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_all_sub_item_names()
+    return boq_controller.get_all_sub_item_names()
 
 @boq_routes.route('/sub_item_by_name/<string:sub_item_name>', methods=['GET'])
 @jwt_required
@@ -130,7 +133,7 @@ def get_sub_item_by_name_route(sub_item_name):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_sub_item_by_name(sub_item_name)
+    return boq_controller.get_sub_item_by_name(sub_item_name)
 
 # BOQ Email Notification technical director
 @boq_routes.route('/boq_email/<int:boq_id>', methods=['GET'])
@@ -140,7 +143,7 @@ def send_boq_email_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return send_boq_email(boq_id)
+    return boq_controller.send_boq_email(boq_id)
 
 #  BOQ Upload and Extraction Routes
 @boq_routes.route('/boq/upload', methods=['POST'])
@@ -150,7 +153,7 @@ def upload_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return upload_boq_file()
+    return boq_upload_controller.upload_boq_file()
 
 @boq_routes.route('/boq_history/<int:boq_id>', methods=['GET'])
 @jwt_required
@@ -159,7 +162,7 @@ def get_boq_history_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_boq_history(boq_id)
+    return boq_controller.get_boq_history(boq_id)
 
 @boq_routes.route('/estimator_dashboard', methods=['GET'])
 @jwt_required
@@ -168,7 +171,7 @@ def get_estimator_dashboard_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_estimator_dashboard()
+    return boq_controller.get_estimator_dashboard()
 
 # BOQ Bulk Upload
 @boq_routes.route('/boq/bulk_upload', methods=['POST'])
@@ -178,7 +181,7 @@ def bulk_upload_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return bulk_upload_boq()
+    return boq_bulk_controller.bulk_upload_boq()
 
 # BOQ Revisions - Dynamic Tabs
 @boq_routes.route('/boq/revision-tabs', methods=['GET'])
@@ -188,7 +191,7 @@ def get_revision_tabs_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_revision_tabs()
+    return boq_revisions.get_revision_tabs()
 
 @boq_routes.route('/boq/revisions/<revision_number>', methods=['GET'])
 @jwt_required
@@ -197,7 +200,7 @@ def get_projects_by_revision_route(revision_number):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_projects_by_revision(revision_number)
+    return boq_revisions.get_projects_by_revision(revision_number)
 
 @boq_routes.route('/boq/revision-statistics', methods=['GET'])
 @jwt_required
@@ -206,7 +209,7 @@ def get_revision_statistics_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_revision_statistics()
+    return boq_revisions.get_revision_statistics()
 
 @boq_routes.route('/boq/<int:boq_id>/internal_revisions', methods=['GET'])
 @jwt_required
@@ -215,7 +218,7 @@ def get_internal_revisions_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_internal_revisions(boq_id)
+    return boq_internal_revisions_controller.get_internal_revisions(boq_id)
 
 @boq_routes.route('/material/<int:sub_item_id>', methods=['GET'])
 @jwt_required
@@ -224,7 +227,7 @@ def  get_sub_item_material_route(sub_item_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return  get_sub_item_material(sub_item_id)
+    return  boq_controller.get_sub_item_material(sub_item_id)
 
 @boq_routes.route('/update_internal_boq/<int:boq_id>', methods=['PUT'])
 @jwt_required
@@ -233,7 +236,7 @@ def update_internal_revision_boq_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return update_internal_revision_boq(boq_id)
+    return boq_internal_revisions_controller.update_internal_revision_boq(boq_id)
 
 @boq_routes.route('/boqs/internal_revisions', methods=['GET'])
 @jwt_required
@@ -243,7 +246,7 @@ def get_all_internal_revision_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_all_internal_revision()
+    return boq_internal_revisions_controller.get_all_internal_revision()
 
 # PDF Download Routes - Rate limited to prevent abuse (CPU-intensive operations)
 @boq_routes.route('/boq/download/internal/<int:boq_id>', methods=['GET'])
@@ -254,7 +257,7 @@ def download_internal_pdf_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return download_internal_pdf()
+    return download_boq_pdf.download_internal_pdf()
 
 @boq_routes.route('/boq/download/client/<int:boq_id>', methods=['GET', 'POST'])
 @jwt_required
@@ -264,7 +267,7 @@ def download_client_pdf_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return download_client_pdf()
+    return download_boq_pdf.download_client_pdf()
 
 @boq_routes.route('/boq/preview/client/<int:boq_id>', methods=['POST'])
 @jwt_required
@@ -274,19 +277,19 @@ def preview_client_pdf_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return preview_client_pdf()
+    return download_boq_pdf.preview_client_pdf()
 
 @boq_routes.route('/boq/download/internal-excel/<int:boq_id>', methods=['GET'])
 @jwt_required
 @rate_limit("30 per hour")  # Excel generation is less intensive than PDF
 def download_internal_excel_route(boq_id):
-    return download_internal_excel()
+    return download_boq_pdf.download_internal_excel()
 
 @boq_routes.route('/boq/download/client-excel/<int:boq_id>', methods=['GET'])
 @jwt_required
 @rate_limit("30 per hour")  # Excel generation is less intensive than PDF
 def download_client_excel_route(boq_id):
-    return download_client_excel()
+    return download_boq_pdf.download_client_excel()
 
 @boq_routes.route('/client_td_approval', methods=['POST'])
 @jwt_required
@@ -295,7 +298,7 @@ def client_revision_td_mail_send_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return client_revision_td_mail_send()
+    return boq_revisions.client_revision_td_mail_send()
 
 # Material Search (Global autocomplete)
 @boq_routes.route('/materials/search', methods=['GET'])
@@ -305,7 +308,7 @@ def search_all_materials_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return search_all_materials()
+    return boq_controller.search_all_materials()
 
 # Labour Search (Global autocomplete)
 @boq_routes.route('/labours/search', methods=['GET'])
@@ -315,7 +318,7 @@ def search_all_labours_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return search_all_labours()
+    return boq_controller.search_all_labours()
 
 # Custom Units Management
 @boq_routes.route('/boq/custom-units', methods=['GET'])
@@ -325,7 +328,7 @@ def get_custom_units_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_custom_units()
+    return boq_controller.get_custom_units()
 
 @boq_routes.route('/boq/custom-units', methods=['POST'])
 @jwt_required
@@ -334,7 +337,7 @@ def create_custom_unit_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return create_custom_unit()
+    return boq_controller.create_custom_unit()
 
 @boq_routes.route('/pending_boq', methods=['GET'])
 @jwt_required
@@ -343,7 +346,7 @@ def get_pending_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_pending_boq()
+    return boq_controller.get_pending_boq()
 
 
 @boq_routes.route('/approved_boq', methods=['GET'])
@@ -353,7 +356,7 @@ def approved_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_approved_boq()
+    return boq_controller.get_approved_boq()
 
 @boq_routes.route('/rejected_boq', methods=['GET'])
 @jwt_required
@@ -362,7 +365,7 @@ def rejected_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_rejected_boq()
+    return boq_controller.get_rejected_boq()
 
 @boq_routes.route('/completed_boq', methods=['GET'])
 @jwt_required
@@ -371,7 +374,7 @@ def completed_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_completed_boq()
+    return boq_controller.get_completed_boq()
 
 @boq_routes.route('/cancelled_boq', methods=['GET'])
 @jwt_required
@@ -380,7 +383,7 @@ def get_cancelled_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_cancelled_boq()
+    return boq_controller.get_cancelled_boq()
 
 @boq_routes.route('/revisions_boq', methods=['GET'])
 @jwt_required
@@ -389,7 +392,7 @@ def get_revisions_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_revisions_boq()
+    return boq_controller.get_revisions_boq()
 
 @boq_routes.route('/all_send_boq', methods=['GET'])
 @jwt_required
@@ -398,7 +401,7 @@ def get_send_to_client_boq_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_send_to_client_boq()
+    return boq_controller.get_send_to_client_boq()
 
 
 @boq_routes.route('/estimator_tab_counts', methods=['GET'])
@@ -408,7 +411,7 @@ def get_estimator_tab_counts_route():
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return get_estimator_tab_counts()
+    return boq_controller.get_estimator_tab_counts()
 
 @boq_routes.route('/send_client_revision/<int:boq_id>', methods=['GET'])
 @jwt_required
@@ -417,4 +420,4 @@ def send_td_client_boq_email_route(boq_id):
     access_check = check_boq_access()
     if access_check:
         return access_check
-    return send_td_client_boq_email(boq_id)
\ No newline at end of file
+    return boq_revisions.send_td_client_boq_email(boq_id)
\ No newline at end of file
@@ -1,83 +1,19 @@
 from flask import Blueprint, g, jsonify
-from controllers.auth_controller import jwt_required
-from controllers.upload_image_controller import *
-from controllers.boq_controller import get_custom_units
-
-# Import from the new buyer package modules
-from controllers.buyer.purchases_controller import (
-    get_buyer_boq_materials,
-    get_buyer_pending_purchases,
-    get_buyer_completed_purchases,
-    get_buyer_rejected_purchases,
-    complete_purchase,
-    get_purchase_by_id
-)
-from controllers.buyer.vendor_selection_controller import (
-    select_vendor_for_purchase,
-    select_vendor_for_material,
-    create_po_children,
-    update_purchase_order,
-    td_approve_vendor,
-    td_reject_vendor,
-    get_vendor_selection_data,
-    update_vendor_price,
-    save_supplier_notes,
-    send_po_children_for_approval
-)
-from controllers.buyer.po_child_controller import (
-    update_po_child_prices,
-    update_purchase_prices,
-    td_approve_po_child,
-    td_reject_po_child,
-    reselect_vendor_for_po_child,
-    get_project_site_engineers,
-    complete_po_child_purchase,
-    get_pending_po_children,
-    get_rejected_po_children,
-    get_buyer_pending_po_children,
-    get_approved_po_children
-)
-from controllers.buyer.email_controller import (
-    preview_vendor_email,
-    preview_po_child_vendor_email,
-    send_vendor_email,
-    send_po_child_vendor_email,
-    send_vendor_whatsapp
-)
-from controllers.buyer.lpo_controller import (
-    get_lpo_settings,
-    preview_lpo_pdf,
-    save_lpo_customization,
-    generate_lpo_pdf,
-    save_lpo_default_template,
-    get_lpo_default_template
-)
-from controllers.buyer.store_controller import (
-    get_store_items,
-    get_store_item_details,
-    get_store_categories,
-    get_projects_by_material,
-    check_store_availability,
-    complete_from_store,
-    get_store_request_status,
-    route_all_to_store
-)
-from controllers.buyer.se_boq_controller import (
-    get_se_boq_assignments,
-    select_vendor_for_se_boq,
-    td_approve_vendor_for_se_boq,
-    td_reject_vendor_for_se_boq,
-    complete_se_boq_purchase,
-    send_se_boq_vendor_email
-)
-from controllers.buyer.material_transfer_controller import (
-    get_crs_for_material_transfer,
-    create_buyer_material_transfer,
-    get_site_engineers_for_transfer,
-    get_projects_for_site_engineer,
-    get_buyer_transfer_history
-)
-from controllers.buyer.dashboard_controller import get_buyer_dashboard_analytics
+from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+boq_controller = LazyModule('controllers.boq_controller')
+dashboard_controller = LazyModule('controllers.buyer.dashboard_controller')
+email_controller = LazyModule('controllers.buyer.email_controller')
+lpo_controller = LazyModule('controllers.buyer.lpo_controller')
+material_transfer_controller = LazyModule('controllers.buyer.material_transfer_controller')
+po_child_controller = LazyModule('controllers.buyer.po_child_controller')
+purchases_controller = LazyModule('controllers.buyer.purchases_controller')
+se_boq_controller = LazyModule('controllers.buyer.se_boq_controller')
+store_controller = LazyModule('controllers.buyer.store_controller')
+vendor_selection_controller = LazyModule('controllers.buyer.vendor_selection_controller')
+upload_image_controller = LazyModule('controllers.upload_image_controller')
 
 # Create blueprint with URL prefix
 buyer_routes = Blueprint('buyer_routes', __name__, url_prefix='/api/buyer')
@@ -146,7 +82,7 @@ def get_buyer_boq_materials_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_buyer_boq_materials()
+    return purchases_controller.get_buyer_boq_materials()
 
 
 @buyer_routes.route('/new-purchases', methods=['GET'])
@@ -156,7 +92,7 @@ def get_buyer_pending_purchases_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_buyer_pending_purchases()
+    return purchases_controller.get_buyer_pending_purchases()
 
 
 @buyer_routes.route('/completed-purchases', methods=['GET'])
@@ -166,7 +102,7 @@ def get_buyer_completed_purchases_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_buyer_completed_purchases()
+    return purchases_controller.get_buyer_completed_purchases()
 
 
 @buyer_routes.route('/rejected-purchases', methods=['GET'])
@@ -176,7 +112,7 @@ def get_buyer_rejected_purchases_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_buyer_rejected_purchases()
+    return purchases_controller.get_buyer_rejected_purchases()
 
 
 @buyer_routes.route('/complete-purchase', methods=['POST'])
@@ -186,7 +122,7 @@ def complete_purchase_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return complete_purchase()
+    return purchases_controller.complete_purchase()
 
 
 @buyer_routes.route('/purchase/<int:cr_id>', methods=['GET'])
@@ -196,7 +132,7 @@ def get_purchase_by_id_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_purchase_by_id(cr_id)
+    return purchases_controller.get_purchase_by_id(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/select-vendor', methods=['POST'])
@@ -206,7 +142,7 @@ def select_vendor_for_purchase_route(cr_id):
     access_check = check_buyer_td_or_admin_access()
     if access_check:
         return access_check
-    return select_vendor_for_purchase(cr_id)
+    return vendor_selection_controller.select_vendor_for_purchase(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/select-vendor-for-material', methods=['POST'])
@@ -216,7 +152,7 @@ def select_vendor_for_material_route(cr_id):
     access_check = check_buyer_td_or_admin_access()
     if access_check:
         return access_check
-    return select_vendor_for_material(cr_id)
+    return vendor_selection_controller.select_vendor_for_material(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/create-po-children', methods=['POST'])
@@ -226,7 +162,7 @@ def create_po_children_route(cr_id):
     access_check = check_buyer_td_or_admin_access()
     if access_check:
         return access_check
-    return create_po_children(cr_id)
+    return vendor_selection_controller.create_po_children(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/send-for-approval', methods=['POST'])
@@ -236,7 +172,7 @@ def send_po_children_for_approval_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return send_po_children_for_approval(cr_id)
+    return vendor_selection_controller.send_po_children_for_approval(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/update', methods=['PUT'])
@@ -246,7 +182,7 @@ def update_purchase_order_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return update_purchase_order(cr_id)
+    return vendor_selection_controller.update_purchase_order(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/td-approve-vendor', methods=['POST'])
@@ -256,7 +192,7 @@ def td_approve_vendor_route(cr_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return td_approve_vendor(cr_id)
+    return vendor_selection_controller.td_approve_vendor(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/td-reject-vendor', methods=['POST'])
@@ -266,7 +202,7 @@ def td_reject_vendor_route(cr_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return td_reject_vendor(cr_id)
+    return vendor_selection_controller.td_reject_vendor(cr_id)
 
 
 # POChild routes
@@ -277,7 +213,7 @@ def get_pending_po_children_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_pending_po_children()
+    return po_child_controller.get_pending_po_children()
 
 
 @buyer_routes.route('/po-children/buyer-pending', methods=['GET'])
@@ -287,14 +223,14 @@ def get_buyer_pending_po_children_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_buyer_pending_po_children()
+    return po_child_controller.get_buyer_pending_po_children()
 
 
 @buyer_routes.route('/po-children/approved', methods=['GET'])
 @jwt_required
 def get_approved_po_children_route():
     """Get all POChild records with approved vendor (Buyer, TD, or Admin)"""
-    return get_approved_po_children()
+    return po_child_controller.get_approved_po_children()
 
 
 @buyer_routes.route('/po-children/rejected', methods=['GET'])
@@ -304,7 +240,7 @@ def get_rejected_po_children_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_rejected_po_children()
+    return po_child_controller.get_rejected_po_children()
 
 
 @buyer_routes.route('/po-child/<int:po_child_id>/td-approve', methods=['POST'])
@@ -314,7 +250,7 @@ def td_approve_po_child_route(po_child_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return td_approve_po_child(po_child_id)
+    return po_child_controller.td_approve_po_child(po_child_id)
 
 
 @buyer_routes.route('/po-child/<int:po_child_id>/td-reject', methods=['POST'])
@@ -324,7 +260,7 @@ def td_reject_po_child_route(po_child_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return td_reject_po_child(po_child_id)
+    return po_child_controller.td_reject_po_child(po_child_id)
 
 
 @buyer_routes.route('/po-child/<int:po_child_id>/reselect-vendor', methods=['POST'])
@@ -334,7 +270,7 @@ def reselect_vendor_for_po_child_route(po_child_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return reselect_vendor_for_po_child(po_child_id)
+    return po_child_controller.reselect_vendor_for_po_child(po_child_id)
 
 
 @buyer_routes.route('/po-child/<int:po_child_id>/complete', methods=['POST'])
@@ -344,7 +280,7 @@ def complete_po_child_purchase_route(po_child_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return complete_po_child_purchase(po_child_id)
+    return po_child_controller.complete_po_child_purchase(po_child_id)
 
 
 @buyer_routes.route('/po-child/<int:po_child_id>/update-prices', methods=['PUT'])
@@ -354,7 +290,7 @@ def update_po_child_prices_route(po_child_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return update_po_child_prices(po_child_id)
+    return po_child_controller.update_po_child_prices(po_child_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/update-prices', methods=['PUT'])
@@ -364,7 +300,7 @@ def update_purchase_prices_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return update_purchase_prices(cr_id)
+    return po_child_controller.update_purchase_prices(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/preview-vendor-email', methods=['GET'])
@@ -374,7 +310,7 @@ def preview_vendor_email_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return preview_vendor_email(cr_id)
+    return email_controller.preview_vendor_email(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/send-vendor-email', methods=['POST'])
@@ -384,7 +320,7 @@ def send_vendor_email_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return send_vendor_email(cr_id)
+    return email_controller.send_vendor_email(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/generate-lpo-pdf', methods=['POST'])
@@ -394,7 +330,7 @@ def generate_lpo_pdf_route(cr_id):
     access_check = check_buyer_td_or_admin_access()
     if access_check:
         return access_check
-    return generate_lpo_pdf(cr_id)
+    return lpo_controller.generate_lpo_pdf(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/preview-lpo-pdf', methods=['POST'])
@@ -404,7 +340,7 @@ def preview_lpo_pdf_route(cr_id):
     access_check = check_buyer_td_or_admin_access()
     if access_check:
         return access_check
-    return preview_lpo_pdf(cr_id)
+    return lpo_controller.preview_lpo_pdf(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/save-lpo-customization', methods=['POST'])
@@ -414,7 +350,7 @@ def save_lpo_customization_route(cr_id):
     access_check = check_buyer_td_or_admin_access()
     if access_check:
         return access_check
-    return save_lpo_customization(cr_id)
+    return lpo_controller.save_lpo_customization(cr_id)
 
 
 @buyer_routes.route('/lpo-default-template', methods=['POST'])
@@ -424,7 +360,7 @@ def save_lpo_default_template_route():
     access_check = check_buyer_td_or_admin_access()
     if access_check:
         return access_check
-    return save_lpo_default_template()
+    return lpo_controller.save_lpo_default_template()
 
 
 @buyer_routes.route('/lpo-default-template', methods=['GET'])
@@ -434,7 +370,7 @@ def get_lpo_default_template_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_lpo_default_template()
+    return lpo_controller.get_lpo_default_template()
 
 
 @buyer_routes.route('/lpo-settings', methods=['GET'])
@@ -444,7 +380,7 @@ def get_lpo_settings_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_lpo_settings()
+    return lpo_controller.get_lpo_settings()
 
 
 @buyer_routes.route('/po-child/<int:po_child_id>/preview-vendor-email', methods=['GET'])
@@ -454,7 +390,7 @@ def preview_po_child_vendor_email_route(po_child_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return preview_po_child_vendor_email(po_child_id)
+    return email_controller.preview_po_child_vendor_email(po_child_id)
 
 
 @buyer_routes.route('/po-child/<int:po_child_id>/send-vendor-email', methods=['POST'])
@@ -464,7 +400,7 @@ def send_po_child_vendor_email_route(po_child_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return send_po_child_vendor_email(po_child_id)
+    return email_controller.send_po_child_vendor_email(po_child_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/send-vendor-whatsapp', methods=['POST'])
@@ -474,7 +410,7 @@ def send_vendor_whatsapp_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return send_vendor_whatsapp(cr_id)
+    return email_controller.send_vendor_whatsapp(cr_id)
 
 
 # SE BOQ Assignment routes
@@ -485,7 +421,7 @@ def get_se_boq_assignments_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_se_boq_assignments()
+    return se_boq_controller.get_se_boq_assignments()
 
 
 @buyer_routes.route('/se-boq/<int:assignment_id>/select-vendor', methods=['POST'])
@@ -495,7 +431,7 @@ def select_vendor_for_se_boq_route(assignment_id):
     access_check = check_buyer_td_or_admin_access()
     if access_check:
         return access_check
-    return select_vendor_for_se_boq(assignment_id)
+    return se_boq_controller.select_vendor_for_se_boq(assignment_id)
 
 
 @buyer_routes.route('/se-boq/<int:assignment_id>/td-approve-vendor', methods=['POST'])
@@ -505,7 +441,7 @@ def td_approve_vendor_for_se_boq_route(assignment_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return td_approve_vendor_for_se_boq(assignment_id)
+    return se_boq_controller.td_approve_vendor_for_se_boq(assignment_id)
 
 
 @buyer_routes.route('/se-boq/<int:assignment_id>/td-reject-vendor', methods=['POST'])
@@ -515,7 +451,7 @@ def td_reject_vendor_for_se_boq_route(assignment_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return td_reject_vendor_for_se_boq(assignment_id)
+    return se_boq_controller.td_reject_vendor_for_se_boq(assignment_id)
 
 
 @buyer_routes.route('/se-boq/<int:assignment_id>/complete-purchase', methods=['POST'])
@@ -525,7 +461,7 @@ def complete_se_boq_purchase_route(assignment_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return complete_se_boq_purchase(assignment_id)
+    return se_boq_controller.complete_se_boq_purchase(assignment_id)
 
 
 @buyer_routes.route('/se-boq/<int:assignment_id>/send-vendor-email', methods=['POST'])
@@ -535,32 +471,32 @@ def send_se_boq_vendor_email_route(assignment_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return send_se_boq_vendor_email(assignment_id)
+    return se_boq_controller.send_se_boq_vendor_email(assignment_id)
 
 
 # File Management routes
 @buyer_routes.route('/upload/<int:cr_id>', methods=['POST'])
 @jwt_required
 def upload_files_route(cr_id):
-    return buyer_upload_files(cr_id)
+    return upload_image_controller.buyer_upload_files(cr_id)
 
 
 @buyer_routes.route('/files/<int:cr_id>', methods=['GET'])
 @jwt_required
 def view_files_route(cr_id):
-    return buyer_view_files(cr_id)
+    return upload_image_controller.buyer_view_files(cr_id)
 
 
 @buyer_routes.route('/files/<int:cr_id>', methods=['DELETE'])
 @jwt_required
 def delete_files_route(cr_id):
-    return buyer_delete_files(cr_id)
+    return upload_image_controller.buyer_delete_files(cr_id)
 
 
 @buyer_routes.route('/files/all/<int:cr_id>', methods=['DELETE'])
 @jwt_required
 def delete_all_files_route(cr_id):
-    return buyer_delete_all_files(cr_id)
+    return upload_image_controller.buyer_delete_all_files(cr_id)
 
 
 # Store Management Routes
@@ -571,7 +507,7 @@ def get_store_items_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_store_items()
+    return store_controller.get_store_items()
 
 
 @buyer_routes.route('/store/items/<int:item_id>', methods=['GET'])
@@ -581,7 +517,7 @@ def get_store_item_details_route(item_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_store_item_details(item_id)
+    return store_controller.get_store_item_details(item_id)
 
 
 @buyer_routes.route('/store/categories', methods=['GET'])
@@ -591,7 +527,7 @@ def get_store_categories_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_store_categories()
+    return store_controller.get_store_categories()
 
 
 @buyer_routes.route('/store/projects-by-material/<int:material_id>', methods=['GET'])
@@ -601,7 +537,7 @@ def get_projects_by_material_route(material_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_projects_by_material(material_id)
+    return store_controller.get_projects_by_material(material_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/check-store-availability', methods=['GET'])
@@ -611,7 +547,7 @@ def check_store_availability_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return check_store_availability(cr_id)
+    return store_controller.check_store_availability(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/complete-from-store', methods=['POST'])
@@ -621,7 +557,7 @@ def complete_from_store_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return complete_from_store(cr_id)
+    return store_controller.complete_from_store(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/route-all-to-store', methods=['POST'])
@@ -631,7 +567,7 @@ def route_all_to_store_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return route_all_to_store(cr_id)
+    return store_controller.route_all_to_store(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/store-request-status', methods=['GET'])
@@ -641,7 +577,7 @@ def get_store_request_status_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_store_request_status(cr_id)
+    return store_controller.get_store_request_status(cr_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/vendor-selection', methods=['GET'])
@@ -651,7 +587,7 @@ def get_vendor_selection_data_route(cr_id):
     access_check = check_buyer_td_or_admin_access()
     if access_check:
         return access_check
-    return get_vendor_selection_data(cr_id)
+    return vendor_selection_controller.get_vendor_selection_data(cr_id)
 
 
 @buyer_routes.route('/vendor/<int:vendor_id>/update-price', methods=['POST'])
@@ -661,7 +597,7 @@ def update_vendor_price_route(vendor_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return update_vendor_price(vendor_id)
+    return vendor_selection_controller.update_vendor_price(vendor_id)
 
 
 @buyer_routes.route('/purchase/<int:cr_id>/save-supplier-notes', methods=['POST'])
@@ -671,7 +607,7 @@ def save_supplier_notes_route(cr_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return save_supplier_notes(cr_id)
+    return vendor_selection_controller.save_supplier_notes(cr_id)
 
 
 # Project Site Engineers route
@@ -682,7 +618,7 @@ def get_project_site_engineers_route(project_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_project_site_engineers(project_id)
+    return po_child_controller.get_project_site_engineers(project_id)
 
 
 # Buyer Material Transfer - Get Available CRs
@@ -693,7 +629,7 @@ def get_crs_for_material_transfer_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_crs_for_material_transfer()
+    return material_transfer_controller.get_crs_for_material_transfer()
 
 
 # Buyer Material Transfer - Create DN
@@ -704,7 +640,7 @@ def create_buyer_material_transfer_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return create_buyer_material_transfer()
+    return material_transfer_controller.create_buyer_material_transfer()
 
 
 # Buyer Transfer History
@@ -715,7 +651,7 @@ def get_buyer_transfer_history_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_buyer_transfer_history()
+    return material_transfer_controller.get_buyer_transfer_history()
 
 
 # Get Site Engineers for Material Transfer
@@ -726,7 +662,7 @@ def get_site_engineers_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_site_engineers_for_transfer()
+    return material_transfer_controller.get_site_engineers_for_transfer()
 
 
 # Get Projects for Site Engineer
@@ -737,7 +673,7 @@ def get_se_projects_route(site_engineer_id):
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_projects_for_site_engineer(site_engineer_id)
+    return material_transfer_controller.get_projects_for_site_engineer(site_engineer_id)
 
 # Get Custom Units (for Material Transfer)
 @buyer_routes.route('/custom-units', methods=['GET'])
@@ -747,7 +683,7 @@ def get_buyer_custom_units_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_custom_units()
+    return boq_controller.get_custom_units()
 
 
 # Dashboard Analytics
@@ -758,4 +694,4 @@ def get_buyer_dashboard_route():
     access_check = check_buyer_or_admin_access()
     if access_check:
         return access_check
-    return get_buyer_dashboard_analytics()
+    return dashboard_controller.get_buyer_dashboard_analytics()
@@ -6,22 +6,11 @@ Buyer/Admin manages the catalog; all authenticated users can read.
 """
 
 from flask import Blueprint
-from controllers.catalog_items_controller import (
-    get_all_catalog_items,
-    get_catalog_item,
-    search_catalog_items,
-    get_full_tree,
-    create_catalog_item,
-    update_catalog_item,
-    delete_catalog_item,
-    create_catalog_sub_item,
-    update_catalog_sub_item,
-    delete_catalog_sub_item,
-    link_material_to_sub_item,
-    unlink_material_from_sub_item,
-    get_catalog_categories,
-)
-from controllers.auth_controller import jwt_required
+from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+catalog_items_controller = LazyModule('controllers.catalog_items_controller')
 
 catalog_items_routes = Blueprint('catalog_items_routes', __name__, url_prefix='/api/catalog-items')
 
@@ -34,56 +23,56 @@ catalog_items_routes = Blueprint('catalog_items_routes', __name__, url_prefix='/
 @jwt_required
 def list_items():
     """GET /api/catalog-items"""
-    return get_all_catalog_items()
+    return catalog_items_controller.get_all_catalog_items()
 
 
 @catalog_items_routes.route('/search', methods=['GET'])
 @jwt_required
 def search_items():
     """GET /api/catalog-items/search?q=foundation"""
-    return search_catalog_items()
+    return catalog_items_controller.search_catalog_items()
 
 
 @catalog_items_routes.route('/full-tree', methods=['GET'])
 @jwt_required
 def full_tree():
     """GET /api/catalog-items/full-tree"""
-    return get_full_tree()
+    return catalog_items_controller.get_full_tree()
 
 
 @catalog_items_routes.route('/categories', methods=['GET'])
 @jwt_required
 def categories():
     """GET /api/catalog-items/categories"""
-    return get_catalog_categories()
+    return catalog_items_controller.get_catalog_categories()
 
 
 @catalog_items_routes.route('/<int:item_id>', methods=['GET'])
 @jwt_required
 def get_item(item_id):
     """GET /api/catalog-items/<id>"""
-    return get_catalog_item(item_id)
+    return catalog_items_controller.get_catalog_item(item_id)
 
 
 @catalog_items_routes.route('', methods=['POST'])
 @jwt_required
 def create_item():
     """POST /api/catalog-items"""
-    return create_catalog_item()
+    return catalog_items_controller.create_catalog_item()
 
 
 @catalog_items_routes.route('/<int:item_id>', methods=['PUT'])
 @jwt_required
 def update_item(item_id):
     """PUT /api/catalog-items/<id>"""
-    return update_catalog_item(item_id)
+    return catalog_items_controller.update_catalog_item(item_id)
 
 
 @catalog_items_routes.route('/<int:item_id>', methods=['DELETE'])
 @jwt_required
 def delete_item(item_id):
     """DELETE /api/catalog-items/<id>"""
-    return delete_catalog_item(item_id)
+    return catalog_items_controller.delete_catalog_item(item_id)
 
 
 # ============================================================================
@@ -94,21 +83,21 @@ def delete_item(item_id):
 @jwt_required
 def create_sub_item(item_id):
     """POST /api/catalog-items/<id>/sub-items"""
-    return create_catalog_sub_item(item_id)
+    return catalog_items_controller.create_catalog_sub_item(item_id)
 
 
 @catalog_items_routes.route('/sub-items/<int:sub_item_id>', methods=['PUT'])
 @jwt_required
 def update_sub_item(sub_item_id):
     """PUT /api/catalog-items/sub-items/<id>"""
-    return update_catalog_sub_item(sub_item_id)
+    return catalog_items_controller.update_catalog_sub_item(sub_item_id)
 
 
 @catalog_items_routes.route('/sub-items/<int:sub_item_id>', methods=['DELETE'])
 @jwt_required
 def delete_sub_item(sub_item_id):
     """DELETE /api/catalog-items/sub-items/<id>"""
-    return delete_catalog_sub_item(sub_item_id)
+    return catalog_items_controller.delete_catalog_sub_item(sub_item_id)
 
 
 # ============================================================================
@@ -119,11 +108,11 @@ def delete_sub_item(sub_item_id):
 @jwt_required
 def link_material(sub_item_id):
     """POST /api/catalog-items/sub-items/<id>/materials"""
-    return link_material_to_sub_item(sub_item_id)
+    return catalog_items_controller.link_material_to_sub_item(sub_item_id)
 
 
 @catalog_items_routes.route('/sub-items/<int:sub_item_id>/materials/<int:material_id>', methods=['DELETE'])
 @jwt_required
 def unlink_material(sub_item_id, material_id):
     """DELETE /api/catalog-items/sub-items/<sub_id>/materials/<material_id>"""
-    return unlink_material_from_sub_item(sub_item_id, material_id)
+    return catalog_items_controller.unlink_material_from_sub_item(sub_item_id, material_id)
@@ -1,6 +1,9 @@
 from flask import Blueprint, g, jsonify
 from utils.authentication import jwt_required
-from controllers.change_request_controller import *
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+change_request_controller = LazyModule('controllers.change_request_controller')
 
 change_request_routes = Blueprint('change_request_routes', __name__, url_prefix='/api')
 
@@ -37,7 +40,7 @@ def create_change_request_route():
     access_check = check_cr_access()
     if access_check:
         return access_check
-    return create_change_request()
+    return change_request_controller.create_change_request()
 
 
 # Get all change requests (role-filtered)
@@ -48,7 +51,7 @@ def get_all_change_requests_route():
     access_check = check_cr_access()
     if access_check:
         return access_check
-    return get_all_change_requests()
+    return change_request_controller.get_all_change_requests()
 
 
 # Get specific change request by ID
@@ -59,7 +62,7 @@ def get_change_request_by_id_route(cr_id):
     access_check = check_cr_access()
     if access_check:
         return access_check
-    return get_change_request_by_id(cr_id)
+    return change_request_controller.get_change_request_by_id(cr_id)
 
 
 # Update change request (Only for pending requests by creator)
@@ -70,7 +73,7 @@ def update_change_request_route(cr_id):
     access_check = check_cr_access()
     if access_check:
         return access_check
-    return update_change_request(cr_id)
+    return change_request_controller.update_change_request(cr_id)
 
 
 # Delete change request (Only for pending/rejected requests by creator)
@@ -81,7 +84,7 @@ def delete_change_request_route(cr_id):
     access_check = check_cr_access()
     if access_check:
         return access_check
-    return delete_change_request(cr_id)
+    return change_request_controller.delete_change_request(cr_id)
 
 
 # Approve change request (Estimator/TD/Admin)
@@ -92,7 +95,7 @@ def approve_change_request_route(cr_id):
     access_check = check_cr_access()
     if access_check:
         return access_check
-    return approve_change_request(cr_id)
+    return change_request_controller.approve_change_request(cr_id)
 
 
 # Reject change request (Estimator/TD/Admin)
@@ -103,7 +106,7 @@ def reject_change_request_route(cr_id):
     access_check = check_cr_access()
     if access_check:
         return access_check
-    return reject_change_request(cr_id)
+    return change_request_controller.reject_change_request(cr_id)
 
 
 # Resend rejected change request (Creator/Buyer/Admin)
@@ -114,7 +117,7 @@ def resend_change_request_route(cr_id):
     access_check = check_cr_access()
     if access_check:
         return access_check
-    return resend_change_request(cr_id)
+    return change_request_controller.resend_change_request(cr_id)
 
 
 # Send for review (PM/SE/Admin sends request to next approver)
@@ -125,7 +128,7 @@ def send_for_review_route(cr_id):
     access_check = check_cr_access()
     if access_check:
         return access_check
-    return send_for_review(cr_id)
+    return change_request_controller.send_for_review(cr_id)
 
 
 # REMOVED: update_change_request_status endpoint - DEPRECATED
@@ -141,7 +144,7 @@ def get_boq_change_requests_route(boq_id):
     Get all change requests (pending/approved/rejected) for a specific BOQ
     Used by PM/SE to view their submitted requests in BOQ modal
     """
-    return get_boq_change_requests(boq_id)
+    return change_request_controller.get_boq_change_requests(boq_id)
 
 
 # Get item overhead snapshot
@@ -187,7 +190,7 @@ def get_all_buyers_route():
     Get all active buyers in the system
     Used by Estimator/TD to select buyer when approving change requests
     """
-    return get_all_buyers()
+    return change_request_controller.get_all_buyers()
 
 
 # REMOVED: Extra Material Endpoints - DEPRECATED
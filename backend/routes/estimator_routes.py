@@ -1,8 +1,11 @@
 from flask import Blueprint, request, jsonify, g, current_app
 from datetime import datetime
-from controllers.send_boq_client import *
-from controllers.estimator_controller import *
 from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+estimator_controller = LazyModule('controllers.estimator_controller')
+send_boq_client = LazyModule('controllers.send_boq_client')
 
 # Rate limit decorator helper for heavy endpoints
 def rate_limit(limit_string):
@@ -39,7 +42,7 @@ def send_boq_to_client_route():
     access_check = check_estimator_or_admin_access()
     if access_check:
         return access_check
-    return send_boq_to_client()
+    return send_boq_client.send_boq_to_client()
 
 @estimator_routes.route('/confirm_client_approval/<int:boq_id>', methods=['PUT'])
 @jwt_required
@@ -48,7 +51,7 @@ def confirm_client_approval_route(boq_id):
     access_check = check_estimator_or_admin_access()
     if access_check:
         return access_check
-    return confirm_client_approval(boq_id)
+    return estimator_controller.confirm_client_approval(boq_id)
 
 @estimator_routes.route('/reject_client_approval/<int:boq_id>', methods=['PUT'])
 @jwt_required
@@ -57,7 +60,7 @@ def reject_client_approval_route(boq_id):
     access_check = check_estimator_or_admin_access()
     if access_check:
         return access_check
-    return reject_client_approval(boq_id)
+    return estimator_controller.reject_client_approval(boq_id)
 
 @estimator_routes.route('/cancel_boq/<int:boq_id>', methods=['PUT'])
 @jwt_required
@@ -66,7 +69,7 @@ def cancel_boq_route(boq_id):
     access_check = check_estimator_or_admin_access()
     if access_check:
         return access_check
-    return cancel_boq(boq_id)
+    return estimator_controller.cancel_boq(boq_id)
 
 # revision history view
 @estimator_routes.route('/boq_details_history/<int:boq_id>', methods=['GET'])
@@ -78,7 +81,7 @@ def get_boq_details_history_route(boq_id):
     user_role = current_user.get('role', '').lower()
     if user_role not in ['estimator', 'technicaldirector', 'admin']:
         return jsonify({"error": "Access denied. Estimator, Technical Director, or Admin role required."}), 403
-    return get_boq_details_history(boq_id)
+    return estimator_controller.get_boq_details_history(boq_id)
 
 # BOQ Email Notification to Project Manager
 @estimator_routes.route('/boq/send_to_pm', methods=['POST'])
@@ -88,7 +91,7 @@ def send_boq_to_pm_route():
     access_check = check_estimator_or_admin_access()
     if access_check:
         return access_check
-    return send_boq_to_project_manager()
+    return estimator_controller.send_boq_to_project_manager()
 
 # BOQ Email Notification to Technical Director (after PM approval)
 @estimator_routes.route('/boq/send_to_td', methods=['POST'])
@@ -98,4 +101,4 @@ def send_boq_to_td_route():
     access_check = check_estimator_or_admin_access()
     if access_check:
         return access_check
-    return send_boq_to_technical_director()
\ No newline at end of file
+    return estimator_controller.send_boq_to_technical_director()
\ No newline at end of file
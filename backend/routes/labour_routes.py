@@ -11,9 +11,13 @@ API endpoints for 8-step SOP workflow:
 8. Admin (HR): Payroll Processing
 """
 from flask import Blueprint, request, jsonify, g
-from controllers.labour_controller import *
 from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
 
+# Controllers are imported on the first request that reaches them
+labour_assignment_controller = LazyModule('controllers.labour_assignment_controller')
+labour_payroll_controller = LazyModule('controllers.labour_payroll_controller')
+labour_requisition_controller = LazyModule('controllers.labour_requisition_controller')
 
 labour_routes = Blueprint('labour', __name__, url_prefix='/api/labour')
 
@@ -26,42 +30,42 @@ labour_routes = Blueprint('labour', __name__, url_prefix='/api/labour')
 @jwt_required
 def list_workers():
     """Get all workers with optional filtering"""
-    return get_workers()
+    return labour_requisition_controller.get_workers()
 
 
 @labour_routes.route('/workers/<int:worker_id>', methods=['GET'])
 @jwt_required
 def get_worker(worker_id):
     """Get single worker details"""
-    return get_worker_by_id(worker_id)
+    return labour_requisition_controller.get_worker_by_id(worker_id)
 
 
 @labour_routes.route('/workers', methods=['POST'])
 @jwt_required
 def add_worker():
     """Create new worker (Production Manager)"""
-    return create_worker()
+    return labour_requisition_controller.create_worker()
 
 
 @labour_routes.route('/workers/<int:worker_id>', methods=['PUT'])
 @jwt_required
 def edit_worker(worker_id):
     """Update worker details"""
-    return update_worker(worker_id)
+    return labour_requisition_controller.update_worker(worker_id)
 
 
 @labour_routes.route('/workers/<int:worker_id>', methods=['DELETE'])
 @jwt_required
 def remove_worker(worker_id):
     """Soft delete worker"""
-    return delete_worker(worker_id)
+    return labour_requisition_controller.delete_worker(worker_id)
 
 
 @labour_routes.route('/workers/by-skill/<string:skill>', methods=['GET'])
 @jwt_required
 def workers_by_skill(skill):
     """Get workers with specific skill"""
-    return get_workers_by_skill(skill)
+    return labour_requisition_controller.get_workers_by_skill(skill)
 
 
 # ============================================================================
@@ -75,28 +79,28 @@ def workers_by_skill(skill):
 @jwt_required
 def create_new_requisition():
     """Create labour requisition (Site Engineer)"""
-    return create_requisition()
+    return labour_requisition_controller.create_requisition()
 
 
 @labour_routes.route('/requisitions/my-requests', methods=['GET'])
 @jwt_required
 def my_requisitions():
     """Get requester's own requisitions"""
-    return get_my_requisitions()
+    return labour_requisition_controller.get_my_requisitions()
 
 
 @labour_routes.route('/requisitions/pending', methods=['GET'])
 @jwt_required
 def pending_requisitions():
     """Get pending requisitions for approval (Project Manager)"""
-    return get_pending_requisitions()
+    return labour_requisition_controller.get_pending_requisitions()
 
 
 @labour_routes.route('/requisitions/approved', methods=['GET'])
 @jwt_required
 def approved_requisitions():
     """Get approved requisitions pending assignment (Production Manager)"""
-    return get_approved_requisitions()
+    return labour_assignment_controller.get_approved_requisitions()
 
 
 # --- DYNAMIC REQUISITION ROUTES (must come after static routes) ---
@@ -105,49 +109,49 @@ def approved_requisitions():
 @jwt_required
 def get_requisition(requisition_id):
     """Get requisition details"""
-    return get_requisition_by_id(requisition_id)
+    return labour_requisition_controller.get_requisition_by_id(requisition_id)
 
 
 @labour_routes.route('/requisitions/<int:requisition_id>', methods=['PUT'])
 @jwt_required
 def edit_requisition(requisition_id):
     """Update requisition (only pending status)"""
-    return update_requisition(requisition_id)
+    return labour_requisition_controller.update_requisition(requisition_id)
 
 
 @labour_routes.route('/requisitions/<int:requisition_id>/resubmit', methods=['POST', 'PUT'])
 @jwt_required
 def resubmit_req(requisition_id):
     """Resubmit/update requisition with edits (Site Engineer)"""
-    return resubmit_requisition(requisition_id)
+    return labour_requisition_controller.resubmit_requisition(requisition_id)
 
 
 @labour_routes.route('/requisitions/<int:requisition_id>/send-to-production', methods=['POST'])
 @jwt_required
 def send_req_to_production(requisition_id):
     """Send PM's pending requisition to production for worker assignment (Project Manager only)"""
-    return send_to_production(requisition_id)
+    return labour_requisition_controller.send_to_production(requisition_id)
 
 
 @labour_routes.route('/requisitions/<int:requisition_id>', methods=['DELETE'])
 @jwt_required
 def delete_req(requisition_id):
     """Delete requisition (Site Engineer - only pending)"""
-    return delete_requisition(requisition_id)
+    return labour_requisition_controller.delete_requisition(requisition_id)
 
 
 @labour_routes.route('/requisitions/<int:requisition_id>/resend', methods=['POST'])
 @jwt_required
 def resend_req(requisition_id):
     """Resend pending requisition to PM (Site Engineer)"""
-    return resend_requisition(requisition_id)
+    return labour_requisition_controller.resend_requisition(requisition_id)
 
 
 @labour_routes.route('/requisitions/by-project/<int:project_id>', methods=['GET'])
 @jwt_required
 def requisitions_by_project(project_id):
     """Get all requisitions for a project (for labour item status tracking)"""
-    return get_requisitions_by_project(project_id)
+    return labour_requisition_controller.get_requisitions_by_project(project_id)
 
 
 # ============================================================================
@@ -158,14 +162,14 @@ def requisitions_by_project(project_id):
 @jwt_required
 def approve_req(requisition_id):
     """Approve requisition (Project Manager)"""
-    return approve_requisition(requisition_id)
+    return labour_requisition_controller.approve_requisition(requisition_id)
 
 
 @labour_routes.route('/requisitions/<int:requisition_id>/reject', methods=['POST'])
 @jwt_required
 def reject_req(requisition_id):
     """Reject requisition with reason (Project Manager)"""
-    return reject_requisition(requisition_id)
+    return labour_requisition_controller.reject_requisition(requisition_id)
 
 
 # ============================================================================
@@ -176,14 +180,14 @@ def reject_req(requisition_id):
 @jwt_required
 def available_workers():
     """Get available workers for a skill and date"""
-    return get_available_workers()
+    return labour_assignment_controller.get_available_workers()
 
 
 @labour_routes.route('/requisitions/<int:requisition_id>/assign', methods=['POST'])
 @jwt_required
 def assign_workers(requisition_id):
     """Assign workers to requisition (Production Manager)"""
-    return assign_workers_to_requisition(requisition_id)
+    return labour_assignment_controller.assign_workers_to_requisition(requisition_id)
 
 
 @labour_routes.route('/requisitions/<int:requisition_id>/retain', methods=['POST'])
@@ -191,21 +195,21 @@ def assign_workers(requisition_id):
 @jwt_required
 def retain_workers(requisition_id):
     """Reassign/duplicate requisition with same workers for a new date. Sends to PM for approval."""
-    return retain_workers_for_next_day(requisition_id)
+    return labour_assignment_controller.retain_workers_for_next_day(requisition_id)
 
 
 @labour_routes.route('/requisitions/<int:requisition_id>/download_pdf', methods=['GET'])
 @jwt_required
 def download_pdf(requisition_id):
     """Download PDF report for requisition assignment (Production Manager)"""
-    return download_assignment_pdf(requisition_id)
+    return labour_payroll_controller.download_assignment_pdf(requisition_id)
 
 
 @labour_routes.route('/daily-schedule/download_pdf', methods=['GET'])
 @jwt_required
 def download_daily_schedule():
     """Download daily worker assignment schedule poster PDF (Production Manager)"""
-    return download_daily_schedule_pdf()
+    return labour_payroll_controller.download_daily_schedule_pdf()
 
 
 # ============================================================================
@@ -216,28 +220,35 @@ def download_daily_schedule():
 @jwt_required
 def arrivals_for_date(project_id, date):
     """Get assigned workers for a project on a date"""
-    return get_arrivals_for_date(project_id, date)
+    return labour_assignment_controller.get_arrivals_for_date(project_id, date)
 
 
 @labour_routes.route('/arrivals/confirm', methods=['POST'])
 @jwt_required
 def confirm_worker_arrival():
     """Confirm worker arrival at site (Site Engineer)"""
-    return confirm_arrival()
+    return labour_assignment_controller.confirm_arrival()
 
 
 @labour_routes.route('/arrivals/no-show', methods=['POST'])
 @jwt_required
 def mark_worker_no_show():
     """Mark worker as no-show (Site Engineer)"""
-    return mark_no_show()
+    return labour_assignment_controller.mark_no_show()
 
 
 @labour_routes.route('/arrivals/departure', methods=['POST'])
 @jwt_required
 def mark_worker_departure():
     """Mark worker departure/clock out (Site Engineer)"""
-    return mark_departure()
+    return labour_assignment_controller.mark_departure()
+
+
+@labour_routes.route('/arrivals/confirm/bulk', methods=['POST'])
+@jwt_required
+def confirm_crew_arrival():
+    """Confirm arrival of a list of workers for a project/date (Site Engineer)"""
+    return labour_assignment_controller.bulk_confirm_worker_arrivals()
 
 
 # ============================================================================
@@ -248,28 +259,42 @@ def mark_worker_departure():
 @jwt_required
 def clock_in():
     """Clock in worker (Site Engineer)"""
-    return clock_in_worker()
+    return labour_assignment_controller.clock_in_worker()
 
 
 @labour_routes.route('/attendance/clock-out', methods=['POST'])
 @jwt_required
 def clock_out():
     """Clock out worker (Site Engineer)"""
-    return clock_out_worker()
+    return labour_assignment_controller.clock_out_worker()
+
+
+@labour_routes.route('/attendance/clock-in/bulk', methods=['POST'])
+@jwt_required
+def clock_in_crew():
+    """Clock in a list of workers for a project/date (Site Engineer)"""
+    return labour_assignment_controller.bulk_clock_in_workers()
+
+
+@labour_routes.route('/attendance/clock-out/bulk', methods=['POST'])
+@jwt_required
+def clock_out_crew():
+    """Clock out a list of workers for a project/date (Site Engineer)"""
+    return labour_assignment_controller.bulk_clock_out_workers()
 
 
 @labour_routes.route('/attendance/<int:project_id>/<string:date>', methods=['GET'])
 @jwt_required
 def daily_attendance(project_id, date):
     """Get daily attendance for project"""
-    return get_daily_attendance(project_id, date)
+    return labour_assignment_controller.get_daily_attendance(project_id, date)
 
 
 @labour_routes.route('/attendance/<int:attendance_id>', methods=['PUT'])
 @jwt_required
 def edit_attendance(attendance_id):
     """Update attendance record (corrections)"""
-    return update_attendance(attendance_id)
+    return labour_assignment_controller.update_attendance(attendance_id)
 
 
 # ============================================================================
@@ -280,21 +305,21 @@ def edit_attendance(attendance_id):
 @jwt_required
 def attendance_to_lock():
     """Get attendance records pending lock (Project Manager)"""
-    return get_attendance_to_lock()
+    return labour_payroll_controller.get_attendance_to_lock()
 
 
 @labour_routes.route('/attendance/<int:attendance_id>/lock', methods=['POST'])
 @jwt_required
 def lock_single_attendance(attendance_id):
     """Lock single attendance record (Project Manager)"""
-    return lock_attendance(attendance_id)
+    return labour_payroll_controller.lock_attendance(attendance_id)
 
 
 @labour_routes.route('/attendance/lock-day', methods=['POST'])
 @jwt_required
 def lock_day():
     """Lock all attendance for a project/date (Project Manager)"""
-    return lock_day_attendance()
+    return labour_payroll_controller.lock_day_attendance()
 
 
 # ============================================================================
@@ -305,14 +330,14 @@ def lock_day():
 @jwt_required
 def locked_for_payroll():
     """Get locked attendance records for payroll (Admin/HR)"""
-    return get_locked_for_payroll()
+    return labour_payroll_controller.get_locked_for_payroll()
 
 
 @labour_routes.route('/payroll/summary', methods=['GET'])
 @jwt_required
 def payroll_summary():
     """Get payroll summary grouped by worker (Admin/HR)"""
-    return get_payroll_summary()
+    return labour_payroll_controller.get_payroll_summary()
 
 
 # ============================================================================
@@ -323,7 +348,7 @@ def payroll_summary():
 @jwt_required
 def dashboard():
     """Get labour dashboard statistics"""
-    return get_labour_dashboard()
+    return labour_payroll_controller.get_labour_dashboard()
 
 
 # ============================================================================
@@ -334,4 +359,4 @@ def dashboard():
 @jwt_required
 def list_projects():
     """Get projects accessible to current user (for dropdowns/filters)"""
-    return get_user_projects()
+    return labour_payroll_controller.get_user_projects()
@@ -1,14 +1,9 @@
 from flask import Blueprint, g, jsonify
-from controllers.mep_controller import (
-    get_mep_approval_boq,
-    get_mep_assign_project,
-    get_mep_approved_boq,
-    get_mep_pending_boq,
-    get_mep_rejected_boq,
-    get_mep_completed_project,
-    get_mep_dashboard
-)
 from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+mep_controller = LazyModule('controllers.mep_controller')
 
 mep_routes = Blueprint("mep_routes", __name__, url_prefix='/api')
 
@@ -49,7 +44,7 @@ def get_mep_approval_boq_route():
     access_check = check_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_mep_approval_boq()
+    return mep_controller.get_mep_approval_boq()
 
 
 @mep_routes.route('/mep_dashboard', methods=['GET'])
@@ -62,7 +57,7 @@ def get_mep_dashboard_route():
     access_check = check_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_mep_dashboard()
+    return mep_controller.get_mep_dashboard()
 
 
 @mep_routes.route('/mep_assign_project', methods=['GET'])
@@ -75,7 +70,7 @@ def get_mep_assign_project_route():
     access_check = check_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_mep_assign_project()
+    return mep_controller.get_mep_assign_project()
 
 
 @mep_routes.route('/mep_approve_boq', methods=['GET'])
@@ -88,7 +83,7 @@ def get_mep_approved_boq_route():
     access_check = check_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_mep_approved_boq()
+    return mep_controller.get_mep_approved_boq()
 
 
 @mep_routes.route('/mep_pending_boq', methods=['GET'])
@@ -101,7 +96,7 @@ def get_mep_pending_boq_route():
     access_check = check_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_mep_pending_boq()
+    return mep_controller.get_mep_pending_boq()
 
 
 @mep_routes.route('/mep_rejected_boq', methods=['GET'])
@@ -114,7 +109,7 @@ def get_mep_rejected_boq_route():
     access_check = check_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_mep_rejected_boq()
+    return mep_controller.get_mep_rejected_boq()
 
 
 @mep_routes.route('/mep_completed_project', methods=['GET'])
@@ -127,4 +122,4 @@ def get_mep_completed_project_route():
     access_check = check_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_mep_completed_project()
+    return mep_controller.get_mep_completed_project()
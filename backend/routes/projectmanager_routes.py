@@ -1,14 +1,11 @@
 from flask import Blueprint, g, jsonify
-from controllers.site_supervisor_controller import *
-from controllers.projectmanager_controller import *
-from controllers.buyer_controller import (
-    create_buyer,
-    get_all_buyers,
-    get_buyer_id,
-    update_buyer,
-    delete_buyer
-)
 from utils.authentication import *
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+buyer_controller = LazyModule('controllers.buyer_controller')
+projectmanager_controller = LazyModule('controllers.projectmanager_controller')
+site_supervisor_controller = LazyModule('controllers.site_supervisor_controller')
 
 pm_routes = Blueprint("pm_routes", __name__, url_prefix='/api')
 
@@ -59,7 +56,7 @@ def send_boq_to_estimator_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return send_boq_to_estimator()
+    return projectmanager_controller.send_boq_to_estimator()
 
 # Dashboard statistics
 @pm_routes.route('/pm_dashboard', methods=['GET'])
@@ -69,7 +66,7 @@ def get_pm_dashboard_route():
     access_check = check_pm_or_admin_access()
     if access_check:
         return access_check
-    return get_pm_dashboard()
+    return projectmanager_controller.get_pm_dashboard()
 
 @pm_routes.route('/all_sitesupervisor', methods=['GET'])
 @jwt_required
@@ -78,7 +75,7 @@ def get_all_sitesupervisor_route():
     access_check = check_pm_or_admin_access()
     if access_check:
         return access_check
-    return get_all_sitesupervisor()
+    return site_supervisor_controller.get_all_sitesupervisor()
 
 # ============================================================================
 # SITE ENGINEER (SE) ROUTES - PM manages Site Engineers
@@ -92,7 +89,7 @@ def create_sitesupervisor_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return create_sitesupervisor()
+    return site_supervisor_controller.create_sitesupervisor()
 
 
 # Get specific site engineer by ID
@@ -103,7 +100,7 @@ def get_sitesupervisor_id_route(site_supervisor_id):
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_sitesupervisor_id(site_supervisor_id)
+    return site_supervisor_controller.get_sitesupervisor_id(site_supervisor_id)
 
 # Update site engineer
 @pm_routes.route('/update_sitesupervisor/<int:site_supervisor_id>', methods=['PUT'])
@@ -113,7 +110,7 @@ def update_sitesupervisor_route(site_supervisor_id):
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return update_sitesupervisor(site_supervisor_id)
+    return site_supervisor_controller.update_sitesupervisor(site_supervisor_id)
 
 # Delete site engineer
 @pm_routes.route('/delete_sitesupervisor/<int:site_supervisor_id>', methods=['DELETE'])
@@ -123,7 +120,7 @@ def delete_sitesupervisor_route(site_supervisor_id):
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return delete_sitesupervisor(site_supervisor_id)
+    return site_supervisor_controller.delete_sitesupervisor(site_supervisor_id)
 
 # Assign site engineer to project
 @pm_routes.route('/ss_assign', methods=['POST'])
@@ -133,7 +130,7 @@ def assign_projects_sitesupervisor_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return assign_projects_sitesupervisor()
+    return site_supervisor_controller.assign_projects_sitesupervisor()
 
 
 # ============================================================================
@@ -148,7 +145,7 @@ def create_buyer_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return create_buyer()
+    return buyer_controller.create_buyer()
 
 # Get all buyers
 @pm_routes.route('/all_buyers', methods=['GET'])
@@ -158,7 +155,7 @@ def get_all_buyers_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_all_buyers()
+    return buyer_controller.get_all_buyers()
 
 # Get specific buyer by ID
 @pm_routes.route('/get_buyer/<int:user_id>', methods=['GET'])
@@ -168,7 +165,7 @@ def get_buyer_id_route(user_id):
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_buyer_id(user_id)
+    return buyer_controller.get_buyer_id(user_id)
 
 # Update buyer
 @pm_routes.route('/update_buyer/<int:user_id>', methods=['PUT'])
@@ -178,7 +175,7 @@ def update_buyer_route(user_id):
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return update_buyer(user_id)
+    return buyer_controller.update_buyer(user_id)
 
 # Delete buyer
 @pm_routes.route('/delete_buyer/<int:user_id>', methods=['DELETE'])
@@ -188,7 +185,7 @@ def delete_buyer_route(user_id):
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return delete_buyer(user_id)
+    return buyer_controller.delete_buyer(user_id)
 
 
 # ============================================================================
@@ -203,7 +200,7 @@ def assign_items_to_se_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return assign_items_to_se()
+    return projectmanager_controller.assign_items_to_se()
 
 # Get item assignments for a BOQ
 @pm_routes.route('/boq/<int:boq_id>/item-assignments', methods=['GET'])
@@ -213,7 +210,7 @@ def get_item_assignments_route(boq_id):
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_item_assignments(boq_id)
+    return projectmanager_controller.get_item_assignments(boq_id)
 
 # Unassign items from Site Engineer
 @pm_routes.route('/boq/unassign-items', methods=['POST'])
@@ -223,7 +220,7 @@ def unassign_items_from_se_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return unassign_items_from_se()
+    return projectmanager_controller.unassign_items_from_se()
 
 # Get available Site Engineers for assignment
 @pm_routes.route('/available-site-engineers', methods=['GET'])
@@ -233,7 +230,7 @@ def get_available_site_engineers_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_available_site_engineers()
+    return projectmanager_controller.get_available_site_engineers()
 
 
 # ============================================================================
@@ -248,7 +245,7 @@ def confirm_se_completion_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return confirm_se_completion()
+    return projectmanager_controller.confirm_se_completion()
 
 # Get project completion details
 @pm_routes.route('/projects/<int:project_id>/completion-details', methods=['GET'])
@@ -258,7 +255,7 @@ def get_project_completion_details_route(project_id):
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_project_completion_details(project_id) 
+    return projectmanager_controller.get_project_completion_details(project_id) 
 
 @pm_routes.route('/pm_approval_boq', methods=['GET'])
 @jwt_required
@@ -267,7 +264,7 @@ def get_pm_approval_boq_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_pm_approval_boq()
+    return projectmanager_controller.get_pm_approval_boq()
 
 
 @pm_routes.route('/pm_assign_project', methods=['GET'])
@@ -277,7 +274,7 @@ def get_pm_assign_project_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_pm_assign_project()
+    return projectmanager_controller.get_pm_assign_project()
 
 @pm_routes.route('/pm_approve_boq', methods=['GET'])
 @jwt_required
@@ -286,7 +283,7 @@ def get_pm_approved_boq_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_pm_approved_boq()
+    return projectmanager_controller.get_pm_approved_boq()
 
 @pm_routes.route('/pm_production_management', methods=['GET'])
 @jwt_required
@@ -295,7 +292,7 @@ def get_pm_production_management_boqs_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_pm_production_management_boqs()
+    return projectmanager_controller.get_pm_production_management_boqs()
 
 @pm_routes.route('/pm_pending_boq', methods=['GET'])
 @jwt_required
@@ -304,7 +301,7 @@ def get_pm_pending_boq_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_pm_pending_boq()
+    return projectmanager_controller.get_pm_pending_boq()
 
 @pm_routes.route('/pm_rejected_boq', methods=['GET'])
 @jwt_required
@@ -313,7 +310,7 @@ def get_pm_rejected_boq_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_pm_rejected_boq()
+    return projectmanager_controller.get_pm_rejected_boq()
 
 @pm_routes.route('/pm_completed_project', methods=['GET'])
 @jwt_required
@@ -322,4 +319,4 @@ def get_pm_completed_project_route():
     access_check = check_pm_or_mep_or_admin_access()
     if access_check:
         return access_check
-    return get_pm_completed_project()
+    return projectmanager_controller.get_pm_completed_project()
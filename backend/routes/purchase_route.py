@@ -1,6 +1,9 @@
 from flask import Blueprint, g, jsonify
 from utils.authentication import jwt_required
-from controllers.purchase_controller import *
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+purchase_controller = LazyModule('controllers.purchase_controller')
 
 purchase_routes = Blueprint('purchase_routes', __name__, url_prefix='/api')
 
@@ -54,7 +57,7 @@ def add_new_purchase_route():
     access_check = check_pm_or_admin_access()
     if access_check:
         return access_check
-    return add_new_purchase()
+    return purchase_controller.add_new_purchase()
 
 # Send New Purchase Notification to Estimator
 @purchase_routes.route('/new_purchase/estimator/<int:boq_id>', methods=['POST'])
@@ -64,7 +67,7 @@ def send_new_purchase_to_estimator(boq_id):
     access_check = check_pm_or_admin_access()
     if access_check:
         return access_check
-    return new_purchase_send_estimator(boq_id)
+    return purchase_controller.new_purchase_send_estimator(boq_id)
 
 # Estimator Approves or Rejects New Purchase (Single API)
 @purchase_routes.route('/new_purchase/decision/<int:boq_id>', methods=['POST'])
@@ -74,4 +77,4 @@ def process_purchase_decision(boq_id):
     access_check = check_estimator_or_admin_access()
     if access_check:
         return access_check
-    return process_new_purchase_decision(boq_id)
\ No newline at end of file
+    return purchase_controller.process_new_purchase_decision(boq_id)
\ No newline at end of file
@@ -7,16 +7,12 @@ select materials from it when creating BOQs.
 """
 
 from flask import Blueprint
-from controllers.raw_materials_controller import (
-    get_all_raw_materials,
-    search_raw_materials,
-    create_raw_material,
-    update_raw_material,
-    delete_raw_material,
-    get_material_categories
-)
-from controllers.boq_controller import search_all_materials, get_all_item, get_all_master_materials, get_all_master_sub_items
-from controllers.auth_controller import jwt_required
+from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+boq_controller = LazyModule('controllers.boq_controller')
+raw_materials_controller = LazyModule('controllers.raw_materials_controller')
 
 # Create blueprint with URL prefix
 raw_materials_routes = Blueprint('raw_materials_routes', __name__, url_prefix='/api/raw-materials')
@@ -41,7 +37,7 @@ def get_materials_route():
     - page (optional): Page number for pagination (default: 1)
     - per_page (optional): Items per page (default: 50, max: 200)
     """
-    return get_all_raw_materials()
+    return raw_materials_controller.get_all_raw_materials()
 
 
 @raw_materials_routes.route('/search', methods=['GET'])
@@ -57,7 +53,7 @@ def search_materials_route():
     - active_only (optional): If true, return only active materials (default: true)
     - limit (optional): Maximum number of results (default: 20, max: 100)
     """
-    return search_raw_materials()
+    return raw_materials_controller.search_raw_materials()
 
 
 @raw_materials_routes.route('/categories', methods=['GET'])
@@ -69,7 +65,7 @@ def get_categories_route():
     Get all unique material categories in the catalog.
     Useful for filtering and dropdown lists.
     """
-    return get_material_categories()
+    return raw_materials_controller.get_material_categories()
 
 
 @raw_materials_routes.route('', methods=['POST'])
@@ -92,7 +88,7 @@ def create_material_route():
         "category": "Cement"
     }
     """
-    return create_raw_material()
+    return raw_materials_controller.create_raw_material()
 
 
 @raw_materials_routes.route('/<int:material_id>', methods=['PUT'])
@@ -111,7 +107,7 @@ def update_material_route(material_id):
         ...
     }
     """
-    return update_raw_material(material_id)
+    return raw_materials_controller.update_raw_material(material_id)
 
 
 @raw_materials_routes.route('/<int:material_id>', methods=['DELETE'])
@@ -124,7 +120,7 @@ def delete_material_route(material_id):
     Only accessible by Buyer and Admin roles.
     Sets is_active to False instead of actually deleting the record.
     """
-    return delete_raw_material(material_id)
+    return raw_materials_controller.delete_raw_material(material_id)
 
 
 @raw_materials_routes.route('/master-search', methods=['GET'])
@@ -140,7 +136,7 @@ def master_materials_search_route():
     - q (required): Search query
     - limit (optional): Maximum results (default: 20, max: 50)
     """
-    return search_all_materials()
+    return boq_controller.search_all_materials()
 
 
 @raw_materials_routes.route('/master-items', methods=['GET'])
@@ -152,7 +148,7 @@ def master_items_search_route():
     Get all master items (from existing BOQs) for duplicate-check in buyer's catalog.
     Accessible to Buyer role (bypasses check_boq_access).
     """
-    return get_all_item()
+    return boq_controller.get_all_item()
 
 
 @raw_materials_routes.route('/master-sub-items', methods=['GET'])
@@ -164,7 +160,7 @@ def master_sub_items_search_route():
     Get all master sub-items with details (from existing BOQs) for duplicate-check in buyer's catalog.
     Accessible to Buyer role (bypasses check_boq_access).
     """
-    return get_all_master_sub_items()
+    return boq_controller.get_all_master_sub_items()
 
 
 @raw_materials_routes.route('/master-materials', methods=['GET'])
@@ -176,4 +172,4 @@ def master_materials_all_route():
     Get all master materials (from existing BOQs) for duplicate-check in buyer's catalog.
     Accessible to Buyer role (bypasses check_boq_access).
     """
-    return get_all_master_materials()
+    return boq_controller.get_all_master_materials()
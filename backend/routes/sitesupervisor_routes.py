@@ -1,6 +1,9 @@
 from flask import Blueprint, g, jsonify
-from controllers.site_supervisor_controller import *
 from utils.authentication import *
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+site_supervisor_controller = LazyModule('controllers.site_supervisor_controller')
 
 sitesupervisor_routes = Blueprint("sitesupervisor_routes", __name__, url_prefix='/api')
 
@@ -22,7 +25,7 @@ def validate_completion_request_route(project_id):
     access_check = check_ss_or_admin_access()
     if access_check:
         return access_check
-    return validate_completion_request(project_id)
+    return site_supervisor_controller.validate_completion_request(project_id)
 
 #Site Engineer requests project completion
 @sitesupervisor_routes.route('/request_completion/<int:project_id>', methods=['POST'])
@@ -32,7 +35,7 @@ def request_project_completion_route(project_id):
     access_check = check_ss_or_admin_access()
     if access_check:
         return access_check
-    return request_project_completion(project_id)
+    return site_supervisor_controller.request_project_completion(project_id)
 
 # Site Engineer gets available buyers
 @sitesupervisor_routes.route('/available-buyers', methods=['GET'])
@@ -42,7 +45,7 @@ def get_available_buyers_route():
     access_check = check_ss_or_admin_access()
     if access_check:
         return access_check
-    return get_available_buyers()
+    return site_supervisor_controller.get_available_buyers()
 
 # Site Engineer assigns BOQ to buyer
 @sitesupervisor_routes.route('/boq/<int:boq_id>/assign-buyer', methods=['POST'])
@@ -52,7 +55,7 @@ def assign_boq_to_buyer_route(boq_id):
     access_check = check_ss_or_admin_access()
     if access_check:
         return access_check
-    return assign_boq_to_buyer(boq_id)
+    return site_supervisor_controller.assign_boq_to_buyer(boq_id)
 
 # Site Engineer gets items assigned to them
 @sitesupervisor_routes.route('/my-assigned-items', methods=['GET'])
@@ -62,7 +65,7 @@ def get_my_assigned_items_route():
     access_check = check_ss_or_admin_access()
     if access_check:
         return access_check
-    return get_my_assigned_items()
+    return site_supervisor_controller.get_my_assigned_items()
 
 # Site Engineer gets ongoing projects (status != completed)
 @sitesupervisor_routes.route('/se_ongoing_projects', methods=['GET'])
@@ -72,7 +75,7 @@ def get_se_ongoing_projects_route():
     access_check = check_ss_or_admin_access()
     if access_check:
         return access_check
-    return get_se_ongoing_projects()
+    return site_supervisor_controller.get_se_ongoing_projects()
 
 # Site Engineer gets completed projects (status = completed)
 @sitesupervisor_routes.route('/se_completed_projects', methods=['GET'])
@@ -82,7 +85,7 @@ def get_se_completed_projects_route():
     access_check = check_ss_or_admin_access()
     if access_check:
         return access_check
-    return get_se_completed_projects()
+    return site_supervisor_controller.get_se_completed_projects()
 
 #Role base view a site supervisor boq
 @sitesupervisor_routes.route('/sitesupervisor_boq', methods=['GET'])
@@ -92,7 +95,7 @@ def get_all_sitesupervisor_boqs_route():
     access_check = check_ss_or_admin_access()
     if access_check:
         return access_check
-    return get_all_sitesupervisor_boqs()
+    return site_supervisor_controller.get_all_sitesupervisor_boqs()
 
 
 # ============================================
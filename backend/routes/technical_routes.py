@@ -1,8 +1,11 @@
 from flask import Blueprint, g, jsonify
-from controllers.projectmanager_controller import *
 from utils.authentication import jwt_required
-from controllers.techical_director_controller import *
 from utils.response_cache import cached_response, cache_dashboard_data
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+projectmanager_controller = LazyModule('controllers.projectmanager_controller')
+techical_director_controller = LazyModule('controllers.techical_director_controller')
 
 technical_routes = Blueprint('technical_routes', __name__, url_prefix='/api')
 
@@ -31,7 +34,7 @@ def td_mail_send_route():
     access_check = check_estimator_td_or_admin_access()
     if access_check:
         return access_check
-    return td_mail_send()
+    return techical_director_controller.td_mail_send()
 
 @technical_routes.route('/craete_pm', methods=['POST'])
 @jwt_required
@@ -40,7 +43,7 @@ def create_pm_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return create_pm()
+    return projectmanager_controller.create_pm()
 
 #All project manager listout assign and unassign project
 @technical_routes.route('/all_pm', methods=['GET'])
@@ -51,7 +54,7 @@ def get_all_pm_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_all_pm()
+    return projectmanager_controller.get_all_pm()
 
 #Particular Project manager view
 @technical_routes.route('/get_pm/<int:user_id>', methods=['GET'])
@@ -61,7 +64,7 @@ def get_pm_id_route(user_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_pm_id(user_id)
+    return projectmanager_controller.get_pm_id(user_id)
 
 #Edit project manager
 @technical_routes.route('/update_pm/<int:user_id>', methods=['PUT'])
@@ -71,7 +74,7 @@ def update_pm_route(user_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return update_pm(user_id)
+    return projectmanager_controller.update_pm(user_id)
 
 #Delete Project manager
 @technical_routes.route('/delete_pm/<int:user_id>', methods=['DELETE'])
@@ -81,7 +84,7 @@ def delete_pm_route(user_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return delete_pm(user_id)
+    return projectmanager_controller.delete_pm(user_id)
 
 #Assign project manager
 @technical_routes.route('/assign_projects', methods=['POST'])
@@ -91,7 +94,7 @@ def assign_projects_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return assign_projects()
+    return projectmanager_controller.assign_projects()
 
 # Get all MEP Supervisors (for TD to assign to projects)
 @technical_routes.route('/all_meps', methods=['GET'])
@@ -181,7 +184,7 @@ def get_td_se_boq_vendor_requests_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_se_boq_vendor_requests()
+    return techical_director_controller.get_td_se_boq_vendor_requests()
 
 # Dashboard Statistics
 @technical_routes.route('/td-dashboard-stats', methods=['GET'])
@@ -192,7 +195,7 @@ def get_td_dashboard_stats_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_dashboard_stats()
+    return techical_director_controller.get_td_dashboard_stats()
 
 # TD Purchase Orders - View-only access to purchase orders
 @technical_routes.route('/td-purchase-orders', methods=['GET'])
@@ -203,7 +206,7 @@ def get_td_purchase_orders_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_purchase_orders()
+    return techical_director_controller.get_td_purchase_orders()
 
 @technical_routes.route('/td-purchase-order/<int:cr_id>', methods=['GET'])
 @jwt_required
@@ -212,7 +215,7 @@ def get_td_purchase_order_by_id_route(cr_id):
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_purchase_order_by_id(cr_id) 
+    return techical_director_controller.get_td_purchase_order_by_id(cr_id) 
 
 @technical_routes.route('/td_pending_boq', methods=['GET'])
 @jwt_required
@@ -222,7 +225,7 @@ def get_td_pending_boq_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_pending_boq()
+    return techical_director_controller.get_td_pending_boq()
 
 @technical_routes.route('/td_client_boq', methods=['GET'])
 @jwt_required
@@ -231,7 +234,7 @@ def get_client_boq_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_client_boq()
+    return techical_director_controller.get_client_boq()
 
 @technical_routes.route('/td_assign_boq', methods=['GET'])
 @jwt_required
@@ -240,7 +243,7 @@ def get_td_assign_boq_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_assign_boq()
+    return techical_director_controller.get_td_assign_boq()
 
 @technical_routes.route('/td_approved_boq', methods=['GET'])
 @jwt_required
@@ -249,7 +252,7 @@ def td_approved_boq_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return td_approved_boq()
+    return techical_director_controller.td_approved_boq()
 
 @technical_routes.route('/td_revisions_boq', methods=['GET'])
 @jwt_required
@@ -259,7 +262,7 @@ def get_td_revisions_boq_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_revisions_boq()
+    return techical_director_controller.get_td_revisions_boq()
 
 @technical_routes.route('/td_completed_boq', methods=['GET'])
 @jwt_required
@@ -268,7 +271,7 @@ def get_td_completed_boq_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_completed_boq()
+    return techical_director_controller.get_td_completed_boq()
 
 @technical_routes.route('/td_rejected_boq', methods=['GET'])
 @jwt_required
@@ -277,7 +280,7 @@ def get_td_rejected_boq_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_rejected_boq()
+    return techical_director_controller.get_td_rejected_boq()
 
 @technical_routes.route('/td_cancelled_boq', methods=['GET'])
 @jwt_required
@@ -286,7 +289,7 @@ def get_td_cancelled_boq_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_cancelled_boq()
+    return techical_director_controller.get_td_cancelled_boq()
 
 @technical_routes.route('/td_tab_counts', methods=['GET'])
 @jwt_required
@@ -296,7 +299,7 @@ def get_td_tab_counts_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_tab_counts()
+    return techical_director_controller.get_td_tab_counts()
 
 @technical_routes.route('/td_production_management', methods=['GET'])
 @jwt_required
@@ -305,4 +308,4 @@ def get_td_production_management_boqs_route():
     access_check = check_td_or_admin_access()
     if access_check:
         return access_check
-    return get_td_production_management_boqs()
\ No newline at end of file
+    return techical_director_controller.get_td_production_management_boqs()
\ No newline at end of file
@@ -1,21 +1,24 @@
 """
 Terms & Conditions Routes - API endpoints for managing BOQ Terms & Conditions templates
 """
-from controllers.terms_conditions_controller import *
 from flask import Blueprint
 from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+terms_conditions_controller = LazyModule('controllers.terms_conditions_controller')
 
 terms_conditions_routes = Blueprint('terms', __name__, url_prefix='/api')
 
 @terms_conditions_routes.route('/terms', methods=['GET'])
 @jwt_required
 def get_all_terms_route():
-    return get_all_terms()
+    return terms_conditions_controller.get_all_terms()
 
 @terms_conditions_routes.route('/terms/default', methods=['GET'])
 @jwt_required
 def get_default_terms_route():
-    return get_default_terms()
+    return terms_conditions_controller.get_default_terms()
 
 @terms_conditions_routes.route('/terms/<int:term_id>', methods=['GET'])
 @jwt_required
@@ -25,53 +28,53 @@ def get_term_by_id_route(term_id):
 @terms_conditions_routes.route('/terms', methods=['POST'])
 @jwt_required
 def create_term_route():
-    return create_term()
+    return terms_conditions_controller.create_term()
 
 @terms_conditions_routes.route('/terms/<int:term_id>', methods=['PUT'])
 @jwt_required
 def update_term_route(term_id):
-    return update_term(term_id)
+    return terms_conditions_controller.update_term(term_id)
 
 @terms_conditions_routes.route('/terms/<int:term_id>', methods=['DELETE'])
 @jwt_required
 def delete_term_route(term_id):
-    return delete_term(term_id)
+    return terms_conditions_controller.delete_term(term_id)
 
 # ===== BOQ-SPECIFIC TERMS ENDPOINTS _route(Similar to Preliminaries) =====
 
 @terms_conditions_routes.route('/boq/<int:boq_id>/terms', methods=['GET'])
 @jwt_required
 def get_boq_terms_route(boq_id):
-    return get_boq_terms(boq_id)
+    return terms_conditions_controller.get_boq_terms(boq_id)
 
 @terms_conditions_routes.route('/boq/<int:boq_id>/terms', methods=['POST'])
 @jwt_required
 def save_boq_terms_route(boq_id):
-    return save_boq_terms(boq_id)
+    return terms_conditions_controller.save_boq_terms(boq_id)
 
 @terms_conditions_routes.route('/boq/<int:boq_id>/terms/selected', methods=['GET'])
 @jwt_required
 def get_boq_selected_terms_route(boq_id):
-    return get_boq_selected_terms(boq_id)
+    return terms_conditions_controller.get_boq_selected_terms(boq_id)
 
 @terms_conditions_routes.route('/terms-master', methods=['GET'])
 @jwt_required
 def get_all_terms_master_route():
-    return get_all_terms_master()
+    return terms_conditions_controller.get_all_terms_master()
 
 
 @terms_conditions_routes.route('/terms-master', methods=['POST'])
 @jwt_required
 def create_term_master_route():
-    return create_term_master()
+    return terms_conditions_controller.create_term_master()
 
 @terms_conditions_routes.route('/terms-master/<int:term_id>', methods=['PUT'])
 @jwt_required
 def update_term_master_route(term_id):
-    return update_term_master(term_id)
+    return terms_conditions_controller.update_term_master(term_id)
 
 
 @terms_conditions_routes.route('/terms-master/<int:term_id>', methods=['DELETE'])
 @jwt_required
 def delete_term_master_route(term_id):
-    return delete_term_master(term_id)
\ No newline at end of file
+    return terms_conditions_controller.delete_term_master(term_id)
\ No newline at end of file
@@ -1,5 +1,8 @@
 from flask import Blueprint, g, jsonify, current_app
-from controllers.upload_image_controller import *
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+upload_image_controller = LazyModule('controllers.upload_image_controller')
 
 image_routes = Blueprint('image_routes', __name__, url_prefix='/api')
 
@@ -22,16 +25,16 @@ def rate_limit(limit_string):
 @image_routes.route('/upload_image/<int:id>', methods=['POST'])
 @rate_limit("50 per hour")  # Image upload with compression is resource-intensive
 def item_upload_image_route(id):
-    return item_upload_image(id)
+    return upload_image_controller.item_upload_image(id)
 
 @image_routes.route('/images/<int:id>', methods=['GET'])
 def get_item_images_route(id):
-    return get_item_images(id)
+    return upload_image_controller.get_item_images(id)
 
 @image_routes.route('/images/<int:id>', methods=['DELETE'])
 def delete_item_images_route(id):
-    return delete_item_images(id)
+    return upload_image_controller.delete_item_images(id)
 
 @image_routes.route('/images/all/<int:id>', methods=['DELETE'])
 def delete_all_item_images_route(id):
-    return delete_all_item_images(id)
\ No newline at end of file
+    return upload_image_controller.delete_all_item_images(id)
\ No newline at end of file
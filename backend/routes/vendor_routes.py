@@ -1,20 +1,9 @@
 from flask import Blueprint, g, jsonify
-from controllers.vendor_controller import (
-    create_vendor,
-    get_all_vendors,
-    get_all_vendors_with_products,
-    get_vendor_by_id,
-    update_vendor,
-    delete_vendor,
-    add_vendor_product,
-    get_vendor_products,
-    update_vendor_product,
-    delete_vendor_product,
-    get_vendor_categories,
-    create_vendor_category,
-    get_vendors_matching_materials
-)
-from controllers.auth_controller import jwt_required
+from utils.authentication import jwt_required
+from utils.lazy_module import LazyModule
+
+# Controllers are imported on the first request that reaches them
+vendor_controller = LazyModule('controllers.vendor_controller')
 
 # Create blueprint with URL prefix
 vendor_routes = Blueprint('vendor_routes', __name__, url_prefix='/api/vendor')
@@ -41,7 +30,7 @@ def create_vendor_route():
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return create_vendor()
+    return vendor_controller.create_vendor()
 
 
 @vendor_routes.route('/all', methods=['GET'])
@@ -51,7 +40,7 @@ def get_all_vendors_route():
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return get_all_vendors()
+    return vendor_controller.get_all_vendors()
 
 
 @vendor_routes.route('/all-with-products', methods=['GET'])
@@ -61,7 +50,7 @@ def get_all_vendors_with_products_route():
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return get_all_vendors_with_products()
+    return vendor_controller.get_all_vendors_with_products()
 
 
 @vendor_routes.route('/<int:vendor_id>', methods=['GET'])
@@ -71,7 +60,7 @@ def get_vendor_by_id_route(vendor_id):
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return get_vendor_by_id(vendor_id)
+    return vendor_controller.get_vendor_by_id(vendor_id)
 
 
 @vendor_routes.route('/<int:vendor_id>', methods=['PUT'])
@@ -81,7 +70,7 @@ def update_vendor_route(vendor_id):
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return update_vendor(vendor_id)
+    return vendor_controller.update_vendor(vendor_id)
 
 
 @vendor_routes.route('/<int:vendor_id>', methods=['DELETE'])
@@ -91,7 +80,7 @@ def delete_vendor_route(vendor_id):
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return delete_vendor(vendor_id)
+    return vendor_controller.delete_vendor(vendor_id)
 
 
 # Vendor products routes
@@ -102,7 +91,7 @@ def add_vendor_product_route(vendor_id):
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return add_vendor_product(vendor_id)
+    return vendor_controller.add_vendor_product(vendor_id)
 
 
 @vendor_routes.route('/<int:vendor_id>/products', methods=['GET'])
@@ -112,7 +101,7 @@ def get_vendor_products_route(vendor_id):
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return get_vendor_products(vendor_id)
+    return vendor_controller.get_vendor_products(vendor_id)
 
 
 @vendor_routes.route('/<int:vendor_id>/products/<int:product_id>', methods=['PUT'])
@@ -122,7 +111,7 @@ def update_vendor_product_route(vendor_id, product_id):
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return update_vendor_product(vendor_id, product_id)
+    return vendor_controller.update_vendor_product(vendor_id, product_id)
 
 
 @vendor_routes.route('/<int:vendor_id>/products/<int:product_id>', methods=['DELETE'])
@@ -132,7 +121,7 @@ def delete_vendor_product_route(vendor_id, product_id):
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return delete_vendor_product(vendor_id, product_id)
+    return vendor_controller.delete_vendor_product(vendor_id, product_id)
 
 
 # Utility routes
@@ -143,7 +132,7 @@ def get_vendor_categories_route():
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return get_vendor_categories()
+    return vendor_controller.get_vendor_categories()
 
 
 @vendor_routes.route('/categories', methods=['POST'])
@@ -153,7 +142,7 @@ def create_vendor_category_route():
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return create_vendor_category()
+    return vendor_controller.create_vendor_category()
 
 @vendor_routes.route('/matching-vendors', methods=['POST'])
 @jwt_required
@@ -162,7 +151,7 @@ def get_matching_vendors_route():
     access_check = check_vendor_access()
     if access_check:
         return access_check
-    return get_vendors_matching_materials()
+    return vendor_controller.get_vendors_matching_materials()
 
 
 # DEBUG endpoint - temporary
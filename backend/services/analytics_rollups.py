@@ -0,0 +1,285 @@
+"""
+Analytics Rollups - daily pre-aggregates for the admin dashboard
+
+Period metrics on the admin dashboard (new users/projects/BOQs/CRs/vendors,
+creation and login trends, inventory transactions, delivery notes and
+material requests in the last N days) are answered from
+analytics_daily_rollups (models/analytics_rollup.py) instead of scanning the
+source tables on every call.
+
+Each metric is one source table grouped by the day of its timestamp column
+(and optionally a dimension such as status). A period read combines:
+- rollup rows for closed days up to the metric's rolled_up_through day
+- one live grouped query for the days rollups can't answer: the partial
+  first day of the window, days after rolled_up_through (today), and days
+  marked dirty since they were rolled up
+so the result equals the live computation at all times
+(tests/test_analytics_rollups.py checks this around period edges).
+
+Dirty days are recorded by an after_flush listener
+(register_analytics_rollup_tracking) when an ORM write touches a row of a
+past day, e.g. a soft-deleted user or a delivery note changing status.
+refresh_analytics_rollups() rolls up new closed days and recomputes dirty
+ones; schedule it hourly:
+  cd backend && python migrations/create_analytics_rollup_tables.py --refresh
+"""
+
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from config.db import db
+from config.logging import get_logger
+from models.analytics_rollup import AnalyticsRollupDirtyDay
+
+log = get_logger()
+
+# Closed days re-aggregated on every refresh, to pick up writes that bypass the ORM
+ROLLUP_RECOMPUTE_DAYS = int(os.getenv('ANALYTICS_ROLLUP_RECOMPUTE_DAYS', '2'))
+
+
+@dataclass(frozen=True)
+class RollupMetric:
+    """One daily aggregate: COUNT(*) and SUM(amount) per day (and dimension) of table"""
+    table: str
+    date_column: str
+    where: str = 'TRUE'
+    dimension: str = None
+    amount: str = None
+
+
+ROLLUP_METRICS = {
+    'users_created': RollupMetric('users', 'created_at', 'is_deleted = FALSE'),
+    'projects_created': RollupMetric('project', 'created_at', 'is_deleted = FALSE'),
+    'boqs_created': RollupMetric('boq', 'created_at', 'is_deleted = FALSE'),
+    'change_requests_created': RollupMetric('change_requests', 'created_at', 'is_deleted = FALSE'),
+    'vendors_created': RollupMetric('vendors', 'created_at', 'is_deleted = FALSE'),
+    'inventory_transactions': RollupMetric(
+        'inventory_transactions', 'created_at', dimension='transaction_type', amount='total_amount'
+    ),
+    'delivery_notes': RollupMetric('material_delivery_notes', 'created_at', dimension='status'),
+    'material_requests': RollupMetric('internal_inventory_material_requests', 'created_at', dimension='status'),
+    'logins': RollupMetric('login_history', 'login_at', dimension='login_method'),
+}
+
+_METRICS_BY_TABLE = defaultdict(list)
+for _name, _metric in ROLLUP_METRICS.items():
+    _METRICS_BY_TABLE[_metric.table].append(_name)
+
+
+def _aggregate_select(name, metric, day_filter):
+    """SELECT day, metric, dimension, count, amount for metric rows matching day_filter."""
+    dimension = f"COALESCE(CAST({metric.dimension} AS VARCHAR), '')" if metric.dimension else "''"
+    amount = f"COALESCE(SUM({metric.amount}), 0)" if metric.amount else "0"
+    return f"""
+        SELECT DATE({metric.date_column}) AS day, '{name}' AS metric, {dimension} AS dimension,
+               COUNT(*) AS count, {amount} AS amount
+        FROM {metric.table}
+        WHERE {metric.where} AND {metric.date_column} IS NOT NULL AND ({day_filter})
+        GROUP BY 1, 3
+    """
+
+
+# ============================================
+# Dirty-day tracking
+# ============================================
+
+def _days_touched(obj, column):
+    values = [getattr(obj, column, None)]
+    values += list(db.inspect(obj).attrs[column].history.deleted or ())
+    return {v.date() for v in values if isinstance(v, datetime)}
+
+
+def _track_rollup_days_after_flush(session, flush_context):
+    today = datetime.utcnow().date()
+    dirty = set()
+    changed = list(session.new) + list(session.deleted) + [
+        obj for obj in session.dirty if session.is_modified(obj, include_collections=False)
+    ]
+    for obj in changed:
+        for name in _METRICS_BY_TABLE.get(getattr(obj, '__tablename__', None), ()):
+            for day in _days_touched(obj, ROLLUP_METRICS[name].date_column):
+                if day < today:  # Today is always computed live
+                    dirty.add((name, day))
+    if dirty:
+        session.connection().execute(
+            pg_insert(AnalyticsRollupDirtyDay.__table__)
+            .values([{'metric': name, 'day': day} for name, day in sorted(dirty)])
+            .on_conflict_do_nothing()
+        )
+
+
+def register_analytics_rollup_tracking():
+    """Install the after_flush listener that marks changed past days for re-aggregation."""
+    if not event.contains(Session, "after_flush", _track_rollup_days_after_flush):
+        event.listen(Session, "after_flush", _track_rollup_days_after_flush)
+
+
+# ============================================
+# Incremental refresh job
+# ============================================
+
+def refresh_analytics_rollups(metrics=None):
+    """
+    Roll up closed days not yet aggregated (all history on the first run),
+    re-aggregate the last ROLLUP_RECOMPUTE_DAYS closed days and every dirty
+    day. One transaction per metric.
+
+    Returns {metric: number of days (re)aggregated}.
+    """
+    today = datetime.utcnow().date()
+    yesterday = today - timedelta(days=1)
+    refreshed = {}
+
+    for name in metrics or ROLLUP_METRICS:
+        metric = ROLLUP_METRICS[name]
+        try:
+            through = db.session.execute(
+                text("SELECT rolled_up_through FROM analytics_rollup_state WHERE metric = :metric FOR UPDATE"),
+                {'metric': name}
+            ).scalar()
+            if through is None:
+                start = db.session.execute(
+                    text(f"SELECT MIN(DATE({metric.date_column})) FROM {metric.table}")
+                ).scalar() or yesterday
+            else:
+                start = min(through + timedelta(days=1), yesterday - timedelta(days=ROLLUP_RECOMPUTE_DAYS - 1))
+
+            days = set()
+            day = start
+            while day <= yesterday:
+                days.add(day)
+                day += timedelta(days=1)
+            # Claim dirty marks; a write landing after this re-marks the day for the next run
+            days.update(row.day for row in db.session.execute(
+                text("DELETE FROM analytics_rollup_dirty_days WHERE metric = :metric AND day < :today RETURNING day"),
+                {'metric': name, 'today': today}
+            ))
+
+            if days:
+                day_list = sorted(days)
+                db.session.execute(
+                    text("DELETE FROM analytics_daily_rollups WHERE metric = :metric AND day = ANY(:days)"),
+                    {'metric': name, 'days': day_list}
+                )
+                day_filter = (
+                    f"{metric.date_column} >= :first_day AND {metric.date_column} < :end_day "
+                    f"AND DATE({metric.date_column}) = ANY(:days)"
+                )
+                db.session.execute(text(f"""
+                    INSERT INTO analytics_daily_rollups (day, metric, dimension, count, amount)
+                    {_aggregate_select(name, metric, day_filter)}
+                """), {
+                    'first_day': day_list[0],
+                    'end_day': day_list[-1] + timedelta(days=1),
+                    'days': day_list,
+                })
+
+            db.session.execute(text("""
+                INSERT INTO analytics_rollup_state (metric, rolled_up_through, refreshed_at)
+                VALUES (:metric, :through, :now)
+                ON CONFLICT (metric) DO UPDATE
+                    SET rolled_up_through = GREATEST(analytics_rollup_state.rolled_up_through, EXCLUDED.rolled_up_through),
+                        refreshed_at = EXCLUDED.refreshed_at
+            """), {'metric': name, 'through': yesterday, 'now': datetime.utcnow()})
+            db.session.commit()
+            refreshed[name] = len(days)
+
+        except Exception as e:
+            db.session.rollback()
+            log.error(f"[AnalyticsRollups] Refresh failed for {name}: {e}")
+            raise
+    return refreshed
+
+
+# ============================================
+# Period reads
+# ============================================
+
+class PeriodAggregates:
+    """Per-metric {(day, dimension): [count, amount]} for one period."""
+
+    def __init__(self, cells):
+        self._cells = cells
+
+    def total(self, name):
+        return sum(count for count, _ in self._cells[name].values())
+
+    def trend(self, name):
+        """[(day, count)] ordered by day."""
+        per_day = defaultdict(int)
+        for (day, _), (count, _) in self._cells[name].items():
+            per_day[day] += count
+        return sorted(per_day.items())
+
+    def breakdown(self, name):
+        """[(dimension, count, amount)]; dimension is None for NULL source values."""
+        per_dimension = defaultdict(lambda: [0, 0.0])
+        for (_, dimension), (count, amount) in self._cells[name].items():
+            per_dimension[dimension][0] += count
+            per_dimension[dimension][1] += amount
+        return [(dimension or None, count, amount) for dimension, (count, amount) in per_dimension.items()]
+
+
+def get_period_aggregates(cutoff, metrics=None):
+    """
+    Aggregates for rows with date_column >= cutoff, for each metric.
+    Uses two small reads (state + dirty days), one rollup read and one
+    live UNION ALL over the days rollups don't cover.
+    """
+    names = list(metrics or ROLLUP_METRICS)
+    first_day = cutoff.date()
+    head_end = datetime.combine(first_day + timedelta(days=1), datetime.min.time())
+
+    through = dict(db.session.execute(
+        text("SELECT metric, rolled_up_through FROM analytics_rollup_state WHERE metric = ANY(:metrics)"),
+        {'metrics': names}
+    ).all())
+    dirty = defaultdict(set)
+    for row in db.session.execute(
+        text("SELECT metric, day FROM analytics_rollup_dirty_days WHERE metric = ANY(:metrics) AND day > :first_day"),
+        {'metrics': names, 'first_day': first_day}
+    ):
+        dirty[row.metric].add(row.day)
+
+    cells = {name: defaultdict(lambda: [0, 0.0]) for name in names}
+
+    def add(row):
+        cell = cells[row.metric][(row.day, row.dimension)]
+        cell[0] += row.count
+        cell[1] += float(row.amount or 0)
+
+    # Closed, clean days from rollups
+    rolled_up = [name for name in names if through.get(name) and through[name] > first_day]
+    if rolled_up:
+        for row in db.session.execute(text("""
+            SELECT day, metric, dimension, count, amount
+            FROM analytics_daily_rollups
+            WHERE metric = ANY(:metrics) AND day > :first_day AND day <= :max_through
+        """), {'metrics': rolled_up, 'first_day': first_day, 'max_through': max(through[n] for n in rolled_up)}):
+            if row.day <= through[row.metric] and row.day not in dirty[row.metric]:
+                add(row)
+
+    # Everything else live: partial first day, days after rolled_up_through, dirty days
+    selects, params = [], {'cutoff': cutoff, 'head_end': head_end}
+    for i, name in enumerate(names):
+        metric = ROLLUP_METRICS[name]
+        column = metric.date_column
+        tail_start = through.get(name)
+        tail_start = datetime.combine(tail_start + timedelta(days=1), datetime.min.time()) if tail_start else cutoff
+        params[f'tail_{i}'] = tail_start
+        params[f'dirty_{i}'] = sorted(dirty[name])
+        selects.append(_aggregate_select(name, metric, (
+            f"{column} >= :cutoff AND ({column} < :head_end OR {column} >= :tail_{i} "
+            f"OR DATE({column}) = ANY(CAST(:dirty_{i} AS DATE[])))"
+        )))
+    for row in db.session.execute(text(" UNION ALL ".join(selects)), params):
+        add(row)
+
+    return PeriodAggregates(cells)
+
@@ -0,0 +1,304 @@
+"""
+Attendance Batch Engine - crew-level clock-in/out and arrival confirmation
+
+The single-worker endpoints (confirm_arrival, clock_in_worker, clock_out_worker)
+each do their own existence lookup, Worker.query.get and commit, so a Site
+Engineer recording a 60-person crew sent 60 requests and 60 transactions.
+
+The batch operations here take every worker of one project/date at once:
+- existing rows and workers are loaded with one query each and validated
+  set-wise against unique_worker_project_date (worker_id, project_id, attendance_date)
+- clock-in writes every row with one multi-row INSERT ... ON CONFLICT DO UPDATE
+  on that constraint; the conflict branch only fires for rows that are not yet
+  clocked in, so a concurrent clock-in is reported instead of overwritten. The
+  Core upsert bypasses the ORM after_flush listeners, so the project's PM
+  dashboards are invalidated explicitly in the same transaction
+- clock-out and arrival confirmation lock the day's rows (FOR UPDATE), apply
+  the same rules as the single-worker endpoints and flush in one transaction
+
+Every operation returns one outcome per requested worker:
+    {'worker_id': 12, 'status': 'clocked_in' | 'clocked_out' | 'confirmed' | 'skipped' | 'error',
+     'error': <reason when skipped/error>, 'attendance_id' / 'arrival_ids': ...}
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import joinedload
+
+from config.db import db
+from config.logging import get_logger
+from models.worker import Worker
+from models.labour_arrival import LabourArrival
+from models.daily_attendance import DailyAttendance
+from services.pm_dashboard_read_model import invalidate_pm_dashboards
+
+log = get_logger()
+
+MAX_BATCH_WORKERS = 500
+HHMM_PATTERN = re.compile(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$')
+
+
+# ---------------------------------------------------------------------------
+# Request parsing
+# ---------------------------------------------------------------------------
+
+def parse_clock_time(value: Optional[str], target_date) -> datetime:
+    """
+    ISO datetime or HH:MM on target_date (same formats as the single-worker
+    endpoints); now when empty. Raises ValueError for anything else, including
+    non-string values, so callers reject just that entry.
+    """
+    if not value:
+        return datetime.now()
+    if not isinstance(value, str):
+        raise ValueError(f"Expected a time string, got {type(value).__name__}")
+    if 'T' in value:
+        return datetime.fromisoformat(value)
+    return datetime.combine(target_date, datetime.strptime(value, '%H:%M').time())
+
+
+def normalize_batch_entries(data: Dict, defaults: Tuple[str, ...]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Split the request's workers into entries to process and early outcomes.
+
+    Accepts `workers` as worker ids or {worker_id, ...} objects (or `worker_ids`);
+    per-worker fields fall back to the request-level value for each key in defaults.
+    Returns (entries, outcomes) where outcomes hold invalid and duplicate workers.
+    """
+    raw = data.get('workers')
+    if raw is None:
+        raw = data.get('worker_ids') or []
+    if not isinstance(raw, list):
+        raise ValueError("workers must be a list")
+    if len(raw) > MAX_BATCH_WORKERS:
+        raise ValueError(f"At most {MAX_BATCH_WORKERS} workers per request")
+
+    entries, outcomes, seen = [], [], set()
+    for item in raw:
+        entry = dict(item) if isinstance(item, dict) else {'worker_id': item}
+        try:
+            worker_id = int(entry.get('worker_id'))
+        except (TypeError, ValueError):
+            outcomes.append({'worker_id': entry.get('worker_id'), 'status': 'error', 'error': 'Invalid worker_id'})
+            continue
+        if worker_id in seen:
+            outcomes.append({'worker_id': worker_id, 'status': 'skipped', 'error': 'Duplicate worker in request'})
+            continue
+        seen.add(worker_id)
+        entry['worker_id'] = worker_id
+        for key in defaults:
+            if entry.get(key) in (None, ''):
+                entry[key] = data.get(key)
+        entries.append(entry)
+    return entries, outcomes
+
+
+# ---------------------------------------------------------------------------
+# Clock-in
+# ---------------------------------------------------------------------------
+
+def bulk_clock_in(project_id: int, target_date, entries: List[Dict], current_user: Dict) -> List[Dict]:
+    """Clock in every entry with one multi-row upsert on unique_worker_project_date."""
+    outcomes = {}
+    worker_ids = [entry['worker_id'] for entry in entries]
+    if not worker_ids:
+        return []
+
+    existing = {
+        row.worker_id: row
+        for row in db.session.query(
+            DailyAttendance.worker_id, DailyAttendance.hourly_rate,
+            DailyAttendance.clock_in_time, DailyAttendance.is_deleted
+        ).filter(
+            DailyAttendance.project_id == project_id,
+            DailyAttendance.attendance_date == target_date,
+            DailyAttendance.worker_id.in_(worker_ids)
+        )
+    }
+    missing_ids = [worker_id for worker_id in worker_ids if worker_id not in existing]
+    hourly_rates = dict(
+        db.session.query(Worker.worker_id, Worker.hourly_rate).filter(Worker.worker_id.in_(missing_ids))
+    ) if missing_ids else {}
+
+    now = datetime.utcnow()
+    user_name = current_user.get('full_name', 'System')
+    rows = []
+    for entry in entries:
+        worker_id = entry['worker_id']
+        row = existing.get(worker_id)
+        if row is not None and row.is_deleted:
+            outcomes[worker_id] = {'status': 'error', 'error': 'Attendance record for this day was removed'}
+            continue
+        if row is not None and row.clock_in_time:
+            outcomes[worker_id] = {'status': 'skipped', 'error': 'Worker already clocked in for this day'}
+            continue
+        if row is None and worker_id not in hourly_rates:
+            outcomes[worker_id] = {'status': 'error', 'error': 'Worker not found'}
+            continue
+        try:
+            clock_in_time = parse_clock_time(entry.get('clock_in_time'), target_date)
+        except ValueError:
+            outcomes[worker_id] = {'status': 'error', 'error': 'Invalid clock_in_time. Use HH:MM or ISO format'}
+            continue
+
+        labour_role = entry.get('labour_role')
+        rows.append({
+            'worker_id': worker_id,
+            'project_id': project_id,
+            'attendance_date': target_date,
+            # Existing rows keep their own rate (not part of the conflict update)
+            'hourly_rate': row.hourly_rate if row is not None else hourly_rates[worker_id],
+            'labour_role': str(labour_role).strip()[:100] if labour_role else None,
+            'clock_in_time': clock_in_time,
+            'attendance_status': 'present',
+            'approval_status': 'pending',  # Will be reviewed by PM after completion
+            'entered_by_user_id': current_user.get('user_id'),
+            'entered_by_role': current_user.get('role', 'SE'),
+            'created_by': user_name,
+            'created_at': now,
+            'last_modified_by': user_name,
+            'last_modified_at': now,
+        })
+
+    if rows:
+        table = DailyAttendance.__table__
+        stmt = pg_insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint='unique_worker_project_date',
+            set_={
+                'clock_in_time': stmt.excluded.clock_in_time,
+                'attendance_status': 'present',
+                'labour_role': func.coalesce(table.c.labour_role, stmt.excluded.labour_role),
+                'last_modified_by': stmt.excluded.last_modified_by,
+                'last_modified_at': stmt.excluded.last_modified_at,
+            },
+            where=and_(table.c.clock_in_time.is_(None), table.c.is_deleted == False)
+        ).returning(table.c.worker_id, table.c.attendance_id)
+
+        written = dict(db.session.execute(stmt).all())
+        if written:
+            invalidate_pm_dashboards(project_ids=[project_id])
+        for row in rows:
+            worker_id = row['worker_id']
+            if worker_id in written:
+                outcomes[worker_id] = {'status': 'clocked_in', 'attendance_id': written[worker_id]}
+            else:
+                # Clocked in (or removed) by another request since the pre-check
+                outcomes[worker_id] = {'status': 'skipped', 'error': 'Worker already clocked in for this day'}
+
+    return [{'worker_id': entry['worker_id'], **outcomes[entry['worker_id']]} for entry in entries]
+
+
+# ---------------------------------------------------------------------------
+# Clock-out
+# ---------------------------------------------------------------------------
+
+def bulk_clock_out(project_id: int, target_date, entries: List[Dict], current_user: Dict) -> List[Dict]:
+    """Clock out every entry, recalculating hours and cost, in one transaction."""
+    worker_ids = [entry['worker_id'] for entry in entries]
+    if not worker_ids:
+        return []
+
+    records = {
+        record.worker_id: record
+        for record in DailyAttendance.query.filter(
+            DailyAttendance.project_id == project_id,
+            DailyAttendance.attendance_date == target_date,
+            DailyAttendance.worker_id.in_(worker_ids),
+            DailyAttendance.is_deleted == False
+        ).with_for_update(of=DailyAttendance).all()
+    }
+
+    user_name = current_user.get('full_name', 'System')
+    results = []
+    for entry in entries:
+        worker_id = entry['worker_id']
+        attendance = records.get(worker_id)
+        if attendance is None:
+            results.append({'worker_id': worker_id, 'status': 'error', 'error': 'No clock-in record found for this worker'})
+            continue
+        if not attendance.clock_in_time:
+            results.append({'worker_id': worker_id, 'status': 'error', 'error': 'Worker has not clocked in'})
+            continue
+        if attendance.clock_out_time:
+            results.append({'worker_id': worker_id, 'status': 'skipped', 'error': 'Worker already clocked out'})
+            continue
+        try:
+            clock_out_time = parse_clock_time(entry.get('clock_out_time'), target_date)
+            break_minutes = int(entry.get('break_duration_minutes') or 0)
+        except (TypeError, ValueError):
+            results.append({'worker_id': worker_id, 'status': 'error', 'error': 'Invalid clock_out_time or break_duration_minutes'})
+            continue
+
+        attendance.clock_out_time = clock_out_time
+        attendance.break_duration_minutes = break_minutes
+        attendance.attendance_status = 'completed'
+        attendance.approval_status = 'pending'  # Ready for PM review
+        attendance.calculate_hours_and_cost()
+        attendance.last_modified_by = user_name
+        results.append({'worker_id': worker_id, 'status': 'clocked_out', 'attendance_id': attendance.attendance_id})
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Arrival confirmation
+# ---------------------------------------------------------------------------
+
+def bulk_confirm_arrivals(project_id: int, target_date, entries: List[Dict], current_user: Dict) -> List[Dict]:
+    """Confirm the day's assigned arrivals of every entry in one transaction."""
+    worker_ids = [entry['worker_id'] for entry in entries]
+    if not worker_ids:
+        return []
+
+    arrivals_by_worker = {}
+    for arrival in LabourArrival.query.filter(
+        LabourArrival.project_id == project_id,
+        LabourArrival.arrival_date == target_date,
+        LabourArrival.worker_id.in_(worker_ids),
+        LabourArrival.is_deleted == False
+    ).with_for_update(of=LabourArrival).all():
+        arrivals_by_worker.setdefault(arrival.worker_id, []).append(arrival)
+
+    confirmed_at = datetime.utcnow()
+    results = []
+    for entry in entries:
+        worker_id = entry['worker_id']
+        arrivals = arrivals_by_worker.get(worker_id)
+        if not arrivals:
+            results.append({'worker_id': worker_id, 'status': 'error', 'error': 'Arrival record not found'})
+            continue
+        pending = [a for a in arrivals if a.arrival_status not in ('confirmed', 'departed')]
+        if not pending:
+            results.append({'worker_id': worker_id, 'status': 'skipped', 'error': 'Arrival already confirmed'})
+            continue
+        arrival_time = entry.get('arrival_time')
+        if arrival_time and not (isinstance(arrival_time, str) and HHMM_PATTERN.match(arrival_time)):
+            results.append({'worker_id': worker_id, 'status': 'error', 'error': 'Invalid arrival_time format. Use HH:MM'})
+            continue
+
+        for arrival in pending:
+            arrival.arrival_status = 'confirmed'
+            arrival.arrival_time = arrival_time or datetime.now().strftime('%H:%M')
+            arrival.confirmed_at = confirmed_at
+            arrival.confirmed_by_user_id = current_user.get('user_id')
+        results.append({
+            'worker_id': worker_id,
+            'status': 'confirmed',
+            'arrival_ids': [a.arrival_id for a in pending]
+        })
+
+    return results
+
+
+def load_attendance_records(attendance_ids: List[int]) -> List[DailyAttendance]:
+    """Attendance rows written by a batch, with workers loaded for to_dict()."""
+    if not attendance_ids:
+        return []
+    return DailyAttendance.query.options(
+        joinedload(DailyAttendance.worker)
+    ).filter(DailyAttendance.attendance_id.in_(attendance_ids)).all()
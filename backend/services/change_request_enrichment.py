@@ -0,0 +1,217 @@
+"""
+Change Request Enrichment Service
+Persists the BOQ-derived cost and sub_item_name enrichment of change requests
+
+SE-created change requests carry no prices (materials_total_cost = 0). Their
+cost is estimated from the BOQ's unit prices, and materials missing a
+sub_item_name get the name of the BOQ sub-item the material belongs to.
+
+Both are computed when the CR is written (or its BOQ's details change) and
+stored on the CR:
+- ChangeRequest.boq_estimated_cost:  materials × BOQ unit price
+- ChangeRequest.boq_sub_item_names:  {'materials_data': {key: name}, 'sub_items_data': {key: name}}
+  where key is the material's master_material_id or "name:<lowercased name>"
+
+so list endpoints apply them with apply_change_request_enrichment() instead
+of loading and walking BOQ JSON per request.
+"""
+from sqlalchemy import event, or_
+from sqlalchemy.orm import Session
+
+from config.db import db
+from config.logging import get_logger
+from models.boq import BOQDetails
+from models.change_request import ChangeRequest
+
+log = get_logger()
+
+# CR columns the enrichment depends on
+_ENRICHMENT_INPUTS = ('materials_data', 'sub_items_data', 'materials_total_cost', 'boq_id')
+
+
+def _needs_enrichment(materials_total_cost):
+    return not materials_total_cost or materials_total_cost == 0
+
+
+def build_boq_material_lookup(boq_id, boq_json):
+    """
+    Material price and sub_item_name lookups from BOQ JSON, keyed by the
+    generated material id (mat_<boq>_<item>_<sub_item>_<material>) and by
+    "name:<lowercased material name>".
+    """
+    material_prices = {}
+    material_sub_items = {}
+    for item_idx, item in enumerate((boq_json or {}).get('items', [])):
+        for sub_item_idx, sub_item in enumerate(item.get('sub_items', [])):
+            sub_item_name = sub_item.get('sub_item_name')
+            for mat_idx, boq_material in enumerate(sub_item.get('materials', [])):
+                material_id = f"mat_{boq_id}_{item_idx+1}_{sub_item_idx+1}_{mat_idx+1}"
+                material_prices[material_id] = boq_material.get('unit_price', 0)
+                material_sub_items[material_id] = sub_item_name
+                # Also store by material name for fallback lookup
+                mat_name = (boq_material.get('material_name') or '').lower().strip()
+                if mat_name:
+                    material_prices[f"name:{mat_name}"] = boq_material.get('unit_price', 0)
+                    material_sub_items[f"name:{mat_name}"] = sub_item_name
+    return material_prices, material_sub_items
+
+
+def _lookup_key(mat, lookup):
+    """master_material_id if the lookup has it, else the name key if present."""
+    mat_id = mat.get('master_material_id')
+    if mat_id and mat_id in lookup:
+        return mat_id
+    mat_name = (mat.get('material_name') or '').lower().strip()
+    if mat_name and f"name:{mat_name}" in lookup:
+        return f"name:{mat_name}"
+    return None
+
+
+def _price_and_names(entries, material_prices, material_sub_items):
+    total_cost = 0.0
+    names = {}
+    for mat in entries or []:
+        try:
+            quantity = float(mat.get('quantity', 0) or 0)
+            unit_price = float(mat.get('unit_price', 0) or 0)
+        except (ValueError, TypeError):
+            quantity = 0
+            unit_price = 0
+
+        # If unit_price is 0, take it from the BOQ
+        if not unit_price:
+            key = _lookup_key(mat, material_prices)
+            if key:
+                unit_price = float(material_prices[key] or 0)
+
+        if not mat.get('sub_item_name'):
+            key = _lookup_key(mat, material_sub_items)
+            if key:
+                names[key] = material_sub_items[key]
+
+        total_cost += quantity * unit_price
+    return total_cost, names
+
+
+def compute_change_request_enrichment(boq_id, materials_data, sub_items_data, boq_json):
+    """
+    Returns (estimated_cost or None, sub_item_names or None).
+    sub_items_data is only priced (and enriched) when materials_data prices to 0.
+    """
+    material_prices, material_sub_items = build_boq_material_lookup(boq_id, boq_json)
+    total_cost, material_names = _price_and_names(materials_data, material_prices, material_sub_items)
+    sub_item_names = {}
+    if total_cost == 0:
+        total_cost, sub_item_names = _price_and_names(sub_items_data, material_prices, material_sub_items)
+
+    names = {}
+    if material_names:
+        names['materials_data'] = material_names
+    if sub_item_names:
+        names['sub_items_data'] = sub_item_names
+    return (round(total_cost, 2) if total_cost > 0 else None), (names or None)
+
+
+def enrich_change_request(cr, boq_json):
+    """Set cr.boq_estimated_cost / cr.boq_sub_item_names from the BOQ JSON."""
+    if not cr.boq_id or not _needs_enrichment(cr.materials_total_cost) or not boq_json:
+        cost, names = None, None
+    else:
+        try:
+            cost, names = compute_change_request_enrichment(cr.boq_id, cr.materials_data, cr.sub_items_data, boq_json)
+        except Exception as e:
+            log.error(f"Failed to enrich materials_total_cost for CR {cr.cr_id}: {e}")
+            cost, names = None, None
+    if cr.boq_estimated_cost != cost:
+        cr.boq_estimated_cost = cost
+    if cr.boq_sub_item_names != names:
+        cr.boq_sub_item_names = names
+
+
+def apply_change_request_enrichment(cr_dict, cr):
+    """Apply the stored enrichment to a CR's to_dict() output (no BOQ access)."""
+    if cr.boq_estimated_cost:
+        cr_dict['materials_total_cost'] = round(cr.boq_estimated_cost, 2)
+    for field, names in (cr.boq_sub_item_names or {}).items():
+        for mat in cr_dict.get(field) or []:
+            if not mat.get('sub_item_name'):
+                key = _lookup_key(mat, names)
+                if key:
+                    mat['sub_item_name'] = names[key]
+
+
+def _load_boq_json(session, boq_ids, in_session):
+    boq_json = {boq_id: details.boq_details for boq_id, details in in_session.items() if boq_id in boq_ids}
+    missing = [boq_id for boq_id in boq_ids if boq_id not in boq_json]
+    if missing:
+        for boq_id, details in session.query(BOQDetails.boq_id, BOQDetails.boq_details).filter(
+            BOQDetails.boq_id.in_(missing),
+            BOQDetails.is_deleted == False
+        ):
+            boq_json.setdefault(boq_id, details)
+    return boq_json
+
+
+def _enrich_before_flush(session, flush_context, instances):
+    changed_crs = []
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, ChangeRequest):
+            continue
+        state = db.inspect(obj)
+        if obj in session.new or any(state.attrs[attr].history.has_changes() for attr in _ENRICHMENT_INPUTS):
+            changed_crs.append(obj)
+
+    changed_boqs = {
+        obj.boq_id: obj
+        for obj in list(session.new) + list(session.dirty)
+        if isinstance(obj, BOQDetails) and not obj.is_deleted and obj.boq_id
+        and (obj in session.new or db.inspect(obj).attrs['boq_details'].history.has_changes())
+    }
+    if not changed_crs and not changed_boqs:
+        return
+
+    with session.no_autoflush:
+        if changed_boqs:
+            # Price changes in the BOQ re-price its unpriced CRs
+            seen = {id(cr) for cr in changed_crs}
+            for cr in session.query(ChangeRequest).filter(
+                ChangeRequest.boq_id.in_(list(changed_boqs)),
+                ChangeRequest.is_deleted == False,
+                or_(ChangeRequest.materials_total_cost.is_(None), ChangeRequest.materials_total_cost == 0)
+            ):
+                if id(cr) not in seen:
+                    changed_crs.append(cr)
+
+        boq_json = _load_boq_json(session, {cr.boq_id for cr in changed_crs if cr.boq_id}, changed_boqs)
+        for cr in changed_crs:
+            enrich_change_request(cr, boq_json.get(cr.boq_id))
+
+
+def register_change_request_enrichment():
+    """Install the before_flush listener that keeps CR enrichment up to date."""
+    if not event.contains(Session, "before_flush", _enrich_before_flush):
+        event.listen(Session, "before_flush", _enrich_before_flush)
+
+
+def backfill_change_request_enrichment(batch_size=500):
+    """Compute the enrichment for every existing CR. Returns the number of CRs updated."""
+    updated = 0
+    last_id = 0
+    while True:
+        crs = ChangeRequest.query.filter(
+            ChangeRequest.cr_id > last_id,
+            ChangeRequest.is_deleted == False
+        ).order_by(ChangeRequest.cr_id).limit(batch_size).all()
+        if not crs:
+            break
+        last_id = crs[-1].cr_id
+
+        boq_json = _load_boq_json(db.session, {cr.boq_id for cr in crs if cr.boq_id}, {})
+        with db.session.no_autoflush:
+            for cr in crs:
+                before = (cr.boq_estimated_cost, cr.boq_sub_item_names)
+                enrich_change_request(cr, boq_json.get(cr.boq_id))
+                if (cr.boq_estimated_cost, cr.boq_sub_item_names) != before:
+                    updated += 1
+        db.session.commit()
+    return updated
@@ -0,0 +1,394 @@
+"""
+Change Request Visibility Index
+Role inbox filtering for change requests from a precomputed index
+
+The SE / PM / MEP / estimator views of get_all_change_requests used to load
+the user's PMAssignSS rows or projects into Python and build large IN
+filters on every call. The same rules are now materialised in cr_visibility
+(models/cr_visibility.py) as (user_id, reason, cr_id) rows:
+- INSERT_SQL evaluates the rules set-based for a set of CRs
+- an after_flush listener (register_cr_visibility_sync) refreshes the CRs
+  touched by CR writes, project membership/estimator changes and SE item
+  assignments, in the same transaction
+- inbox_filter(role, user_id) turns a role inbox into one indexed semi-join
+
+legacy_inbox_filter() keeps the previous per-request filters as the
+reference implementation; verify_visibility_index() compares both for every
+user (migrations/create_cr_visibility_table.py --verify), and
+tests/test_cr_visibility.py checks them against each other on a seeded database.
+"""
+from sqlalchemy import and_, event, func, or_, select, text
+from sqlalchemy.orm import Session
+
+from config.change_request_config import CR_CONFIG
+from config.db import db
+from config.logging import get_logger
+from models.change_request import ChangeRequest
+from models.cr_visibility import (
+    ChangeRequestVisibility,
+    REASON_OWN, REASON_SE_PROJECT, REASON_PM_PROJECT, REASON_PM_APPROVED,
+    REASON_MEP_PROJECT, REASON_ESTIMATOR_PROJECT, REASON_ESTIMATOR_APPROVED,
+)
+from models.pm_assign_ss import PMAssignSS
+from models.project import Project
+from models.project_member import ROLE_PROJECT_MANAGER, ROLE_MEP_SUPERVISOR
+from utils.project_membership import project_member_filter
+
+log = get_logger()
+
+SE_ROLES = ['siteengineer', 'site_engineer', 'sitesupervisor', 'site_supervisor']
+PM_ROLES = ['projectmanager', 'project_manager']
+MEP_ROLES = ['mep', 'mepsupervisor']
+ESTIMATOR_ROLES = ['estimator']
+
+# requested_by_role values of PM-raised requests
+_PM_REQUESTER_ROLES = ['projectmanager', 'project_manager', 'pm']
+
+# Project columns whose changes move visibility
+_PROJECT_VISIBILITY_ATTRS = ('user_id', 'mep_supervisor_id', 'estimator_id', 'is_deleted')
+
+# Rule set per reason; kept in step with legacy_inbox_filter()
+_TARGET_CRS = """
+    WITH target AS (
+        SELECT * FROM change_requests cr
+        WHERE cr.is_deleted = false
+          AND (:rebuild_all
+               OR cr.cr_id = ANY(CAST(:cr_ids AS integer[]))
+               OR cr.project_id = ANY(CAST(:project_ids AS integer[])))
+    )
+"""
+
+DELETE_SQL = text("""
+    DELETE FROM cr_visibility
+    WHERE :rebuild_all
+       OR cr_id = ANY(CAST(:cr_ids AS integer[]))
+       OR cr_id IN (SELECT cr_id FROM change_requests WHERE project_id = ANY(CAST(:project_ids AS integer[])))
+""")
+
+INSERT_SQL = text(_TARGET_CRS + """
+    INSERT INTO cr_visibility (user_id, reason, cr_id)
+    SELECT requested_by_user_id, 'own', cr_id FROM target
+    WHERE requested_by_user_id IS NOT NULL
+    UNION
+    SELECT a.assigned_to_se_id, 'se_project', t.cr_id
+    FROM target t
+    JOIN pm_assign_ss a ON a.project_id = t.project_id AND a.is_deleted = false
+    WHERE a.assigned_to_se_id IS NOT NULL
+      AND ((t.requested_by_role = ANY(CAST(:se_roles AS varchar[])) AND t.status = 'pending')
+           OR t.requested_by_role = 'admin'
+           OR (t.status = ANY(CAST(:approved AS varchar[])) AND t.requested_by_role = ANY(CAST(:se_roles AS varchar[]))))
+    UNION
+    SELECT m.user_id, 'pm_project', t.cr_id
+    FROM target t
+    JOIN project p ON p.project_id = t.project_id AND p.is_deleted = false
+    JOIN project_members m ON m.project_id = t.project_id AND m.role = :pm_member_role
+    WHERE (t.requested_by_role = ANY(CAST(:pm_requester_roles AS varchar[])) AND t.status IN ('pending', 'pm_request'))
+       OR lower(t.requested_by_role) = 'admin'
+       OR (t.status = :send_to_pm AND t.assigned_to_pm_user_id = m.user_id)
+       OR (t.assigned_to_pm_user_id = m.user_id AND t.status = ANY(CAST(:approved AS varchar[])))
+       OR (t.status = ANY(CAST(:approved AS varchar[]))
+           AND lower(t.requested_by_role) = ANY(CAST(:pm_or_admin_roles AS varchar[]))
+           AND t.assigned_to_pm_user_id IS NULL)
+    UNION
+    SELECT pm_approved_by_user_id, 'pm_approved', cr_id FROM target
+    WHERE pm_approved_by_user_id IS NOT NULL
+    UNION
+    SELECT m.user_id, 'mep_project', t.cr_id
+    FROM target t
+    JOIN project p ON p.project_id = t.project_id AND p.is_deleted = false
+    JOIN project_members m ON m.project_id = t.project_id AND m.role = :mep_member_role
+    WHERE (t.requested_by_role = ANY(CAST(:mep_roles AS varchar[])) AND t.status = 'pending')
+       OR (t.status = :send_to_mep AND t.current_approver_role = :mep_approver AND t.assigned_to_pm_user_id = m.user_id)
+       OR t.requested_by_role = 'admin'
+       OR (t.assigned_to_pm_user_id = m.user_id AND t.status = ANY(CAST(:mep_approved AS varchar[])))
+       OR (t.status = ANY(CAST(:mep_approved AS varchar[]))
+           AND lower(t.requested_by_role) = ANY(CAST(:mep_or_admin_roles AS varchar[]))
+           AND t.assigned_to_pm_user_id IS NULL)
+    UNION
+    SELECT p.estimator_id, 'estimator_project', t.cr_id
+    FROM target t
+    JOIN project p ON p.project_id = t.project_id AND p.is_deleted = false
+    WHERE p.estimator_id IS NOT NULL AND t.approval_required_from = 'estimator'
+    UNION
+    SELECT approved_by_user_id, 'estimator_approved', cr_id FROM target
+    WHERE approved_by_user_id IS NOT NULL
+    ON CONFLICT DO NOTHING
+""")
+
+
+def _rule_params():
+    return {
+        'se_roles': SE_ROLES,
+        'approved': list(CR_CONFIG.APPROVED_WORKFLOW_STATUSES),
+        'pm_member_role': ROLE_PROJECT_MANAGER,
+        'pm_requester_roles': _PM_REQUESTER_ROLES,
+        'pm_or_admin_roles': _PM_REQUESTER_ROLES + ['admin'],
+        'send_to_pm': CR_CONFIG.STATUS_SEND_TO_PM,
+        'mep_member_role': ROLE_MEP_SUPERVISOR,
+        'mep_roles': MEP_ROLES,
+        'mep_or_admin_roles': MEP_ROLES + ['admin'],
+        'send_to_mep': CR_CONFIG.STATUS_SEND_TO_MEP,
+        'mep_approver': CR_CONFIG.ROLE_MEP,
+        'mep_approved': list(CR_CONFIG.MEP_APPROVED_STATUSES),
+    }
+
+
+def refresh_cr_visibility(cr_ids=(), project_ids=(), rebuild_all=False, connection=None):
+    """
+    Recompute the visibility rows of the given CRs and of every CR in the
+    given projects (or of all CRs). Runs in the caller's transaction.
+    """
+    if not rebuild_all and not cr_ids and not project_ids:
+        return
+    connection = connection if connection is not None else db.session.connection()
+    scope = {
+        'rebuild_all': rebuild_all,
+        'cr_ids': sorted(cr_ids),
+        'project_ids': sorted(project_ids),
+    }
+    connection.execute(DELETE_SQL, scope)
+    connection.execute(INSERT_SQL, {**scope, **_rule_params()})
+
+
+def _ids(*values):
+    ids = set()
+    for value in values:
+        try:
+            if value is not None:
+                ids.add(int(value))
+        except (TypeError, ValueError):
+            continue
+    return ids
+
+
+def _current_and_previous(obj, attr):
+    history = db.inspect(obj).attrs[attr].history
+    return _ids(getattr(obj, attr, None), *(history.deleted or ()))
+
+
+def _sync_cr_visibility_after_flush(session, flush_context):
+    cr_ids, project_ids = set(), set()
+
+    for obj in session.new:
+        if isinstance(obj, ChangeRequest):
+            cr_ids |= _ids(obj.cr_id)
+        elif isinstance(obj, (Project, PMAssignSS)):
+            project_ids |= _ids(obj.project_id)
+
+    for obj in session.dirty:
+        if not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, ChangeRequest):
+            cr_ids |= _ids(obj.cr_id)
+        elif isinstance(obj, PMAssignSS):
+            project_ids |= _current_and_previous(obj, 'project_id')
+        elif isinstance(obj, Project):
+            state = db.inspect(obj)
+            if any(state.attrs[attr].history.has_changes() for attr in _PROJECT_VISIBILITY_ATTRS):
+                project_ids |= _ids(obj.project_id)
+
+    for obj in session.deleted:
+        if isinstance(obj, ChangeRequest):
+            cr_ids |= _ids(obj.cr_id)
+        elif isinstance(obj, PMAssignSS):
+            project_ids |= _current_and_previous(obj, 'project_id')
+
+    if cr_ids or project_ids:
+        refresh_cr_visibility(cr_ids, project_ids, connection=session.connection())
+
+
+def register_cr_visibility_sync():
+    """
+    Install the after_flush listener that keeps cr_visibility current.
+    Register after register_project_member_sync() so project_members is
+    already synced when a project's rows are recomputed.
+    """
+    if not event.contains(Session, "after_flush", _sync_cr_visibility_after_flush):
+        event.listen(Session, "after_flush", _sync_cr_visibility_after_flush)
+
+
+def _has_pm_projects(user_id):
+    return db.session.query(
+        Project.query.filter(
+            project_member_filter(user_id, ROLE_PROJECT_MANAGER),
+            Project.is_deleted == False
+        ).exists()
+    ).scalar()
+
+
+def _has_mep_projects(user_id):
+    return db.session.query(
+        Project.query.filter(
+            project_member_filter(user_id, ROLE_MEP_SUPERVISOR),
+            Project.is_deleted == False
+        ).exists()
+    ).scalar()
+
+
+def _has_estimator_projects(user_id):
+    return db.session.query(
+        Project.query.filter_by(estimator_id=user_id, is_deleted=False).exists()
+    ).scalar()
+
+
+def inbox_reasons(user_role, user_id):
+    """Visibility reasons that make up the user's inbox in the given role."""
+    if user_role in SE_ROLES:
+        return (REASON_SE_PROJECT, REASON_OWN)
+    if user_role in PM_ROLES:
+        if _has_pm_projects(user_id):
+            return (REASON_PM_PROJECT, REASON_PM_APPROVED, REASON_OWN)
+        log.warning(f"PM {user_id} has no assigned projects")
+        return (REASON_OWN,)
+    if user_role in MEP_ROLES:
+        if not _has_mep_projects(user_id):
+            log.warning(f"MEP {user_id} has no assigned projects, showing only their own requests")
+        return (REASON_MEP_PROJECT, REASON_OWN)
+    if user_role in ESTIMATOR_ROLES:
+        if _has_estimator_projects(user_id):
+            # Estimators only see CRs they are involved in, not their own drafts
+            return (REASON_ESTIMATOR_PROJECT, REASON_ESTIMATOR_APPROVED)
+        log.warning(f"Estimator {user_id} has no assigned projects, showing only their own requests")
+        return (REASON_OWN,)
+    return ()
+
+
+def inbox_filter(user_role, user_id):
+    """ChangeRequest filter for the user's inbox: one semi-join on cr_visibility."""
+    return ChangeRequest.cr_id.in_(
+        select(ChangeRequestVisibility.cr_id).where(
+            ChangeRequestVisibility.user_id == user_id,
+            ChangeRequestVisibility.reason.in_(inbox_reasons(user_role, user_id))
+        )
+    )
+
+
+def legacy_inbox_filter(user_role, user_id):
+    """
+    Reference implementation: the role filters get_all_change_requests built
+    per request before the index existed. Used by verify_visibility_index().
+    """
+    if user_role in SE_ROLES:
+        se_assigned_project_ids = [p[0] for p in db.session.query(PMAssignSS.project_id).filter(
+            PMAssignSS.assigned_to_se_id == user_id,
+            PMAssignSS.is_deleted == False
+        ).distinct().all()]
+        if not se_assigned_project_ids:
+            return ChangeRequest.requested_by_user_id == user_id
+        in_projects = ChangeRequest.project_id.in_(se_assigned_project_ids)
+        return or_(
+            and_(in_projects, ChangeRequest.requested_by_role.in_(SE_ROLES), ChangeRequest.status == 'pending'),
+            and_(in_projects, ChangeRequest.requested_by_role == 'admin'),
+            and_(
+                in_projects,
+                ChangeRequest.status.in_(CR_CONFIG.APPROVED_WORKFLOW_STATUSES),
+                ChangeRequest.requested_by_role.in_(SE_ROLES)
+            ),
+            ChangeRequest.requested_by_user_id == user_id
+        )
+
+    if user_role in PM_ROLES:
+        pm_project_ids = [p.project_id for p in Project.query.filter(
+            project_member_filter(user_id, ROLE_PROJECT_MANAGER),
+            Project.is_deleted == False
+        ).all()]
+        if not pm_project_ids:
+            return ChangeRequest.requested_by_user_id == user_id
+        in_projects = ChangeRequest.project_id.in_(pm_project_ids)
+        approved_status_filter = ChangeRequest.status.in_(CR_CONFIG.APPROVED_WORKFLOW_STATUSES)
+        return or_(
+            and_(
+                in_projects,
+                ChangeRequest.requested_by_role.in_(_PM_REQUESTER_ROLES),
+                ChangeRequest.status.in_(['pending', 'pm_request'])
+            ),
+            and_(in_projects, func.lower(ChangeRequest.requested_by_role) == 'admin'),
+            and_(
+                in_projects,
+                ChangeRequest.status == CR_CONFIG.STATUS_SEND_TO_PM,
+                ChangeRequest.assigned_to_pm_user_id == user_id
+            ),
+            and_(in_projects, ChangeRequest.assigned_to_pm_user_id == user_id, approved_status_filter),
+            and_(
+                in_projects,
+                approved_status_filter,
+                func.lower(ChangeRequest.requested_by_role).in_(_PM_REQUESTER_ROLES + ['admin']),
+                ChangeRequest.assigned_to_pm_user_id.is_(None)
+            ),
+            ChangeRequest.pm_approved_by_user_id == user_id,
+            ChangeRequest.requested_by_user_id == user_id
+        )
+
+    if user_role in MEP_ROLES:
+        mep_project_ids = [p.project_id for p in Project.query.filter(
+            project_member_filter(user_id, ROLE_MEP_SUPERVISOR),
+            Project.is_deleted == False
+        ).all()]
+        if not mep_project_ids:
+            return ChangeRequest.requested_by_user_id == user_id
+        in_projects = ChangeRequest.project_id.in_(mep_project_ids)
+        mep_approved_statuses = ChangeRequest.status.in_(CR_CONFIG.MEP_APPROVED_STATUSES)
+        return or_(
+            and_(in_projects, ChangeRequest.requested_by_role.in_(MEP_ROLES), ChangeRequest.status == 'pending'),
+            and_(
+                in_projects,
+                ChangeRequest.status == CR_CONFIG.STATUS_SEND_TO_MEP,
+                ChangeRequest.current_approver_role == CR_CONFIG.ROLE_MEP,
+                ChangeRequest.assigned_to_pm_user_id == user_id
+            ),
+            and_(in_projects, ChangeRequest.requested_by_role == 'admin'),
+            and_(in_projects, ChangeRequest.assigned_to_pm_user_id == user_id, mep_approved_statuses),
+            and_(
+                in_projects,
+                mep_approved_statuses,
+                func.lower(ChangeRequest.requested_by_role).in_(MEP_ROLES + ['admin']),
+                ChangeRequest.assigned_to_pm_user_id.is_(None)
+            ),
+            ChangeRequest.requested_by_user_id == user_id
+        )
+
+    if user_role in ESTIMATOR_ROLES:
+        estimator_project_ids = [p.project_id for p in Project.query.filter_by(
+            estimator_id=user_id, is_deleted=False
+        ).all()]
+        if not estimator_project_ids:
+            return ChangeRequest.requested_by_user_id == user_id
+        return or_(
+            and_(
+                ChangeRequest.approval_required_from == 'estimator',
+                ChangeRequest.project_id.in_(estimator_project_ids)
+            ),
+            ChangeRequest.approved_by_user_id == user_id
+        )
+
+    return ChangeRequest.cr_id == -1
+
+
+def verify_visibility_index(user_ids=None):
+    """
+    Compare the indexed inbox with the legacy filters for every SE / PM / MEP /
+    estimator user (or the given user ids). Returns a list of mismatch messages.
+    """
+    from models.role import Role
+    from models.user import User
+
+    handled_roles = SE_ROLES + PM_ROLES + MEP_ROLES + ESTIMATOR_ROLES
+    query = db.session.query(User.user_id, Role.role).join(Role, Role.role_id == User.role_id).filter(
+        User.is_deleted == False,
+        func.lower(Role.role).in_(handled_roles)
+    )
+    if user_ids:
+        query = query.filter(User.user_id.in_(list(user_ids)))
+
+    mismatches = []
+    for user_id, role in query.order_by(User.user_id).all():
+        role = role.lower()
+        base = db.session.query(ChangeRequest.cr_id).filter(ChangeRequest.is_deleted == False)
+        expected = {row[0] for row in base.filter(legacy_inbox_filter(role, user_id)).all()}
+        actual = {row[0] for row in base.filter(inbox_filter(role, user_id)).all()}
+        if expected != actual:
+            mismatches.append(
+                f"user {user_id} ({role}): missing {sorted(expected - actual)[:20]}, "
+                f"extra {sorted(actual - expected)[:20]}"
+            )
+    return mismatches
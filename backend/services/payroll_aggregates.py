@@ -0,0 +1,215 @@
+"""
+Payroll Aggregates - daily pre-aggregates behind the payroll summary
+
+GET /api/labour/payroll/summary used to aggregate daily_attendance joined to
+workers, requisitions and projects over the whole requested range on every
+call. Locked attendance is now mirrored into payroll_daily_aggregates
+(models/payroll_aggregate.py), one row per (attendance_date, project_id,
+worker_id), and range summaries sum those day rows instead.
+
+Maintenance: an after_flush listener (register_payroll_aggregate_sync)
+recomputes the day rows of every attendance record written through the ORM
+whose payroll figures or lock state changed - clock-out, corrections,
+lock_attendance, lock_day_attendance - in the same transaction, so the
+summary is never ahead of or behind the locked data.
+rebuild_payroll_aggregates() recomputes a date range (or all history) for
+writes made outside the ORM.
+
+tests/test_payroll_aggregates.py compares the summary with the raw
+computation (raw_payroll_summary_rows) over arbitrary ranges.
+"""
+
+from sqlalchemy import delete, event, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from config.db import db
+from config.logging import get_logger
+from models.worker import Worker
+from models.project import Project
+from models.labour_requisition import LabourRequisition
+from models.daily_attendance import DailyAttendance
+from models.payroll_aggregate import PayrollDailyAggregate
+
+log = get_logger()
+
+KEY_COLUMNS = ('attendance_date', 'project_id', 'worker_id')
+# Attendance attributes that change a day's payroll figures
+PAYROLL_COLUMNS = KEY_COLUMNS + (
+    'requisition_id', 'approval_status', 'is_deleted',
+    'total_hours', 'regular_hours', 'overtime_hours', 'total_cost',
+)
+AGGREGATE_COLUMNS = KEY_COLUMNS + (
+    'requisition_id', 'days_worked', 'total_hours', 'regular_hours', 'overtime_hours', 'total_cost',
+)
+
+
+# ---------------------------------------------------------------------------
+# Day-row computation
+# ---------------------------------------------------------------------------
+
+def _day_rows_select(*criteria):
+    """Locked, non-deleted attendance grouped into payroll_daily_aggregates rows."""
+    attendance = DailyAttendance.__table__
+    return select(
+        attendance.c.attendance_date,
+        attendance.c.project_id,
+        attendance.c.worker_id,
+        func.max(attendance.c.requisition_id),
+        func.count(),
+        func.coalesce(func.sum(attendance.c.total_hours), 0),
+        func.coalesce(func.sum(attendance.c.regular_hours), 0),
+        func.coalesce(func.sum(attendance.c.overtime_hours), 0),
+        func.coalesce(func.sum(attendance.c.total_cost), 0),
+    ).where(
+        attendance.c.approval_status == 'locked',
+        attendance.c.is_deleted == False,
+        *criteria
+    ).group_by(
+        attendance.c.attendance_date, attendance.c.project_id, attendance.c.worker_id
+    )
+
+
+def refresh_payroll_days(connection, keys):
+    """Recompute the aggregate rows for (attendance_date, project_id, worker_id) keys."""
+    keys = sorted(set(keys))
+    if not keys:
+        return
+    aggregate = PayrollDailyAggregate.__table__
+    attendance = DailyAttendance.__table__
+    connection.execute(
+        delete(aggregate).where(tuple_(*(aggregate.c[c] for c in KEY_COLUMNS)).in_(keys))
+    )
+    connection.execute(
+        pg_insert(aggregate).from_select(
+            AGGREGATE_COLUMNS,
+            _day_rows_select(tuple_(*(attendance.c[c] for c in KEY_COLUMNS)).in_(keys))
+        )
+    )
+
+
+def rebuild_payroll_aggregates(start=None, end=None):
+    """Recompute every day row in [start, end] (all history when omitted). Returns rows written."""
+    aggregate = PayrollDailyAggregate.__table__
+    attendance = DailyAttendance.__table__
+    target, source = [], []
+    if start:
+        target.append(aggregate.c.attendance_date >= start)
+        source.append(attendance.c.attendance_date >= start)
+    if end:
+        target.append(aggregate.c.attendance_date <= end)
+        source.append(attendance.c.attendance_date <= end)
+
+    db.session.execute(delete(aggregate).where(*target))
+    result = db.session.execute(pg_insert(aggregate).from_select(AGGREGATE_COLUMNS, _day_rows_select(*source)))
+    db.session.commit()
+    return result.rowcount
+
+
+# ---------------------------------------------------------------------------
+# Write tracking
+# ---------------------------------------------------------------------------
+
+def _attendance_keys(obj):
+    """Current key of an attendance row, plus its previous key when a key column changed."""
+    state = db.inspect(obj)
+    current = tuple(getattr(obj, c) for c in KEY_COLUMNS)
+    previous = tuple(
+        (state.attrs[c].history.deleted or [getattr(obj, c)])[0] for c in KEY_COLUMNS
+    )
+    return {key for key in (current, previous) if None not in key}
+
+
+def _affects_payroll(obj):
+    state = db.inspect(obj)
+    status = state.attrs.approval_status.history
+    was_or_is_locked = 'locked' in ((status.deleted or []) + [obj.approval_status])
+    return was_or_is_locked and any(state.attrs[c].history.has_changes() for c in PAYROLL_COLUMNS)
+
+
+def _sync_payroll_aggregates_after_flush(session, flush_context):
+    """Recompute the payroll day rows of attendance changed in this flush."""
+    keys = set()
+    for obj in session.new:
+        if isinstance(obj, DailyAttendance) and obj.approval_status == 'locked':
+            keys |= _attendance_keys(obj)
+    for obj in session.deleted:
+        if isinstance(obj, DailyAttendance):
+            keys |= _attendance_keys(obj)
+    for obj in session.dirty:
+        if isinstance(obj, DailyAttendance) and _affects_payroll(obj):
+            keys |= _attendance_keys(obj)
+    if keys:
+        refresh_payroll_days(session.connection(), keys)
+
+
+def register_payroll_aggregate_sync():
+    """Install the after_flush listener that keeps payroll_daily_aggregates current."""
+    if not event.contains(Session, "after_flush", _sync_payroll_aggregates_after_flush):
+        event.listen(Session, "after_flush", _sync_payroll_aggregates_after_flush)
+
+
+# ---------------------------------------------------------------------------
+# Range summaries
+# ---------------------------------------------------------------------------
+
+_SUMMARY_COLUMNS = (
+    Project.project_name,
+    Project.project_code,
+    LabourRequisition.requisition_code,
+    LabourRequisition.work_description,
+    LabourRequisition.skill_required,
+    LabourRequisition.site_name,
+    LabourRequisition.workers_count,
+    LabourRequisition.transport_fee,
+    Worker.worker_code,
+    Worker.full_name,
+    Worker.hourly_rate,
+)
+
+
+def _summary_query(source, start, end, project_id, days_worked):
+    """Group `source` rows of the range by project, requisition and worker, with display columns."""
+    query = db.session.query(
+        source.project_id,
+        source.requisition_id,
+        source.worker_id,
+        *_SUMMARY_COLUMNS,
+        days_worked.label('days_worked'),
+        func.sum(source.total_hours).label('total_hours'),
+        func.sum(source.regular_hours).label('regular_hours'),
+        func.sum(source.overtime_hours).label('overtime_hours'),
+        func.sum(source.total_cost).label('total_cost')
+    ).join(
+        Worker, Worker.worker_id == source.worker_id
+    ).join(
+        Project, Project.project_id == source.project_id
+    ).outerjoin(
+        LabourRequisition, source.requisition_id == LabourRequisition.requisition_id
+    ).filter(
+        source.attendance_date >= start,
+        source.attendance_date <= end
+    )
+    if project_id:
+        query = query.filter(source.project_id == project_id)
+    return query.group_by(
+        source.project_id, source.requisition_id, source.worker_id, *_SUMMARY_COLUMNS
+    ).order_by(Project.project_name, LabourRequisition.requisition_code, Worker.full_name)
+
+
+def payroll_summary_rows(start, end, project_id=None):
+    """Payroll per project, requisition and worker for [start, end], summed from the day rows."""
+    return _summary_query(
+        PayrollDailyAggregate, start, end, project_id, func.sum(PayrollDailyAggregate.days_worked)
+    ).all()
+
+
+def raw_payroll_summary_rows(start, end, project_id=None):
+    """The same summary computed from daily_attendance (reference for the tests)."""
+    return _summary_query(
+        DailyAttendance, start, end, project_id, func.count(DailyAttendance.attendance_id)
+    ).filter(
+        DailyAttendance.approval_status == 'locked',
+        DailyAttendance.is_deleted == False
+    ).all()
+
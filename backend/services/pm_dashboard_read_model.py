@@ -0,0 +1,300 @@
+"""
+PM Dashboard Read Model - precomputed per-PM dashboard documents
+
+The PM dashboard aggregates projects, BOQs, CRs, PO children, labour
+requisitions, attendance and asset requisitions in dozens of queries.
+Instead of running them on every page load, the computed document is kept
+in pm_dashboard_snapshots (models/pm_dashboard.py), one row per scope:
+- 'pm:<user_id>': a PM's dashboard (also what an admin sees when viewing as that PM)
+- 'all':          the admin general view
+
+Freshness:
+- Workflow writes (BOQ, BOQ details, CR, PO child, PM→SE assignment, labour
+  requisition, attendance, asset requisition, project membership) mark the
+  'pm:' scopes of the affected projects and PMs stale inside the same
+  transaction, via an after_flush listener installed by
+  register_pm_dashboard_invalidation(). Every invalidation also bumps the
+  row's version; a rebuild only clears stale_since if the version it read
+  before building is still current
+- A stale, missing or older than PM_DASHBOARD_MAX_AGE_SECONDS PM snapshot is
+  rebuilt on the next read; the age limit covers writes that bypass the ORM
+- Writes never touch the 'all' row (every write would otherwise invalidate
+  the most expensive document and contend on one row). Once it is older than
+  PM_DASHBOARD_ALL_REFRESH_SECONDS, reads keep serving it and rebuild it in
+  the background, one build at a time per process
+- ?refresh=true on the endpoint forces a synchronous rebuild
+
+Responses carry a 'freshness' block (computed_at, age_seconds, source, build_ms).
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import case, event, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from config.db import db
+from config.logging import get_logger
+from models.pm_dashboard import PMDashboardSnapshot
+
+log = get_logger()
+
+PM_DASHBOARD_MAX_AGE_SECONDS = int(os.getenv('PM_DASHBOARD_MAX_AGE_SECONDS', '600'))
+PM_DASHBOARD_ALL_REFRESH_SECONDS = int(os.getenv('PM_DASHBOARD_ALL_REFRESH_SECONDS', '60'))
+ALL_PROJECTS_SCOPE = 'all'
+
+_snapshots = PMDashboardSnapshot.__table__
+
+_lock = threading.Lock()
+_state = {
+    'executor': None,     # Background rebuilds of the 'all' scope
+    'refreshing': False,  # An 'all' rebuild is queued or running in this process
+}
+
+# Models whose writes change dashboard aggregates
+_TRACKED_TABLES = {
+    'project', 'boq', 'boq_details', 'change_requests', 'po_child', 'pm_assign_ss',
+    'labour_requisitions', 'daily_attendance', 'asset_requisitions',
+}
+
+# Columns naming a PM whose dashboard counts the row
+_PM_USER_COLUMNS = (
+    'last_pm_user_id',         # BOQ
+    'assigned_to_pm_user_id',  # ChangeRequest
+    'pm_approved_by_user_id',  # ChangeRequest
+    'requested_by_user_id',    # ChangeRequest / requisitions raised by the PM
+    'approved_by_user_id',     # LabourRequisition
+    'assigned_by_pm_id',       # PMAssignSS
+)
+
+INVALIDATE_SQL = text("""
+    WITH affected AS (
+        SELECT unnest(CAST(:project_ids AS integer[])) AS project_id
+        UNION
+        SELECT project_id FROM boq WHERE boq_id = ANY(CAST(:boq_ids AS integer[]))
+    )
+    UPDATE pm_dashboard_snapshots s
+    SET stale_since = COALESCE(s.stale_since, :now),
+        version = s.version + 1
+    WHERE s.scope_key = ANY(CAST(:scope_keys AS varchar[]))
+       OR s.scope_key IN (
+            SELECT 'pm:' || m.user_id FROM project_members m
+            JOIN affected a ON a.project_id = m.project_id
+            WHERE m.role = 'pm'
+       )
+       OR s.scope_key IN (
+            SELECT 'pm:' || b.last_pm_user_id FROM boq b
+            JOIN affected a ON a.project_id = b.project_id
+            WHERE b.last_pm_user_id IS NOT NULL
+       )
+""")
+
+
+def scope_key_for(filter_user_id, all_projects=False):
+    return ALL_PROJECTS_SCOPE if all_projects else f"pm:{filter_user_id}"
+
+
+def _int_values(value):
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    ints = set()
+    for v in values:
+        try:
+            if v is not None and v != '':
+                ints.add(int(v))
+        except (TypeError, ValueError):
+            continue
+    return ints
+
+
+def _current_and_previous(obj, attr):
+    """Current value of attr plus the value it replaced in this flush."""
+    values = _int_values(getattr(obj, attr, None))
+    history = db.inspect(obj).attrs[attr].history
+    for old in history.deleted or ():
+        values |= _int_values(old)
+    return values
+
+
+def invalidate_pm_dashboards(project_ids=(), boq_ids=(), user_ids=(), all_scopes=False, session=None):
+    """
+    Mark snapshots stale inside the current transaction: the given PMs and
+    every PM of the given projects/BOQs. The 'all' scope refreshes in the
+    background instead. all_scopes=True marks every snapshot stale, 'all'
+    included (rebuild on next read).
+    """
+    session = session if session is not None else db.session
+    now = datetime.utcnow()
+    if all_scopes:
+        session.execute(_snapshots.update().values(
+            stale_since=func.coalesce(_snapshots.c.stale_since, now),
+            version=_snapshots.c.version + 1,
+        ))
+        return
+    session.connection().execute(INVALIDATE_SQL, {
+        'now': now,
+        'project_ids': sorted(project_ids),
+        'boq_ids': sorted(boq_ids),
+        'scope_keys': [scope_key_for(uid) for uid in sorted(user_ids)],
+    })
+
+
+def _invalidate_after_flush(session, flush_context):
+    project_ids, boq_ids, user_ids = set(), set(), set()
+    changed = list(session.new) + list(session.deleted) + [
+        obj for obj in session.dirty if session.is_modified(obj, include_collections=False)
+    ]
+    for obj in changed:
+        table = getattr(obj, '__tablename__', None)
+        if table not in _TRACKED_TABLES:
+            continue
+        state = db.inspect(obj)
+        if 'project_id' in state.attrs:
+            project_ids |= _current_and_previous(obj, 'project_id')
+        if 'boq_id' in state.attrs:
+            boq_ids |= _current_and_previous(obj, 'boq_id')
+        if table == 'project':
+            user_ids |= _current_and_previous(obj, 'user_id')  # PM list
+        else:
+            for attr in _PM_USER_COLUMNS:
+                if attr in state.attrs:
+                    user_ids |= _current_and_previous(obj, attr)
+
+    if project_ids or boq_ids or user_ids:
+        invalidate_pm_dashboards(project_ids, boq_ids, user_ids, session=session)
+
+
+def register_pm_dashboard_invalidation():
+    """Install the after_flush listener that marks affected dashboards stale."""
+    if not event.contains(Session, "after_flush", _invalidate_after_flush):
+        event.listen(Session, "after_flush", _invalidate_after_flush)
+
+
+def _with_freshness(payload, computed_at, source, build_ms):
+    document = dict(payload)
+    document['freshness'] = {
+        'computed_at': computed_at.isoformat(),
+        'age_seconds': max(int((datetime.utcnow() - computed_at).total_seconds()), 0),
+        'source': source,
+        'build_ms': build_ms,
+    }
+    return document
+
+
+def rebuild_dashboard_snapshot(filter_user_id, all_projects, builder):
+    """
+    Compute the dashboard with builder(filter_user_id, all_projects) and store it.
+    The row's version is read before building: if any invalidation committed
+    since (or was still uncommitted at that read) bumped it, the stored row
+    stays stale. An older build never overwrites a newer one. If the snapshot
+    can't be stored the freshly computed document is still returned.
+    """
+    scope_key = scope_key_for(filter_user_id, all_projects)
+    read_version = db.session.execute(
+        select(_snapshots.c.version).where(_snapshots.c.scope_key == scope_key)
+    ).scalar()
+    started = datetime.utcnow()
+    t0 = time.perf_counter()
+    # Normalise through the app's JSON provider so the stored document is what jsonify returns
+    payload = json.loads(current_app.json.dumps(builder(filter_user_id, all_projects)))
+    build_ms = int((time.perf_counter() - t0) * 1000)
+
+    stmt = pg_insert(_snapshots).values(
+        scope_key=scope_key,
+        payload=payload,
+        computed_at=started,
+        stale_since=None,
+        build_ms=build_ms,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[_snapshots.c.scope_key],
+        set_={
+            'payload': stmt.excluded.payload,
+            'computed_at': stmt.excluded.computed_at,
+            'build_ms': stmt.excluded.build_ms,
+            'stale_since': (
+                case((_snapshots.c.version == read_version, None), else_=_snapshots.c.stale_since)
+                if read_version is not None
+                else _snapshots.c.stale_since  # Row created by a concurrent build, maybe invalidated since
+            ),
+        },
+        where=_snapshots.c.computed_at <= started,
+    )
+    try:
+        db.session.execute(stmt)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        log.error(f"[PMDashboard] Snapshot store failed for {scope_key}: {e}")
+        return _with_freshness(payload, started, 'live', build_ms)
+    return _with_freshness(payload, started, 'rebuilt', build_ms)
+
+
+def _get_refresh_executor():
+    with _lock:
+        if _state['executor'] is None:
+            _state['executor'] = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pm-dashboard')
+        return _state['executor']
+
+
+def shutdown_dashboard_refresh(wait=True):
+    """Finish (wait=True) a running 'all' rebuild and stop the executor thread."""
+    with _lock:
+        executor, _state['executor'] = _state['executor'], None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def _refresh_all_scope(app, builder):
+    """Rebuild the 'all' snapshot off the request path. Runs on the executor."""
+    try:
+        with app.app_context():
+            rebuild_dashboard_snapshot(None, True, builder)
+    except Exception as e:
+        log.error(f"[PMDashboard] Background rebuild of '{ALL_PROJECTS_SCOPE}' failed: {e}")
+    finally:
+        with _lock:
+            _state['refreshing'] = False
+
+
+def _schedule_all_scope_refresh(builder):
+    """Queue a background 'all' rebuild unless one is already queued or running."""
+    with _lock:
+        if _state['refreshing']:
+            return
+        _state['refreshing'] = True
+    try:
+        _get_refresh_executor().submit(_refresh_all_scope, current_app._get_current_object(), builder)
+    except Exception as e:
+        with _lock:
+            _state['refreshing'] = False
+        log.warning(f"[PMDashboard] Could not schedule '{ALL_PROJECTS_SCOPE}' rebuild: {e}")
+
+
+def get_dashboard_snapshot(filter_user_id, all_projects, builder, force_rebuild=False):
+    """
+    Dashboard document for the scope: one primary-key read when the snapshot
+    is fresh, otherwise a rebuild. An existing 'all' snapshot is always served
+    as is; when stale or older than PM_DASHBOARD_ALL_REFRESH_SECONDS a
+    background rebuild is scheduled.
+    """
+    if not force_rebuild:
+        row = db.session.execute(
+            select(_snapshots.c.payload, _snapshots.c.computed_at, _snapshots.c.stale_since, _snapshots.c.build_ms)
+            .where(_snapshots.c.scope_key == scope_key_for(filter_user_id, all_projects))
+        ).first()
+        if row is not None:
+            age_seconds = (datetime.utcnow() - row.computed_at).total_seconds()
+            if all_projects:
+                if row.stale_since is not None or age_seconds >= PM_DASHBOARD_ALL_REFRESH_SECONDS:
+                    _schedule_all_scope_refresh(builder)
+                return _with_freshness(row.payload, row.computed_at, 'snapshot', row.build_ms)
+            if row.stale_since is None and age_seconds < PM_DASHBOARD_MAX_AGE_SECONDS:
+                return _with_freshness(row.payload, row.computed_at, 'snapshot', row.build_ms)
+
+    return rebuild_dashboard_snapshot(filter_user_id, all_projects, builder)
@@ -0,0 +1,225 @@
+"""
+Worker Availability Engine - indexed availability lookups for labour assignment
+
+Replaces the Python-side scans in labour assignment:
+- skill matching over every active worker's JSONB skills list
+- conflict detection over every assigned requisition's JSONB assigned_worker_ids
+
+with two normalised tables (models/worker_availability.py):
+- worker_skills:   (skill_key, worker_id) using skill_matcher.canonical_skill_key
+- worker_bookings: (worker_id, work_date, start_time, end_time) per assigned requisition
+
+so "free workers with skill S on date D for window W" is one indexed query.
+
+Bookings follow the requisition: editing its date or times
+(rebook_requisition) moves the bookings to the new slot.
+
+Conflict rules:
+- Both the booking and the requested window have start/end times:
+  conflict when they overlap (new_start < existing_end AND new_end > existing_start)
+- Otherwise: conflict while the booking is not released (worker not departed).
+  This is the rule the availability listing used; the old assign-path check
+  only blocked once an arrival record existed, so a worker assigned but not
+  yet processed now also blocks an untimed assignment on the same date.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, or_, exists, select, delete, update, event
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from config.db import db
+from config.logging import get_logger
+from models.worker import Worker
+from models.labour_requisition import LabourRequisition
+from models.worker_availability import WorkerSkill, WorkerBooking
+from utils.skill_matcher import canonical_skill_key
+
+log = get_logger()
+
+# Requisition fields that define its booked slot
+REQUISITION_SLOT_FIELDS = ('required_date', 'start_time', 'end_time')
+
+
+# ---------------------------------------------------------------------------
+# worker_skills maintenance
+# ---------------------------------------------------------------------------
+
+def worker_skill_rows(worker_id: int, skills) -> List[Dict]:
+    """Build worker_skills rows (one per canonical key) from a JSONB skills list."""
+    rows = {}
+    for skill in (skills if isinstance(skills, list) else []):
+        key = canonical_skill_key(skill)
+        if key and key not in rows:
+            rows[key] = {'skill_key': key[:100], 'worker_id': worker_id, 'skill_name': str(skill).strip()[:255]}
+    return list(rows.values())
+
+
+def _sync_worker_skill_rows(connection, worker_id: int, skills):
+    connection.execute(delete(WorkerSkill.__table__).where(WorkerSkill.worker_id == worker_id))
+    rows = worker_skill_rows(worker_id, skills)
+    if rows:
+        connection.execute(pg_insert(WorkerSkill.__table__).values(rows).on_conflict_do_nothing())
+
+
+def _sync_worker_skills_after_flush(session, flush_context):
+    """Mirror Worker.skills changes into worker_skills in the same transaction."""
+    workers = [obj for obj in session.new if isinstance(obj, Worker)]
+    workers += [
+        obj for obj in session.dirty
+        if isinstance(obj, Worker) and db.inspect(obj).attrs.skills.history.has_changes()
+    ]
+    if not workers:
+        return
+
+    connection = session.connection()
+    for worker in workers:
+        if worker.worker_id is not None:
+            _sync_worker_skill_rows(connection, worker.worker_id, worker.skills)
+
+
+def register_worker_skill_sync():
+    """Install the after_flush listener that keeps worker_skills in sync."""
+    if not event.contains(Session, "after_flush", _sync_worker_skills_after_flush):
+        event.listen(Session, "after_flush", _sync_worker_skills_after_flush)
+
+
+# ---------------------------------------------------------------------------
+# worker_bookings maintenance
+# ---------------------------------------------------------------------------
+
+def book_workers(requisition: LabourRequisition, worker_ids: Iterable[int]):
+    """Replace the bookings of a requisition with one row per assigned worker."""
+    connection = db.session.connection()
+    connection.execute(
+        delete(WorkerBooking.__table__).where(WorkerBooking.requisition_id == requisition.requisition_id)
+    )
+    rows = [
+        {
+            'worker_id': int(worker_id),
+            'requisition_id': requisition.requisition_id,
+            'work_date': requisition.required_date,
+            'start_time': requisition.start_time,
+            'end_time': requisition.end_time,
+            'created_at': datetime.utcnow()
+        }
+        for worker_id in dict.fromkeys(worker_ids)
+    ]
+    if rows:
+        connection.execute(pg_insert(WorkerBooking.__table__).values(rows).on_conflict_do_nothing())
+
+
+def rebook_requisition(requisition: LabourRequisition):
+    """
+    Move a requisition's bookings to its current required_date / start_time /
+    end_time after an edit: the old slot's bookings are dropped and the
+    assigned workers booked again on the new one.
+    """
+    if requisition.assignment_status == 'assigned' and requisition.assigned_worker_ids:
+        book_workers(requisition, requisition.assigned_worker_ids)
+    else:
+        db.session.execute(
+            delete(WorkerBooking.__table__).where(WorkerBooking.requisition_id == requisition.requisition_id)
+        )
+
+
+def release_worker_booking(requisition_id: int, worker_id: int, released_at: Optional[datetime] = None):
+    """Mark a worker's booking as released (worker departed)."""
+    db.session.execute(
+        update(WorkerBooking.__table__)
+        .where(
+            WorkerBooking.requisition_id == requisition_id,
+            WorkerBooking.worker_id == worker_id,
+            WorkerBooking.released_at.is_(None)
+        )
+        .values(released_at=released_at or datetime.utcnow())
+    )
+
+
+# ---------------------------------------------------------------------------
+# Availability queries
+# ---------------------------------------------------------------------------
+
+def _conflict_condition(work_date, start_time=None, end_time=None, exclude_requisition_id=None):
+    """SQL condition on WorkerBooking (joined to its requisition) that blocks a worker."""
+    conditions = [
+        WorkerBooking.work_date == work_date,
+        LabourRequisition.requisition_id == WorkerBooking.requisition_id,
+        LabourRequisition.is_deleted == False,
+        LabourRequisition.assignment_status == 'assigned',
+    ]
+    if exclude_requisition_id:
+        conditions.append(WorkerBooking.requisition_id != exclude_requisition_id)
+
+    untimed_active = WorkerBooking.released_at.is_(None)
+    if start_time and end_time:
+        conditions.append(or_(
+            and_(
+                WorkerBooking.start_time.isnot(None),
+                WorkerBooking.end_time.isnot(None),
+                WorkerBooking.start_time < end_time,
+                WorkerBooking.end_time > start_time
+            ),
+            and_(
+                or_(WorkerBooking.start_time.is_(None), WorkerBooking.end_time.is_(None)),
+                untimed_active
+            )
+        ))
+    else:
+        conditions.append(untimed_active)
+    return and_(*conditions)
+
+
+def matching_workers_query(skill: Optional[str] = None):
+    """Active workers, optionally restricted to a skill via the worker_skills index."""
+    query = Worker.query.filter(
+        Worker.is_deleted == False,
+        Worker.status == 'active'
+    )
+    if skill:
+        key = canonical_skill_key(skill)
+        if not key:
+            return query.filter(False)
+        query = query.filter(
+            Worker.worker_id.in_(select(WorkerSkill.worker_id).where(WorkerSkill.skill_key == key))
+        )
+    return query
+
+
+def available_workers_query(skill, work_date, start_time=None, end_time=None, exclude_requisition_id=None):
+    """Single indexed query returning only workers free for the skill, date and window."""
+    busy = exists().where(
+        WorkerBooking.worker_id == Worker.worker_id,
+        _conflict_condition(work_date, start_time, end_time, exclude_requisition_id)
+    )
+    return matching_workers_query(skill).filter(~busy)
+
+
+def find_booking_conflicts(worker_ids, work_date, start_time=None, end_time=None,
+                           exclude_requisition_id=None) -> Dict[int, Dict]:
+    """
+    Return {worker_id: {'requisition_id', 'requisition_code'}} for the given
+    workers that are already booked against the date/window.
+    """
+    worker_ids = [int(w) for w in worker_ids or []]
+    if not worker_ids:
+        return {}
+
+    rows = db.session.query(
+        WorkerBooking.worker_id,
+        WorkerBooking.requisition_id,
+        LabourRequisition.requisition_code
+    ).filter(
+        WorkerBooking.worker_id.in_(worker_ids),
+        _conflict_condition(work_date, start_time, end_time, exclude_requisition_id)
+    ).order_by(WorkerBooking.worker_id, WorkerBooking.requisition_id).all()
+
+    conflicts = {}
+    for row in rows:
+        conflicts.setdefault(row.worker_id, {
+            'requisition_id': row.requisition_id,
+            'requisition_code': row.requisition_code
+        })
+    return conflicts
@@ -271,6 +271,17 @@ def send_notification_to_user(user_id, notification_data):
     return len(active_users) > 0
 
 
+def send_unread_count_to_user(user_id, unread_count):
+    """
+    Push the user's unread notification count (badge) to their room
+
+    Args:
+        user_id: Target user ID
+        unread_count: Current unread count
+    """
+    socketio.emit('notification_count', {'unread_count': unread_count}, room=f'user_{user_id}')
+
+
 def send_notification_to_role(role, notification_data):
     """
     Send notification to all users with a specific role
@@ -497,8 +508,11 @@ def init_socketio(app):
 
     Args:
         app: Flask application instance
+
+    With several server processes (gunicorn.conf.py), SOCKETIO_MESSAGE_QUEUE
+    (e.g. redis://...) relays emits between them.
     """
-    socketio.init_app(app)
+    socketio.init_app(app, message_queue=os.getenv('SOCKETIO_MESSAGE_QUEUE'))
     log.info("Socket.IO server initialized")
     return socketio
 
@@ -0,0 +1,53 @@
+"""
+Shared test fixtures.
+
+Tests run against a disposable Postgres database seeded once per session
+with the benchmark dataset (benchmarks/seed.py, small sizes). All tables in
+it are dropped and recreated, so never point TEST_DATABASE_URL at real data.
+Without TEST_DATABASE_URL the database tests are skipped.
+
+pytest-flask pushes a request context for every test that uses `app`, so
+tests use db.session and call controllers directly.
+
+Run (from backend/):
+    TEST_DATABASE_URL=postgresql://localhost/metersquare_test python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SEED_ARGS = [
+    '--reset',
+    '--projects', '8',
+    '--boq-items', '40',
+    '--crs-per-project', '30',
+    '--workers', '40',
+    # Longer than two months, so ranges cross month boundaries
+    '--attendance-days', '75',
+    '--inventory-items', '20',
+    '--vendors', '5',
+    '--vendor-products', '20',
+]
+
+
+@pytest.fixture(scope='session')
+def app():
+    """The app on TEST_DATABASE_URL with the seeded dataset (used by pytest-flask)."""
+    database_url = os.getenv('TEST_DATABASE_URL')
+    if not database_url:
+        pytest.skip("TEST_DATABASE_URL is not set (use a local, disposable Postgres database)")
+    os.environ['BENCHMARK_DATABASE_URL'] = database_url
+
+    from benchmarks.environment import configure_benchmark_environment
+    from benchmarks.seed import parse_args, seed
+
+    app = configure_benchmark_environment()
+    with app.app_context():
+        seed(parse_args(SEED_ARGS))
+    return app
+
@@ -0,0 +1,141 @@
+"""
+Rollup-backed period analytics (services/analytics_rollups.py) must equal a
+fully live aggregation for every period, before the first refresh, after a
+refresh and with dirty days. Rows are placed on the edges each period read
+splits on: the cutoff itself, the rest of the partial first day, the first
+and last instant of rolled-up days, and today (after rolled_up_through).
+"""
+
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from benchmarks.seed import _insert
+from config.db import db
+from models.inventory import InventoryMaterial, InventoryTransaction
+from models.vendor import Vendor
+from services.analytics_rollups import (
+    ROLLUP_METRICS, _aggregate_select, get_period_aggregates, refresh_analytics_rollups,
+)
+
+PERIOD_DAYS = (1, 7, 30, 90)
+NOW = datetime.utcnow()
+TODAY = datetime.combine(NOW.date(), time.min)
+# One cutoff inside a day and one on midnight for every period length
+CUTOFFS = [NOW - timedelta(days=days) for days in PERIOD_DAYS] + [TODAY - timedelta(days=days) for days in PERIOD_DAYS]
+
+
+def _edge_timestamps():
+    stamps = {TODAY, NOW, TODAY - timedelta(microseconds=1)}  # Today / end of yesterday
+    for cutoff in CUTOFFS:
+        first_day = datetime.combine(cutoff.date(), time.min)
+        stamps |= {
+            cutoff,
+            cutoff - timedelta(microseconds=1),
+            first_day,
+            first_day + timedelta(days=1) - timedelta(microseconds=1),
+            first_day + timedelta(days=1),
+        }
+    return sorted(stamp for stamp in stamps if stamp <= NOW)
+
+
+@pytest.fixture(scope='module', autouse=True)
+def edge_rows(app):
+    """Vendors and inventory transactions on every period edge."""
+    with app.app_context():
+        material_id = db.session.query(InventoryMaterial.inventory_material_id).first()[0]
+        stamps = _edge_timestamps()
+        _insert(Vendor.__table__, [
+            {
+                'company_name': f'Rollup Edge {i}',
+                'email': f'rollup-edge{i}@test.local',
+                'status': 'active',
+                'is_deleted': False,
+                'created_at': stamp,
+                'last_modified_at': stamp,
+            }
+            for i, stamp in enumerate(stamps)
+        ])
+        _insert(InventoryTransaction.__table__, [
+            {
+                'inventory_material_id': material_id,
+                'transaction_type': transaction_type,
+                'quantity': 1,
+                'unit_price': 12.5,
+                'total_amount': 12.5 * (i + 1),
+                'created_at': stamp,
+                'created_by': 'test',
+            }
+            for i, stamp in enumerate(stamps)
+            for transaction_type in ('PURCHASE', 'WITHDRAWAL')
+        ])
+        db.session.execute(db.text("DELETE FROM analytics_daily_rollups"))
+        db.session.execute(db.text("DELETE FROM analytics_rollup_state"))
+        db.session.execute(db.text("DELETE FROM analytics_rollup_dirty_days"))
+        db.session.commit()
+
+
+def _live(name, cutoff):
+    """{day: count} and {dimension: (count, amount)} computed from the source table."""
+    metric = ROLLUP_METRICS[name]
+    per_day, per_dimension = defaultdict(int), defaultdict(lambda: [0, 0.0])
+    for row in db.session.execute(
+        db.text(_aggregate_select(name, metric, f"{metric.date_column} >= :cutoff")), {'cutoff': cutoff}
+    ):
+        per_day[row.day] += row.count
+        per_dimension[row.dimension or None][0] += row.count
+        per_dimension[row.dimension or None][1] += float(row.amount or 0)
+    return dict(per_day), {dimension: tuple(values) for dimension, values in per_dimension.items()}
+
+
+def _assert_matches_live():
+    for cutoff in CUTOFFS:
+        aggregates = get_period_aggregates(cutoff)
+        for name in ROLLUP_METRICS:
+            per_day, per_dimension = _live(name, cutoff)
+            assert dict(aggregates.trend(name)) == per_day, f"{name} since {cutoff}"
+            assert aggregates.total(name) == sum(per_day.values()), f"{name} since {cutoff}"
+            served = {dimension: (count, amount) for dimension, count, amount in aggregates.breakdown(name)}
+            assert served.keys() == per_dimension.keys(), f"{name} since {cutoff}"
+            for dimension, (count, amount) in per_dimension.items():
+                assert served[dimension][0] == count, f"{name} {dimension} since {cutoff}"
+                assert served[dimension][1] == pytest.approx(amount, abs=0.005), f"{name} {dimension} since {cutoff}"
+
+
+def test_live_only_before_first_refresh():
+    _assert_matches_live()
+
+
+def test_rollups_match_live_after_refresh():
+    refreshed = refresh_analytics_rollups()
+    assert refreshed['vendors_created'] > 0
+    _assert_matches_live()
+
+
+def test_refresh_is_idempotent():
+    refresh_analytics_rollups()
+    refresh_analytics_rollups()
+    _assert_matches_live()
+
+
+def test_orm_write_to_a_rolled_up_day_is_served_live_until_refreshed():
+    day = NOW.date() - timedelta(days=7)
+    vendors = Vendor.query.filter(
+        Vendor.company_name.like('Rollup Edge %'),
+        db.func.date(Vendor.created_at) == day
+    ).all()
+    assert vendors
+    for vendor in vendors:
+        vendor.is_deleted = True
+    db.session.commit()
+
+    dirty = db.session.execute(
+        db.text("SELECT day FROM analytics_rollup_dirty_days WHERE metric = 'vendors_created'")
+    ).scalars().all()
+    assert day in dirty
+    _assert_matches_live()
+
+    refresh_analytics_rollups()
+    assert not db.session.execute(db.text("SELECT COUNT(*) FROM analytics_rollup_dirty_days")).scalar()
+    _assert_matches_live()
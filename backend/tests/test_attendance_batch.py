@@ -0,0 +1,270 @@
+"""
+Crew clock-in / clock-out (services/attendance_batch.py) through the bulk
+endpoints: per-worker outcomes for new, already clocked-in, removed,
+duplicate, unknown and badly timed workers, rows taken by another request
+between the pre-check and the upsert, and the PM dashboard snapshot of the
+project marked stale by every batch that writes.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from flask import current_app, g
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from benchmarks.seed import _insert
+from config.db import db
+from controllers.labour_assignment_controller import bulk_clock_in_workers, bulk_clock_out_workers
+from models.daily_attendance import DailyAttendance
+from models.pm_dashboard import PMDashboardSnapshot
+from models.project_member import ProjectMember, ROLE_PROJECT_MANAGER
+from models.worker import Worker
+from services import attendance_batch
+from services.pm_dashboard_read_model import scope_key_for
+
+# After the seeded attendance (which ends today), so only this module's rows are on it
+WORK_DATE = date.today() + timedelta(days=1)
+
+WORKERS = [
+    # clock-in
+    'new', 'new_other', 'clocked_in', 'removed', 'not_clocked_in', 'bad_time', 'bad_type',
+    'race_clocked_in', 'race_removed',
+    # clock-out
+    'open', 'closed', 'out_not_clocked_in', 'out_no_record', 'out_bad_time',
+]
+
+
+def _attendance(batch, name, clock_in=None, clock_out=None, is_deleted=False):
+    return {
+        'worker_id': batch[name],
+        'project_id': batch['project_id'],
+        'attendance_date': WORK_DATE,
+        'clock_in_time': datetime.combine(WORK_DATE, clock_in) if clock_in else None,
+        'clock_out_time': datetime.combine(WORK_DATE, clock_out) if clock_out else None,
+        'hourly_rate': batch['rates'][name],
+        'attendance_status': 'present',
+        'entered_by_user_id': batch['user']['user_id'],
+        'entered_by_role': 'SE',
+        'approval_status': 'pending',
+        'is_deleted': is_deleted,
+        'created_at': datetime.utcnow(),
+        'created_by': 'test',
+    }
+
+
+@pytest.fixture(scope='module')
+def batch(app):
+    """Seeded workers by role in the tests, their existing rows on WORK_DATE and the project's PM."""
+    with app.app_context():
+        membership = ProjectMember.query.filter_by(role=ROLE_PROJECT_MANAGER).order_by(ProjectMember.project_id).first()
+        workers = db.session.query(Worker.worker_id, Worker.hourly_rate).filter(
+            Worker.status == 'active', Worker.is_deleted == False
+        ).order_by(Worker.worker_id).limit(len(WORKERS)).all()
+        assert len(workers) == len(WORKERS)
+        se_id = db.session.execute(db.text(
+            "SELECT MIN(user_id) FROM users u JOIN roles r ON r.role_id = u.role_id WHERE r.role = 'siteEngineer'"
+        )).scalar()
+
+        batch = dict(zip(WORKERS, (w.worker_id for w in workers)))
+        batch.update({
+            'project_id': membership.project_id,
+            'scope_key': scope_key_for(membership.user_id),
+            'rates': dict(zip(WORKERS, (w.hourly_rate for w in workers))),
+            'unknown': db.session.query(db.func.max(Worker.worker_id)).scalar() + 1000,
+            'user': {'user_id': se_id, 'role': 'siteEngineer', 'full_name': 'Test SE'},
+        })
+        existing = [
+            _attendance(batch, 'clocked_in', clock_in=time(7, 0)),
+            _attendance(batch, 'removed', is_deleted=True),
+            _attendance(batch, 'not_clocked_in'),
+            _attendance(batch, 'race_clocked_in'),
+            _attendance(batch, 'race_removed'),
+            _attendance(batch, 'open', clock_in=time(7, 0)),
+            _attendance(batch, 'closed', clock_in=time(7, 0), clock_out=time(15, 0)),
+            _attendance(batch, 'out_not_clocked_in'),
+            _attendance(batch, 'out_bad_time', clock_in=time(7, 0)),
+        ]
+        ids = _insert(DailyAttendance.__table__, existing, pk='attendance_id')
+        batch['existing_ids'] = {row['worker_id']: attendance_id for row, attendance_id in zip(existing, ids)}
+        db.session.commit()
+    return batch
+
+
+def _fresh_snapshot(batch):
+    """Store a fresh snapshot for the project's PM; returns its version."""
+    table = PMDashboardSnapshot.__table__
+    stmt = pg_insert(table).values(
+        scope_key=batch['scope_key'], payload={}, computed_at=datetime.utcnow(), stale_since=None, version=0
+    )
+    db.session.execute(stmt.on_conflict_do_update(index_elements=[table.c.scope_key], set_={'stale_since': None}))
+    db.session.commit()
+    return _snapshot(batch).version
+
+
+def _snapshot(batch):
+    table = PMDashboardSnapshot.__table__
+    return db.session.execute(
+        select(table.c.stale_since, table.c.version).where(table.c.scope_key == batch['scope_key'])
+    ).one()
+
+
+def _post(view, batch, **body):
+    body.setdefault('project_id', batch['project_id'])
+    body.setdefault('attendance_date', WORK_DATE.isoformat())
+    with current_app.test_request_context(method='POST', json=body):
+        g.user = batch['user']
+        response, status = view()
+    return status, response.get_json()
+
+
+def _outcomes(body, worker_id):
+    return [(r['status'], r.get('error')) for r in body['results'] if r['worker_id'] == worker_id]
+
+
+def _row(batch, name):
+    return db.session.execute(
+        select(DailyAttendance.__table__).where(
+            DailyAttendance.worker_id == batch[name],
+            DailyAttendance.project_id == batch['project_id'],
+            DailyAttendance.attendance_date == WORK_DATE,
+        )
+    ).one()
+
+
+def test_bulk_clock_in(batch):
+    version = _fresh_snapshot(batch)
+
+    status, body = _post(bulk_clock_in_workers, batch, clock_in_time='07:30', workers=[
+        batch['new'],
+        {'worker_id': batch['new_other'], 'clock_in_time': f'{WORK_DATE.isoformat()}T06:45:00'},
+        batch['new'],
+        batch['clocked_in'],
+        batch['removed'],
+        batch['not_clocked_in'],
+        {'worker_id': batch['bad_time'], 'clock_in_time': '25:99'},
+        {'worker_id': batch['bad_type'], 'clock_in_time': 730},
+        batch['unknown'],
+        'abc',
+    ])
+    assert status == 200, body
+
+    assert _outcomes(body, batch['new']) == [('skipped', 'Duplicate worker in request'), ('clocked_in', None)]
+    assert _outcomes(body, batch['new_other']) == [('clocked_in', None)]
+    assert _outcomes(body, batch['clocked_in']) == [('skipped', 'Worker already clocked in for this day')]
+    assert _outcomes(body, batch['removed']) == [('error', 'Attendance record for this day was removed')]
+    assert _outcomes(body, batch['not_clocked_in']) == [('clocked_in', None)]
+    assert _outcomes(body, batch['bad_time']) == [('error', 'Invalid clock_in_time. Use HH:MM or ISO format')]
+    assert _outcomes(body, batch['bad_type']) == [('error', 'Invalid clock_in_time. Use HH:MM or ISO format')]
+    assert _outcomes(body, batch['unknown']) == [('error', 'Worker not found')]
+    assert _outcomes(body, 'abc') == [('error', 'Invalid worker_id')]
+    assert body['summary'] == {'clocked_in': 3, 'skipped': 2, 'error': 5}
+    assert {a['worker_id'] for a in body['attendance']} == {batch['new'], batch['new_other'], batch['not_clocked_in']}
+
+    new = _row(batch, 'new')
+    assert new.clock_in_time == datetime.combine(WORK_DATE, time(7, 30))
+    assert new.hourly_rate == batch['rates']['new']
+    assert new.approval_status == 'pending'
+    assert _row(batch, 'new_other').clock_in_time == datetime.combine(WORK_DATE, time(6, 45))
+    # The existing row is clocked in in place, not duplicated
+    not_clocked_in = _row(batch, 'not_clocked_in')
+    assert not_clocked_in.attendance_id == batch['existing_ids'][batch['not_clocked_in']]
+    assert not_clocked_in.clock_in_time == datetime.combine(WORK_DATE, time(7, 30))
+    assert _row(batch, 'clocked_in').clock_in_time == datetime.combine(WORK_DATE, time(7, 0))
+    assert _row(batch, 'removed').clock_in_time is None
+    for name in ('bad_time', 'bad_type'):
+        assert not DailyAttendance.query.filter_by(worker_id=batch[name], attendance_date=WORK_DATE).count()
+
+    snapshot = _snapshot(batch)
+    assert snapshot.stale_since is not None
+    assert snapshot.version > version
+
+
+def test_clocking_in_again_is_skipped_without_invalidating(batch):
+    version = _fresh_snapshot(batch)
+
+    status, body = _post(bulk_clock_in_workers, batch, workers=[batch['new'], batch['new_other']])
+    assert status == 200, body
+    assert body['summary'] == {'skipped': 2}
+    assert body['attendance'] == []
+    assert _row(batch, 'new').clock_in_time == datetime.combine(WORK_DATE, time(7, 30))
+
+    snapshot = _snapshot(batch)
+    assert snapshot.stale_since is None
+    assert snapshot.version == version
+
+
+def test_rows_taken_after_the_pre_check_are_skipped(batch, monkeypatch):
+    """Another request clocks one worker in and removes another between the pre-check and the upsert."""
+    version = _fresh_snapshot(batch)
+    table = DailyAttendance.__table__
+    parse_clock_time = attendance_batch.parse_clock_time
+    raced = []
+
+    def parse_after_concurrent_writes(value, target_date):
+        if not raced:
+            with db.engine.begin() as connection:
+                day = (table.c.project_id == batch['project_id']) & (table.c.attendance_date == WORK_DATE)
+                connection.execute(update(table).where(day, table.c.worker_id == batch['race_clocked_in'])
+                                   .values(clock_in_time=datetime.combine(WORK_DATE, time(6, 0))))
+                connection.execute(update(table).where(day, table.c.worker_id == batch['race_removed'])
+                                   .values(is_deleted=True))
+            raced.append(True)
+        return parse_clock_time(value, target_date)
+
+    monkeypatch.setattr(attendance_batch, 'parse_clock_time', parse_after_concurrent_writes)
+    status, body = _post(bulk_clock_in_workers, batch, clock_in_time='07:30',
+                         workers=[batch['race_clocked_in'], batch['race_removed']])
+    assert status == 200, body
+
+    assert raced
+    for name in ('race_clocked_in', 'race_removed'):
+        assert _outcomes(body, batch[name]) == [('skipped', 'Worker already clocked in for this day')]
+    assert _row(batch, 'race_clocked_in').clock_in_time == datetime.combine(WORK_DATE, time(6, 0))
+    assert _row(batch, 'race_removed').clock_in_time is None
+
+    snapshot = _snapshot(batch)
+    assert snapshot.stale_since is None
+    assert snapshot.version == version
+
+
+def test_bulk_clock_out(batch):
+    version = _fresh_snapshot(batch)
+
+    status, body = _post(bulk_clock_out_workers, batch, clock_out_time='16:00', break_duration_minutes=30, workers=[
+        batch['open'],
+        batch['closed'],
+        batch['out_not_clocked_in'],
+        batch['out_no_record'],
+        batch['removed'],
+        {'worker_id': batch['out_bad_time'], 'clock_out_time': 1600},
+    ])
+    assert status == 200, body
+
+    assert _outcomes(body, batch['open']) == [('clocked_out', None)]
+    assert _outcomes(body, batch['closed']) == [('skipped', 'Worker already clocked out')]
+    assert _outcomes(body, batch['out_not_clocked_in']) == [('error', 'Worker has not clocked in')]
+    for name in ('out_no_record', 'removed'):
+        assert _outcomes(body, batch[name]) == [('error', 'No clock-in record found for this worker')]
+    assert _outcomes(body, batch['out_bad_time']) == [
+        ('error', 'Invalid clock_out_time or break_duration_minutes')
+    ]
+    assert body['summary'] == {'clocked_out': 1, 'skipped': 1, 'error': 4}
+
+    row = _row(batch, 'open')
+    assert row.clock_out_time == datetime.combine(WORK_DATE, time(16, 0))
+    assert row.total_hours == pytest.approx(8.5)
+    assert row.attendance_status == 'completed'
+    assert _row(batch, 'closed').clock_out_time == datetime.combine(WORK_DATE, time(15, 0))
+    assert _row(batch, 'out_bad_time').clock_out_time is None
+
+    # Clock-out goes through the ORM, so the after_flush listener invalidates
+    snapshot = _snapshot(batch)
+    assert snapshot.stale_since is not None
+    assert snapshot.version > version
+
+
+def test_batch_without_project_is_rejected(batch):
+    status, body = _post(bulk_clock_in_workers, batch, project_id=None, workers=[batch['new']])
+    assert status == 400
+    assert body['error'] == 'project_id is required'
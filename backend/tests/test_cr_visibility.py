@@ -0,0 +1,133 @@
+"""
+cr_visibility index vs the legacy per-request inbox filters
+(services/cr_visibility.py): for every SE / PM / MEP / estimator user the
+indexed inbox must return exactly the CRs legacy_inbox_filter() returns,
+after seeding and after ORM writes that move visibility.
+"""
+
+import pytest
+
+from config.db import db
+from models.change_request import ChangeRequest
+from models.pm_assign_ss import PMAssignSS
+from models.project import Project
+from models.role import Role
+from models.user import User
+from services.cr_visibility import (
+    ESTIMATOR_ROLES, MEP_ROLES, PM_ROLES, SE_ROLES,
+    inbox_filter, legacy_inbox_filter, refresh_cr_visibility,
+)
+
+HANDLED_ROLES = SE_ROLES + PM_ROLES + MEP_ROLES + ESTIMATOR_ROLES
+
+
+@pytest.fixture(scope='module', autouse=True)
+def visibility_index(app):
+    """Assign site engineers to half of the projects, then build the index from scratch."""
+    with app.app_context():
+        projects = Project.query.filter_by(is_deleted=False).order_by(Project.project_id).all()
+        for project in projects[::2]:
+            db.session.add(PMAssignSS(
+                project_id=project.project_id,
+                assigned_to_se_id=project.site_supervisor_id,
+                assigned_by_pm_id=project.user_id[0] if project.user_id else None,
+                is_deleted=False,
+            ))
+        db.session.commit()
+        # Seeded CRs were bulk-inserted, bypassing the after_flush sync
+        refresh_cr_visibility(rebuild_all=True)
+        db.session.commit()
+
+
+def _role_users():
+    return [
+        (user_id, role.lower())
+        for user_id, role in db.session.query(User.user_id, Role.role)
+        .join(Role, Role.role_id == User.role_id)
+        .filter(User.is_deleted == False, db.func.lower(Role.role).in_(HANDLED_ROLES))
+        .order_by(User.user_id)
+    ]
+
+
+def _inbox(criterion):
+    return {
+        cr_id for (cr_id,) in db.session.query(ChangeRequest.cr_id)
+        .filter(ChangeRequest.is_deleted == False, criterion)
+    }
+
+
+def _assert_inboxes_match(users=None):
+    users = users or _role_users()
+    assert users
+    for user_id, role in users:
+        expected = _inbox(legacy_inbox_filter(role, user_id))
+        actual = _inbox(inbox_filter(role, user_id))
+        assert actual == expected, (
+            f"user {user_id} ({role}): missing {sorted(expected - actual)[:20]}, "
+            f"extra {sorted(actual - expected)[:20]}"
+        )
+
+
+def test_seeded_dataset_covers_every_inbox_role():
+    roles = {role for _, role in _role_users()}
+    for group in (SE_ROLES, PM_ROLES, MEP_ROLES, ESTIMATOR_ROLES):
+        assert roles & set(group)
+
+
+def test_index_matches_legacy_filters_for_every_user():
+    _assert_inboxes_match()
+
+
+def test_index_follows_cr_writes():
+    crs = ChangeRequest.query.filter_by(is_deleted=False).order_by(ChangeRequest.cr_id).limit(6).all()
+    crs[0].status = 'send_to_pm'
+    crs[1].requested_by_role = 'admin'
+    crs[2].approval_required_from = 'estimator'
+    crs[3].pm_approved_by_user_id = crs[3].assigned_to_pm_user_id
+    crs[4].is_deleted = True
+    db.session.commit()
+
+    _assert_inboxes_match()
+
+
+def test_index_follows_pm_reassignment():
+    project = Project.query.filter_by(is_deleted=False).order_by(Project.project_id).first()
+    previous_pm = project.user_id[0]
+    new_pm = next(
+        user_id for user_id, role in _role_users() if role in PM_ROLES and user_id != previous_pm
+    )
+    project.user_id = [new_pm]
+    db.session.commit()
+
+    _assert_inboxes_match([(previous_pm, 'projectmanager'), (new_pm, 'projectmanager')])
+    _assert_inboxes_match()
+
+
+def test_index_follows_pm_unassignment():
+    """Removing a PM from all their projects (projectmanager_controller) keeps the index in step."""
+    from models.project_member import ROLE_PROJECT_MANAGER
+    from utils.project_membership import project_member_filter
+
+    pm_id = next(user_id for user_id, role in _role_users() if role in PM_ROLES)
+    for project in Project.query.filter(project_member_filter(pm_id, ROLE_PROJECT_MANAGER)).all():
+        remaining = [user_id for user_id in project.user_id if user_id != pm_id]
+        project.user_id = remaining or None
+    db.session.commit()
+
+    assert not Project.query.filter(project_member_filter(pm_id, ROLE_PROJECT_MANAGER)).count()
+    _assert_inboxes_match()
+
+
+def test_index_follows_se_assignment_changes():
+    assignment = PMAssignSS.query.filter_by(is_deleted=False).order_by(PMAssignSS.pm_assign_id).first()
+    se_id = assignment.assigned_to_se_id
+    assignment.is_deleted = True
+    unassigned = Project.query.filter(
+        Project.is_deleted == False,
+        ~Project.project_id.in_(db.session.query(PMAssignSS.project_id).filter(PMAssignSS.is_deleted == False))
+    ).first()
+    if unassigned is not None:
+        db.session.add(PMAssignSS(project_id=unassigned.project_id, assigned_to_se_id=se_id, is_deleted=False))
+    db.session.commit()
+
+    _assert_inboxes_match()
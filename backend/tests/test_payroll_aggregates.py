@@ -0,0 +1,170 @@
+"""
+Payroll summary from payroll_daily_aggregates (services/payroll_aggregates.py)
+vs the raw computation over daily_attendance: the same rows for arbitrary
+ranges, ranges across month boundaries and single locked days, also after
+attendance is locked, corrected, moved or deleted through the ORM.
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from config.db import db
+from models.daily_attendance import DailyAttendance
+from services.payroll_aggregates import (
+    payroll_summary_rows, raw_payroll_summary_rows, rebuild_payroll_aggregates,
+)
+
+
+@pytest.fixture(scope='module', autouse=True)
+def aggregates(app):
+    """Seeded attendance was bulk-inserted, bypassing the after_flush sync."""
+    with app.app_context():
+        rebuild_payroll_aggregates()
+
+
+def _values(rows):
+    return {
+        (r.project_id, r.requisition_id, r.worker_id): (
+            int(r.days_worked or 0),
+            round(float(r.total_hours or 0), 2),
+            round(float(r.regular_hours or 0), 2),
+            round(float(r.overtime_hours or 0), 2),
+            round(float(r.total_cost or 0), 2),
+        )
+        for r in rows
+    }
+
+
+def _assert_summary_matches(start, end, project_id=None):
+    expected = _values(raw_payroll_summary_rows(start, end, project_id))
+    assert _values(payroll_summary_rows(start, end, project_id)) == expected, f"{start}..{end} project={project_id}"
+    return expected
+
+
+def _attendance_bounds():
+    return db.session.query(
+        db.func.min(DailyAttendance.attendance_date), db.func.max(DailyAttendance.attendance_date)
+    ).filter(DailyAttendance.is_deleted == False).one()
+
+
+def _month_starts(first, last):
+    month = date(first.year, first.month, 1)
+    starts = []
+    while month <= last:
+        if month > first:
+            starts.append(month)
+        month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+    return starts
+
+
+def _locked_day():
+    return db.session.query(DailyAttendance.attendance_date).filter(
+        DailyAttendance.approval_status == 'locked', DailyAttendance.is_deleted == False
+    ).order_by(DailyAttendance.attendance_date).first()[0]
+
+
+def _project_ids():
+    return [p for (p,) in db.session.query(DailyAttendance.project_id).distinct().order_by(DailyAttendance.project_id)]
+
+
+def test_full_history():
+    first, last = _attendance_bounds()
+    assert _assert_summary_matches(first, last)
+
+
+def test_ranges_across_month_boundaries():
+    first, last = _attendance_bounds()
+    month_starts = _month_starts(first, last)
+    assert month_starts, "seeded attendance must span a month boundary"
+
+    for month_start in month_starts:
+        month_end = month_start - timedelta(days=1)
+        _assert_summary_matches(month_end, month_start)
+        _assert_summary_matches(month_start - timedelta(days=10), month_start + timedelta(days=10))
+        _assert_summary_matches(first, month_end)
+        _assert_summary_matches(month_start, last)
+        for project_id in _project_ids():
+            _assert_summary_matches(month_end - timedelta(days=3), month_start + timedelta(days=3), project_id)
+
+
+def test_single_locked_days():
+    day = _locked_day()
+    assert _assert_summary_matches(day, day)
+    for project_id in _project_ids():
+        _assert_summary_matches(day, day, project_id)
+
+
+def test_arbitrary_ranges():
+    first, last = _attendance_bounds()
+    span = (last - first).days
+    rng = random.Random(47)
+    project_ids = _project_ids() + [None]
+    for _ in range(40):
+        start = first + timedelta(days=rng.randint(-5, span))
+        end = start + timedelta(days=rng.randint(0, span + 5))
+        _assert_summary_matches(start, end, rng.choice(project_ids))
+
+
+def test_empty_and_inverted_ranges():
+    first, last = _attendance_bounds()
+    assert not _assert_summary_matches(last + timedelta(days=1), last + timedelta(days=30))
+    assert not _assert_summary_matches(last, first - timedelta(days=1))
+
+
+def test_locking_a_day_through_the_orm():
+    pending = DailyAttendance.query.filter_by(approval_status='pending', is_deleted=False).order_by(
+        DailyAttendance.attendance_date, DailyAttendance.project_id
+    ).first()
+    day, project_id = pending.attendance_date, pending.project_id
+    before = _assert_summary_matches(day, day, project_id)
+
+    # Same as lock_day_attendance: every pending record of the project's day
+    for attendance in DailyAttendance.query.filter_by(
+        attendance_date=day, project_id=project_id, approval_status='pending', is_deleted=False
+    ).all():
+        attendance.approval_status = 'locked'
+    db.session.commit()
+
+    assert _assert_summary_matches(day, day, project_id) != before
+    _assert_summary_matches(day - timedelta(days=1), day + timedelta(days=1))
+
+
+def test_corrections_moves_and_deletes_of_locked_attendance():
+    day = _locked_day()
+    locked = DailyAttendance.query.filter_by(approval_status='locked', is_deleted=False).filter(
+        DailyAttendance.attendance_date > day
+    ).order_by(DailyAttendance.attendance_id).limit(3).all()
+    assert len(locked) == 3
+
+    corrected, moved, deleted = locked
+    corrected.total_hours = 11
+    corrected.overtime_hours = 3
+    corrected.total_cost = round(11 * corrected.hourly_rate, 2)
+    # Into another month: both the old and the new day rows are recomputed
+    moved_from = moved.attendance_date
+    moved_to = moved_from - timedelta(days=31)
+    while DailyAttendance.query.filter_by(
+        worker_id=moved.worker_id, project_id=moved.project_id, attendance_date=moved_to
+    ).count():
+        moved_to -= timedelta(days=1)
+    moved.attendance_date = moved_to
+    deleted.is_deleted = True
+    db.session.commit()
+
+    first, last = _attendance_bounds()
+    _assert_summary_matches(first, last)
+    for changed_day in (corrected.attendance_date, moved_from, moved.attendance_date, deleted.attendance_date):
+        _assert_summary_matches(changed_day, changed_day)
+
+
+def test_unlocking_removes_the_day_rows():
+    attendance = DailyAttendance.query.filter_by(approval_status='locked', is_deleted=False).order_by(
+        DailyAttendance.attendance_id.desc()
+    ).first()
+    day, project_id = attendance.attendance_date, attendance.project_id
+    attendance.approval_status = 'pending'
+    db.session.commit()
+
+    _assert_summary_matches(day, day, project_id)
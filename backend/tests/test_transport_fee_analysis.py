@@ -0,0 +1,169 @@
+"""
+Set-based transport analytics (utils/transport_fee_analysis.py) vs the BOQ
+Profit Report's per-project Transport Details (get_profit_report), which
+applies the dedup rules row by row: vendor-to-store PURCHASE transport once
+per MSQ-IN delivery batch (latest non-zero fee), DRAFT / CANCELLED notes and
+deleted requisitions excluded.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from benchmarks.seed import _insert
+from config.db import db
+from controllers.boq_tracking_controller import get_profit_report
+from models.boq import BOQ
+from models.inventory import InventoryMaterial, InventoryTransaction, MaterialDeliveryNote, ReturnDeliveryNote
+from models.labour_requisition import LabourRequisition
+from models.returnable_assets import AssetDeliveryNote, AssetReturnDeliveryNote
+from utils.transport_fee_analysis import (
+    get_actual_transport_by_project,
+    get_all_projects_transport_comparison,
+    get_estimated_transport_by_project,
+    get_project_transport_comparison,
+)
+
+
+def _purchase(material_id, project_id, batch_ref, fee, created_at, transaction_type='PURCHASE'):
+    return {
+        'inventory_material_id': material_id,
+        'project_id': project_id,
+        'transaction_type': transaction_type,
+        'quantity': 10,
+        'unit_price': 5.0,
+        'total_amount': 50.0,
+        'delivery_batch_ref': batch_ref,
+        'transport_fee': fee,
+        'created_at': created_at,
+        'created_by': 'test',
+    }
+
+
+def _transport_rows(project_id, index, material_id, requester_id):
+    """Every source, each with rows the report counts and rows it must skip."""
+    now = datetime.utcnow()
+    code = f'{project_id}-{index}'
+    transactions = [
+        # Same batch stocked in twice: only the latest fee counts
+        _purchase(material_id, project_id, f'MSQ-IN-{code}-A', 40.0, now - timedelta(days=3)),
+        _purchase(material_id, project_id, f'MSQ-IN-{code}-A', 55.0, now - timedelta(days=2)),
+        # Latest row without a fee: the batch falls back to its earlier fee
+        _purchase(material_id, project_id, f'MSQ-IN-{code}-B', 30.0, now - timedelta(days=2)),
+        _purchase(material_id, project_id, f'MSQ-IN-{code}-B', 0.0, now - timedelta(days=1)),
+        _purchase(material_id, project_id, f'MSQ-IN-{code}-C', None, now),
+        # Not counted: unlinked stock-in, no batch, withdrawal
+        _purchase(material_id, project_id, f'OLD-{code}', 70.0, now),
+        _purchase(material_id, project_id, None, 80.0, now),
+        _purchase(material_id, project_id, f'MSQ-IN-{code}-D', 90.0, now, transaction_type='WITHDRAWAL'),
+    ]
+
+    def note(number_field, number, status, fee, **extra):
+        return {number_field: number, 'project_id': project_id, 'status': status, 'transport_fee': fee,
+                'prepared_by': 'test', 'created_by': 'test', 'created_at': now, **extra}
+
+    delivery_notes = [
+        note('delivery_note_number', f'MDN-T{code}-{i}', status, fee, delivery_date=now)
+        for i, (status, fee) in enumerate([('ISSUED', 100.0), ('DELIVERED', None), ('DRAFT', 15.0), ('CANCELLED', 25.0)])
+    ]
+    return_notes = [
+        note('return_note_number', f'RDN-T{code}-{i}', status, fee,
+             return_date=now, returned_by='test', driver_name='Driver')
+        for i, (status, fee) in enumerate([('RECEIVED', 35.5), ('IN_TRANSIT', 12.25), ('DRAFT', 60.0)])
+    ]
+    asset_deliveries = [
+        note('adn_number', f'ADN-T{code}-{i}', status, fee, delivery_date=now)
+        for i, (status, fee) in enumerate([('DISPATCHED', 45.0), ('CANCELLED', 20.0)])
+    ]
+    asset_returns = [
+        note('ardn_number', f'ARDN-T{code}-{i}', status, fee, return_date=now, returned_by='test')
+        for i, (status, fee) in enumerate([('PROCESSED', 22.0), ('DRAFT', 18.0)])
+    ]
+    requisitions = [
+        {
+            'requisition_code': f'REQ-T{code}-{i}',
+            'project_id': project_id,
+            'site_name': 'Site',
+            'required_date': now.date(),
+            'labour_items': [],
+            'requested_by_user_id': requester_id,
+            'requested_by_name': 'test',
+            'transport_fee': fee,
+            'is_deleted': deleted,
+            'created_at': now,
+            'created_by': 'test',
+        }
+        for i, (fee, deleted) in enumerate([(65.0, False), (0.0, False), (95.0, True)])
+    ]
+    return [
+        (InventoryTransaction, transactions),
+        (MaterialDeliveryNote, delivery_notes),
+        (ReturnDeliveryNote, return_notes),
+        (AssetDeliveryNote, asset_deliveries),
+        (AssetReturnDeliveryNote, asset_returns),
+        (LabourRequisition, requisitions),
+    ]
+
+
+@pytest.fixture(scope='module', autouse=True)
+def transport_records(app):
+    """Transport rows on every seeded project except the last (which keeps none)."""
+    with app.app_context():
+        material_id = db.session.query(InventoryMaterial.inventory_material_id).first()[0]
+        requester_id = db.session.execute(db.text("SELECT MIN(user_id) FROM users")).scalar()
+        project_ids = [p for (p,) in db.session.query(BOQ.project_id).filter(BOQ.is_deleted == False)
+                       .order_by(BOQ.project_id).distinct()]
+        for index, project_id in enumerate(project_ids[:-1]):
+            for model, rows in _transport_rows(project_id, index, material_id, requester_id):
+                _insert(model.__table__, rows)
+        db.session.commit()
+
+
+def _profit_report(boq_id):
+    response, status = get_profit_report(boq_id)
+    assert status == 200, response.get_json()
+    return response.get_json()
+
+
+def test_grouped_query_matches_profit_report_per_project():
+    boqs = BOQ.query.filter_by(is_deleted=False).order_by(BOQ.project_id).all()
+    actual = get_actual_transport_by_project()
+    estimated = get_estimated_transport_by_project()
+    assert boqs
+
+    for boq in boqs:
+        report = _profit_report(boq.boq_id)['transport']
+        breakdown = actual.get(boq.project_id, {})
+        assert float(sum(breakdown.values(), Decimal('0'))) == pytest.approx(report['actual'], abs=0.01), boq.project_id
+        assert float(estimated.get(boq.project_id, 0)) == pytest.approx(report['planned'], abs=0.01), boq.project_id
+
+
+def test_breakdown_applies_dedup_rules():
+    project_id = BOQ.query.filter_by(is_deleted=False).order_by(BOQ.project_id).first().project_id
+    breakdown = get_actual_transport_by_project([project_id])[project_id]
+
+    assert breakdown['vendor_to_store'] == Decimal('85')  # 55 (batch A, latest) + 30 (batch B)
+    assert breakdown['store_to_site'] == Decimal('100')
+    assert breakdown['site_to_store'] == Decimal('47.75')
+    assert breakdown['asset_delivery'] == Decimal('45')
+    assert breakdown['asset_return'] == Decimal('22')
+    assert breakdown['labour_transport'] == Decimal('65')
+
+
+def test_project_without_transport_spend():
+    project_id = BOQ.query.filter_by(is_deleted=False).order_by(BOQ.project_id.desc()).first().project_id
+    comparison = get_project_transport_comparison(project_id)
+
+    assert comparison['actual_transport_spent'] == 0
+    assert set(comparison['breakdown'].values()) == {0}
+    assert comparison['boq_estimated_transport'] == pytest.approx(
+        _profit_report(BOQ.query.filter_by(project_id=project_id).first().boq_id)['transport']['planned'], abs=0.01
+    )
+
+
+def test_all_projects_comparison_matches_single_project():
+    comparisons = get_all_projects_transport_comparison(use_cache=False)
+    assert comparisons
+    for comparison in comparisons:
+        assert get_project_transport_comparison(comparison['project_id']) == comparison
@@ -4,7 +4,6 @@ Asynchronous email sending using threading to prevent blocking
 import threading
 import queue
 import time
-from datetime import datetime, timedelta
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -29,8 +28,8 @@ ENVIRONMENT = os.environ.get("ENVIRONMENT")
 email_queue = queue.Queue()
 email_worker = None
 
-# OTP storage (shared with authentication.py)
-from utils.authentication import otp_storage
+# OTP store (shared across workers, see utils/otp_store.py)
+from utils.otp_store import get_otp_store
 
 def email_worker_thread():
     """Background thread that processes email queue"""
@@ -200,11 +199,8 @@ def send_otp_async(email_id):
         # Generate OTP
         otp = random.randint(100000, 999999)
 
-        # Store OTP in memory (immediate)
-        otp_storage[email_id] = {
-            "otp": otp,
-            "expires_at": (datetime.utcnow() + timedelta(seconds=300)).timestamp()
-        }
+        # Store OTP in the shared store (expires after SecurityConfig.OTP_EXPIRES)
+        get_otp_store().save(email_id, {"otp": otp})
 
         # Start email worker thread if not running
         if email_worker is None or not email_worker.is_alive():
@@ -9,6 +9,7 @@ from email.mime.image import MIMEImage
 from email.header import Header
 from email.utils import formataddr
 from datetime import datetime, timedelta
+from functools import lru_cache
 from sqlalchemy import func
 import jwt
 from models.user import User
@@ -42,7 +43,7 @@ EMAIL_PORT = int(os.getenv("EMAIL_PORT", "465"))
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "True").lower() == "true"
 SECRET_KEY = os.getenv('SECRET_KEY')
 
-otp_storage = {}
+from utils.otp_store import get_otp_store, check_otp
 
 
 def parse_user_agent(user_agent_string):
@@ -52,7 +53,12 @@ def parse_user_agent(user_agent_string):
     """
     if not user_agent_string:
         return {'device_type': 'unknown', 'browser': 'unknown', 'os': 'unknown'}
+    return dict(_parse_user_agent_cached(user_agent_string))
 
+
+@lru_cache(maxsize=1024)
+def _parse_user_agent_cached(user_agent_string):
+    """Memoised UA parsing keyed by the raw UA string (returns an immutable tuple of pairs)"""
     ua = user_agent_string.lower()
 
     # Detect device type
@@ -95,21 +101,23 @@ def parse_user_agent(user_agent_string):
     else:
         os_name = 'Unknown OS'
 
-    return {
-        'device_type': device_type,
-        'browser': browser,
-        'os': os_name
-    }
+    return (
+        ('device_type', device_type),
+        ('browser', browser),
+        ('os', os_name)
+    )
 
 
 def record_login_history(user_id, login_method='email_otp'):
     """
     Record a login event to the login_history table
-    Extracts IP address and user agent from the current request
+    Extracts IP address and user agent from the current request and queues
+    the row for the background writer (utils/login_history_writer.py), so the
+    login response never waits on the insert.
     """
     try:
-        from models.login_history import LoginHistory
-        from config.db import db
+        from flask import current_app
+        from utils.login_history_writer import enqueue_login_event
 
         # Get client info from request
         ip_address = request.headers.get('X-Forwarded-For', request.remote_addr)
@@ -119,28 +127,24 @@ def record_login_history(user_id, login_method='email_otp'):
         user_agent = request.headers.get('User-Agent', '')
         ua_info = parse_user_agent(user_agent)
 
-        # Create login history record
-        login_record = LoginHistory(
-            user_id=user_id,
-            ip_address=ip_address,
-            user_agent=user_agent[:500] if user_agent else None,  # Truncate if too long
-            device_type=ua_info['device_type'],
-            browser=ua_info['browser'],
-            os=ua_info['os'],
-            login_method=login_method
-        )
-
-        db.session.add(login_record)
-        db.session.commit()
-
-        log.debug(f"Recorded login for user {user_id} ({ua_info['browser']} on {ua_info['os']})")
-
-        return login_record.id
+        now = datetime.utcnow()
+        return enqueue_login_event(current_app._get_current_object(), {
+            'user_id': user_id,
+            'login_at': now,
+            'ip_address': ip_address[:45] if ip_address else None,
+            'user_agent': user_agent[:500] if user_agent else None,  # Truncate if too long
+            'device_type': ua_info['device_type'],
+            'browser': ua_info['browser'],
+            'os': ua_info['os'],
+            'login_method': login_method,
+            'status': 'active',
+            'created_at': now
+        })
 
     except Exception as e:
-        log.error(f"Failed to record login history: {str(e)}")
+        log.error(f"Failed to queue login history: {str(e)}")
         # Don't fail the login if history recording fails
-        return None
+        return False
 
 
 def get_logo_base64():
@@ -188,10 +192,7 @@ def get_logo_base64():
 def send_otp(email_id):
     try:
         otp = random.randint(100000, 999999)
-        otp_storage[email_id] = {
-            "otp": otp,
-            "expires_at": (datetime.utcnow() + timedelta(seconds=300)).timestamp()
-        }
+        get_otp_store().save(email_id, {"otp": otp})
         
         sender_email = SENDER_EMAIL
         password = SENDER_EMAIL_PASSWORD
@@ -403,7 +404,8 @@ def verification_otp():
         return jsonify({"error": "OTP must be a number"}), 400
     
     # Get OTP data from storage first to check if role was specified
-    otp_data = otp_storage.get(email_id)
+    otp_store = get_otp_store()
+    otp_data = otp_store.get(email_id)
     if not otp_data:
         on_login_failed(email_id)  # Audit log - potential brute force attempt
         return jsonify({"error": "OTP not found or expired"}), 400
@@ -433,23 +435,13 @@ def verification_otp():
         else:
             return jsonify({"error": "User not found or inactive"}), 404
     
-    # OTP data already retrieved above
-    stored_otp = otp_data.get("otp")
-    expires_at = datetime.fromtimestamp(otp_data.get("expires_at"))
-    
-    log.info(f"Stored OTP for {email_id}: {stored_otp}, Input OTP: {otp_input}")
-
-    # Check if OTP matches
-    if otp_input != stored_otp:
+    # Check if OTP matches (expiry is enforced by the store TTL, failed attempts are counted)
+    otp_data, otp_error = check_otp(email_id, otp_input)
+    if otp_error:
         on_login_failed(email_id)  # Audit log failed attempt
-        return jsonify({"error": "Invalid OTP"}), 400
+        return jsonify({"error": otp_error}), 400
 
-    # Check expiry
     current_time = datetime.utcnow()
-    if current_time > expires_at:
-        del otp_storage[email_id]
-        on_login_failed(email_id)  # Audit log expired OTP attempt
-        return jsonify({"error": "OTP expired"}), 400
     
     # Update last login and set user status to online
     user.last_login = current_time
@@ -463,7 +455,7 @@ def verification_otp():
     on_login_success(user.user_id)
 
     # OTP verified, remove from storage
-    del otp_storage[email_id]
+    otp_store.delete(email_id)
     
     # Get role information safely
     role_permissions = []
@@ -0,0 +1,170 @@
+"""
+Versioned cache of the catalog full-tree payload.
+
+GET /api/catalog-items/full-tree returns every active catalog item with its
+sub-items, linked materials and creator names. It used to be built on every
+request from chained joinedloads (one wide cartesian result set) and
+serialised with to_dict_full() each time an estimator opened the import
+dialog.
+
+The tree is now:
+- loaded with selectinload (one flat query per level)
+- serialised once to JSON bytes, plus a gzip-precompressed copy and an ETag
+- cached per process and in the Flask-Caching backend (Redis when
+  configured) under a catalog version token
+
+Invalidation: catalog item / sub-item / material-link and raw material write
+endpoints call invalidate_catalog_tree(), which bumps the shared version so
+every worker rebuilds on its next read. Out-of-band edits (migrations,
+manual SQL) are bounded by TREE_TTL_SECONDS: a tree records when it was built,
+workers rebuild once it is older than that, and the shared copy expires at
+the same age, so reloading it can't extend staleness. If the version key is
+evicted, a new random version is seeded (cache.add), so trees stored under
+an earlier version are never served again.
+
+Usage:
+    from utils.catalog_tree_cache import get_catalog_tree, invalidate_catalog_tree
+
+    tree = get_catalog_tree()   # CatalogTree(body, gzip_body, etag, version, built_at)
+"""
+
+import gzip
+import hashlib
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+from flask import current_app, has_app_context
+from sqlalchemy.orm import selectinload
+from config.logging import get_logger
+
+log = get_logger()
+
+CATALOG_VERSION_KEY = 'catalog:version'
+CATALOG_TREE_KEY = 'catalog:full_tree:{version}'
+TREE_TTL_SECONDS = 300  # Upper bound on staleness without an explicit invalidation
+GZIP_LEVEL = 6
+
+CatalogTree = namedtuple('CatalogTree', ['body', 'gzip_body', 'etag', 'version', 'built_at'])
+
+_lock = threading.Lock()
+_state = {
+    'tree': None,  # CatalogTree, its version is the shared token it was loaded for
+}
+
+
+def _shared_cache():
+    if has_app_context():
+        return getattr(current_app, 'cache', None)
+    return None
+
+
+def _shared_version():
+    cache = _shared_cache()
+    if cache is None:
+        return None
+    try:
+        version = cache.get(CATALOG_VERSION_KEY)
+        if version is None:
+            # Evicted or never set: seed a new version (first writer wins) instead of
+            # a fixed one, so no tree cached under an earlier version is reused
+            cache.add(CATALOG_VERSION_KEY, uuid.uuid4().hex, timeout=0)
+            version = cache.get(CATALOG_VERSION_KEY)
+        return version
+    except Exception as e:
+        log.warning(f"[CatalogTree] Could not read shared version: {e}")
+        return None
+
+
+def _expired(tree):
+    return time.time() - tree.built_at > TREE_TTL_SECONDS
+
+
+def _fresh_tree(shared_version):
+    """The local tree if it is current, else None (one read of _state['tree'], which invalidation may clear)."""
+    tree = _state['tree']
+    if tree is None or _expired(tree):
+        return None
+    return tree if shared_version is None or shared_version == tree.version else None
+
+
+def build_catalog_tree_payload():
+    """The full-tree response document, loaded level by level with selectinload."""
+    from models.catalog_item import CatalogItem, CatalogSubItem, CatalogSubItemMaterial
+
+    items = CatalogItem.query.filter(
+        CatalogItem.is_active == True
+    ).options(
+        selectinload(CatalogItem.creator),
+        selectinload(CatalogItem.sub_items)
+        .selectinload(CatalogSubItem.creator),
+        selectinload(CatalogItem.sub_items)
+        .selectinload(CatalogSubItem.material_links)
+        .selectinload(CatalogSubItemMaterial.raw_material)
+    ).order_by(CatalogItem.item_name.asc()).all()
+
+    return {
+        'success': True,
+        'items': [item.to_dict_full() for item in items],
+        'total_count': len(items)
+    }
+
+
+def _serialise(payload, version):
+    body = current_app.json.dumps(payload).encode('utf-8')
+    return CatalogTree(
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=GZIP_LEVEL),
+        etag=hashlib.sha1(body).hexdigest(),
+        version=version,
+        built_at=time.time(),
+    )
+
+
+def _load_tree(shared_version):
+    cache = _shared_cache()
+    key = CATALOG_TREE_KEY.format(version=shared_version)
+    tree = None
+    if cache is not None and shared_version is not None:
+        try:
+            cached = cache.get(key)
+            if cached:
+                tree = CatalogTree(*cached)
+                if _expired(tree):
+                    tree = None
+        except Exception as e:
+            log.warning(f"[CatalogTree] Could not read shared tree: {e}")
+
+    if tree is None:
+        tree = _serialise(build_catalog_tree_payload(), shared_version)
+        if cache is not None and shared_version is not None:
+            try:
+                cache.set(key, tuple(tree), timeout=TREE_TTL_SECONDS)
+            except Exception as e:
+                log.warning(f"[CatalogTree] Could not store shared tree: {e}")
+
+    _state['tree'] = tree
+    return tree
+
+
+def get_catalog_tree():
+    """Serialised full tree for the current catalog version, at most TREE_TTL_SECONDS old."""
+    shared_version = _shared_version()
+    tree = _fresh_tree(shared_version)
+    if tree is None:
+        with _lock:
+            tree = _fresh_tree(shared_version) or _load_tree(shared_version)
+    return tree
+
+
+def invalidate_catalog_tree():
+    """Drop the local copy and bump the shared version so every worker rebuilds."""
+    with _lock:
+        _state['tree'] = None
+    cache = _shared_cache()
+    if cache is not None:
+        try:
+            cache.set(CATALOG_VERSION_KEY, uuid.uuid4().hex, timeout=0)
+        except Exception as e:
+            log.warning(f"[CatalogTree] Could not bump shared version: {e}")
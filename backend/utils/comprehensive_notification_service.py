@@ -17,7 +17,7 @@ from datetime import datetime, timedelta
 
 # ✅ NEW: Import dynamic route mapping utilities
 from utils.role_route_mapper import *
-from utils.notification_dedup import check_duplicate_notification  # noqa: F401 - re-exported
+from utils.notification_dedup import notification_dedup_key
 from utils.labour_notification_service import LabourNotificationMixin
 
 log = get_logger()
@@ -183,11 +183,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         ✅ FIXED: Dynamic URL based on recipient's actual role
         """
         try:
-            # Check for duplicate notification (within 2 minutes - reduced from 5 for reliability)
-            # Use specific title pattern to avoid blocking other BOQ notification types
-            if check_duplicate_notification(td_user_id, 'New BOQ for Approval', 'boq_id', boq_id, minutes=2):
-                return
-
             # ✅ Generate dynamic URL based on recipient's role
             action_url = get_td_approval_url(td_user_id, boq_id, tab='pending')
 
@@ -204,8 +199,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 metadata={'boq_id': boq_id},
                 sender_id=estimator_id,
                 sender_name=estimator_name,
-                target_role='technical_director'
+                target_role='technical_director',
+                dedup_key=notification_dedup_key(td_user_id, 'New BOQ for Approval', 'boq_id', boq_id, minutes=2)
             )
+            if notification is None:
+                return
             # Send via Socket.IO - send to BOTH user room AND role room for reliability
             notification_data = notification.to_dict()
             delivered = send_notification_to_user(td_user_id, notification_data)
@@ -265,10 +263,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             client_info = f" by {client_name}" if client_name else ""
 
             for td_user in td_users:
-                # Check for duplicate notification (reduced to 2 minutes)
-                if check_duplicate_notification(td_user.user_id, 'Client Approved', 'boq_id', boq_id, minutes=2):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=td_user.user_id,
                     type='success',
@@ -280,8 +274,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     action_label='View BOQ',
                     metadata={'boq_id': boq_id, 'client_confirmed': True},
                     sender_id=estimator_id,
-                    sender_name=estimator_name
+                    sender_name=estimator_name,
+                    dedup_key=notification_dedup_key(td_user.user_id, 'Client Approved', 'boq_id', boq_id, minutes=2)
                 )
+                if notification is None:
+                    continue
 
                 send_notification_to_user(td_user.user_id, notification.to_dict())
 
@@ -310,10 +307,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 return
 
             for td_user in td_users:
-                # Check for duplicate notification (reduced to 2 minutes)
-                if check_duplicate_notification(td_user.user_id, 'Client Rejected', 'boq_id', boq_id, minutes=2):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=td_user.user_id,
                     type='rejection',
@@ -326,8 +319,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     action_label='View Details',
                     metadata={'boq_id': boq_id, 'client_rejected': True, 'reason': rejection_reason},
                     sender_id=estimator_id,
-                    sender_name=estimator_name
+                    sender_name=estimator_name,
+                    dedup_key=notification_dedup_key(td_user.user_id, 'Client Rejected', 'boq_id', boq_id, minutes=2)
                 )
+                if notification is None:
+                    continue
 
                 send_notification_to_user(td_user.user_id, notification.to_dict())
 
@@ -350,11 +346,8 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             dedup_title = 'BOQ Approved by Technical Director' if approved else 'BOQ Rejected by Technical Director'
             sent_count = 0
             for user_id in recipient_user_ids:
-                # Check for duplicate notification (specific to this decision type)
-                if check_duplicate_notification(user_id, dedup_title, 'boq_id', boq_id, minutes=2):
-                    sent_count += 1  # Count as sent since a recent notification already exists
-                    continue
-
+                # Dedup key specific to this decision type
+                dedup_key = notification_dedup_key(user_id, dedup_title, 'boq_id', boq_id, minutes=2)
                 if approved:
                     notification = NotificationManager.create_notification(
                         user_id=user_id,
@@ -368,7 +361,8 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         metadata={'boq_id': boq_id, 'decision': 'approved', 'target_role': 'estimator'},
                         sender_id=td_id,
                         sender_name=td_name,
-                        target_role='estimator'
+                        target_role='estimator',
+                        dedup_key=dedup_key
                     )
                 else:
                     notification = NotificationManager.create_notification(
@@ -384,8 +378,12 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         metadata={'boq_id': boq_id, 'decision': 'rejected', 'reason': rejection_reason, 'target_role': 'estimator'},
                         sender_id=td_id,
                         sender_name=td_name,
-                        target_role='estimator'
+                        target_role='estimator',
+                        dedup_key=dedup_key
                     )
+                if notification is None:
+                    sent_count += 1  # Count as sent since a recent notification already exists
+                    continue
 
                 send_notification_to_user(user_id, notification.to_dict())
                 sent_count += 1
@@ -406,10 +404,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         """
         try:
             for pm_user_id in pm_user_ids:
-                # Check for duplicate notification
-                if check_duplicate_notification(pm_user_id, 'Project Assigned', 'project_id', project_id, minutes=5):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=pm_user_id,
                     type='assignment',
@@ -422,8 +416,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     action_label='View Project',
                     metadata={'project_id': project_id},
                     sender_id=td_id,
-                    sender_name=td_name
+                    sender_name=td_name,
+                    dedup_key=notification_dedup_key(pm_user_id, 'Project Assigned', 'project_id', project_id, minutes=5)
                 )
+                if notification is None:
+                    continue
 
                 send_notification_to_user(pm_user_id, notification.to_dict())
 
@@ -439,10 +436,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: HIGH
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(se_user_id, 'Items Assigned', 'boq_id', boq_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=se_user_id,
                 type='assignment',
@@ -455,8 +448,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 action_label='View Items',
                 metadata={'boq_id': boq_id, 'items_count': items_count},
                 sender_id=pm_id,
-                sender_name=pm_name
+                sender_name=pm_name,
+                dedup_key=notification_dedup_key(se_user_id, 'Items Assigned', 'boq_id', boq_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(se_user_id, notification.to_dict())
         except Exception as e:
@@ -471,10 +467,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: MEDIUM
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(pm_user_id, 'Completion Request', 'boq_id', boq_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=pm_user_id,
                 type='update',
@@ -487,8 +479,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 action_label='Confirm Completion',
                 metadata={'boq_id': boq_id},
                 sender_id=se_id,
-                sender_name=se_name
+                sender_name=se_name,
+                dedup_key=notification_dedup_key(pm_user_id, 'Completion Request', 'boq_id', boq_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(pm_user_id, notification.to_dict())
         except Exception as e:
@@ -503,10 +498,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: MEDIUM
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(se_user_id, 'Completion Confirmed', 'boq_id', boq_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=se_user_id,
                 type='success',
@@ -518,8 +509,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 action_label='View Project',
                 metadata={'boq_id': boq_id},
                 sender_id=pm_id,
-                sender_name=pm_name
+                sender_name=pm_name,
+                dedup_key=notification_dedup_key(se_user_id, 'Completion Confirmed', 'boq_id', boq_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(se_user_id, notification.to_dict())
         except Exception as e:
@@ -541,10 +535,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         """
         try:
             for user_id in recipient_user_ids:
-                # Check for duplicate notification
-                if check_duplicate_notification(user_id, 'Materials Purchase', 'cr_id', cr_id, minutes=5):
-                    continue
-
                 # Determine correct route based on recipient_role and request_type
                 # Buyer uses 'purchase-orders' page for all CR/PO work
                 # Estimator uses 'change-requests' page (they don't have /extra-material route)
@@ -589,8 +579,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     metadata={'cr_id': cr_id, 'action_url': action_url, 'request_type': request_type, 'target_role': recipient_role_lower},
                     sender_id=creator_id,
                     sender_name=creator_name,
-                    target_role=recipient_role_lower
+                    target_role=recipient_role_lower,
+                    dedup_key=notification_dedup_key(user_id, 'Materials Purchase', 'cr_id', cr_id, minutes=5)
                 )
+                if notification is None:
+                    continue
 
                 send_notification_to_user(user_id, notification.to_dict())
         except Exception as e:
@@ -633,10 +626,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 route = 'extra-material' if request_type == 'EXTRA_MATERIALS' else 'change-requests'
 
             for user_id in next_user_ids:
-                # Check for duplicate notification
-                if check_duplicate_notification(user_id, 'Request Approved', 'cr_id', cr_id, minutes=5):
-                    continue
-
                 # ✅ Set correct tab/subtab parameters based on role
                 # Buyer/Procurement → Ongoing tab with Pending Purchase subtab
                 # Others → Pending tab (default)
@@ -666,8 +655,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     metadata={'cr_id': cr_id, 'request_type': request_type, 'target_role': next_role_lower},
                     sender_id=approver_id,
                     sender_name=approver_name,
-                    target_role=next_role_lower
+                    target_role=next_role_lower,
+                    dedup_key=notification_dedup_key(user_id, 'Request Approved', 'cr_id', cr_id, minutes=5)
                 )
+                if notification is None:
+                    continue
 
                 send_notification_to_user(user_id, notification.to_dict())
         except Exception as e:
@@ -688,10 +680,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
           - Creator is ONLINE   → skip email (real-time WebSocket notification is sufficient)
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(creator_user_id, 'Request Rejected', 'cr_id', cr_id, minutes=5):
-                return
-
             # ✅ Generate dynamic URL based on recipient's actual role from database
             # Site Engineers ALWAYS use extra-material page (they don't have access to change-requests)
             from utils.role_route_mapper import get_user_role_route
@@ -720,8 +708,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 action_label='View Details',
                 metadata={'cr_id': cr_id, 'reason': rejection_reason, 'request_type': request_type},
                 sender_id=rejector_id,
-                sender_name=rejector_name
+                sender_name=rejector_name,
+                dedup_key=notification_dedup_key(creator_user_id, 'Request Rejected', 'cr_id', cr_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(creator_user_id, notification.to_dict())
             # ── Email: only send when the creator is OFFLINE ──────────────────
@@ -772,10 +763,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: URGENT
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(td_user_id, 'Vendor Selection', 'cr_id', cr_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=td_user_id,
                 type='approval',
@@ -789,8 +776,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 metadata={'cr_id': cr_id, 'vendor_name': vendor_name, 'request_type': request_type, 'target_role': 'technical-director'},
                 sender_id=buyer_id,
                 sender_name=buyer_name,
-                target_role='technical-director'
+                target_role='technical-director',
+                dedup_key=notification_dedup_key(td_user_id, 'Vendor Selection', 'cr_id', cr_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(td_user_id, notification.to_dict())
         except Exception as e:
@@ -805,10 +795,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: MEDIUM
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(requester_user_id, 'Purchase Completed', 'cr_id', cr_id, minutes=5):
-                return
-
             # ✅ Generate dynamic URL based on recipient's actual role from database
             # Site Engineers ALWAYS use extra-material page (they don't have access to change-requests)
             from utils.role_route_mapper import get_user_role_route
@@ -837,8 +823,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 action_label='View Details',
                 metadata={'cr_id': cr_id, 'request_type': request_type},
                 sender_id=buyer_id,
-                sender_name=buyer_name
+                sender_name=buyer_name,
+                dedup_key=notification_dedup_key(requester_user_id, 'Purchase Completed', 'cr_id', cr_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(requester_user_id, notification.to_dict())
             # Email fallback for offline users (action_required -> must receive it)
@@ -871,10 +860,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: URGENT
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(td_user_id, 'Extension Request', 'boq_id', boq_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=td_user_id,
                 type='alert',
@@ -887,8 +872,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 action_label='Review Request',
                 metadata={'boq_id': boq_id, 'days_requested': days_requested, 'reason': reason, 'view_extension': True},
                 sender_id=pm_id,
-                sender_name=pm_name
+                sender_name=pm_name,
+                dedup_key=notification_dedup_key(td_user_id, 'Extension Request', 'boq_id', boq_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(td_user_id, notification.to_dict())
         except Exception as e:
@@ -903,10 +891,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: HIGH
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(pm_user_id, 'Extension Approved', 'boq_id', boq_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=pm_user_id,
                 type='success',
@@ -918,8 +902,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 action_label='View Project',
                 metadata={'boq_id': boq_id, 'days_approved': days_approved},
                 sender_id=td_id,
-                sender_name=td_name
+                sender_name=td_name,
+                dedup_key=notification_dedup_key(pm_user_id, 'Extension Approved', 'boq_id', boq_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(pm_user_id, notification.to_dict())
         except Exception as e:
@@ -934,10 +921,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: HIGH
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(pm_user_id, 'Extension Rejected', 'boq_id', boq_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=pm_user_id,
                 type='rejection',
@@ -950,8 +933,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 action_label='View Details',
                 metadata={'boq_id': boq_id, 'reason': rejection_reason},
                 sender_id=td_id,
-                sender_name=td_name
+                sender_name=td_name,
+                dedup_key=notification_dedup_key(pm_user_id, 'Extension Rejected', 'boq_id', boq_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(pm_user_id, notification.to_dict())
         except Exception as e:
@@ -970,10 +956,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: MEDIUM
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(buyer_user_id, 'Vendor Approved', 'vendor_id', vendor_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=buyer_user_id,
                 type='success',
@@ -986,8 +968,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 metadata={'vendor_id': vendor_id},
                 sender_id=td_id,
                 sender_name=td_name,
-                target_role='buyer'
+                target_role='buyer',
+                dedup_key=notification_dedup_key(buyer_user_id, 'Vendor Approved', 'vendor_id', vendor_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(buyer_user_id, notification.to_dict())
         except Exception as e:
@@ -1016,13 +1001,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
 
             for td_user in td_users:
                 try:
-                    # CRITICAL FIX: Check duplicate by revision_number instead of boq_id
-                    # This allows multiple revisions of the same BOQ to send notifications
-                    # Only prevents accidental double-clicks (same revision sent twice)
-                    if check_duplicate_notification(td_user.user_id, 'Internal Revision BOQ for Approval', 'internal_revision_number', revision_number, minutes=1):
-                        log.warning(f"[notify_internal_revision_created] Duplicate notification detected for TD {td_user.user_id}, BOQ {boq_id}, Revision #{revision_number} - skipping to prevent spam")
-                        continue
-
                     notification = NotificationManager.create_notification(
                         user_id=td_user.user_id,
                         type='approval',
@@ -1036,8 +1014,12 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         metadata={'boq_id': boq_id, 'internal_revision_number': revision_number, 'target_role': 'technical_director'},
                         sender_id=actor_id,
                         sender_name=actor_name,
-                        target_role='technical_director'
+                        target_role='technical_director',
+                        dedup_key=notification_dedup_key(td_user.user_id, 'Internal Revision BOQ for Approval', 'internal_revision_number', revision_number, minutes=1)
                     )
+                    if notification is None:
+                        log.warning(f"[notify_internal_revision_created] Duplicate notification detected for TD {td_user.user_id}, BOQ {boq_id}, Revision #{revision_number} - skipping to prevent spam")
+                        continue
 
                     send_notification_to_user(td_user.user_id, notification.to_dict())
 
@@ -1061,10 +1043,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: HIGH
         """
         try:
-            # Check for duplicate notification (reduced window to 2 minutes)
-            if check_duplicate_notification(actor_user_id, 'Internal Revision Approved', 'boq_id', boq_id, minutes=2):
-                return
-
             # Build URL to navigate to Internal Revisions tab
             from utils.role_route_mapper import build_notification_action_url
             action_url = build_notification_action_url(
@@ -1086,8 +1064,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 metadata={'boq_id': boq_id, 'internal_revision_number': revision_number, 'decision': 'approved', 'target_role': 'estimator'},
                 sender_id=td_id,
                 sender_name=td_name,
-                target_role='estimator'
+                target_role='estimator',
+                dedup_key=notification_dedup_key(actor_user_id, 'Internal Revision Approved', 'boq_id', boq_id, minutes=2)
             )
+            if notification is None:
+                return
             send_notification_to_user(actor_user_id, notification.to_dict())
         except Exception as e:
             log.error(f"[notify_internal_revision_approved] Error for BOQ {boq_id}, user {actor_user_id}: {e}")
@@ -1104,10 +1085,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: HIGH
         """
         try:
-            # Check for duplicate notification (reduced window to 2 minutes)
-            if check_duplicate_notification(actor_user_id, 'Internal Revision Rejected', 'boq_id', boq_id, minutes=2):
-                return  # Recent notification exists, caller should count as sent
-
             # Build URL to navigate to Internal Revisions tab
             from utils.role_route_mapper import build_notification_action_url
             action_url = build_notification_action_url(
@@ -1130,8 +1107,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 metadata={'boq_id': boq_id, 'internal_revision_number': revision_number, 'decision': 'rejected', 'reason': rejection_reason, 'target_role': 'estimator'},
                 sender_id=td_id,
                 sender_name=td_name,
-                target_role='estimator'
+                target_role='estimator',
+                dedup_key=notification_dedup_key(actor_user_id, 'Internal Revision Rejected', 'boq_id', boq_id, minutes=2)
             )
+            if notification is None:
+                return  # Recent notification exists, caller should count as sent
 
             send_notification_to_user(actor_user_id, notification.to_dict())
         except Exception as e:
@@ -1164,13 +1144,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
 
             for td_user in td_users:
                 try:
-                    # CRITICAL FIX: Check duplicate by client_revision_number instead of boq_id
-                    # This allows multiple revisions of the same BOQ to send notifications
-                    # Only prevents accidental double-clicks (same revision sent twice)
-                    if check_duplicate_notification(td_user.user_id, 'Client Revision BOQ for Approval', 'client_revision_number', revision_number, minutes=1):
-                        log.warning(f"[notify_client_revision_created] Duplicate notification detected for TD {td_user.user_id}, BOQ {boq_id}, Revision R{revision_number} - skipping to prevent spam")
-                        continue
-
                     notification = NotificationManager.create_notification(
                         user_id=td_user.user_id,
                         type='approval',
@@ -1184,8 +1157,12 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         metadata={'boq_id': boq_id, 'client_revision_number': revision_number, 'target_role': 'technical_director'},
                         sender_id=actor_id,
                         sender_name=actor_name,
-                        target_role='technical_director'
+                        target_role='technical_director',
+                        dedup_key=notification_dedup_key(td_user.user_id, 'Client Revision BOQ for Approval', 'client_revision_number', revision_number, minutes=1)
                     )
+                    if notification is None:
+                        log.warning(f"[notify_client_revision_created] Duplicate notification detected for TD {td_user.user_id}, BOQ {boq_id}, Revision R{revision_number} - skipping to prevent spam")
+                        continue
                     send_notification_to_user(td_user.user_id, notification.to_dict())
 
                 except Exception as e:
@@ -1209,10 +1186,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: HIGH
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(estimator_user_id, 'Client Revision Approved', 'boq_id', boq_id, minutes=5):
-                return
-
             # Build message with revision number if available
             if revision_number and revision_number > 0:
                 message = f'Client revision R{revision_number} for {project_name} has been approved by {td_name}'
@@ -1231,8 +1204,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 metadata={'boq_id': boq_id, 'client_revision_approved': True, 'revision_number': revision_number, 'target_role': 'estimator'},
                 sender_id=td_id,
                 sender_name=td_name,
-                target_role='estimator'
+                target_role='estimator',
+                dedup_key=notification_dedup_key(estimator_user_id, 'Client Revision Approved', 'boq_id', boq_id, minutes=5)
             )
+            if notification is None:
+                return
 
             send_notification_to_user(estimator_user_id, notification.to_dict())
         except Exception as e:
@@ -1250,10 +1226,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: HIGH
         """
         try:
-            # Check for duplicate notification
-            if check_duplicate_notification(estimator_user_id, 'Client Revision Rejected', 'boq_id', boq_id, minutes=5):
-                return
-
             # Build message with revision number if available
             if revision_number and revision_number > 0:
                 message = f'Client revision R{revision_number} for {project_name} was rejected by {td_name}. Reason: {rejection_reason}'
@@ -1273,8 +1245,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 metadata={'boq_id': boq_id, 'client_revision_rejected': True, 'reason': rejection_reason, 'revision_number': revision_number, 'target_role': 'estimator'},
                 sender_id=td_id,
                 sender_name=td_name,
-                target_role='estimator'
+                target_role='estimator',
+                dedup_key=notification_dedup_key(estimator_user_id, 'Client Revision Rejected', 'boq_id', boq_id, minutes=5)
             )
+            if notification is None:
+                return
             send_notification_to_user(estimator_user_id, notification.to_dict())
         except Exception as e:
             log.error(f"[notify_client_revision_rejected] Error for BOQ {boq_id}, estimator {estimator_user_id}: {e}")
@@ -1295,9 +1270,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         """
         try:
             for se_user_id in se_user_ids:
-                if check_duplicate_notification(se_user_id, 'Assets Dispatched to Site', 'adn_id', adn_id, minutes=5):
-                    continue
-
                 action_url = build_notification_action_url(
                     user_id=se_user_id,
                     base_page='site-assets',
@@ -1324,8 +1296,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'total_quantity': total_quantity,
                         'workflow': 'adn_dispatched'
                     },
-                    sender_name=dispatched_by_name
+                    sender_name=dispatched_by_name,
+                    dedup_key=notification_dedup_key(se_user_id, 'Assets Dispatched to Site', 'adn_id', adn_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(se_user_id, notification.to_dict())
 
         except Exception as e:
@@ -1348,10 +1323,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 items_text = f"Quantity: {quantity}"
 
             for se_user_id in se_user_ids:
-                # Check for duplicate
-                if check_duplicate_notification(se_user_id, f'Assets Dispatched', 'category_code', category_code, minutes=2):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=se_user_id,
                     type='info',
@@ -1370,8 +1341,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'workflow': 'returnable_assets',
                         'action': 'dispatch'
                     },
-                    sender_name=dispatched_by_name
+                    sender_name=dispatched_by_name,
+                    dedup_key=notification_dedup_key(se_user_id, f'Assets Dispatched', 'category_code', category_code, minutes=2)
                 )
+                if notification is None:
+                    continue
 
                 send_notification_to_user(se_user_id, notification.to_dict())
 
@@ -1489,9 +1463,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             ).all()
 
             for pm in pm_users:
-                if check_duplicate_notification(pm.user_id, 'Asset Return In Transit', 'ardn_id', ardn_id, minutes=5):
-                    continue
-
                 action_url = build_notification_action_url(
                     user_id=pm.user_id,
                     base_page='returnable-assets/receive-returns',
@@ -1517,8 +1488,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'item_count': item_count,
                         'workflow': 'ardn_dispatched'
                     },
-                    sender_name=dispatched_by_name
+                    sender_name=dispatched_by_name,
+                    dedup_key=notification_dedup_key(pm.user_id, 'Asset Return In Transit', 'ardn_id', ardn_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm.user_id, notification.to_dict())
 
         except Exception as e:
@@ -1545,9 +1519,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             ).all()
 
             for pm in pm_users:
-                if check_duplicate_notification(pm.user_id, 'Asset Return Note Created', 'ardn_id', ardn_id, minutes=5):
-                    continue
-
                 action_url = build_notification_action_url(
                     user_id=pm.user_id,
                     base_page='returnable-assets/receive-returns',
@@ -1572,8 +1543,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'item_count': item_count,
                         'workflow': 'ardn_created'
                     },
-                    sender_name=created_by_name
+                    sender_name=created_by_name,
+                    dedup_key=notification_dedup_key(pm.user_id, 'Asset Return Note Created', 'ardn_id', ardn_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm.user_id, notification.to_dict())
 
         except Exception as e:
@@ -1600,9 +1574,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             ).all()
 
             for pm in pm_users:
-                if check_duplicate_notification(pm.user_id, 'Asset Return Note Issued', 'ardn_id', ardn_id, minutes=5):
-                    continue
-
                 action_url = build_notification_action_url(
                     user_id=pm.user_id,
                     base_page='returnable-assets/receive-returns',
@@ -1627,8 +1598,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'item_count': item_count,
                         'workflow': 'ardn_issued'
                     },
-                    sender_name=issued_by_name
+                    sender_name=issued_by_name,
+                    dedup_key=notification_dedup_key(pm.user_id, 'Asset Return Note Issued', 'ardn_id', ardn_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm.user_id, notification.to_dict())
 
         except Exception as e:
@@ -1694,9 +1668,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             ).all()
 
             for td in td_users:
-                if check_duplicate_notification(td.user_id, 'Asset Disposal Request', 'disposal_id', disposal_id, minutes=5):
-                    continue
-
                 action_url = build_notification_action_url(
                     user_id=td.user_id,
                     base_page='asset-disposal-approvals',
@@ -1720,8 +1691,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'quantity': quantity,
                         'workflow': 'asset_disposal_request'
                     },
-                    sender_name=requested_by_name
+                    sender_name=requested_by_name,
+                    dedup_key=notification_dedup_key(td.user_id, 'Asset Disposal Request', 'disposal_id', disposal_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(td.user_id, notification.to_dict())
 
         except Exception as e:
@@ -1736,9 +1710,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Recipients: The PM who requested the disposal
         """
         try:
-            if check_duplicate_notification(pm_user_id, 'Asset Disposal Approved', 'disposal_id', disposal_id, minutes=5):
-                return
-
             action_url = build_notification_action_url(
                 user_id=pm_user_id,
                 base_page='returnable-assets',
@@ -1761,8 +1732,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     'quantity': quantity,
                     'workflow': 'asset_disposal_approved'
                 },
-                sender_name=approved_by_name
+                sender_name=approved_by_name,
+                dedup_key=notification_dedup_key(pm_user_id, 'Asset Disposal Approved', 'disposal_id', disposal_id, minutes=5)
             )
+            if notification is None:
+                return
             send_notification_to_user(pm_user_id, notification.to_dict())
 
         except Exception as e:
@@ -1777,9 +1751,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Recipients: The PM who requested the disposal
         """
         try:
-            if check_duplicate_notification(pm_user_id, 'Asset Disposal Rejected', 'disposal_id', disposal_id, minutes=5):
-                return
-
             action_text = 'returned to stock' if action == 'return_to_stock' else 'sent back for repair'
 
             action_url = build_notification_action_url(
@@ -1806,8 +1777,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     'action': action,
                     'workflow': 'asset_disposal_rejected'
                 },
-                sender_name=rejected_by_name
+                sender_name=rejected_by_name,
+                dedup_key=notification_dedup_key(pm_user_id, 'Asset Disposal Rejected', 'disposal_id', disposal_id, minutes=5)
             )
+            if notification is None:
+                return
             send_notification_to_user(pm_user_id, notification.to_dict())
 
         except Exception as e:
@@ -1826,10 +1800,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         """
         try:
             for pm_user_id in pm_user_ids:
-                # Check for duplicate
-                if check_duplicate_notification(pm_user_id, 'New Asset Requisition', 'requisition_id', requisition_id, minutes=5):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=pm_user_id,
                     type='approval',
@@ -1848,8 +1818,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'workflow': 'asset_requisition'
                     },
                     sender_id=se_user_id,
-                    sender_name=se_name
+                    sender_name=se_name,
+                    dedup_key=notification_dedup_key(pm_user_id, 'New Asset Requisition', 'requisition_id', requisition_id, minutes=5)
                 )
+                if notification is None:
+                    continue
 
                 send_notification_to_user(pm_user_id, notification.to_dict())
 
@@ -1867,10 +1840,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         """
         try:
             for prod_mgr_id in prod_mgr_user_ids:
-                # Check for duplicate
-                if check_duplicate_notification(prod_mgr_id, 'Asset Requisition Needs Approval', 'requisition_id', requisition_id, minutes=5):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=prod_mgr_id,
                     type='approval',
@@ -1887,8 +1856,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'workflow': 'asset_requisition'
                     },
                     sender_id=pm_user_id,
-                    sender_name=pm_name
+                    sender_name=pm_name,
+                    dedup_key=notification_dedup_key(prod_mgr_id, 'Asset Requisition Needs Approval', 'requisition_id', requisition_id, minutes=5)
                 )
+                if notification is None:
+                    continue
 
                 send_notification_to_user(prod_mgr_id, notification.to_dict())
 
@@ -2181,10 +2153,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             pm_users = User.query.filter_by(role_id=pm_role.role_id, is_active=True, is_deleted=False).all()
 
             for pm in pm_users:
-                # Check for duplicate
-                if check_duplicate_notification(pm.user_id, 'Damaged Material Return', 'return_id', return_id):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=pm.user_id,
                     type='warning',
@@ -2203,8 +2171,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'project_name': project_name,
                         'workflow': 'material_return_review'
                     },
-                    sender_name=returned_by_name
+                    sender_name=returned_by_name,
+                    dedup_key=notification_dedup_key(pm.user_id, 'Damaged Material Return', 'return_id', return_id)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm.user_id, notification.to_dict())
                 # Email fallback -- PM must review damaged material (urgent action required)
                 if ComprehensiveNotificationService.is_user_offline(pm.user_id):
@@ -2334,9 +2305,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             # Notify all Site Engineers
             for se_id in (site_engineer_ids or []):
                 # Guard: skip if SE was already notified about this delivery note within 10 minutes
-                if check_duplicate_notification(se_id, 'Materials In Transit to Your Site', 'delivery_note_number', delivery_note_number, minutes=10):
-                    log.info(f"Skipping duplicate dispatch notification for SE {se_id}, DN {delivery_note_number}")
-                    continue
                 notification = NotificationManager.create_notification(
                     user_id=se_id,
                     type='delivery_note_dispatched',
@@ -2357,12 +2325,16 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'workflow': 'delivery_note_dispatched',
                         'target_role': 'site-engineer'
                     },
-                    sender_name=dispatched_by_name
+                    sender_name=dispatched_by_name,
+                    dedup_key=notification_dedup_key(se_id, 'Materials In Transit to Your Site', 'delivery_note_number', delivery_note_number, minutes=10)
                 )
+                if notification is None:
+                    log.info(f"Skipping duplicate dispatch notification for SE {se_id}, DN {delivery_note_number}")
+                    continue
                 send_notification_to_user(se_id, notification.to_dict())
 
             # Notify Buyer
-            if buyer_user_id and not check_duplicate_notification(buyer_user_id, 'Materials Dispatched to Site', 'delivery_note_number', delivery_note_number, minutes=10):
+            if buyer_user_id:
                 buyer_notification = NotificationManager.create_notification(
                     user_id=buyer_user_id,
                     type='delivery_note_dispatched',
@@ -2380,9 +2352,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'workflow': 'delivery_note_dispatched',
                         'target_role': 'buyer'
                     },
-                    sender_name=dispatched_by_name
+                    sender_name=dispatched_by_name,
+                    dedup_key=notification_dedup_key(buyer_user_id, 'Materials Dispatched to Site', 'delivery_note_number', delivery_note_number, minutes=10)
                 )
-                send_notification_to_user(buyer_user_id, buyer_notification.to_dict())
+                if buyer_notification is not None:
+                    send_notification_to_user(buyer_user_id, buyer_notification.to_dict())
 
             # Send professional emails to SE(s) and Buyer
             try:
@@ -2845,28 +2819,28 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 if user:
                     actual_user_id = user.user_id
             if actual_user_id:
-                # Check for duplicate
-                if not check_duplicate_notification(actual_user_id, f'Ticket #{ticket_number} Approved', 'ticket_id', ticket_id):
-                    notification = NotificationManager.create_notification(
-                        user_id=actual_user_id,
-                        type='success',
-                        title=f'Your Ticket #{ticket_number} is Approved',
-                        message=f'Your support ticket "{subject[:60]}..." has been approved and our team is working on it.',
-                        priority='normal',
-                        category='support',
-                        action_required=False,
-                        action_url=build_notification_action_url(actual_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
-                        action_label='View Ticket',
-                        metadata={
-                            'ticket_id': ticket_id,
-                            'ticket_number': ticket_number,
-                            'status': 'approved',
-                            'workflow': 'support_ticket',
-                            'target_role': 'client'
-                        },
-                        sender_name=approved_by_name,
-                        target_role='client'
-                    )
+                notification = NotificationManager.create_notification(
+                    user_id=actual_user_id,
+                    type='success',
+                    title=f'Your Ticket #{ticket_number} is Approved',
+                    message=f'Your support ticket "{subject[:60]}..." has been approved and our team is working on it.',
+                    priority='normal',
+                    category='support',
+                    action_required=False,
+                    action_url=build_notification_action_url(actual_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
+                    action_label='View Ticket',
+                    metadata={
+                        'ticket_id': ticket_id,
+                        'ticket_number': ticket_number,
+                        'status': 'approved',
+                        'workflow': 'support_ticket',
+                        'target_role': 'client'
+                    },
+                    sender_name=approved_by_name,
+                    target_role='client',
+                    dedup_key=notification_dedup_key(actual_user_id, f'Ticket #{ticket_number} Approved', 'ticket_id', ticket_id)
+                )
+                if notification is not None:
                     send_notification_to_user(actual_user_id, notification.to_dict())
             else:
                 log.warning(f"Cannot send approval notification for ticket #{ticket_number}: No user_id found (email: {client_email})")
@@ -2883,29 +2857,29 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         try:
             # Notify client if they have a user account
             if client_user_id:
-                # Check for duplicate
-                if not check_duplicate_notification(client_user_id, f'Ticket #{ticket_number} Rejected', 'ticket_id', ticket_id):
-                    notification = NotificationManager.create_notification(
-                        user_id=client_user_id,
-                        type='error',
-                        title=f'Your Ticket #{ticket_number} was Rejected',
-                        message=f'Your support ticket was not approved. Reason: {rejection_reason[:80] if rejection_reason else "No reason provided"}...',
-                        priority='normal',
-                        category='support',
-                        action_required=False,
-                        action_url=build_notification_action_url(client_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
-                        action_label='View Ticket',
-                        metadata={
-                            'ticket_id': ticket_id,
-                            'ticket_number': ticket_number,
-                            'status': 'rejected',
-                            'rejection_reason': rejection_reason,
-                            'workflow': 'support_ticket',
-                            'target_role': 'client'
-                        },
-                        sender_name=rejected_by_name,
-                        target_role='client'
-                    )
+                notification = NotificationManager.create_notification(
+                    user_id=client_user_id,
+                    type='error',
+                    title=f'Your Ticket #{ticket_number} was Rejected',
+                    message=f'Your support ticket was not approved. Reason: {rejection_reason[:80] if rejection_reason else "No reason provided"}...',
+                    priority='normal',
+                    category='support',
+                    action_required=False,
+                    action_url=build_notification_action_url(client_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
+                    action_label='View Ticket',
+                    metadata={
+                        'ticket_id': ticket_id,
+                        'ticket_number': ticket_number,
+                        'status': 'rejected',
+                        'rejection_reason': rejection_reason,
+                        'workflow': 'support_ticket',
+                        'target_role': 'client'
+                    },
+                    sender_name=rejected_by_name,
+                    target_role='client',
+                    dedup_key=notification_dedup_key(client_user_id, f'Ticket #{ticket_number} Rejected', 'ticket_id', ticket_id)
+                )
+                if notification is not None:
                     send_notification_to_user(client_user_id, notification.to_dict())
         except Exception as e:
             log.error(f"Error sending ticket rejection notification: {e}")
@@ -2928,28 +2902,28 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
 
             # Notify client if they have a user account
             if client_user_id:
-                # Check for duplicate
-                if not check_duplicate_notification(client_user_id, f'Ticket #{ticket_number} Status Update', 'ticket_id', ticket_id):
-                    notification = NotificationManager.create_notification(
-                        user_id=client_user_id,
-                        type='info',
-                        title=f'Ticket #{ticket_number} Status Update',
-                        message=f'Your support ticket "{subject[:60]}..." {status_message}.',
-                        priority='normal',
-                        category='support',
-                        action_required=False,
-                        action_url=build_notification_action_url(client_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
-                        action_label='View Ticket',
-                        metadata={
-                            'ticket_id': ticket_id,
-                            'ticket_number': ticket_number,
-                            'status': new_status,
-                            'workflow': 'support_ticket',
-                            'target_role': 'client'
-                        },
-                        sender_name=updated_by_name,
-                        target_role='client'
-                    )
+                notification = NotificationManager.create_notification(
+                    user_id=client_user_id,
+                    type='info',
+                    title=f'Ticket #{ticket_number} Status Update',
+                    message=f'Your support ticket "{subject[:60]}..." {status_message}.',
+                    priority='normal',
+                    category='support',
+                    action_required=False,
+                    action_url=build_notification_action_url(client_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
+                    action_label='View Ticket',
+                    metadata={
+                        'ticket_id': ticket_id,
+                        'ticket_number': ticket_number,
+                        'status': new_status,
+                        'workflow': 'support_ticket',
+                        'target_role': 'client'
+                    },
+                    sender_name=updated_by_name,
+                    target_role='client',
+                    dedup_key=notification_dedup_key(client_user_id, f'Ticket #{ticket_number} Status Update', 'ticket_id', ticket_id)
+                )
+                if notification is not None:
                     send_notification_to_user(client_user_id, notification.to_dict())
         except Exception as e:
             log.error(f"Error sending ticket status update notification: {e}")
@@ -2964,29 +2938,29 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         try:
             # Notify client if they have a user account
             if client_user_id:
-                # Check for duplicate
-                if not check_duplicate_notification(client_user_id, f'Ticket #{ticket_number} Resolved', 'ticket_id', ticket_id):
-                    notification = NotificationManager.create_notification(
-                        user_id=client_user_id,
-                        type='success',
-                        title=f'Your Ticket #{ticket_number} is Resolved',
-                        message=f'Your support ticket "{subject[:60]}..." has been resolved. Please confirm if the issue is fixed.',
-                        priority='normal',
-                        category='support',
-                        action_required=True,
-                        action_url=build_notification_action_url(client_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
-                        action_label='Confirm Resolution',
-                        metadata={
-                            'ticket_id': ticket_id,
-                            'ticket_number': ticket_number,
-                            'status': 'resolved',
-                            'resolution_notes': resolution_notes,
-                            'workflow': 'support_ticket',
-                            'target_role': 'client'
-                        },
-                        sender_name=resolved_by_name,
-                        target_role='client'
-                    )
+                notification = NotificationManager.create_notification(
+                    user_id=client_user_id,
+                    type='success',
+                    title=f'Your Ticket #{ticket_number} is Resolved',
+                    message=f'Your support ticket "{subject[:60]}..." has been resolved. Please confirm if the issue is fixed.',
+                    priority='normal',
+                    category='support',
+                    action_required=True,
+                    action_url=build_notification_action_url(client_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
+                    action_label='Confirm Resolution',
+                    metadata={
+                        'ticket_id': ticket_id,
+                        'ticket_number': ticket_number,
+                        'status': 'resolved',
+                        'resolution_notes': resolution_notes,
+                        'workflow': 'support_ticket',
+                        'target_role': 'client'
+                    },
+                    sender_name=resolved_by_name,
+                    target_role='client',
+                    dedup_key=notification_dedup_key(client_user_id, f'Ticket #{ticket_number} Resolved', 'ticket_id', ticket_id)
+                )
+                if notification is not None:
                     send_notification_to_user(client_user_id, notification.to_dict())
         except Exception as e:
             log.error(f"Error sending ticket resolution notification: {e}")
@@ -3045,10 +3019,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 log.warning(f"Cannot send ticket closed notification - no user found for ticket #{ticket_number}")
                 return
 
-            # Check for duplicate
-            if check_duplicate_notification(actual_user_id, f'Ticket #{ticket_number} Closed', 'ticket_id', ticket_id):
-                return
-
             message = f'Your ticket "{subject[:60]}..." has been closed by the development team.'
             if closing_notes:
                 message += f' Notes: {closing_notes[:50]}...'
@@ -3072,8 +3042,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     'target_role': 'client'
                 },
                 sender_name=closed_by_name,
-                target_role='client'
+                target_role='client',
+                dedup_key=notification_dedup_key(actual_user_id, f'Ticket #{ticket_number} Closed', 'ticket_id', ticket_id)
             )
+            if notification is None:
+                return
             send_notification_to_user(actual_user_id, notification.to_dict())
         except Exception as e:
             log.error(f"Error sending ticket closed notification: {e}")
@@ -3094,28 +3067,28 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     actual_user_id = user.user_id
 
             if actual_user_id:
-                # Check for duplicate (within 2 minutes for comments)
-                if not check_duplicate_notification(actual_user_id, f'New Comment on Ticket #{ticket_number}', 'ticket_id', ticket_id, minutes=2):
-                    notification = NotificationManager.create_notification(
-                        user_id=actual_user_id,
-                        type='info',
-                        title=f'New Comment on Ticket #{ticket_number}',
-                        message=f'{comment_by} added a comment to your support ticket "{subject[:60]}..."',
-                        priority='normal',
-                        category='support',
-                        action_required=False,
-                        action_url=build_notification_action_url(actual_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
-                        action_label='View Comment',
-                        metadata={
-                            'ticket_id': ticket_id,
-                            'ticket_number': ticket_number,
-                            'event_type': 'new_comment',
-                            'workflow': 'support_ticket',
-                            'target_role': 'client'
-                        },
-                        sender_name=comment_by,
-                        target_role='client'
-                    )
+                notification = NotificationManager.create_notification(
+                    user_id=actual_user_id,
+                    type='info',
+                    title=f'New Comment on Ticket #{ticket_number}',
+                    message=f'{comment_by} added a comment to your support ticket "{subject[:60]}..."',
+                    priority='normal',
+                    category='support',
+                    action_required=False,
+                    action_url=build_notification_action_url(actual_user_id, 'support', {'ticket_id': ticket_id}, 'dashboard'),
+                    action_label='View Comment',
+                    metadata={
+                        'ticket_id': ticket_id,
+                        'ticket_number': ticket_number,
+                        'event_type': 'new_comment',
+                        'workflow': 'support_ticket',
+                        'target_role': 'client'
+                    },
+                    sender_name=comment_by,
+                    target_role='client',
+                    dedup_key=notification_dedup_key(actual_user_id, f'New Comment on Ticket #{ticket_number}', 'ticket_id', ticket_id, minutes=2)
+                )
+                if notification is not None:
                     send_notification_to_user(actual_user_id, notification.to_dict())
                 else:
                     log.info(f"Skipped duplicate comment notification for ticket #{ticket_number}")
@@ -3211,9 +3184,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         Priority: HIGH (action required — buyer must act)
         """
         try:
-            if check_duplicate_notification(buyer_user_id, 'CR Assigned', 'cr_id', cr_id, minutes=5):
-                return
-
             action_url = build_notification_action_url(
                 user_id=buyer_user_id,
                 base_page='change-requests',
@@ -3239,8 +3209,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     'project_name': project_name,
                     'workflow': 'cr_buyer_assignment'
                 },
-                sender_name=assigned_by_name
+                sender_name=assigned_by_name,
+                dedup_key=notification_dedup_key(buyer_user_id, 'CR Assigned', 'cr_id', cr_id, minutes=5)
             )
+            if notification is None:
+                return
             send_notification_to_user(buyer_user_id, notification.to_dict())
 
             # Email fallback — buyer must act on this
@@ -3293,9 +3266,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             ).all()
 
             for td in td_users:
-                if check_duplicate_notification(td.user_id, 'Disposal Escalation', 'return_id', return_id or item_name, minutes=5):
-                    continue
-
                 action_url = build_notification_action_url(
                     user_id=td.user_id,
                     base_page='disposal-approvals',
@@ -3323,8 +3293,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'project_name': project_name,
                         'workflow': 'td_inventory_escalation'
                     },
-                    sender_name=escalated_by_name
+                    sender_name=escalated_by_name,
+                    dedup_key=notification_dedup_key(td.user_id, 'Disposal Escalation', 'return_id', return_id or item_name, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(td.user_id, notification.to_dict())
 
                 # Email fallback — TD must approve (action required)
@@ -3382,8 +3355,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 return
             pm_users = User.query.filter_by(role_id=pm_role.role_id, is_active=True, is_deleted=False).all()
             for pm in pm_users:
-                if check_duplicate_notification(pm.user_id, 'Return Delivery Note Created', 'rdn_number', rdn_number, minutes=5):
-                    continue
                 action_url = build_notification_action_url(
                     user_id=pm.user_id,
                     base_page='m2-store/receive-returns',
@@ -3405,8 +3376,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'project_name': project_name,
                         'workflow': 'rdn_created'
                     },
-                    sender_name=returned_by_name
+                    sender_name=returned_by_name,
+                    dedup_key=notification_dedup_key(pm.user_id, 'Return Delivery Note Created', 'rdn_number', rdn_number, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm.user_id, notification.to_dict())
                 if ComprehensiveNotificationService.is_user_offline(pm.user_id):
                     if pm.email:
@@ -3450,8 +3424,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         """
         try:
             for pm_id in pm_user_ids:
-                if check_duplicate_notification(pm_id, 'Return In Transit', 'rdn_number', rdn_number, minutes=5):
-                    continue
                 action_url = build_notification_action_url(
                     user_id=pm_id,
                     base_page='m2-store/receive-returns',
@@ -3473,8 +3445,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'project_name': project_name,
                         'workflow': 'rdn_dispatched'
                     },
-                    sender_name=returned_by_name
+                    sender_name=returned_by_name,
+                    dedup_key=notification_dedup_key(pm_id, 'Return In Transit', 'rdn_number', rdn_number, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm_id, notification.to_dict())
                 pm_user = User.query.get(pm_id)
                 if pm_user and ComprehensiveNotificationService.is_user_offline(pm_id):
@@ -3527,8 +3502,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     recipients.append(('pm', pm_id))
 
             for role_type, user_id in recipients:
-                if check_duplicate_notification(user_id, 'Material Repaired', 'material_name', material_name, minutes=5):
-                    continue
                 if role_type == 'se':
                     action_url = build_notification_action_url(
                         user_id=user_id,
@@ -3557,8 +3530,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'project_name': project_name,
                         'workflow': 'material_repaired'
                     },
-                    sender_name=repaired_by_name
+                    sender_name=repaired_by_name,
+                    dedup_key=notification_dedup_key(user_id, 'Material Repaired', 'material_name', material_name, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(user_id, notification.to_dict())
         except Exception as e:
             log.error(f"Error sending material repaired notification: {e}")
@@ -3585,8 +3561,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     recipients.append(('pm', pm_id))
 
             for role_type, user_id in recipients:
-                if check_duplicate_notification(user_id, 'Material Disposed', 'material_name', material_name, minutes=5):
-                    continue
                 if role_type == 'se':
                     action_url = build_notification_action_url(
                         user_id=user_id,
@@ -3615,8 +3589,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'project_name': project_name,
                         'workflow': 'material_disposed'
                     },
-                    sender_name=disposed_by_name
+                    sender_name=disposed_by_name,
+                    dedup_key=notification_dedup_key(user_id, 'Material Disposed', 'material_name', material_name, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(user_id, notification.to_dict())
         except Exception as e:
             log.error(f"Error sending material disposed notification: {e}")
@@ -3636,8 +3613,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         """
         try:
             for pm_id in pm_user_ids:
-                if check_duplicate_notification(pm_id, 'Asset Returned', 'category_name', category_name, minutes=5):
-                    continue
                 action_url = build_notification_action_url(
                     user_id=pm_id,
                     base_page='returnable-assets/stock-in',
@@ -3658,8 +3633,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'project_name': project_name,
                         'workflow': 'asset_returned_good'
                     },
-                    sender_name=returned_by_name
+                    sender_name=returned_by_name,
+                    dedup_key=notification_dedup_key(pm_id, 'Asset Returned', 'category_name', category_name, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm_id, notification.to_dict())
         except Exception as e:
             log.error(f"Error sending asset returned good notification: {e}")
@@ -3695,9 +3673,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             label = 'from inventory' if routing_type == 'store' else 'to M2 Store'
 
             for pm in pm_users:
-                if check_duplicate_notification(pm.user_id, 'Store Request', 'cr_id', cr_id, minutes=5):
-                    continue
-
                 action_url = build_notification_action_url(
                     user_id=pm.user_id,
                     base_page='m2-store/stock-in',
@@ -3724,8 +3699,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'workflow': 'store_routing',
                         'target_role': 'productionManager'
                     },
-                    sender_name=buyer_name
+                    sender_name=buyer_name,
+                    dedup_key=notification_dedup_key(pm.user_id, 'Store Request', 'cr_id', cr_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm.user_id, notification.to_dict())
 
                 # Email fallback — PM must act on this
@@ -3804,8 +3782,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 return
             pm_users = User.query.filter_by(role_id=pm_role.role_id, is_active=True, is_deleted=False).all()
             for pm in pm_users:
-                if check_duplicate_notification(pm.user_id, 'Material Request Sent', 'request_number', request_number, minutes=5):
-                    continue
                 action_url = build_notification_action_url(
                     user_id=pm.user_id,
                     base_page='m2-store/internal-requests',
@@ -3828,8 +3804,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'project_name': project_name,
                         'workflow': 'imr_sent_for_approval'
                     },
-                    sender_name=sent_by_name
+                    sender_name=sent_by_name,
+                    dedup_key=notification_dedup_key(pm.user_id, 'Material Request Sent', 'request_number', request_number, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm.user_id, notification.to_dict())
                 if ComprehensiveNotificationService.is_user_offline(pm.user_id):
                     if pm.email:
@@ -3872,8 +3851,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         try:
             if not requester_user_id:
                 return
-            if check_duplicate_notification(requester_user_id, 'Material Issued', 'request_number', request_number, minutes=5):
-                return
             action_url = build_notification_action_url(
                 user_id=requester_user_id,
                 base_page='material-receipts',
@@ -3896,8 +3873,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     'project_name': project_name,
                     'workflow': 'material_issued_from_inventory'
                 },
-                sender_name=issued_by_name
+                sender_name=issued_by_name,
+                dedup_key=notification_dedup_key(requester_user_id, 'Material Issued', 'request_number', request_number, minutes=5)
             )
+            if notification is None:
+                return
             send_notification_to_user(requester_user_id, notification.to_dict())
         except Exception as e:
             log.error(f"Error sending material issued notification: {e}")
@@ -3919,8 +3899,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                 return
             pm_users = User.query.filter_by(role_id=pm_role.role_id, is_active=True, is_deleted=False).all()
             for pm in pm_users:
-                if check_duplicate_notification(pm.user_id, 'Return Note Issued', 'rdn_number', rdn_number, minutes=5):
-                    continue
                 action_url = build_notification_action_url(
                     user_id=pm.user_id,
                     base_page='m2-store/receive-returns',
@@ -3942,8 +3920,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'project_name': project_name,
                         'workflow': 'rdn_issued'
                     },
-                    sender_name=issued_by_name
+                    sender_name=issued_by_name,
+                    dedup_key=notification_dedup_key(pm.user_id, 'Return Note Issued', 'rdn_number', rdn_number, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm.user_id, notification.to_dict())
                 if ComprehensiveNotificationService.is_user_offline(pm.user_id):
                     if pm.email:
@@ -3994,8 +3975,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
             reason_display = disposal_reason.replace('_', ' ').title() if disposal_reason else 'Damaged'
 
             for td in td_users:
-                if check_duplicate_notification(td.user_id, 'Material Disposal Request', 'return_id', return_id, minutes=5):
-                    continue
                 action_url = build_notification_action_url(
                     user_id=td.user_id,
                     base_page='disposal-approvals',
@@ -4018,8 +3997,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                         'material_code': material_code,
                         'workflow': 'material_disposal_request'
                     },
-                    sender_name=requested_by_name
+                    sender_name=requested_by_name,
+                    dedup_key=notification_dedup_key(td.user_id, 'Material Disposal Request', 'return_id', return_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(td.user_id, notification.to_dict())
                 if ComprehensiveNotificationService.is_user_offline(td.user_id):
                     if td.email:
@@ -4064,8 +4046,6 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
         try:
             if not pm_user_id:
                 return
-            if check_duplicate_notification(pm_user_id, 'Disposal Review', 'return_id', return_id, minutes=5):
-                return
 
             if action == 'approved':
                 title = f'Disposal Approved — {material_name}'
@@ -4105,8 +4085,11 @@ class ComprehensiveNotificationService(LabourNotificationMixin):
                     'action': action,
                     'workflow': 'material_disposal_reviewed'
                 },
-                sender_name=reviewed_by_name
+                sender_name=reviewed_by_name,
+                dedup_key=notification_dedup_key(pm_user_id, 'Disposal Review', 'return_id', return_id, minutes=5)
             )
+            if notification is None:
+                return
             send_notification_to_user(pm_user_id, notification.to_dict())
         except Exception as e:
             log.error(f"Error sending material disposal reviewed notification: {e}")
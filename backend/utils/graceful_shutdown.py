@@ -0,0 +1,57 @@
+"""
+Drain in-process background work before a worker process exits.
+
+Requests hand work to background queues and pools (storage uploads, image
+processing, evidence write-backs, dashboard rebuilds, OTP emails, login
+history). When a worker stopped, whatever was still queued there was lost:
+the threads are daemons and the image pool was never shut down.
+drain_background_work() finishes that work and stops the threads; gunicorn
+calls it from the worker_exit hook (gunicorn.conf.py) after the worker has
+stopped accepting requests, and app.py calls it when the development server
+stops.
+
+Only modules this process actually imported are drained, so shutdown never
+imports Pillow, the Supabase SDK etc. just to find an empty queue.
+"""
+
+import sys
+import threading
+import time
+
+from config.logging import get_logger
+
+log = get_logger()
+
+# (module, shutdown function) in drain order: work that can still enqueue
+# emails / login events first, the queues it feeds last
+DRAIN_STEPS = (
+    ('controllers.upload_image_controller', 'shutdown_upload_executor'),
+    ('utils.image_pipeline', 'shutdown_image_pool'),
+    ('utils.inspection_evidence', 'shutdown_evidence_executor'),
+    ('services.pm_dashboard_read_model', 'shutdown_dashboard_refresh'),
+    ('utils.async_email', 'shutdown_email_worker'),
+    ('utils.login_history_writer', 'flush_login_history'),
+)
+
+_lock = threading.Lock()
+_drained = False
+
+
+def drain_background_work():
+    """Finish queued background work and stop its threads (once per process)."""
+    global _drained
+    with _lock:
+        if _drained:
+            return
+        _drained = True
+
+    for module_name, function_name in DRAIN_STEPS:
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue  # Never imported here, nothing queued
+        started = time.perf_counter()
+        try:
+            getattr(module, function_name)()
+            log.info(f"[Shutdown] {function_name} done in {time.perf_counter() - started:.2f}s")
+        except Exception as e:
+            log.error(f"[Shutdown] {function_name} failed: {e}")
@@ -0,0 +1,229 @@
+"""
+Image upload pipeline: header-first validation, bounded process pool,
+size-capped originals and fixed display variants.
+
+compress_image used to fully decode every upload (and flatten RGBA/P to RGB)
+before checking whether it was already under the size limit, then re-encode
+JPEG in a descending quality loop (up to 17 encodes) on the request thread.
+Thumbnail grids later downloaded the full-size originals.
+
+Now:
+- format and dimensions are read from the header (Image.open is lazy); files
+  under the size limit are stored as-is without decoding the full image
+- oversized images search JPEG quality by binary search (about 7 encodes) and
+  only then downscale
+- variants (VARIANT_SIZES) are decoded once with Image.draft (JPEG DCT scaling
+  to the nearest 1/2, 1/4 or 1/8) and shrunk with thumbnail() (reduce + resample)
+- the work runs in a process pool of IMAGE_WORKERS processes with at most
+  IMAGE_QUEUE_LIMIT jobs in flight, off the request thread and the GIL; the
+  workers fork from a forkserver that preloads only this module, and a pool
+  broken by a dead worker is replaced on the next job
+
+Usage:
+    from utils.image_pipeline import submit_image
+
+    future = submit_image(file_content, max_size)
+    result = future.result(timeout=IMAGE_JOB_TIMEOUT_SECONDS)
+    # {'content', 'content_type', 'ext', 'width', 'height', 'quality',
+    #  'variants': {'thumb': bytes, 'preview': bytes}}
+"""
+
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from PIL import Image, ImageOps
+
+IMAGE_WORKERS = int(os.getenv('IMAGE_WORKERS', str(min(4, os.cpu_count() or 1))))
+IMAGE_QUEUE_LIMIT = int(os.getenv('IMAGE_QUEUE_LIMIT', str(IMAGE_WORKERS * 4)))
+IMAGE_SUBMIT_TIMEOUT_SECONDS = 30
+IMAGE_JOB_TIMEOUT_SECONDS = 60
+MAX_IMAGE_PIXELS = int(os.getenv('MAX_IMAGE_PIXELS', '80000000'))  # Reject before decoding (decompression bombs)
+
+# Longest edge of each display variant (always JPEG)
+VARIANT_SIZES = {
+    'preview': 1280,
+    'thumb': 320,
+}
+VARIANT_QUALITY = 80
+MIN_QUALITY = 10
+MAX_QUALITY = 95
+DOWNSCALE_STEP = 0.8
+MIN_EDGE = 64
+
+FORMAT_EXTENSIONS = {
+    'JPEG': 'jpg', 'PNG': 'png', 'GIF': 'gif', 'BMP': 'bmp', 'TIFF': 'tiff', 'WEBP': 'webp',
+}
+
+_lock = threading.Lock()
+_state = {
+    'pool': None,
+    'slots': None,   # BoundedSemaphore of in-flight jobs
+}
+
+
+# ---------------------------------------------------------------------------
+# Image processing (runs in the worker processes)
+# ---------------------------------------------------------------------------
+
+def probe_image(content):
+    """(format, width, height) from the image header, without decoding pixels."""
+    with Image.open(io.BytesIO(content)) as img:
+        image_format, (width, height) = img.format, img.size
+    if image_format not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Unsupported image format: {image_format}")
+    if width * height > MAX_IMAGE_PIXELS:
+        raise ValueError(f"Image too large: {width}x{height} pixels")
+    return image_format, width, height
+
+
+def _to_rgb(img):
+    """Flatten transparency onto white (JPEG has no alpha)."""
+    if img.mode in ('RGBA', 'LA', 'P'):
+        img = img.convert('RGBA')
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    return img if img.mode in ('RGB', 'L') else img.convert('RGB')
+
+
+def _encode_jpeg(img, quality):
+    output = io.BytesIO()
+    img.save(output, format='JPEG', quality=quality, optimize=True)
+    return output.getvalue()
+
+
+def _best_quality_under(img, max_size):
+    """Highest JPEG quality whose encoding fits max_size (binary search): (bytes, quality) or None."""
+    low, high, best = MIN_QUALITY, MAX_QUALITY, None
+    while low <= high:
+        quality = (low + high) // 2
+        encoded = _encode_jpeg(img, quality)
+        if len(encoded) <= max_size:
+            best = (encoded, quality)
+            low = quality + 1
+        else:
+            high = quality - 1
+    return best
+
+
+def _compress_to_limit(content, max_size):
+    with Image.open(io.BytesIO(content)) as source:
+        img = _to_rgb(ImageOps.exif_transpose(source))
+    while True:
+        fitted = _best_quality_under(img, max_size)
+        if fitted:
+            return fitted
+        width, height = int(img.width * DOWNSCALE_STEP), int(img.height * DOWNSCALE_STEP)
+        if min(width, height) < MIN_EDGE:
+            raise ValueError("Image cannot be compressed under the size limit")
+        img = img.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+def _build_variants(content):
+    """Every VARIANT_SIZES rendition from one draft-mode decode, largest first."""
+    variants = {}
+    with Image.open(io.BytesIO(content)) as source:
+        largest = max(VARIANT_SIZES.values())
+        if source.format == 'JPEG':
+            source.draft('RGB', (largest, largest))
+        img = _to_rgb(ImageOps.exif_transpose(source))
+    for name, edge in sorted(VARIANT_SIZES.items(), key=lambda item: -item[1]):
+        img.thumbnail((edge, edge), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        variants[name] = _encode_jpeg(img, VARIANT_QUALITY)
+    return variants
+
+
+def process_image(content, max_size):
+    """Size-capped original plus display variants for one uploaded image."""
+    image_format, width, height = probe_image(content)
+    result = {'width': width, 'height': height, 'quality': None}
+
+    if len(content) <= max_size:
+        # Already under the limit: store the upload unchanged
+        result.update(
+            content=content,
+            content_type=Image.MIME.get(image_format, 'application/octet-stream'),
+            ext=FORMAT_EXTENSIONS[image_format]
+        )
+    else:
+        encoded, quality = _compress_to_limit(content, max_size)
+        result.update(content=encoded, content_type='image/jpeg', ext='jpg', quality=quality)
+
+    result['variants'] = _build_variants(content)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Process pool
+# ---------------------------------------------------------------------------
+
+def _mp_context():
+    """
+    forkserver: workers fork from a small server process that has preloaded
+    only this module (Pillow), never from the app process with its threads and
+    connections. spawn where forkserver is unavailable (Windows).
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload(['utils.image_pipeline'])
+    return context
+
+
+def _get_pool():
+    with _lock:
+        if _state['pool'] is None:
+            _state['pool'] = ProcessPoolExecutor(max_workers=IMAGE_WORKERS, mp_context=_mp_context())
+            if _state['slots'] is None:
+                _state['slots'] = threading.BoundedSemaphore(IMAGE_QUEUE_LIMIT)
+        return _state['pool'], _state['slots']
+
+
+def _discard_pool(pool):
+    """Drop a broken pool (a worker died, e.g. OOM-killed mid-decode) so the next job starts a new one."""
+    with _lock:
+        if _state['pool'] is not pool:
+            return  # Already replaced
+        _state['pool'] = None
+    pool.shutdown(wait=False)
+
+
+def _job_done(pool, slots, future):
+    slots.release()
+    if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+        _discard_pool(pool)
+
+
+def submit_image(content, max_size):
+    """Queue process_image() on the pool; waits for a free slot when IMAGE_QUEUE_LIMIT jobs are in flight."""
+    pool, slots = _get_pool()
+    if not slots.acquire(timeout=IMAGE_SUBMIT_TIMEOUT_SECONDS):
+        raise RuntimeError("Image processing is busy, please retry")
+    try:
+        try:
+            future = pool.submit(process_image, content, max_size)
+        except BrokenProcessPool:
+            # Broken by an earlier job: this one never ran, so retry it once on a new pool
+            _discard_pool(pool)
+            pool, _ = _get_pool()
+            future = pool.submit(process_image, content, max_size)
+    except Exception:
+        slots.release()
+        raise
+    future.add_done_callback(partial(_job_done, pool, slots))
+    return future
+
+
+def shutdown_image_pool(wait=True):
+    """Stop the worker processes (finishing queued jobs when wait=True)."""
+    with _lock:
+        pool = _state['pool']
+        _state['pool'] = None
+        _state['slots'] = None
+    if pool is not None:
+        pool.shutdown(wait=wait)
@@ -0,0 +1,289 @@
+"""
+Vendor inspection evidence normalisation and self-healing.
+
+Inspection evidence_urls are normalised to {url, file_name, file_type}
+objects. Older inspections saved empty/broken evidence objects; for those the
+files are recovered from Supabase Storage (inspections/{cr_id}/, uploaded up
+to 2 minutes before the inspection was created).
+
+Healing used to run on every history / VRR listing read, each time creating
+a Supabase client, listing the folder and discarding the result. Now:
+- a healed result is written back to the inspection (in the background), so
+  the storage listing happens once per broken inspection
+- storage folder listings are cached per process for STORAGE_LISTING_TTL_SECONDS,
+  so inspections of the same CR and repeated reads share one listing
+- the process-wide Supabase client (utils/supabase_client.py) and one bounded
+  executor (EVIDENCE_WORKERS threads) replace the per-request clients and pools
+- repair_inspection_evidence() heals all stored records in one pass
+  (migrations/repair_inspection_evidence.py)
+
+Usage:
+    from utils.inspection_evidence import get_inspections_evidence
+
+    evidence = get_inspections_evidence(inspections)   # {inspection.id: [...]}
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from flask import current_app, has_app_context
+from config.db import db
+from config.logging import get_logger
+from utils.supabase_client import get_supabase_client, supabase_settings
+
+log = get_logger()
+
+BUCKET = 'file_upload'
+STORAGE_LISTING_TTL_SECONDS = int(os.getenv('STORAGE_LISTING_TTL_SECONDS', '300'))
+STORAGE_LISTING_CACHE_SIZE = 512
+EVIDENCE_WORKERS = int(os.getenv('EVIDENCE_WORKERS', '8'))
+HEAL_WINDOW_SECONDS = 120
+
+_lock = threading.Lock()
+_state = {
+    'executor': None,
+}
+_listing_cache = {}  # folder -> (expires_at, files)
+
+
+def _detect_file_type(ext):
+    """Return MIME type from file extension."""
+    type_map = {
+        'jpg': 'image/jpeg', 'jpeg': 'image/jpeg', 'png': 'image/png',
+        'webp': 'image/webp', 'gif': 'image/gif', 'pdf': 'application/pdf',
+        'mp4': 'video/mp4', 'mov': 'video/quicktime', 'webm': 'video/webm',
+        'avi': 'video/x-msvideo', 'mkv': 'video/x-matroska',
+    }
+    return type_map.get(ext, 'image/jpeg')
+
+
+def get_evidence_executor():
+    """Shared bounded executor for evidence storage calls."""
+    with _lock:
+        if _state['executor'] is None:
+            _state['executor'] = ThreadPoolExecutor(max_workers=EVIDENCE_WORKERS, thread_name_prefix='evidence')
+        return _state['executor']
+
+
+def shutdown_evidence_executor(wait=True):
+    """Finish (wait=True) pending evidence write-backs and stop the executor threads."""
+    with _lock:
+        executor, _state['executor'] = _state['executor'], None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def list_storage_folder(folder):
+    """List a storage folder, cached per process for STORAGE_LISTING_TTL_SECONDS."""
+    now = time.time()
+    with _lock:
+        entry = _listing_cache.get(folder)
+        if entry and entry[0] > now:
+            return entry[1]
+
+    client = get_supabase_client()
+    if client is None:
+        return []
+    files = client.storage.from_(BUCKET).list(folder) or []
+
+    with _lock:
+        if len(_listing_cache) >= STORAGE_LISTING_CACHE_SIZE:
+            for key in [k for k, (expires_at, _) in _listing_cache.items() if expires_at <= now]:
+                del _listing_cache[key]
+            while len(_listing_cache) >= STORAGE_LISTING_CACHE_SIZE:
+                del _listing_cache[next(iter(_listing_cache))]  # Oldest listing
+        _listing_cache.pop(folder, None)
+        _listing_cache[folder] = (now + STORAGE_LISTING_TTL_SECONDS, files)
+    return files
+
+
+def clear_storage_listing(folder=None):
+    """Forget a cached folder listing (all listings when folder is None)."""
+    with _lock:
+        if folder is None:
+            _listing_cache.clear()
+        else:
+            _listing_cache.pop(folder, None)
+
+
+def _heal_evidence_from_storage(cr_id, expected_count, inspection_created_at):
+    """
+    Fallback: list files from Supabase Storage under inspections/{cr_id}/
+    and return the ones uploaded within 2 minutes before the inspection was created.
+    Used when evidence_urls contains only empty/broken objects.
+    """
+    try:
+        files = list_storage_folder(f'inspections/{cr_id}')
+        if not files:
+            return []
+
+        candidate = []
+        for f in files:
+            name = f.get('name', '')
+            if not name:
+                continue
+            try:
+                # Filename format: YYYYMMDD_HHMMSS_uuid.ext
+                parts = name.split('_')
+                file_ts = datetime.strptime(f'{parts[0]}_{parts[1]}', '%Y%m%d_%H%M%S')
+                # Keep files uploaded up to 2 minutes before the inspection was created
+                delta = (inspection_created_at.replace(tzinfo=None) - file_ts).total_seconds()
+                if 0 <= delta <= HEAL_WINDOW_SECONDS:
+                    candidate.append((file_ts, name))
+            except (ValueError, IndexError):
+                continue
+
+        candidate.sort(key=lambda x: x[0])
+        selected = candidate[-expected_count:] if len(candidate) >= expected_count else candidate
+
+        supabase_url, _ = supabase_settings()
+        base = f'{supabase_url}/storage/v1/object/public/{BUCKET}'
+        results = []
+        for _, name in selected:
+            ext = name.rsplit('.', 1)[-1].lower() if '.' in name else ''
+            ft = _detect_file_type(ext)
+            results.append({'url': f'{base}/inspections/{cr_id}/{name}', 'file_name': name, 'file_type': ft})
+        return results
+    except Exception as e:
+        log.warning(f'Failed to heal evidence from storage for CR {cr_id}: {e}')
+        return []
+
+
+def _split_evidence(raw):
+    """Normalised valid items and the number of empty/broken items."""
+    valid = []
+    broken_count = 0
+    for item in (raw or []):
+        if isinstance(item, str) and item:
+            file_name = item.split('/')[-1].split('?')[0]
+            ext = file_name.rsplit('.', 1)[-1].lower() if '.' in file_name else ''
+            valid.append({'url': item, 'file_name': file_name, 'file_type': _detect_file_type(ext)})
+        elif isinstance(item, dict) and item.get('url'):
+            valid.append(item)
+        else:
+            broken_count += 1
+    return valid, broken_count
+
+
+def needs_healing(raw):
+    valid, broken_count = _split_evidence(raw)
+    return broken_count > 0 and not valid
+
+
+def normalize_evidence(raw, cr_id=None, inspection_created_at=None):
+    """
+    Normalize evidence items to {url, file_name, file_type} objects.
+    Handles both plain URL strings and dict objects.
+    If all items are empty/broken, auto-heals by listing files from Supabase storage.
+    """
+    valid, broken_count = _split_evidence(raw)
+
+    # If everything is broken and we have enough context, heal from storage
+    if broken_count > 0 and not valid and cr_id and inspection_created_at:
+        return _heal_evidence_from_storage(cr_id, broken_count, inspection_created_at)
+
+    return valid
+
+
+def _persist_healed_evidence(app, healed):
+    """Write healed evidence back, unless the record was fixed meanwhile. Runs on the executor."""
+    from models.vendor_inspection import VendorDeliveryInspection
+
+    with app.app_context():
+        try:
+            table = VendorDeliveryInspection.__table__
+            rows = db.session.execute(
+                db.select(table.c.id, table.c.evidence_urls).where(table.c.id.in_(list(healed)))
+            ).all()
+            for inspection_id, raw in rows:
+                if not needs_healing(raw):
+                    continue
+                db.session.execute(
+                    table.update()
+                    .where(table.c.id == inspection_id)
+                    .values(evidence_urls=healed[inspection_id], updated_at=table.c.updated_at)
+                )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            log.warning(f'Failed to persist healed inspection evidence {sorted(healed)}: {e}')
+
+
+def get_inspections_evidence(inspections):
+    """
+    Normalised evidence for a list of VendorDeliveryInspection rows, {id: [...]}.
+    Only inspections with broken evidence touch storage (on the shared
+    executor); what they heal is persisted so later reads skip storage.
+    """
+    evidence_map = {}
+    to_heal = []
+    for insp in inspections:
+        if insp.id in evidence_map:
+            continue
+        valid, broken_count = _split_evidence(insp.evidence_urls)
+        if broken_count > 0 and not valid and insp.cr_id and insp.created_at:
+            to_heal.append((insp, broken_count))
+        evidence_map[insp.id] = valid
+
+    if not to_heal:
+        return evidence_map
+
+    executor = get_evidence_executor()
+    futures = {
+        insp.id: executor.submit(_heal_evidence_from_storage, insp.cr_id, broken_count, insp.created_at)
+        for insp, broken_count in to_heal
+    }
+    healed = {}
+    for inspection_id, future in futures.items():
+        evidence_map[inspection_id] = future.result()
+        if evidence_map[inspection_id]:
+            healed[inspection_id] = evidence_map[inspection_id]
+
+    if healed and has_app_context():
+        executor.submit(_persist_healed_evidence, current_app._get_current_object(), healed)
+    return evidence_map
+
+
+def repair_inspection_evidence(batch_size=200):
+    """
+    Heal and persist evidence for every inspection whose evidence is all broken.
+    Returns (checked, repaired). Call inside an app context.
+    """
+    from models.vendor_inspection import VendorDeliveryInspection
+
+    checked = repaired = 0
+    last_id = 0
+    while True:
+        inspections = VendorDeliveryInspection.query.filter(
+            VendorDeliveryInspection.id > last_id,
+            VendorDeliveryInspection.is_deleted == False
+        ).order_by(VendorDeliveryInspection.id).limit(batch_size).all()
+        if not inspections:
+            break
+        last_id = inspections[-1].id
+
+        broken = [insp for insp in inspections if needs_healing(insp.evidence_urls)]
+        checked += len(broken)
+        if broken:
+            executor = get_evidence_executor()
+            futures = [
+                (insp, executor.submit(
+                    _heal_evidence_from_storage, insp.cr_id, _split_evidence(insp.evidence_urls)[1], insp.created_at
+                ))
+                for insp in broken if insp.cr_id and insp.created_at
+            ]
+            table = VendorDeliveryInspection.__table__
+            for insp, future in futures:
+                evidence = future.result()
+                if evidence:
+                    db.session.execute(
+                        table.update()
+                        .where(table.c.id == insp.id)
+                        .values(evidence_urls=evidence, updated_at=table.c.updated_at)
+                    )
+                    repaired += 1
+            db.session.commit()
+    return checked, repaired
@@ -10,7 +10,7 @@ from models.user import User
 from models.role import Role
 from config.logging import get_logger
 from utils.role_route_mapper import build_notification_action_url
-from utils.notification_dedup import check_duplicate_notification
+from utils.notification_dedup import notification_dedup_key
 
 log = get_logger()
 
@@ -29,9 +29,6 @@ class LabourNotificationMixin:
         """
         try:
             for pm_id in pm_user_ids:
-                if check_duplicate_notification(pm_id, 'Labour Requisition', 'requisition_id', requisition_id, minutes=5):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=pm_id,
                     type='alert',
@@ -44,8 +41,11 @@ class LabourNotificationMixin:
                     action_label='Review Requisition',
                     metadata={'requisition_id': requisition_id, 'requisition_code': requisition_code, 'project_name': project_name},
                     sender_id=se_user_id,
-                    sender_name=se_name
+                    sender_name=se_name,
+                    dedup_key=notification_dedup_key(pm_id, 'Labour Requisition', 'requisition_id', requisition_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(pm_id, notification.to_dict())
                 # Email fallback -- PM must approve this (action required)
                 try:
@@ -82,9 +82,6 @@ class LabourNotificationMixin:
         Priority: MEDIUM
         """
         try:
-            if check_duplicate_notification(se_user_id, 'Requisition Approved', 'requisition_id', requisition_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=se_user_id,
                 type='success',
@@ -96,8 +93,11 @@ class LabourNotificationMixin:
                 action_label='View Requisition',
                 metadata={'requisition_id': requisition_id, 'requisition_code': requisition_code, 'project_name': project_name},
                 sender_id=pm_user_id,
-                sender_name=pm_name
+                sender_name=pm_name,
+                dedup_key=notification_dedup_key(se_user_id, 'Requisition Approved', 'requisition_id', requisition_id, minutes=5)
             )
+            if notification is None:
+                return
             send_notification_to_user(se_user_id, notification.to_dict())
             log.info(f"Sent labour requisition approved notification for {requisition_code}")
         except Exception as e:
@@ -113,9 +113,6 @@ class LabourNotificationMixin:
         Priority: HIGH
         """
         try:
-            if check_duplicate_notification(se_user_id, 'Requisition Rejected', 'requisition_id', requisition_id, minutes=5):
-                return
-
             notification = NotificationManager.create_notification(
                 user_id=se_user_id,
                 type='rejection',
@@ -128,8 +125,11 @@ class LabourNotificationMixin:
                 action_label='View & Resubmit',
                 metadata={'requisition_id': requisition_id, 'requisition_code': requisition_code, 'project_name': project_name, 'reason': reason},
                 sender_id=pm_user_id,
-                sender_name=pm_name
+                sender_name=pm_name,
+                dedup_key=notification_dedup_key(se_user_id, 'Requisition Rejected', 'requisition_id', requisition_id, minutes=5)
             )
+            if notification is None:
+                return
             send_notification_to_user(se_user_id, notification.to_dict())
             log.info(f"Sent labour requisition rejected notification for {requisition_code}")
         except Exception as e:
@@ -152,9 +152,6 @@ class LabourNotificationMixin:
             ).all()
 
             for prod_mgr in prod_managers:
-                if check_duplicate_notification(prod_mgr.user_id, 'Labour Assignment', 'requisition_id', requisition_id, minutes=5):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=prod_mgr.user_id,
                     type='alert',
@@ -167,8 +164,11 @@ class LabourNotificationMixin:
                     action_label='Assign Workers',
                     metadata={'requisition_id': requisition_id, 'requisition_code': requisition_code, 'project_name': project_name},
                     sender_id=pm_user_id,
-                    sender_name=pm_name
+                    sender_name=pm_name,
+                    dedup_key=notification_dedup_key(prod_mgr.user_id, 'Labour Assignment', 'requisition_id', requisition_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(prod_mgr.user_id, notification.to_dict())
 
             log.info(f"Sent labour sent-to-production notification for {requisition_code}")
@@ -205,9 +205,6 @@ class LabourNotificationMixin:
                         recipients.add(('pm', pm_id))
 
             for role_tag, user_id in recipients:
-                if check_duplicate_notification(user_id, 'Workers Assigned', 'requisition_id', requisition_id, minutes=5):
-                    continue
-
                 page = 'labour/arrivals' if role_tag == 'se' else 'labour/approvals'
                 fallback = 'site-engineer' if role_tag == 'se' else 'project-manager'
 
@@ -222,8 +219,11 @@ class LabourNotificationMixin:
                     action_label='View Assignment',
                     metadata={'requisition_id': requisition_id, 'requisition_code': requisition_code, 'project_name': project_name, 'required_date': str(required_date)},
                     sender_id=prod_mgr_id,
-                    sender_name=prod_mgr_name
+                    sender_name=prod_mgr_name,
+                    dedup_key=notification_dedup_key(user_id, 'Workers Assigned', 'requisition_id', requisition_id, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(user_id, notification.to_dict())
 
             log.info(f"Sent workers-assigned notifications for {requisition_code}")
@@ -258,11 +258,8 @@ class LabourNotificationMixin:
                 else:
                     date_str = f' for {lock_date.strftime("%d %b %Y")}'
 
-            dedup_key = f'{project_id}_{lock_date}' if lock_date else str(project_id)
+            lock_ref = f'{project_id}_{lock_date}' if lock_date else str(project_id)
             for admin in admin_users:
-                if check_duplicate_notification(admin.user_id, 'Attendance Locked', 'project_id', dedup_key, minutes=5):
-                    continue
-
                 notification = NotificationManager.create_notification(
                     user_id=admin.user_id,
                     type='info',
@@ -274,8 +271,11 @@ class LabourNotificationMixin:
                     action_label='Process Payroll',
                     metadata={'project_id': project_id, 'project_name': project_name, 'locked_count': locked_count},
                     sender_id=pm_user_id,
-                    sender_name=pm_name
+                    sender_name=pm_name,
+                    dedup_key=notification_dedup_key(admin.user_id, 'Attendance Locked', 'project_id', lock_ref, minutes=5)
                 )
+                if notification is None:
+                    continue
                 send_notification_to_user(admin.user_id, notification.to_dict())
 
             log.info(f"Sent attendance-locked notification for project {project_name} ({locked_count} records)")
@@ -0,0 +1,35 @@
+"""
+Module stand-ins imported on first attribute access.
+
+Every blueprint is registered at boot, but the controllers behind the route
+modules (inventory_controller alone is about 7.5k lines) were imported with
+them, in every worker and at test collection. Route modules now bind their
+controllers with LazyModule and call controller.function(...) inside the
+view, so a controller is imported by the first request that reaches it,
+once per process (the same idea as Flask's LazyView / import_string).
+
+Usage:
+    from utils.lazy_module import LazyModule
+
+    boq_controller = LazyModule('controllers.boq_controller')
+
+    @boq_routes.route('/boq/<int:boq_id>', methods=['GET'])
+    def get_boq_route(boq_id):
+        return boq_controller.get_boq(boq_id)
+"""
+
+import importlib
+
+
+class LazyModule:
+    """Module-level stand-in for a module; imports it on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        # import_module is a sys.modules lookup once loaded, and serialises the first import across threads
+        return getattr(importlib.import_module(self._name), attr)
+
+    def __repr__(self):
+        return f"<LazyModule {self._name}>"
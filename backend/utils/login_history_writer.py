@@ -0,0 +1,122 @@
+"""
+Background, batched writer for login_history.
+
+Login telemetry used to be inserted and committed synchronously inside the
+OTP verification response. Events are now queued and written by a daemon
+thread in multi-row INSERTs, on its own session, so:
+- login latency no longer depends on the history insert
+- a failed history insert can never roll back the login's session
+
+Usage:
+    from utils.login_history_writer import enqueue_login_event
+
+    enqueue_login_event(app, {...login_history row...})
+"""
+
+import atexit
+import queue
+import threading
+import time
+from sqlalchemy import insert
+from config.logging import get_logger
+
+log = get_logger()
+
+BATCH_SIZE = 100            # Max rows per INSERT
+FLUSH_INTERVAL_SECONDS = 2  # Max time an event waits in the queue
+MAX_QUEUE_SIZE = 10000      # Drop (and log) events beyond this backlog
+
+_login_queue = queue.Queue(maxsize=MAX_QUEUE_SIZE)
+_login_worker = None
+_worker_lock = threading.Lock()
+_app = None
+
+
+def _write_batch(rows):
+    """Insert a batch of login_history rows on the worker's own session."""
+    from config.db import db
+    from models.login_history import LoginHistory
+
+    with _app.app_context():
+        try:
+            db.session.execute(insert(LoginHistory.__table__), rows)
+            db.session.commit()
+            log.debug(f"[LoginHistory] Wrote {len(rows)} login events")
+        except Exception as e:
+            db.session.rollback()
+            log.error(f"[LoginHistory] Failed to write {len(rows)} login events: {e}")
+        finally:
+            db.session.remove()
+
+
+def _login_worker_thread():
+    """Drain the queue in batches of up to BATCH_SIZE or every FLUSH_INTERVAL_SECONDS."""
+    while True:
+        batch = []
+        deadline = time.monotonic() + FLUSH_INTERVAL_SECONDS
+        stop = False
+        while len(batch) < BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = _login_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            _login_queue.task_done()
+            if item is None:  # Shutdown signal
+                stop = True
+                break
+            batch.append(item)
+
+        if batch:
+            _write_batch(batch)
+        if stop:
+            break
+
+
+def _ensure_worker():
+    global _login_worker
+    if _login_worker is None or not _login_worker.is_alive():
+        with _worker_lock:
+            if _login_worker is None or not _login_worker.is_alive():
+                _login_worker = threading.Thread(target=_login_worker_thread, name="login-history-writer", daemon=True)
+                _login_worker.start()
+                log.info("Started login history writer thread")
+
+
+def enqueue_login_event(app, row):
+    """
+    Queue a login_history row for background insertion.
+    Returns False when the queue is full (event dropped), True otherwise.
+    """
+    global _app
+    if _app is None:
+        _app = app
+    _ensure_worker()
+    try:
+        _login_queue.put_nowait(row)
+        return True
+    except queue.Full:
+        log.warning(f"[LoginHistory] Queue full, dropping login event for user {row.get('user_id')}")
+        return False
+
+
+def flush_login_history(timeout=10):
+    """Stop the writer after writing everything queued so far (used on shutdown)."""
+    if _login_worker is None or not _login_worker.is_alive():
+        return
+    try:
+        _login_queue.put(None, timeout=timeout)
+    except queue.Full:
+        log.warning("[LoginHistory] Queue full on shutdown, pending login events may be lost")
+        return
+    _login_worker.join(timeout=timeout)
+
+
+def get_login_queue_depth():
+    """Number of login events waiting to be written."""
+    return _login_queue.qsize()
+
+
+atexit.register(flush_login_history)
@@ -12,7 +12,7 @@ from reportlab.pdfgen import canvas
 from io import BytesIO
 from datetime import datetime
 import os
-import base64
+from utils.settings_cache import image_bytes_for
 
 
 class LPOPDFGenerator:
@@ -86,17 +86,16 @@ class LPOPDFGenerator:
             leading=9
         ))
 
-    def _get_image_from_base64(self, base64_string, width=None, height=None):
-        """Convert base64 string to ReportLab Image"""
+    def _get_image_from_base64(self, base64_string, width=None, height=None, settings_field=None):
+        """Convert base64 string to ReportLab Image (settings_field: the SystemSettings image it normally holds)"""
         try:
             if not base64_string:
                 return None
 
-            # Remove data URL prefix if present
-            if ',' in base64_string:
-                base64_string = base64_string.split(',')[1]
-
-            image_data = base64.b64decode(base64_string)
+            # Settings images are decoded once and reused across PDFs
+            image_data = image_bytes_for(settings_field, base64_string)
+            if not image_data:
+                return None
             image_buffer = BytesIO(image_data)
 
             if width and height:
@@ -301,7 +300,7 @@ class LPOPDFGenerator:
 
         # Try custom header image first
         if header_image:
-            img = self._get_image_from_base64(header_image, width=7.5*inch)
+            img = self._get_image_from_base64(header_image, width=7.5*inch, settings_field='lpo_header_image')
             if img:
                 elements.append(img)
                 return elements
@@ -583,7 +582,7 @@ TRN# {company.get('trn', 'N/A')}'''
         # MD signature cell content
         md_content = []
         if md_signature:
-            md_img = self._get_image_from_base64(md_signature, width=1.2*inch, height=0.5*inch)
+            md_img = self._get_image_from_base64(md_signature, width=1.2*inch, height=0.5*inch, settings_field='md_signature_image')
             if md_img:
                 md_content.append(md_img)
         # Only show name above title if name is different from title (actual person name)
@@ -601,14 +600,14 @@ TRN# {company.get('trn', 'N/A')}'''
         # Stamp cell (center) - reduced size for better fit
         stamp_cell = []
         if stamp_image:
-            stamp_img = self._get_image_from_base64(stamp_image, width=1*inch, height=1*inch)
+            stamp_img = self._get_image_from_base64(stamp_image, width=1*inch, height=1*inch, settings_field='company_stamp_image')
             if stamp_img:
                 stamp_cell.append(stamp_img)
 
         # TD signature cell content - aligned left within cell
         td_content = []
         if td_signature:
-            td_img = self._get_image_from_base64(td_signature, width=1.2*inch, height=0.5*inch)
+            td_img = self._get_image_from_base64(td_signature, width=1.2*inch, height=0.5*inch, settings_field='td_signature_image')
             if td_img:
                 td_content.append(td_img)
         # Only show name above title if name is different from title (actual person name)
@@ -32,7 +32,7 @@ def generate_and_save_lpo_pdf(cr_id, po_child_id=None):
     from models.po_child import POChild
     from models.project import Project
     from models.vendor import Vendor, VendorProduct
-    from models.system_settings import SystemSettings
+    from utils.settings_cache import get_system_settings
     from models.lpo_customization import LPOCustomization
     from controllers.buyer.helpers import _parse_custom_terms, process_materials_with_negotiated_prices
     from utils.lpo_pdf_generator import LPOPDFGenerator
@@ -96,7 +96,7 @@ def generate_and_save_lpo_pdf(cr_id, po_child_id=None):
 
         # ── Load project & system settings ──────────────────────────
         project = Project.query.get(cr.project_id)
-        settings = SystemSettings.query.first()
+        settings = get_system_settings()
 
         # ── Process materials ───────────────────────────────────────
         if po_child and po_child.materials_data:
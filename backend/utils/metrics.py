@@ -0,0 +1,262 @@
+"""
+In-process metrics with a Prometheus text `/metrics` endpoint.
+
+Collected without any per-request database work:
+- http_request_duration_seconds   histogram per blueprint / endpoint / method
+- http_requests_total             counter per endpoint / method / status
+- db_pool_*                       gauges read from the engine pool + checkout/connect counters
+- cache_requests_total            Flask-Caching get() hits and misses per key prefix
+- socketio_*                      active Socket.IO connections and distinct users
+- background_queue_depth          email and login-history queues
+
+Access: allowed when METRICS_TOKEN is set and sent as `Authorization: Bearer <token>`,
+or from a loopback address on a direct (non-proxied) connection.
+
+Metrics are per process; with several workers, scrape each worker directly.
+
+Usage:
+    from utils.metrics import init_metrics, InstrumentedCache
+
+    cache = InstrumentedCache(app)
+    init_metrics(app)
+"""
+
+import os
+import hmac
+import time
+import threading
+from bisect import bisect_left
+from flask import request, g, Response, abort
+from flask_caching import Cache
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+from config.logging import get_logger
+
+log = get_logger()
+
+METRICS_PATH = '/metrics'
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LOOPBACK_ADDRESSES = ('127.0.0.1', '::1', 'localhost')
+
+
+class _Counter:
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            lines.append(f'{self.name}{_format_labels(self.label_names, labels)} {value}')
+        return lines
+
+
+class _Histogram:
+    def __init__(self, name, help_text, label_names, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._values = {}  # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            stats = self._values.get(labels)
+            if stats is None:
+                stats = self._values[labels] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                stats[index] += 1
+            stats[-2] += value
+            stats[-1] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            items = [(labels, list(stats)) for labels, stats in self._values.items()]
+        for labels, stats in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, stats):
+                cumulative += count
+                bucket_labels = _format_labels(self.label_names + ('le',), labels + (str(bound),))
+                lines.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f'{self.name}_bucket{_format_labels(self.label_names + ("le",), labels + ("+Inf",))} {stats[-1]}')
+            lines.append(f'{self.name}_sum{label_text} {stats[-2]:.6f}')
+            lines.append(f'{self.name}_count{label_text} {stats[-1]}')
+        return lines
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    return '{' + ','.join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + '}'
+
+
+def _gauge(name, help_text, samples):
+    """Render a gauge from [(label_names, label_values, value)]."""
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} gauge']
+    for label_names, label_values, value in samples:
+        lines.append(f'{name}{_format_labels(label_names, label_values)} {value}')
+    return lines
+
+
+REQUEST_LATENCY = _Histogram(
+    'http_request_duration_seconds', 'Request latency in seconds',
+    ('blueprint', 'endpoint', 'method')
+)
+REQUEST_COUNT = _Counter(
+    'http_requests_total', 'Requests served', ('endpoint', 'method', 'status')
+)
+CACHE_REQUESTS = _Counter(
+    'cache_requests_total', 'Flask-Caching get() calls', ('prefix', 'result')
+)
+POOL_EVENTS = _Counter(
+    'db_pool_events_total', 'Connection pool events', ('event',)
+)
+
+
+# ---------------------------------------------------------------------------
+# Cache instrumentation
+# ---------------------------------------------------------------------------
+
+class InstrumentedCache(Cache):
+    """Flask-Caching Cache that counts get() hits and misses per key prefix."""
+
+    def get(self, key, *args, **kwargs):
+        value = super().get(key, *args, **kwargs)
+        prefix = str(key).split(':', 1)[0]
+        CACHE_REQUESTS.inc((prefix, 'miss' if value is None else 'hit'))
+        return value
+
+
+# ---------------------------------------------------------------------------
+# Pool instrumentation
+# ---------------------------------------------------------------------------
+
+def _on_pool_event(name):
+    def listener(*args):
+        POOL_EVENTS.inc((name,))
+    return listener
+
+
+_pool_listeners = {name: _on_pool_event(name) for name in ('connect', 'checkout', 'checkin', 'invalidate')}
+
+
+def register_pool_metrics():
+    """Count pool connect/checkout/checkin/invalidate events for every engine."""
+    for name, listener in _pool_listeners.items():
+        if not event.contains(Pool, name, listener):
+            event.listen(Pool, name, listener)
+
+
+def _pool_gauges(app):
+    from config.db import db
+    pool = db.engine.pool  # Reads pool counters only, no connection checkout
+    options = app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+    samples = []
+    for metric, getter in (
+        ('size', getattr(pool, 'size', None)),
+        ('checked_out', getattr(pool, 'checkedout', None)),
+        ('checked_in', getattr(pool, 'checkedin', None)),
+        ('overflow', getattr(pool, 'overflow', None)),
+    ):
+        if getter is not None:
+            samples.append((('state',), (metric,), getter()))
+    lines = _gauge('db_pool_connections', 'Connection pool state', samples)
+    lines += _gauge('db_pool_configured', 'Configured pool limits', [
+        (('limit',), ('pool_size',), options.get('pool_size', 0)),
+        (('limit',), ('max_overflow',), options.get('max_overflow', 0)),
+    ])
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# Socket.IO and background queues
+# ---------------------------------------------------------------------------
+
+def _socketio_gauges():
+    from socketio_server import active_connections
+    connections = list(active_connections.values())
+    users = {conn.get('user_id') for conn in connections}
+    lines = _gauge('socketio_connections', 'Active Socket.IO connections', [((), (), len(connections))])
+    lines += _gauge('socketio_connected_users', 'Distinct users with a Socket.IO connection', [((), (), len(users))])
+    return lines
+
+
+def _queue_gauges():
+    from utils.async_email import email_queue
+    from utils.login_history_writer import get_login_queue_depth
+    return _gauge('background_queue_depth', 'Items waiting in background queues', [
+        (('queue',), ('email',), email_queue.qsize()),
+        (('queue',), ('login_history',), get_login_queue_depth()),
+    ])
+
+
+def render_metrics(app):
+    lines = REQUEST_LATENCY.render() + REQUEST_COUNT.render() + CACHE_REQUESTS.render() + POOL_EVENTS.render()
+    for collect in (lambda: _pool_gauges(app), _socketio_gauges, _queue_gauges):
+        try:
+            lines += collect()
+        except Exception as e:
+            log.error(f"[Metrics] Collector failed: {e}")
+    return '\n'.join(lines) + '\n'
+
+
+# ---------------------------------------------------------------------------
+# Flask wiring
+# ---------------------------------------------------------------------------
+
+def _metrics_access_allowed():
+    token = os.getenv('METRICS_TOKEN')
+    if token:
+        auth = request.headers.get('Authorization', '')
+        if auth.startswith('Bearer ') and hmac.compare_digest(auth[7:], token):
+            return True
+    # Local bind: direct loopback connections only (never via the reverse proxy)
+    return request.remote_addr in LOOPBACK_ADDRESSES and 'X-Forwarded-For' not in request.headers
+
+
+def init_metrics(app):
+    """Register request timing hooks, pool listeners and the /metrics route."""
+    register_pool_metrics()
+
+    @app.before_request
+    def start_request_timer():
+        g._metrics_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.pop('_metrics_started', None)
+        if started is not None and request.path != METRICS_PATH:
+            endpoint = request.endpoint or 'unmatched'
+            REQUEST_LATENCY.observe(
+                (request.blueprint or 'app', endpoint, request.method),
+                time.perf_counter() - started
+            )
+            REQUEST_COUNT.inc((endpoint, request.method, str(response.status_code)))
+        return response
+
+    def metrics():
+        if not _metrics_access_allowed():
+            abort(404)
+        return Response(render_metrics(app), mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule(METRICS_PATH, 'metrics', metrics, methods=['GET'])
+    limiter = getattr(app, 'limiter', None)
+    if limiter is not None:
+        limiter.exempt(metrics)
@@ -13,7 +13,7 @@ from io import BytesIO
 from datetime import date
 import os
 import requests
-import base64
+from utils.settings_cache import image_bytes_for
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
@@ -343,9 +343,8 @@ class ModernBOQPDFGenerator:
             try:
                 # Parse base64 data URL
                 if signature_image_data.startswith('data:image/'):
-                    # Extract base64 content after the data URL prefix
-                    header, encoded = signature_image_data.split(',', 1)
-                    signature_bytes = base64.b64decode(encoded)
+                    # Decode once (reuses the cached settings decode when it is the stored signature)
+                    signature_bytes = image_bytes_for('md_signature_image', signature_image_data)
                     signature_buffer = BytesIO(signature_bytes)
                     signature_cell = Image(signature_buffer, width=1.5*inch, height=0.6*inch, kind='proportional')
             except Exception as e:
@@ -1593,8 +1592,7 @@ class ModernBOQPDFGenerator:
             try:
                 # Parse base64 data URL
                 if self.signature_image.startswith('data:image/'):
-                    header, encoded = self.signature_image.split(',', 1)
-                    sig_bytes = base64.b64decode(encoded)
+                    sig_bytes = image_bytes_for('signature_image', self.signature_image)
                     sig_buffer = BytesIO(sig_bytes)
                     sig_img_element = Image(sig_buffer, width=1.2*inch, height=0.5*inch, kind='proportional')
             except Exception as e:
@@ -1607,8 +1605,7 @@ class ModernBOQPDFGenerator:
                 # Parse base64 data URL
                 seal_data = self.company_seal_image
                 if seal_data.startswith('data:image/'):
-                    header, encoded = seal_data.split(',', 1)
-                    seal_bytes = base64.b64decode(encoded)
+                    seal_bytes = image_bytes_for('company_stamp_image', seal_data)
                     seal_buffer = BytesIO(seal_bytes)
                     seal_img_element = Image(seal_buffer, width=0.8*inch, height=0.8*inch, kind='proportional')
             except Exception as e:
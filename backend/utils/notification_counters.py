@@ -0,0 +1,228 @@
+"""
+Per-user unread notification counters.
+
+notification_unread_counters holds one row per user with their unread,
+non-deleted notification count, so badge polls and the notification list
+read a primary-key row instead of counting the notifications table.
+
+The counter is adjusted in the same transaction as the notification write:
+- ORM writes (create, mark read, mark all read, delete) via an after_flush
+  listener installed by register_unread_counter_sync()
+- Core inserts (deduplicated creates, bulk creates) via adjust_unread_counts()
+
+After commit the new counts are pushed to the users' Socket.IO rooms as a
+'notification_count' event. Counters can drift if notifications are changed
+outside these paths (raw SQL, retention jobs); reconcile_unread_counters()
+recomputes them and is run by
+migrations/create_notification_unread_counters_table.py --reconcile.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import event, func, literal, select, update, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from config.db import db
+from config.logging import get_logger
+from models.notification import Notification, NotificationUnreadCounter
+
+log = get_logger()
+
+_counters = NotificationUnreadCounter.__table__
+_notifications = Notification.__table__
+
+# session.info key: {user_id: unread_count} to push once the transaction commits
+_PENDING_PUSH_KEY = 'unread_counts_to_push'
+
+
+def _unread_filter(user_id):
+    return (
+        (_notifications.c.user_id == user_id)
+        & (_notifications.c.read == False)  # noqa: E712
+        & (_notifications.c.deleted_at.is_(None))
+    )
+
+
+def count_unread(user_id, connection=None):
+    """Exact unread count from the notifications table."""
+    connection = connection if connection is not None else db.session.connection()
+    return connection.execute(
+        select(func.count()).select_from(_notifications).where(_unread_filter(user_id))
+    ).scalar() or 0
+
+
+def _apply_delta(connection, user_id, delta):
+    """Add delta to the user's counter (initialising it on first use). Returns the new count."""
+    now = datetime.utcnow()
+    new_count = connection.execute(
+        update(_counters)
+        .where(_counters.c.user_id == user_id)
+        .values(unread_count=func.greatest(_counters.c.unread_count + delta, 0), updated_at=now)
+        .returning(_counters.c.unread_count)
+    ).scalar()
+    if new_count is not None:
+        return new_count
+
+    # No counter yet: seed it from the table (which already includes this transaction's writes)
+    seed = select(
+        literal(user_id), func.count(), literal(now)
+    ).select_from(_notifications).where(_unread_filter(user_id))
+    stmt = pg_insert(_counters).from_select(['user_id', 'unread_count', 'updated_at'], seed)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[_counters.c.user_id],
+        set_={'unread_count': func.greatest(_counters.c.unread_count + delta, 0), 'updated_at': now}
+    ).returning(_counters.c.unread_count)
+    return connection.execute(stmt).scalar()
+
+
+def adjust_unread_counts(deltas, session=None):
+    """
+    Apply {user_id: delta} to the counters inside the current transaction and
+    queue a Socket.IO push for after commit. Use for writes that bypass the
+    ORM unit of work (Core inserts, bulk_save_objects).
+    """
+    session = session if session is not None else db.session
+    connection = session.connection()
+    pending = session.info.setdefault(_PENDING_PUSH_KEY, {})
+    for user_id, delta in deltas.items():
+        if user_id is None or not delta:
+            continue
+        pending[user_id] = _apply_delta(connection, user_id, delta)
+
+
+def _is_unread(notification):
+    return notification.read is not True and notification.deleted_at is None
+
+
+def _was_unread(notification):
+    state = db.inspect(notification)
+
+    def previous(attr):
+        history = state.attrs[attr].history
+        return history.deleted[0] if history.deleted else getattr(notification, attr)
+
+    return previous('read') is not True and previous('deleted_at') is None
+
+
+def _track_unread_after_flush(session, flush_context):
+    deltas = defaultdict(int)
+    for obj in session.new:
+        if isinstance(obj, Notification) and obj.user_id is not None and _is_unread(obj):
+            deltas[obj.user_id] += 1
+    for obj in session.dirty:
+        if isinstance(obj, Notification) and obj.user_id is not None:
+            was, now = _was_unread(obj), _is_unread(obj)
+            if was != now:
+                deltas[obj.user_id] += 1 if now else -1
+    for obj in session.deleted:
+        if isinstance(obj, Notification) and obj.user_id is not None and _was_unread(obj):
+            deltas[obj.user_id] -= 1
+    if deltas:
+        adjust_unread_counts(deltas, session)
+
+
+def _push_after_commit(session):
+    pending = session.info.pop(_PENDING_PUSH_KEY, None)
+    if pending:
+        push_unread_counts(pending)
+
+
+def _discard_after_rollback(session):
+    session.info.pop(_PENDING_PUSH_KEY, None)
+
+
+def register_unread_counter_sync():
+    """Install the session listeners that maintain and push unread counters."""
+    for name, listener in (
+        ("after_flush", _track_unread_after_flush),
+        ("after_commit", _push_after_commit),
+        ("after_rollback", _discard_after_rollback),
+    ):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+
+def push_unread_counts(counts):
+    """Emit {user_id: unread_count} to each user's Socket.IO room."""
+    try:
+        from socketio_server import send_unread_count_to_user
+    except ImportError:
+        return
+    for user_id, unread_count in counts.items():
+        try:
+            send_unread_count_to_user(user_id, unread_count)
+        except Exception as e:
+            log.error(f"[UnreadCounters] Failed to push count to user {user_id}: {e}")
+
+
+def get_unread_count(user_id):
+    """
+    Unread count for a user from the counter row. A missing row is seeded
+    from the notifications table in its own short transaction, so read-only
+    requests keep their session untouched.
+    """
+    count = db.session.execute(
+        select(_counters.c.unread_count).where(_counters.c.user_id == user_id)
+    ).scalar()
+    if count is not None:
+        return count
+
+    with db.engine.begin() as connection:
+        count = count_unread(user_id, connection)
+        connection.execute(
+            pg_insert(_counters)
+            .values(user_id=user_id, unread_count=count, updated_at=datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=[_counters.c.user_id])
+        )
+    return count
+
+
+RECONCILE_SQL = text("""
+    WITH actual AS (
+        SELECT user_id, COUNT(*) AS unread_count
+        FROM notifications
+        WHERE user_id IS NOT NULL AND read = false AND deleted_at IS NULL
+        GROUP BY user_id
+    ),
+    upserted AS (
+        INSERT INTO notification_unread_counters (user_id, unread_count, updated_at)
+        SELECT user_id, unread_count, :now FROM actual
+        ON CONFLICT (user_id) DO UPDATE
+            SET unread_count = EXCLUDED.unread_count, updated_at = EXCLUDED.updated_at
+            WHERE notification_unread_counters.unread_count IS DISTINCT FROM EXCLUDED.unread_count
+        RETURNING user_id, unread_count
+    ),
+    zeroed AS (
+        UPDATE notification_unread_counters c
+        SET unread_count = 0, updated_at = :now
+        WHERE c.unread_count <> 0
+          AND NOT EXISTS (SELECT 1 FROM actual a WHERE a.user_id = c.user_id)
+        RETURNING user_id, unread_count
+    )
+    SELECT user_id, unread_count FROM upserted
+    UNION ALL
+    SELECT user_id, unread_count FROM zeroed
+""")
+
+
+def reconcile_unread_counters(push=True):
+    """
+    Recompute every counter from the notifications table in one statement.
+    Only rows whose value changed are written (and pushed). A notification
+    write committing while this runs can be overwritten by the snapshot
+    count; the next run corrects it.
+
+    Returns {user_id: unread_count} for the corrected users.
+    """
+    corrected = {
+        row.user_id: row.unread_count
+        for row in db.session.execute(RECONCILE_SQL, {'now': datetime.utcnow()}).all()
+    }
+    db.session.commit()
+    if corrected:
+        log.warning(f"[UnreadCounters] Reconciled {len(corrected)} drifted counter(s)")
+        if push:
+            push_unread_counts(corrected)
+    return corrected
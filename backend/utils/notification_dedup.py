@@ -2,49 +2,43 @@
 Notification deduplication utility.
 Extracted to its own module to avoid circular imports between
 comprehensive_notification_service and labour_notification_service.
+
+Duplicates are suppressed by the database: a deduplicated notification
+carries a deterministic key (event + entity + recipient + time bucket) in
+notifications.dedup_key, which has a partial unique index. A second insert
+with the same key is a no-op (INSERT ... ON CONFLICT DO NOTHING in
+NotificationManager.create_notification), so no pre-read is needed.
 """
 
-from datetime import datetime, timedelta
-from models.notification import Notification
-from config.logging import get_logger
+import hashlib
+import re
+import time
+
+MAX_DEDUP_KEY_LENGTH = 255
 
-log = get_logger()
+_NON_SLUG_CHARS = re.compile(r'[^a-z0-9]+')
 
 
-def check_duplicate_notification(user_id, title_pattern, metadata_key, metadata_value, minutes=5):
+def notification_dedup_key(user_id, event, entity_key, entity_value, minutes=5):
     """
-    Check if a similar notification was already sent recently.
-    Returns True if duplicate exists, False otherwise.
+    Build the dedup key for a notification.
+
+    Sends with the same event, entity and recipient inside the same
+    `minutes`-wide time bucket share a key, so only the first one is stored.
+    Buckets are fixed windows: two sends straddling a bucket boundary are
+    both delivered.
+
+    Args:
+        user_id: Recipient user ID
+        event: Event type, usually the notification title ('New BOQ for Approval')
+        entity_key: Entity identifier name ('boq_id', 'cr_id', ...)
+        entity_value: Entity identifier value
+        minutes: Width of the dedup window
     """
-    try:
-        cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
-        existing = Notification.query.filter(
-            Notification.user_id == user_id,
-            Notification.deleted_at.is_(None),
-            Notification.created_at >= cutoff_time,
-            Notification.title.ilike(f'%{title_pattern}%')
-        ).first()
-
-        if existing:
-            caller_wants_metadata_match = metadata_key and metadata_value is not None
-
-            if caller_wants_metadata_match:
-                # Caller provided metadata criteria – only match if existing notification
-                # also has matching metadata.  If the old notification has no metadata
-                # we must NOT treat it as a duplicate (false-positive).
-                if existing.meta_data:
-                    stored_value = existing.meta_data.get(metadata_key)
-                    if str(stored_value) == str(metadata_value):
-                        log.info(f"[DuplicateCheck] Found duplicate notification for user {user_id}, {metadata_key}={metadata_value}")
-                        return True
-                # Old notification has no metadata or metadata doesn't match – not a dup
-                log.debug(f"[DuplicateCheck] Title matched but metadata didn't for user {user_id}, title: {title_pattern}")
-                return False
-            else:
-                # Caller didn't supply metadata criteria – title match alone is enough
-                log.info(f"[DuplicateCheck] Found duplicate notification by title for user {user_id}, title pattern: {title_pattern}")
-                return True
-        return False
-    except Exception as e:
-        log.error(f"[DuplicateCheck] Error checking duplicate: {e}")
-        return False
+    bucket_seconds = max(int(minutes * 60), 1)
+    bucket = int(time.time() // bucket_seconds)
+    event_slug = _NON_SLUG_CHARS.sub('_', str(event).lower()).strip('_')
+    key = f"{event_slug}:{entity_key}={entity_value}:u{user_id}:{bucket_seconds}s{bucket}"
+    if len(key) > MAX_DEDUP_KEY_LENGTH:
+        key = f"{key[:MAX_DEDUP_KEY_LENGTH - 41]}:{hashlib.sha1(key.encode()).hexdigest()}"
+    return key
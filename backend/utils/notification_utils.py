@@ -3,8 +3,11 @@ Notification Utility Functions
 Helper functions to create and send notifications
 """
 
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from models.notification import Notification
 from config.db import db
+from utils.notification_counters import adjust_unread_counts
 from typing import List, Dict, Optional
 
 class NotificationManager:
@@ -24,8 +27,9 @@ class NotificationManager:
         action_label: Optional[str] = None,
         metadata: Optional[Dict] = None,
         sender_id: Optional[int] = None,
-        sender_name: Optional[str] = None
-    ) -> Notification:
+        sender_name: Optional[str] = None,
+        dedup_key: Optional[str] = None
+    ) -> Optional[Notification]:
         """
         Create a notification and save to database
 
@@ -43,11 +47,41 @@ class NotificationManager:
             metadata: Additional metadata as dictionary
             sender_id: ID of the user who triggered the notification
             sender_name: Name of the user who triggered the notification
+            dedup_key: Key from utils.notification_dedup.notification_dedup_key();
+                       if a notification with the same key exists nothing is inserted
 
         Returns:
-            Created Notification object
+            Created Notification object, or None when dedup_key matched an existing one
         """
         try:
+            if dedup_key:
+                # Single INSERT ... ON CONFLICT DO NOTHING. No conflict target: once notifications
+                # is partitioned the dedup_key unique index exists per month partition only
+                stmt = pg_insert(Notification).values(
+                    user_id=user_id,
+                    type=type,
+                    title=title,
+                    message=message,
+                    priority=priority,
+                    category=category,
+                    target_role=target_role,
+                    read=False,
+                    action_required=action_required,
+                    action_url=action_url,
+                    action_label=action_label,
+                    meta_data=metadata,
+                    sender_id=sender_id,
+                    sender_name=sender_name,
+                    created_at=datetime.utcnow(),
+                    dedup_key=dedup_key
+                ).on_conflict_do_nothing().returning(Notification)
+                notification = db.session.scalars(stmt).first()
+                if notification is not None and user_id is not None:
+                    # Core insert bypasses the ORM flush listener that maintains counters
+                    adjust_unread_counts({user_id: 1})
+                db.session.commit()
+                return notification
+
             notification = Notification.create_notification(
                 user_id=user_id,
                 type=type,
@@ -107,6 +141,12 @@ class NotificationManager:
                 notifications.append(notification)
 
             db.session.bulk_save_objects(notifications)
+            # bulk_save_objects bypasses the ORM flush listener that maintains counters
+            deltas = {}
+            for notification in notifications:
+                if notification.user_id is not None:
+                    deltas[notification.user_id] = deltas.get(notification.user_id, 0) + 1
+            adjust_unread_counts(deltas)
             db.session.commit()
 
             return notifications
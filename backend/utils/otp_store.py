@@ -0,0 +1,234 @@
+"""
+Shared, expiring OTP store.
+
+Replaces the module-level `otp_storage` dict in utils/authentication.py, which
+was per-process (an OTP sent by one worker failed verification on another)
+and never purged unverified entries.
+
+Backends:
+- Redis (when REDIS_URL is set and the redis package is available): entries are
+  hashes with a TTL, so they expire server-side and are shared by all workers.
+- In-memory fallback: dict guarded by a lock, with a daemon sweeper thread that
+  purges expired entries.
+
+Both backends provide an atomic per-key attempt counter for brute-force limits.
+
+Usage:
+    from utils.otp_store import get_otp_store
+
+    otp_store = get_otp_store()
+    otp_store.save(email, {"otp": 123456}, ttl=300)
+    otp_store.update(email, user_id=5)
+    data = otp_store.get(email)          # None when missing or expired
+    attempts = otp_store.incr_attempts(email)
+    otp_store.delete(email)
+"""
+
+import os
+import json
+import time
+import threading
+from config.logging import get_logger
+from config.security_config import SecurityConfig
+
+log = get_logger()
+
+DEFAULT_OTP_TTL = SecurityConfig.OTP_EXPIRES
+SWEEP_INTERVAL_SECONDS = 60
+
+
+class InMemoryOTPStore:
+    """Process-local OTP store with TTL expiry and a background sweeper."""
+
+    def __init__(self, sweep_interval=SWEEP_INTERVAL_SECONDS):
+        self._entries = {}   # key -> (expires_at, data)
+        self._attempts = {}  # key -> (expires_at, count)
+        self._lock = threading.Lock()
+        self._sweep_interval = sweep_interval
+        self._sweeper = None
+
+    def _ensure_sweeper(self):
+        if self._sweeper is None or not self._sweeper.is_alive():
+            self._sweeper = threading.Thread(target=self._sweep_loop, name="otp-sweeper", daemon=True)
+            self._sweeper.start()
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self._sweep_interval)
+            try:
+                self.purge_expired()
+            except Exception as e:
+                log.error(f"[OTPStore] Sweeper error: {e}")
+
+    def purge_expired(self):
+        """Drop expired OTPs and attempt counters. Returns number of entries removed."""
+        now = time.time()
+        with self._lock:
+            expired = [k for k, (exp, _) in self._entries.items() if exp <= now]
+            for k in expired:
+                del self._entries[k]
+            for k in [k for k, (exp, _) in self._attempts.items() if exp <= now]:
+                del self._attempts[k]
+        return len(expired)
+
+    def save(self, key, data, ttl=DEFAULT_OTP_TTL):
+        self._ensure_sweeper()
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, dict(data))
+            self._attempts.pop(key, None)  # New OTP resets the attempt counter
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            return dict(data)
+
+    def update(self, key, **fields):
+        """Merge fields into an existing, unexpired entry. Returns False if missing."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or entry[0] <= time.time():
+                return False
+            entry[1].update(fields)
+            return True
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._attempts.pop(key, None)
+
+    def incr_attempts(self, key, ttl=DEFAULT_OTP_TTL):
+        """Atomically increment and return the failed-attempt count for key."""
+        now = time.time()
+        with self._lock:
+            expires_at, count = self._attempts.get(key, (0, 0))
+            if expires_at <= now:
+                expires_at, count = now + ttl, 0
+            count += 1
+            self._attempts[key] = (expires_at, count)
+            return count
+
+
+class RedisOTPStore:
+    """Redis-backed OTP store shared by all workers; expiry handled by Redis TTLs."""
+
+    KEY_PREFIX = "otp:"
+    ATTEMPTS_PREFIX = "otp_attempts:"
+
+    # HSET only when the key still exists, so updates never resurrect an expired OTP
+    _UPDATE_SCRIPT = """
+        if redis.call('EXISTS', KEYS[1]) == 1 then
+            redis.call('HSET', KEYS[1], unpack(ARGV))
+            return 1
+        end
+        return 0
+    """
+
+    # INCR + EXPIRE on first increment, atomically
+    _INCR_SCRIPT = """
+        local count = redis.call('INCR', KEYS[1])
+        if count == 1 then
+            redis.call('EXPIRE', KEYS[1], ARGV[1])
+        end
+        return count
+    """
+
+    def __init__(self, client):
+        self._redis = client
+        self._update = client.register_script(self._UPDATE_SCRIPT)
+        self._incr = client.register_script(self._INCR_SCRIPT)
+
+    @staticmethod
+    def _encode(fields):
+        return {k: json.dumps(v) for k, v in fields.items()}
+
+    def save(self, key, data, ttl=DEFAULT_OTP_TTL):
+        redis_key = self.KEY_PREFIX + key
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.delete(redis_key, self.ATTEMPTS_PREFIX + key)
+        pipe.hset(redis_key, mapping=self._encode(data))
+        pipe.expire(redis_key, int(ttl))
+        pipe.execute()
+
+    def get(self, key):
+        raw = self._redis.hgetall(self.KEY_PREFIX + key)
+        if not raw:
+            return None
+        return {
+            (k.decode() if isinstance(k, bytes) else k): json.loads(v)
+            for k, v in raw.items()
+        }
+
+    def update(self, key, **fields):
+        if not fields:
+            return True
+        args = []
+        for k, v in self._encode(fields).items():
+            args.extend([k, v])
+        return bool(self._update(keys=[self.KEY_PREFIX + key], args=args))
+
+    def delete(self, key):
+        self._redis.delete(self.KEY_PREFIX + key, self.ATTEMPTS_PREFIX + key)
+
+    def incr_attempts(self, key, ttl=DEFAULT_OTP_TTL):
+        return int(self._incr(keys=[self.ATTEMPTS_PREFIX + key], args=[int(ttl)]))
+
+    def purge_expired(self):
+        return 0  # Redis expires keys itself
+
+
+def _create_store():
+    redis_url = os.getenv('REDIS_URL')
+    if redis_url:
+        try:
+            import redis
+            client = redis.Redis.from_url(redis_url, socket_timeout=5)
+            client.ping()
+            log.info("[OTPStore] Using Redis OTP store")
+            return RedisOTPStore(client)
+        except Exception as e:
+            log.warning(f"[OTPStore] Redis unavailable ({e}), falling back to in-memory OTP store")
+    return InMemoryOTPStore()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_otp_store():
+    """Return the process-wide OTP store, created on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = _create_store()
+    return _store
+
+
+def check_otp(key, otp_input, max_attempts=None):
+    """
+    Validate an OTP against the store, counting failed attempts.
+
+    Returns (otp_data, error_message). On success error_message is None and
+    the entry is left in place (callers delete it once login completes).
+    After max_attempts failures the OTP is invalidated.
+    """
+    store = get_otp_store()
+    otp_data = store.get(key)
+    if not otp_data:
+        return None, "OTP not found or expired"
+
+    if int(otp_input) != otp_data.get("otp"):
+        limit = max_attempts or SecurityConfig.OTP_MAX_ATTEMPTS
+        if store.incr_attempts(key) >= limit:
+            store.delete(key)
+            log.warning(f"[OTPStore] OTP for {key} invalidated after {limit} failed attempts")
+            return None, "Too many invalid attempts. Please request a new OTP"
+        return None, "Invalid OTP"
+
+    return otp_data, None
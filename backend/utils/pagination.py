@@ -17,10 +17,30 @@ Usage:
         page=page,
         page_size=page_size
     )
+
+Cursor (keyset) pagination - opt-in per request with `?cursor=` (empty for the
+first page, then the `next_cursor` from the previous response):
+
+    if is_cursor_request(request):
+        cursor, page_size = get_cursor_params(request)
+        items, next_cursor = keyset_paginate(query, Model.created_at, Model.id, cursor, page_size)
+        total, is_estimate = count_total(query, get_total_mode(request))
+        pagination = create_pagination_response(
+            items, total, page_size=page_size, next_cursor=next_cursor,
+            cursor_mode=True, total_is_estimate=is_estimate
+        )
 """
 
-from flask import Request
-from typing import Any, Dict, List, Tuple
+import base64
+import hashlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import Request, current_app
+from sqlalchemy import func, tuple_
+from sqlalchemy.dialects import postgresql
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # ==================== PAGINATION CONFIGURATION ====================
@@ -31,10 +51,16 @@ MAX_PAGE_SIZE = 100
 MIN_PAGE_SIZE = 1
 DEFAULT_PAGE = 1
 
+CURSOR_PARAM = 'cursor'
+TOTAL_PARAM = 'total'
+TOTAL_MODES = ('exact', 'estimate', 'cached', 'none')
+COUNT_CACHE_TTL = 60  # Seconds a cached total is reused
+
 
 # ==================== HELPER FUNCTIONS ====================
 
-def get_pagination_params(request: Request) -> Tuple[int, int]:
+def get_pagination_params(request: Request, default_page_size: int = DEFAULT_PAGE_SIZE,
+                          max_page_size: int = MAX_PAGE_SIZE) -> Tuple[int, int]:
     """
     Extract and validate pagination parameters from request.
 
@@ -44,6 +70,8 @@ def get_pagination_params(request: Request) -> Tuple[int, int]:
 
     Args:
         request: Flask request object
+        default_page_size: Page size when none is given
+        max_page_size: Upper bound for the page size
 
     Returns:
         Tuple of (page, page_size) with validated values
@@ -59,11 +87,11 @@ def get_pagination_params(request: Request) -> Tuple[int, int]:
         request.args.get('pageSize', type=int) or
         request.args.get('perPage', type=int) or
         request.args.get('limit', type=int) or
-        DEFAULT_PAGE_SIZE
+        default_page_size
     )
 
     # Clamp page_size to valid range
-    page_size = max(MIN_PAGE_SIZE, min(page_size, MAX_PAGE_SIZE))
+    page_size = max(MIN_PAGE_SIZE, min(page_size, max_page_size))
 
     return page, page_size
 
@@ -100,23 +128,39 @@ def calculate_total_pages(total_count: int, page_size: int) -> int:
 
 def create_pagination_response(
     items: List[Any],
-    total_count: int,
-    page: int,
-    page_size: int
+    total_count: Optional[int],
+    page: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    next_cursor: Optional[str] = None,
+    cursor_mode: bool = False,
+    total_is_estimate: bool = False
 ) -> Dict[str, Any]:
     """
     Create standardized pagination response object.
 
     Args:
         items: List of items for current page
-        total_count: Total number of items across all pages
-        page: Current page number
+        total_count: Total number of items across all pages (None when not counted)
+        page: Current page number (offset pagination)
         page_size: Number of items per page
+        next_cursor: Cursor for the next page (cursor pagination)
+        cursor_mode: Build cursor pagination metadata instead of page metadata
+        total_is_estimate: total_count is a planner estimate or a cached value
 
     Returns:
         Dictionary with pagination metadata
     """
-    total_pages = calculate_total_pages(total_count, page_size)
+    if cursor_mode:
+        return {
+            "pagination_type": "cursor",
+            "page_size": page_size,
+            "total_count": total_count,
+            "total_is_estimate": total_is_estimate,
+            "has_next": next_cursor is not None,
+            "next_cursor": next_cursor
+        }
+
+    total_pages = calculate_total_pages(total_count or 0, page_size)
 
     return {
         "page": page,
@@ -170,3 +214,173 @@ def paginate_list(items: List[Any], page: int, page_size: int) -> Tuple[List[Any
     pagination = create_pagination_response(paginated_items, total_count, page, page_size)
 
     return paginated_items, pagination
+
+
+# ==================== CURSOR (KEYSET) PAGINATION ====================
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor cannot be decoded or does not match the query."""
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'n': str(value)}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if 'dt' in value:
+            return datetime.fromisoformat(value['dt'])
+        if 'd' in value:
+            return date.fromisoformat(value['d'])
+        if 'n' in value:
+            return Decimal(value['n'])
+        raise InvalidCursorError('Invalid cursor')
+    return value
+
+
+def encode_cursor(values: Tuple[Any, ...]) -> str:
+    """Encode keyset values (sort value, primary key) as an opaque URL-safe cursor."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[Any, ...]]:
+    """Decode a cursor from encode_cursor(); None/empty means the first page."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursorError('Invalid cursor')
+    if not isinstance(values, list) or not values:
+        raise InvalidCursorError('Invalid cursor')
+    return tuple(_decode_value(v) for v in values)
+
+
+def is_cursor_request(request: Request) -> bool:
+    """Cursor pagination is opt-in: the client sends ?cursor= (empty for the first page)."""
+    return CURSOR_PARAM in request.args
+
+
+def get_cursor_params(request: Request, default_page_size: int = DEFAULT_PAGE_SIZE,
+                      max_page_size: int = MAX_PAGE_SIZE) -> Tuple[Optional[Tuple[Any, ...]], int]:
+    """
+    Extract (decoded cursor, page_size) from the request.
+    Page size uses the same parameter names and limits as get_pagination_params().
+    Raises InvalidCursorError for malformed cursors.
+    """
+    _, page_size = get_pagination_params(request, default_page_size, max_page_size)
+    return decode_cursor(request.args.get(CURSOR_PARAM)), page_size
+
+
+def get_total_mode(request: Request, default: str = 'none') -> str:
+    """How the total should be computed: exact, estimate, cached or none (?total=...)."""
+    mode = (request.args.get(TOTAL_PARAM) or default).lower()
+    return mode if mode in TOTAL_MODES else default
+
+
+def keyset_paginate(query, sort_column, id_column, cursor: Optional[Tuple[Any, ...]], page_size: int,
+                    descending: bool = True, null_value: Any = None) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one page ordered by (sort_column, id_column) starting after `cursor`.
+
+    Uses a row-value comparison on the sort key instead of OFFSET, so deep pages
+    cost the same as the first one when (sort_column, id_column) is indexed.
+    Pass sort_column=id_column to page by primary key only. For a nullable sort
+    column pass null_value, which NULLs sort as (this wraps the column in
+    COALESCE, so prefer a NOT NULL sort column when the listing should use its index).
+
+    id_column may be a tuple of columns when no single column is unique in the
+    listing (e.g. rows of an outer join); labelled expressions work as long as
+    the query selects them under the same label.
+
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    id_columns = tuple(id_column) if isinstance(id_column, (tuple, list)) else (id_column,)
+    single_key = len(id_columns) == 1 and sort_column is id_columns[0]
+    sort_expr = func.coalesce(sort_column, null_value) if null_value is not None else sort_column
+    key_columns = id_columns if single_key else (sort_expr,) + id_columns
+
+    if cursor is not None:
+        if len(cursor) != len(key_columns):
+            raise InvalidCursorError('Cursor does not match this listing')
+        if len(key_columns) == 1:
+            condition = key_columns[0] < cursor[0] if descending else key_columns[0] > cursor[0]
+        else:
+            key, after = tuple_(*key_columns), tuple_(*cursor)
+            condition = key < after if descending else key > after
+        query = query.filter(condition)
+
+    order = [column.desc() if descending else column.asc() for column in key_columns]
+    rows = query.order_by(None).order_by(*order).limit(page_size + 1).all()
+
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    values = [getattr(last, column.key) for column in id_columns]
+    if not single_key:
+        sort_value = getattr(last, sort_column.key)
+        values.insert(0, null_value if sort_value is None else sort_value)
+    return rows, encode_cursor(tuple(values))
+
+
+def _compiled(query):
+    compiled = query.order_by(None).statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={'render_postcompile': True}
+    )
+    return str(compiled), compiled.params
+
+
+def estimate_count(query) -> Optional[int]:
+    """Planner row estimate for the query (EXPLAIN, nothing is executed). None on failure."""
+    from config.db import db
+    try:
+        sql, params = _compiled(query)
+        plan = db.session.connection().exec_driver_sql(f'EXPLAIN (FORMAT JSON) {sql}', params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    except Exception:
+        return None
+
+
+def count_total(query, mode: str = 'exact') -> Tuple[Optional[int], bool]:
+    """
+    Total rows for a listing according to mode.
+
+    - exact:    COUNT(*)
+    - estimate: Postgres planner estimate (no scan)
+    - cached:   exact count, reused for COUNT_CACHE_TTL seconds per distinct query
+    - none:     no total
+
+    Returns (total, is_estimate).
+    """
+    if mode == 'none':
+        return None, False
+    if mode == 'estimate':
+        estimate = estimate_count(query)
+        if estimate is not None:
+            return estimate, True
+        return query.order_by(None).count(), False
+    if mode == 'cached':
+        cache = getattr(current_app, 'cache', None)
+        if cache is not None:
+            sql, params = _compiled(query)
+            key = 'pagination_count:' + hashlib.md5(
+                (sql + json.dumps(params, sort_keys=True, default=str)).encode()
+            ).hexdigest()
+            cached = cache.get(key)
+            if cached is not None:
+                return cached, True
+            total = query.order_by(None).count()
+            cache.set(key, total, timeout=COUNT_CACHE_TTL)
+            return total, False
+    return query.order_by(None).count(), False
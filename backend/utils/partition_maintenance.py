@@ -0,0 +1,350 @@
+"""
+Monthly range partitioning, retention and archival for time-series tables.
+
+Works on a plain DB-API (psycopg2) connection so it can run from cron without
+the Flask app. Policies live in config/retention_config.py; the CLI is
+migrations/partition_time_series_tables.py.
+
+Layout of a partitioned table:
+    <table>              parent, PARTITION BY RANGE (<partition_column>)
+    <table>_pYYYY_MM     one partition per calendar month (UTC boundaries)
+    <table>_default      catch-all, so inserts never fail if maintenance lags
+
+Controllers keep querying <table>; filters on the partition column
+(recent-window dashboards, audit views) are pruned to the matching months.
+"""
+
+import gzip
+import os
+import re
+from datetime import datetime
+
+from psycopg2 import sql
+
+PARTITION_NAME_RE = r'^{table}_p(\d{{4}})_(\d{{2}})$'
+DELETE_BATCH_SIZE = 5000
+
+
+def month_start(value):
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(value, months):
+    month_index = value.year * 12 + (value.month - 1) + months
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(table, month):
+    return f"{table}_p{month:%Y_%m}"
+
+
+def default_partition_name(table):
+    return f"{table}_default"
+
+
+def _table_exists(cur, name):
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL", (f'public.{name}',))
+    return cur.fetchone()[0]
+
+
+def is_partitioned(cur, table):
+    cur.execute("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = %s AND c.relnamespace = 'public'::regnamespace
+        )
+    """, (table,))
+    return cur.fetchone()[0]
+
+
+def list_partitions(cur, table):
+    """Monthly partitions of table as [(month, partition_name)], oldest first."""
+    cur.execute("""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = %s AND p.relnamespace = 'public'::regnamespace
+    """, (table,))
+    pattern = re.compile(PARTITION_NAME_RE.format(table=re.escape(table)))
+    partitions = []
+    for (name,) in cur.fetchall():
+        match = pattern.match(name)
+        if match:
+            partitions.append((datetime(int(match.group(1)), int(match.group(2)), 1), name))
+    return sorted(partitions)
+
+
+def _bound(cur, policy, month):
+    """Literal partition bound; timestamptz columns get an explicit UTC offset."""
+    cur.execute("""
+        SELECT format_type(a.atttypid, a.atttypmod)
+        FROM pg_attribute a
+        WHERE a.attrelid = %s::regclass AND a.attname = %s
+    """, (f'public.{policy.table}', policy.partition_column))
+    column_type = cur.fetchone()[0]
+    suffix = '+00' if 'with time zone' in column_type else ''
+    return sql.Literal(f"{month:%Y-%m-%d} 00:00:00{suffix}")
+
+
+def _create_partition_unique_indexes(cur, policy, name):
+    for column, where in policy.partition_unique_indexes:
+        cur.execute(sql.SQL("CREATE UNIQUE INDEX IF NOT EXISTS {index} ON {partition} ({column}) WHERE {where}").format(
+            index=sql.Identifier(f"{name}_{column}_key"),
+            partition=sql.Identifier(name),
+            column=sql.Identifier(column),
+            where=sql.SQL(where),
+        ))
+
+
+def ensure_partition(cur, policy, month):
+    """
+    Create the partition for `month` if missing. Rows for that month that
+    landed in the default partition are moved into it first.
+    Returns True if a partition was created.
+    """
+    name = partition_name(policy.table, month)
+    if _table_exists(cur, name):
+        return False
+
+    table, column = sql.Identifier(policy.table), sql.Identifier(policy.partition_column)
+    lower, upper = _bound(cur, policy, month), _bound(cur, policy, add_months(month, 1))
+    cur.execute(sql.SQL("CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)").format(
+        name=sql.Identifier(name), table=table,
+    ))
+
+    default_name = default_partition_name(policy.table)
+    if _table_exists(cur, default_name):
+        default = sql.Identifier(default_name)
+        in_range = sql.SQL("{column} >= {lower} AND {column} < {upper}").format(column=column, lower=lower, upper=upper)
+        cur.execute(sql.SQL("INSERT INTO {name} SELECT * FROM {default} WHERE {in_range}").format(
+            name=sql.Identifier(name), default=default, in_range=in_range,
+        ))
+        cur.execute(sql.SQL("DELETE FROM {default} WHERE {in_range}").format(default=default, in_range=in_range))
+
+    cur.execute(sql.SQL("ALTER TABLE {table} ATTACH PARTITION {name} FOR VALUES FROM ({lower}) TO ({upper})").format(
+        table=table, name=sql.Identifier(name), lower=lower, upper=upper,
+    ))
+    _create_partition_unique_indexes(cur, policy, name)
+    return True
+
+
+def ensure_default_partition(cur, policy):
+    name = default_partition_name(policy.table)
+    if _table_exists(cur, name):
+        return False
+    cur.execute(sql.SQL("CREATE TABLE {name} PARTITION OF {table} DEFAULT").format(
+        name=sql.Identifier(name), table=sql.Identifier(policy.table),
+    ))
+    _create_partition_unique_indexes(cur, policy, name)
+    return True
+
+
+def ensure_future_partitions(conn, policy, premake_months, now=None):
+    """Create partitions from the current month up to `premake_months` ahead. Returns names created."""
+    current = month_start(now or datetime.utcnow())
+    created = []
+    with conn.cursor() as cur:
+        for offset in range(premake_months + 1):
+            month = add_months(current, offset)
+            if ensure_partition(cur, policy, month):
+                created.append(partition_name(policy.table, month))
+    conn.commit()
+    return created
+
+
+def retention_cutoff(policy, now=None):
+    """Rows with partition_column before this month start are expired."""
+    return add_months(month_start(now or datetime.utcnow()), -policy.retention_months)
+
+
+def _archive(cur, select_query, path):
+    """COPY a SELECT into a gzip'd CSV (written to .tmp and renamed). Returns bytes written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        cur.copy_expert(sql.SQL("COPY ({query}) TO STDOUT WITH CSV HEADER").format(query=select_query).as_string(cur), f)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def apply_retention(conn, policy, archive_dir, now=None, dry_run=False):
+    """
+    Expire data older than the policy's retention window.
+
+    Partitioned tables: each expired monthly partition is archived (if the
+    action is 'archive'), detached and dropped; expired rows in the default
+    partition are archived and deleted. Unpartitioned tables: expired rows
+    are archived and deleted in batches.
+
+    Returns a list of human-readable actions taken (or planned, for dry_run).
+    """
+    if policy.action == 'keep':
+        return []
+
+    cutoff = retention_cutoff(policy, now)
+    table, column = sql.Identifier(policy.table), sql.Identifier(policy.partition_column)
+    stamp = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+    actions = []
+
+    with conn.cursor() as cur:
+        partitioned = is_partitioned(cur, policy.table)
+        expired_partitions = []
+        if partitioned:
+            expired_partitions = [
+                name for month, name in list_partitions(cur, policy.table)
+                if add_months(month, 1) <= cutoff
+            ]
+            remainder = default_partition_name(policy.table)
+            if not _table_exists(cur, remainder):
+                remainder = None
+        else:
+            remainder = policy.table
+
+        for name in expired_partitions:
+            if dry_run:
+                actions.append(f"would {policy.action} partition {name}")
+                continue
+            if policy.action == 'archive':
+                path = os.path.join(archive_dir, policy.table, f"{name}.csv.gz")
+                size = _archive(cur, sql.SQL("SELECT * FROM {name}").format(name=sql.Identifier(name)), path)
+                actions.append(f"archived {name} -> {path} ({size} bytes)")
+            cur.execute(sql.SQL("ALTER TABLE {table} DETACH PARTITION {name}").format(table=table, name=sql.Identifier(name)))
+            cur.execute(sql.SQL("DROP TABLE {name}").format(name=sql.Identifier(name)))
+            conn.commit()
+            actions.append(f"dropped partition {name}")
+
+        if remainder:
+            source = sql.Identifier(remainder)
+            expired = sql.SQL("{column} < {cutoff}").format(column=column, cutoff=_bound(cur, policy, cutoff))
+            cur.execute(sql.SQL("SELECT COUNT(*) FROM {source} WHERE {expired}").format(source=source, expired=expired))
+            expired_rows = cur.fetchone()[0]
+            if expired_rows and dry_run:
+                actions.append(f"would {policy.action} {expired_rows} row(s) from {remainder}")
+            elif expired_rows:
+                if policy.action == 'archive':
+                    path = os.path.join(archive_dir, policy.table, f"{remainder}_before_{cutoff:%Y_%m}_{stamp}.csv.gz")
+                    size = _archive(cur, sql.SQL("SELECT * FROM {source} WHERE {expired}").format(source=source, expired=expired), path)
+                    actions.append(f"archived {expired_rows} row(s) from {remainder} -> {path} ({size} bytes)")
+                deleted = 0
+                while True:
+                    cur.execute(sql.SQL(
+                        "DELETE FROM {source} WHERE ctid IN (SELECT ctid FROM {source} WHERE {expired} LIMIT {limit})"
+                    ).format(source=source, expired=expired, limit=sql.Literal(DELETE_BATCH_SIZE)))
+                    conn.commit()
+                    if cur.rowcount == 0:
+                        break
+                    deleted += cur.rowcount
+                actions.append(f"deleted {deleted} row(s) from {remainder}")
+    conn.commit()
+    return actions
+
+
+def convert_to_partitioned(conn, policy, premake_months):
+    """
+    Rebuild an existing table as a monthly-partitioned table with the same
+    name, columns, defaults, sequence, indexes and foreign keys.
+
+    Runs in one transaction holding an ACCESS EXCLUSIVE lock on the table
+    while rows are copied, so schedule it in a maintenance window. The old
+    table is kept as <table>_unpartitioned for verification and must be
+    dropped manually.
+    """
+    table = policy.table
+    old_name = f"{table}_unpartitioned"
+    new_name = f"{table}_partitioned"
+    column = policy.partition_column
+    unique_columns = {c for c, _ in policy.partition_unique_indexes}
+
+    with conn.cursor() as cur:
+        if is_partitioned(cur, table):
+            return False
+        if _table_exists(cur, old_name):
+            raise Exception(f"{old_name} already exists; drop it before converting again")
+
+        cur.execute(sql.SQL("LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE").format(table=sql.Identifier(table)))
+
+        cur.execute("""
+            SELECT i.relname, pg_get_indexdef(i.oid), ix.indisunique, ix.indisprimary,
+                   (SELECT array_agg(a.attname) FROM pg_attribute a
+                    WHERE a.attrelid = ix.indrelid AND a.attnum = ANY(ix.indkey))
+            FROM pg_index ix
+            JOIN pg_class i ON i.oid = ix.indexrelid
+            WHERE ix.indrelid = %s::regclass
+        """, (f'public.{table}',))
+        indexes = cur.fetchall()
+        cur.execute("""
+            SELECT conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE conrelid = %s::regclass AND contype = 'f'
+        """, (f'public.{table}',))
+        foreign_keys = cur.fetchall()
+        cur.execute("""
+            SELECT a.attidentity <> '', pg_get_serial_sequence(%s, 'id')
+            FROM pg_attribute a
+            WHERE a.attrelid = %s::regclass AND a.attname = 'id'
+        """, (f'public.{table}', f'public.{table}'))
+        is_identity, sequence = cur.fetchone()
+        cur.execute(sql.SQL("SELECT MIN({column}) FROM {table}").format(
+            column=sql.Identifier(column), table=sql.Identifier(table)))
+        oldest = cur.fetchone()[0]
+
+        # New parent with the same columns, defaults (including the id sequence) and CHECKs
+        cur.execute(sql.SQL(
+            "CREATE TABLE {new} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS {identity}) "
+            "PARTITION BY RANGE ({column})"
+        ).format(
+            new=sql.Identifier(new_name), table=sql.Identifier(table), column=sql.Identifier(column),
+            identity=sql.SQL("INCLUDING IDENTITY" if is_identity else ""),
+        ))
+
+        # Swap names so partitions and indexes are created under their final names
+        suffix = '_unpart'
+        for index_name, _, _, _, _ in indexes:
+            cur.execute(sql.SQL("ALTER INDEX {index} RENAME TO {renamed}").format(
+                index=sql.Identifier(index_name), renamed=sql.Identifier(index_name[:63 - len(suffix)] + suffix)))
+        cur.execute(sql.SQL("ALTER TABLE {table} RENAME TO {old}").format(
+            table=sql.Identifier(table), old=sql.Identifier(old_name)))
+        cur.execute(sql.SQL("ALTER TABLE {new} RENAME TO {table}").format(
+            new=sql.Identifier(new_name), table=sql.Identifier(table)))
+
+        # Primary key must include the partition column
+        cur.execute(sql.SQL("ALTER TABLE {table} ADD CONSTRAINT {pkey} PRIMARY KEY (id, {column})").format(
+            table=sql.Identifier(table), pkey=sql.Identifier(f"{table}_pkey"), column=sql.Identifier(column)))
+
+        first_month = month_start(oldest) if oldest else month_start(datetime.utcnow())
+        last_month = add_months(month_start(datetime.utcnow()), premake_months)
+        month = first_month
+        while month <= last_month:
+            ensure_partition(cur, policy, month)
+            month = add_months(month, 1)
+        ensure_default_partition(cur, policy)
+
+        cur.execute(sql.SQL("INSERT INTO {table} SELECT * FROM {old}").format(
+            table=sql.Identifier(table), old=sql.Identifier(old_name)))
+
+        for index_name, definition, is_unique, is_primary, index_columns in indexes:
+            if is_primary:
+                continue
+            if is_unique and column not in (index_columns or []):
+                if not unique_columns.intersection(index_columns or []):
+                    print(f"  ! {index_name}: unique index without {column} recreated as non-unique")
+                    definition = definition.replace('CREATE UNIQUE INDEX', 'CREATE INDEX', 1)
+                else:
+                    continue  # Created per partition by ensure_partition()
+            # Definitions were captured before the swap, so they already name the new table
+            cur.execute(definition)
+
+        for constraint_name, definition in foreign_keys:
+            cur.execute(sql.SQL("ALTER TABLE {table} ADD CONSTRAINT {name} {definition}").format(
+                table=sql.Identifier(table), name=sql.Identifier(constraint_name), definition=sql.SQL(definition)))
+
+        if sequence and not is_identity:
+            cur.execute(sql.SQL("ALTER SEQUENCE {sequence} OWNED BY {table}.id").format(
+                sequence=sql.SQL(sequence), table=sql.Identifier(table)))
+        cur.execute(sql.SQL("SELECT setval(pg_get_serial_sequence({qualified}, 'id'), COALESCE(MAX(id), 1)) FROM {table}").format(
+            qualified=sql.Literal(f'public.{table}'), table=sql.Identifier(table)))
+
+    conn.commit()
+    return True
@@ -0,0 +1,146 @@
+"""
+Project membership helpers.
+
+Keeps the normalised project_members table in sync with the JSONB
+Project.user_id / Project.mep_supervisor_id arrays (and the scalar
+site_supervisor_id / estimator_id / buyer_id columns) during the transition
+period, and provides the indexed filter used by role dashboards instead of
+`Project.user_id.contains([uid])`.
+
+Usage:
+    from utils.project_membership import project_member_filter
+    from models.project_member import ROLE_PROJECT_MANAGER
+
+    query = query.filter(project_member_filter(user_id, ROLE_PROJECT_MANAGER))
+"""
+
+from sqlalchemy import event, select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from config.db import db
+from config.logging import get_logger
+from models.project import Project
+from models.project_member import ProjectMember, PROJECT_MEMBER_ROLE_COLUMNS
+
+log = get_logger()
+
+
+def _coerce_ids(value):
+    """Normalise a JSONB array / scalar column value to a set of int user ids."""
+    if value is None:
+        return set()
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    ids = set()
+    for v in values:
+        try:
+            if v is not None and v != '':
+                ids.add(int(v))
+        except (TypeError, ValueError):
+            continue
+    return ids
+
+
+def expected_members(project):
+    """Return the set of (user_id, role) pairs the project's columns describe."""
+    members = set()
+    for role, column in PROJECT_MEMBER_ROLE_COLUMNS.items():
+        for uid in _coerce_ids(getattr(project, column, None)):
+            members.add((uid, role))
+    return members
+
+
+def project_member_ids(user_id, role=None):
+    """
+    Select of project_ids where user_id is a member (optionally in one role).
+    Usable inside `.in_()` or as a join target.
+    """
+    stmt = select(ProjectMember.project_id).where(ProjectMember.user_id == user_id)
+    if role is not None:
+        if isinstance(role, (list, tuple, set, frozenset)):
+            stmt = stmt.where(ProjectMember.role.in_(list(role)))
+        else:
+            stmt = stmt.where(ProjectMember.role == role)
+    return stmt
+
+
+def project_member_filter(user_id, role=None, project_id_column=None):
+    """
+    Indexed replacement for `Project.user_id.contains([user_id])` and
+    `Project.mep_supervisor_id.contains([user_id])`.
+
+    Args:
+        user_id: member user id
+        role: role key (or list of role keys) from models.project_member
+        project_id_column: column to filter on (defaults to Project.project_id)
+    """
+    column = project_id_column if project_id_column is not None else Project.project_id
+    try:
+        user_id = int(user_id)
+    except (TypeError, ValueError):
+        # Matches the old containment behaviour: nothing matches an invalid id
+        return column.in_([])
+    return column.in_(project_member_ids(user_id, role))
+
+
+def _sync_rows(connection, project_id, members):
+    """Replace the membership rows of one project with `members`."""
+    connection.execute(delete(ProjectMember.__table__).where(ProjectMember.project_id == project_id))
+    if members:
+        connection.execute(
+            pg_insert(ProjectMember.__table__)
+            .values([
+                {'project_id': project_id, 'user_id': uid, 'role': role}
+                for uid, role in sorted(members)
+            ])
+            .on_conflict_do_nothing()
+        )
+
+
+def _membership_changed(project):
+    state = db.inspect(project)
+    for column in PROJECT_MEMBER_ROLE_COLUMNS.values():
+        if state.attrs[column].history.has_changes():
+            return True
+    return False
+
+
+def _sync_project_members_after_flush(session, flush_context):
+    """
+    Mirror membership column changes into project_members in the same
+    transaction as the Project write, so the two can never commit apart.
+    """
+    projects = [obj for obj in session.new if isinstance(obj, Project)]
+    projects += [obj for obj in session.dirty if isinstance(obj, Project) and _membership_changed(obj)]
+    if not projects:
+        return
+
+    connection = session.connection()
+    for project in projects:
+        if project.project_id is None:
+            continue
+        _sync_rows(connection, project.project_id, expected_members(project))
+
+
+def register_project_member_sync():
+    """Install the after_flush listener that keeps project_members in sync."""
+    if not event.contains(Session, "after_flush", _sync_project_members_after_flush):
+        event.listen(Session, "after_flush", _sync_project_members_after_flush)
+
+
+def backfill_project_members():
+    """
+    Rebuild project_members from the Project columns for every project, with
+    the migration's set-based SQL (migrations/create_project_members_table.py).
+    Returns the number of membership rows written.
+    """
+    from migrations.create_project_members_table import EXPECTED_MEMBERS_SQL
+
+    db.session.execute(delete(ProjectMember.__table__))
+    result = db.session.execute(db.text(f"""
+        INSERT INTO project_members (project_id, user_id, role)
+        {EXPECTED_MEMBERS_SQL}
+        ON CONFLICT DO NOTHING
+    """))
+    db.session.commit()
+    log.info(f"[ProjectMembers] Backfilled {result.rowcount} membership rows")
+    return result.rowcount
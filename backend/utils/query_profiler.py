@@ -0,0 +1,194 @@
+"""
+Per-request SQL profiler with N+1 detection.
+
+Built on the before/after_cursor_execute listeners in config/db.py. For a
+sampled request it records:
+- statement count and total DB time
+- the slowest statements
+- repeated statement shapes (same SQL with different parameters), which are
+  flagged as N+1 patterns once they exceed SQL_PROFILE_N1_THRESHOLD
+
+The summary is returned as a `Server-Timing` header (visible in browser
+devtools) and written as one structured JSON log line (event=sql_profile).
+
+Configuration (environment):
+    SQL_PROFILE_SAMPLE_RATE   fraction of requests to profile, 0.0 - 1.0 (default 0 = off)
+    SQL_PROFILE_N1_THRESHOLD  repeats of one shape that count as N+1 (default 5)
+    SQL_PROFILE_SLOWEST       number of slowest statements to report (default 3)
+
+Outside production a single request can be profiled with the
+`X-Profile-SQL: 1` request header, regardless of the sample rate.
+
+Unsampled requests cost one ContextVar lookup per statement.
+"""
+
+import os
+import re
+import json
+import heapq
+import random
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from flask import request, g
+from config.logging import get_logger
+
+log = get_logger()
+
+SAMPLE_RATE = float(os.getenv('SQL_PROFILE_SAMPLE_RATE', '0') or 0)
+N1_THRESHOLD = int(os.getenv('SQL_PROFILE_N1_THRESHOLD', '5'))
+SLOWEST_COUNT = int(os.getenv('SQL_PROFILE_SLOWEST', '3'))
+FORCE_HEADER = 'X-Profile-SQL'
+MAX_LOGGED_SQL_LENGTH = 300
+
+_current_profile = ContextVar('sql_request_profile', default=None)
+
+_PARAM_RE = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_PARAM_LIST_RE = re.compile(r"\(\s*\?(\s*,\s*\?)*\s*\)")
+_NUMBER_RE = re.compile(r"\b\d+\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def statement_shape(statement):
+    """
+    Normalise a statement to its shape: bound parameters, expanded IN lists
+    and numeric literals collapse, so `WHERE id = 1` and `WHERE id = 2` match.
+    """
+    shape = _PARAM_RE.sub('?', statement)
+    shape = _PARAM_LIST_RE.sub('(?...)', shape)
+    shape = _NUMBER_RE.sub('?', shape)
+    return _WHITESPACE_RE.sub(' ', shape).strip()
+
+
+class RequestProfile:
+    """SQL statistics for one request."""
+
+    __slots__ = ('count', 'total_ms', 'shapes', 'slowest')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes = {}    # statement -> [count, total_ms]
+        self.slowest = []   # min-heap of (ms, sql) limited to SLOWEST_COUNT
+
+    def record(self, statement, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+
+        stats = self.shapes.get(statement)
+        if stats is None:
+            self.shapes[statement] = [1, elapsed_ms]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed_ms
+
+        if len(self.slowest) < SLOWEST_COUNT:
+            heapq.heappush(self.slowest, (elapsed_ms, statement))
+        elif elapsed_ms > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (elapsed_ms, statement))
+
+    def n_plus_one(self):
+        """Statement shapes repeated at least N1_THRESHOLD times, most repeated first."""
+        merged = {}
+        # Raw statements are keyed as executed; merge them by shape only here,
+        # so normalisation runs once per distinct statement, not per execution.
+        for statement, (count, total_ms) in self.shapes.items():
+            stats = merged.setdefault(statement_shape(statement), [0, 0.0])
+            stats[0] += count
+            stats[1] += total_ms
+        repeated = [
+            {'count': count, 'total_ms': round(total_ms, 2), 'sql': shape[:MAX_LOGGED_SQL_LENGTH]}
+            for shape, (count, total_ms) in merged.items()
+            if count >= N1_THRESHOLD
+        ]
+        return sorted(repeated, key=lambda r: r['count'], reverse=True)
+
+    def summary(self):
+        return {
+            'queries': self.count,
+            'db_ms': round(self.total_ms, 2),
+            'slowest': [
+                {'ms': round(ms, 2), 'sql': statement_shape(sql)[:MAX_LOGGED_SQL_LENGTH]}
+                for ms, sql in sorted(self.slowest, reverse=True)
+            ],
+            'n_plus_one': self.n_plus_one(),
+        }
+
+
+def record_statement(statement, elapsed_seconds):
+    """Called from the after_cursor_execute listener; no-op when the request is not sampled."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.record(statement, elapsed_seconds * 1000)
+
+
+def is_profiling():
+    """True while the current request is being profiled (lets the listeners skip timing otherwise)."""
+    return _current_profile.get() is not None
+
+
+def _should_profile(environment):
+    if environment != 'production' and request.headers.get(FORCE_HEADER) == '1':
+        return True
+    return SAMPLE_RATE > 0 and random.random() < SAMPLE_RATE
+
+
+def _server_timing(summary):
+    parts = [f'db;dur={summary["db_ms"]};desc="{summary["queries"]} queries"']
+    if summary['n_plus_one']:
+        worst = summary['n_plus_one'][0]
+        parts.append(
+            f'db-n1;dur={worst["total_ms"]};desc="{len(summary["n_plus_one"])} repeated shapes, '
+            f'worst x{worst["count"]}"'
+        )
+    return ', '.join(parts)
+
+
+def init_query_profiler(app):
+    """Register the per-request hooks that start, report and clear SQL profiles."""
+    environment = os.getenv('ENVIRONMENT', 'development')
+
+    @app.before_request
+    def start_sql_profile():
+        if _should_profile(environment):
+            g._sql_profile_token = _current_profile.set(RequestProfile())
+            g._sql_profile_started = time.perf_counter()
+
+    @app.after_request
+    def report_sql_profile(response):
+        profile = _current_profile.get()
+        if profile is None:
+            return response
+
+        summary = profile.summary()
+        request_ms = (time.perf_counter() - g.get('_sql_profile_started', time.perf_counter())) * 1000
+        existing = response.headers.get('Server-Timing')
+        timing = _server_timing(summary) + f', app;dur={request_ms:.2f}'
+        response.headers['Server-Timing'] = f'{existing}, {timing}' if existing else timing
+
+        log_line = {
+            'event': 'sql_profile',
+            'request_id': g.get('request_id'),
+            'method': request.method,
+            'endpoint': request.endpoint,
+            'path': request.path,
+            'status': response.status_code,
+            'request_ms': round(request_ms, 2),
+            **summary,
+        }
+        # Sampled requests are opt-in, so log at the level the app logger emits
+        log.warning(json.dumps(log_line, default=str))
+        return response
+
+    @app.teardown_request
+    def clear_sql_profile(exception=None):
+        token = g.pop('_sql_profile_token', None)
+        if token is not None:
+            try:
+                _current_profile.reset(token)
+            except ValueError:  # Token created in another context
+                _current_profile.set(None)
+
+    if SAMPLE_RATE > 0:
+        log.warning(f"SQL profiler enabled for {SAMPLE_RATE:.1%} of requests")
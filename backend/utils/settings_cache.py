@@ -0,0 +1,206 @@
+"""
+Process-wide, versioned SystemSettings cache.
+
+SystemSettings is a single-row table read by PDF, LPO, delivery-note, email and
+inventory code paths. The row also carries base64 signature/stamp/header
+images (hundreds of KB), so every `SystemSettings.query.first()` pulled those
+blobs from Postgres again.
+
+This cache keeps:
+- a text snapshot of the row (image columns are deferred on the model and
+  never loaded for text lookups)
+- the image data URLs, loaded separately and only when an image is needed
+- decoded image bytes, decoded once per version
+
+Invalidation: update_settings / signature endpoints call invalidate_settings_cache(),
+which bumps a version token in the Flask-Caching backend (Redis when configured),
+so every worker reloads on its next read. A local TTL bounds staleness for
+out-of-band edits (migrations, manual SQL).
+
+Usage:
+    from utils.settings_cache import get_system_settings, get_settings_image_bytes
+
+    settings = get_system_settings()          # None if the row does not exist
+    store = settings.store_name if settings else 'M2 Store'
+    stamp = get_settings_image_bytes('company_stamp_image')
+"""
+
+import base64
+import threading
+import time
+import uuid
+from flask import current_app, has_app_context
+from config.db import db
+from config.logging import get_logger
+
+log = get_logger()
+
+IMAGE_FIELDS = (
+    'signature_image',
+    'md_signature_image',
+    'td_signature_image',
+    'company_stamp_image',
+    'lpo_header_image',
+)
+
+SETTINGS_VERSION_KEY = 'system_settings:version'
+LOCAL_TTL_SECONDS = 300  # Upper bound on staleness without an explicit invalidation
+
+_lock = threading.Lock()
+_state = {
+    'version': None,      # Shared version token the local copy was built for
+    'loaded_at': 0.0,
+    'snapshot': None,     # SettingsSnapshot (or None when no row exists)
+    'images': None,       # {field: data_url}
+    'image_bytes': {},    # {field: bytes}
+}
+
+
+class SettingsSnapshot:
+    """Read-only view of the SystemSettings row; image fields resolve lazily."""
+
+    __slots__ = ('_values', 'version')
+
+    def __init__(self, values, version):
+        self._values = values
+        self.version = version
+
+    def __getattr__(self, name):
+        if name in IMAGE_FIELDS:
+            return get_settings_images().get(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def to_dict(self):
+        return dict(self._values)
+
+    def __repr__(self):
+        return f"<SettingsSnapshot {self._values.get('company_name')} v={self.version}>"
+
+
+def _shared_cache():
+    if has_app_context():
+        return getattr(current_app, 'cache', None)
+    return None
+
+
+def _shared_version():
+    cache = _shared_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(SETTINGS_VERSION_KEY) or '0'
+    except Exception as e:
+        log.warning(f"[SettingsCache] Could not read shared version: {e}")
+        return None
+
+
+def _is_fresh(shared_version):
+    if _state['loaded_at'] == 0.0:
+        return False
+    if time.time() - _state['loaded_at'] > LOCAL_TTL_SECONDS:
+        return False
+    return shared_version is None or shared_version == _state['version']
+
+
+def _text_columns():
+    from models.system_settings import SystemSettings
+    return [c for c in SystemSettings.__table__.columns if c.name not in IMAGE_FIELDS]
+
+
+def _load_snapshot(shared_version):
+    from models.system_settings import SystemSettings
+    columns = _text_columns()
+    row = db.session.query(*columns).order_by(SystemSettings.id).first()
+    _state.update({
+        'version': shared_version,
+        'loaded_at': time.time(),
+        'snapshot': SettingsSnapshot(dict(row._mapping), shared_version) if row else None,
+        'images': None,
+        'image_bytes': {},
+    })
+
+
+def _ensure_loaded():
+    shared_version = _shared_version()
+    if _is_fresh(shared_version):
+        return
+    with _lock:
+        if not _is_fresh(shared_version):
+            _load_snapshot(shared_version)
+
+
+def get_system_settings():
+    """Return the cached settings snapshot, or None if the settings row does not exist."""
+    _ensure_loaded()
+    return _state['snapshot']
+
+
+def get_settings_images():
+    """Return {image_field: data_url} for the settings row (loaded once per version)."""
+    _ensure_loaded()
+    images = _state['images']
+    if images is not None:
+        return images
+    with _lock:
+        if _state['images'] is None:
+            from models.system_settings import SystemSettings
+            columns = [getattr(SystemSettings, field) for field in IMAGE_FIELDS]
+            row = db.session.query(*columns).order_by(SystemSettings.id).first()
+            _state['images'] = dict(row._mapping) if row else {}
+        return _state['images']
+
+
+def decode_image_data(data):
+    """Decode a base64 image (optionally a data: URL) to bytes; None if empty/invalid."""
+    if not data:
+        return None
+    try:
+        encoded = data.split(',', 1)[1] if data.startswith('data:') and ',' in data else data
+        return base64.b64decode(encoded)
+    except Exception as e:
+        log.warning(f"[SettingsCache] Could not decode image data: {e}")
+        return None
+
+
+def get_settings_image_bytes(field):
+    """Decoded bytes for a settings image field, decoded once per settings version."""
+    if field not in IMAGE_FIELDS:
+        raise ValueError(f"Unknown settings image field: {field}")
+    cache = _state['image_bytes']
+    if field not in cache:
+        cache[field] = decode_image_data(get_settings_images().get(field))
+    return _state['image_bytes'].get(field)
+
+
+def image_bytes_for(field, data):
+    """
+    Decoded bytes for a base64 image a PDF generator was handed for the
+    settings image slot `field` (e.g. 'company_stamp_image'). When `data` is
+    the stored value of that field - the same string the cache handed out,
+    so the check is an identity test - the per-version decode is reused; any
+    other value (e.g. edited on the frontend) is decoded directly.
+    Never queries the database.
+    """
+    if not data:
+        return None
+    images = _state['images']
+    if images and images.get(field) is data:
+        return get_settings_image_bytes(field)
+    return decode_image_data(data)
+
+
+def invalidate_settings_cache():
+    """Drop the local copy and bump the shared version so every worker reloads."""
+    with _lock:
+        _state['loaded_at'] = 0.0
+        _state['images'] = None
+        _state['image_bytes'] = {}
+    cache = _shared_cache()
+    if cache is not None:
+        try:
+            cache.set(SETTINGS_VERSION_KEY, uuid.uuid4().hex, timeout=0)
+        except Exception as e:
+            log.warning(f"[SettingsCache] Could not bump shared version: {e}")
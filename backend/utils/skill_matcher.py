@@ -113,3 +113,22 @@ def get_matching_skills(required_skill, worker_skills):
             matching.append(worker_skill)
 
     return matching
+
+
+def canonical_skill_key(skill_name):
+    """
+    Canonical lookup key for a skill, precomputed into worker_skills.
+
+    Two skills match under skill_matches() exactly when their canonical keys
+    are equal, so availability lookups can use an indexed equality instead
+    of running the matcher over every worker.
+
+    Examples:
+      "Carpenter - Professional" → "carpenter"
+      "General Helper - Standard" → "helper"
+      " Mason " → "mason"
+    """
+    if not skill_name or not str(skill_name).strip():
+        return None
+    base = extract_base_skill(str(skill_name).strip())
+    return base.strip().lower() if base else None
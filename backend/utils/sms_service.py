@@ -3,7 +3,6 @@ SMS service for sending OTP via tuitone.com API
 """
 import requests
 import random
-from datetime import datetime, timedelta
 from config.logging import get_logger
 import os
 
@@ -19,8 +18,8 @@ if not SMS_ACCESS_TOKEN:
 
 ENVIRONMENT = os.environ.get("ENVIRONMENT")
 
-# OTP storage for phone (shared with authentication.py)
-from utils.authentication import otp_storage
+# OTP store for phone (shared with authentication.py, see utils/otp_store.py)
+from utils.otp_store import get_otp_store, check_otp
 
 
 def send_sms_otp(phone_number):
@@ -40,13 +39,10 @@ def send_sms_otp(phone_number):
         # Clean phone number for consistent storage key
         clean_phone = ''.join(filter(str.isdigit, str(phone_number)))
 
-        # Store OTP in memory with cleaned phone number as key
+        # Store OTP with cleaned phone number as key
         # Prefix phone with 'phone:' to distinguish from email
         storage_key = f"phone:{clean_phone}"
-        otp_storage[storage_key] = {
-            "otp": otp,
-            "expires_at": (datetime.utcnow() + timedelta(seconds=300)).timestamp()
-        }
+        get_otp_store().save(storage_key, {"otp": otp})
         log.info(f"OTP stored with key: {storage_key}")
 
         # Prepare SMS message
@@ -109,25 +105,13 @@ def verify_sms_otp(phone_number, otp_input):
     try:
         storage_key = f"phone:{phone_number}"
 
-        # Get OTP data from storage
-        otp_data = otp_storage.get(storage_key)
-        if not otp_data:
-            return False, "OTP not found or expired"
-
-        stored_otp = otp_data.get("otp")
-        expires_at = datetime.fromtimestamp(otp_data.get("expires_at"))
-
-        # Check expiry
-        if datetime.utcnow() > expires_at:
-            del otp_storage[storage_key]
-            return False, "OTP expired"
-
-        # Check if OTP matches
-        if int(otp_input) != stored_otp:
-            return False, "Invalid OTP"
+        # Check OTP (expiry enforced by the store TTL, failed attempts are counted)
+        otp_data, otp_error = check_otp(storage_key, otp_input)
+        if otp_error:
+            return False, otp_error
 
         # OTP verified, remove from storage
-        del otp_storage[storage_key]
+        get_otp_store().delete(storage_key)
         return True, None
 
     except ValueError:
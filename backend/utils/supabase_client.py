@@ -0,0 +1,74 @@
+"""
+Process-wide Supabase clients, created on first use.
+
+Several controllers created their Supabase client (and imported the SDK)
+at module import time, so every worker paid for it while loading routes, and
+upload_image_controller refused to import at all without storage settings.
+Controllers now keep a LazySupabaseClient at module level: the SDK is
+imported and the client created on the first storage call, once per process
+and key type. create_app() calls check_supabase_config() to report missing
+settings at startup instead.
+
+Keys (ENVIRONMENT=development reads the DEV_ prefixed variables):
+- service: SUPABASE_URL / SUPABASE_KEY       (backend storage operations)
+- anon:    SUPABASE_URL / SUPABASE_ANON_KEY
+
+Usage:
+    from utils.supabase_client import LazySupabaseClient
+
+    supabase = LazySupabaseClient()            # service key
+    supabase.storage.from_(bucket).upload(...)
+"""
+
+import os
+import threading
+
+from config.logging import get_logger
+
+log = get_logger()
+
+_lock = threading.Lock()
+_clients = {}  # 'service' / 'anon' -> Client
+
+
+def supabase_settings(anon=False):
+    """(url, key) for the current ENVIRONMENT; values may be None."""
+    prefix = 'DEV_' if os.environ.get('ENVIRONMENT', 'production') == 'development' else ''
+    key_name = 'SUPABASE_ANON_KEY' if anon else 'SUPABASE_KEY'
+    return os.environ.get(f'{prefix}SUPABASE_URL'), os.environ.get(f'{prefix}{key_name}')
+
+
+def get_supabase_client(anon=False):
+    """Shared client for the key type, or None when storage is not configured."""
+    kind = 'anon' if anon else 'service'
+    with _lock:
+        if kind not in _clients:
+            url, key = supabase_settings(anon)
+            if not url or not key:
+                return None
+            from supabase import create_client
+            _clients[kind] = create_client(url, key)
+            log.info(f"Supabase client initialized ({kind} key)")
+        return _clients[kind]
+
+
+class LazySupabaseClient:
+    """Module-level stand-in for a Supabase client; connects on first attribute access."""
+
+    def __init__(self, anon=False):
+        self._anon = anon
+
+    def __getattr__(self, attr):
+        client = get_supabase_client(self._anon)
+        if client is None:
+            raise RuntimeError("Missing Supabase configuration. Please set SUPABASE_URL and SUPABASE_KEY environment variables")
+        return getattr(client, attr)
+
+    def __bool__(self):
+        return all(supabase_settings(self._anon))
+
+
+def check_supabase_config():
+    """Log missing storage settings (called from create_app)."""
+    if not all(supabase_settings()):
+        log.error("Supabase URL or Key not configured in environment variables - storage uploads will fail")
@@ -0,0 +1,278 @@
+"""
+Transport Fee Analysis
+BOQ estimated vs actual transport, for one project or all projects at once.
+
+Actual transport is summed from all six sources in a single grouped query
+(UNION ALL of the source tables, GROUP BY project_id), using the same rules
+as the BOQ Profit Report's Transport Details:
+1. inventory_transactions (Vendor → Store): PURCHASE with an MSQ-IN-% delivery
+   batch, counted once per delivery batch
+2. material_delivery_notes (Store → Site): not DRAFT/CANCELLED
+3. return_delivery_notes (Site → Store): not DRAFT/CANCELLED
+4. asset_delivery_notes: not DRAFT/CANCELLED
+5. asset_return_delivery_notes: not DRAFT/CANCELLED
+6. labour_requisitions: not deleted
+
+Estimated transport comes from the BOQ JSON of every active BOQ (one query),
+per sub-item: stored transport_amount, else base total × transport_percentage.
+
+The all-projects result is cached for TRANSPORT_ANALYSIS_CACHE_SECONDS.
+"""
+
+import os
+from collections import defaultdict
+from decimal import Decimal
+
+from flask import current_app
+from sqlalchemy import text
+
+from config.db import db
+from config.logging import get_logger
+
+log = get_logger()
+
+TRANSPORT_ANALYSIS_CACHE_SECONDS = int(os.getenv('TRANSPORT_ANALYSIS_CACHE_SECONDS', '300'))
+ALL_PROJECTS_CACHE_KEY = 'transport_analysis:all_projects'
+
+TRANSPORT_SOURCES = (
+    'vendor_to_store',
+    'store_to_site',
+    'site_to_store',
+    'asset_delivery',
+    'asset_return',
+    'labour_transport',
+)
+
+ACTUAL_TRANSPORT_SQL = """
+    WITH transport AS (
+        SELECT project_id, 'vendor_to_store' AS source, transport_fee AS fee
+        FROM (
+            SELECT DISTINCT ON (project_id, delivery_batch_ref) project_id, transport_fee
+            FROM inventory_transactions
+            WHERE transaction_type = 'PURCHASE'
+              AND delivery_batch_ref LIKE 'MSQ-IN-%'
+              AND transport_fee > 0
+              {project_filter}
+            ORDER BY project_id, delivery_batch_ref, created_at DESC
+        ) purchase_batches
+
+        UNION ALL
+        SELECT project_id, 'store_to_site', transport_fee
+        FROM material_delivery_notes
+        WHERE status NOT IN ('DRAFT', 'CANCELLED') AND transport_fee IS NOT NULL {project_filter}
+
+        UNION ALL
+        SELECT project_id, 'site_to_store', transport_fee
+        FROM return_delivery_notes
+        WHERE status NOT IN ('DRAFT', 'CANCELLED') AND transport_fee IS NOT NULL {project_filter}
+
+        UNION ALL
+        SELECT project_id, 'asset_delivery', transport_fee
+        FROM asset_delivery_notes
+        WHERE status NOT IN ('DRAFT', 'CANCELLED') AND transport_fee IS NOT NULL {project_filter}
+
+        UNION ALL
+        SELECT project_id, 'asset_return', transport_fee
+        FROM asset_return_delivery_notes
+        WHERE status NOT IN ('DRAFT', 'CANCELLED') AND transport_fee IS NOT NULL {project_filter}
+
+        UNION ALL
+        SELECT project_id, 'labour_transport', transport_fee
+        FROM labour_requisitions
+        WHERE is_deleted = FALSE AND transport_fee IS NOT NULL {project_filter}
+    )
+    SELECT
+        project_id,
+        COALESCE(SUM(fee) FILTER (WHERE source = 'vendor_to_store'), 0) AS vendor_to_store,
+        COALESCE(SUM(fee) FILTER (WHERE source = 'store_to_site'), 0) AS store_to_site,
+        COALESCE(SUM(fee) FILTER (WHERE source = 'site_to_store'), 0) AS site_to_store,
+        COALESCE(SUM(fee) FILTER (WHERE source = 'asset_delivery'), 0) AS asset_delivery,
+        COALESCE(SUM(fee) FILTER (WHERE source = 'asset_return'), 0) AS asset_return,
+        COALESCE(SUM(fee) FILTER (WHERE source = 'labour_transport'), 0) AS labour_transport
+    FROM transport
+    WHERE project_id IS NOT NULL
+    GROUP BY project_id
+"""
+
+BOQ_DETAILS_SQL = """
+    SELECT b.project_id, d.boq_details
+    FROM boq b
+    JOIN boq_details d ON d.boq_id = b.boq_id AND d.is_deleted = FALSE
+    JOIN project p ON p.project_id = b.project_id AND p.is_deleted = FALSE
+    WHERE b.is_deleted = FALSE {project_filter}
+"""
+
+
+def _project_filter(project_ids, column='project_id'):
+    return f"AND {column} = ANY(:project_ids)" if project_ids is not None else ""
+
+
+def get_actual_transport_by_project(project_ids=None):
+    """
+    Actual transport per project and source in one query.
+
+    Args:
+        project_ids: Optional list of project IDs (default: all projects)
+
+    Returns:
+        dict: {project_id: {source: Decimal}}
+    """
+    query = text(ACTUAL_TRANSPORT_SQL.format(project_filter=_project_filter(project_ids)))
+    params = {'project_ids': list(project_ids)} if project_ids is not None else {}
+    return {
+        row.project_id: {source: Decimal(str(getattr(row, source) or 0)) for source in TRANSPORT_SOURCES}
+        for row in db.session.execute(query, params)
+    }
+
+
+def planned_sub_item_transport(sub_item):
+    """
+    Planned transport for one BOQ sub-item:
+    1. stored transport_amount if present
+    2. otherwise base total × transport_percentage / 100, where the base total is
+       qty × rate → base_total / per_unit_cost / client_rate → materials + labour cost
+    """
+    stored_transport = sub_item.get('transport_amount', 0) or 0
+    if stored_transport:
+        return Decimal(str(stored_transport))
+
+    transport_pct = Decimal(str(sub_item.get('transport_percentage', 5) or 5))
+    qty = Decimal(str(sub_item.get('quantity', 0) or 0))
+    rate = Decimal(str(sub_item.get('rate', 0) or 0))
+    if qty > 0 and rate > 0:
+        base_total = qty * rate
+    else:
+        base_total = Decimal(str(
+            sub_item.get('base_total') or
+            sub_item.get('per_unit_cost') or
+            sub_item.get('client_rate') or
+            0
+        ))
+        if base_total == 0:
+            # Fall back to internal cost: sum of materials + labour
+            mat_cost = sum(
+                Decimal(str(m.get('total', 0) or
+                           float(m.get('quantity', 0)) * float(m.get('unit_price', 0))))
+                for m in sub_item.get('materials', [])
+            )
+            lab_cost = sum(
+                Decimal(str(l.get('total_cost', 0) or
+                           float(l.get('hours', 0)) * float(l.get('rate_per_hour', 0))))
+                for l in sub_item.get('labour', [])
+            )
+            base_total = mat_cost + lab_cost
+    return base_total * (transport_pct / 100)
+
+
+def get_estimated_transport_by_project(project_ids=None):
+    """
+    BOQ estimated transport per project (all active BOQs of the project).
+
+    Returns:
+        dict: {project_id: Decimal}
+    """
+    query = text(BOQ_DETAILS_SQL.format(project_filter=_project_filter(project_ids, 'b.project_id')))
+    params = {'project_ids': list(project_ids)} if project_ids is not None else {}
+    estimated = defaultdict(Decimal)
+    for row in db.session.execute(query, params):
+        boq_data = row.boq_details if isinstance(row.boq_details, dict) else {}
+        for item in boq_data.get('items', []) or []:
+            for sub_item in item.get('sub_items', []) or []:
+                estimated[row.project_id] += planned_sub_item_transport(sub_item)
+    return estimated
+
+
+def _build_comparisons(project_ids=None):
+    actual = get_actual_transport_by_project(project_ids)
+    estimated = get_estimated_transport_by_project(project_ids)
+
+    ids = set(actual) | set(estimated)
+    if not ids:
+        return []
+    names = dict(db.session.execute(
+        text("SELECT project_id, project_name FROM project WHERE project_id = ANY(:ids) AND is_deleted = FALSE"),
+        {'ids': list(ids)}
+    ).all())
+
+    comparisons = []
+    for project_id in sorted(names):
+        breakdown = actual.get(project_id, {})
+        estimated_transport = estimated.get(project_id, Decimal('0'))
+        actual_transport = sum(breakdown.values(), Decimal('0'))
+        variance = estimated_transport - actual_transport
+        if variance > 0:
+            profit_status = 'PROFIT'
+        elif variance < 0:
+            profit_status = 'LOSS'
+        else:
+            profit_status = 'BREAK-EVEN'
+
+        comparisons.append({
+            'project_id': project_id,
+            'project_name': names[project_id],
+            'boq_estimated_transport': round(float(estimated_transport), 2),
+            'actual_transport_spent': round(float(actual_transport), 2),
+            'transport_variance': round(float(variance), 2),
+            'variance_percentage': round(float(variance / estimated_transport * 100), 2) if estimated_transport > 0 else 0,
+            'profit_status': profit_status,
+            'breakdown': {
+                source: round(float(breakdown.get(source, 0)), 2) for source in TRANSPORT_SOURCES
+            },
+        })
+    return comparisons
+
+
+def get_project_transport_comparison(project_id):
+    """
+    Transport comparison for one project.
+
+    Returns:
+        dict: Comparison, or {'error': ...} if the project does not exist
+    """
+    comparisons = _build_comparisons([project_id])
+    if comparisons:
+        return comparisons[0]
+
+    project_name = db.session.execute(
+        text("SELECT project_name FROM project WHERE project_id = :project_id AND is_deleted = FALSE"),
+        {'project_id': project_id}
+    ).scalar()
+    if project_name is None:
+        return {'error': 'Project not found'}
+    return {
+        'project_id': project_id,
+        'project_name': project_name,
+        'boq_estimated_transport': 0.0,
+        'actual_transport_spent': 0.0,
+        'transport_variance': 0.0,
+        'variance_percentage': 0,
+        'profit_status': 'BREAK-EVEN',
+        'breakdown': {source: 0.0 for source in TRANSPORT_SOURCES},
+    }
+
+
+def get_all_projects_transport_comparison(use_cache=True):
+    """
+    Transport comparison for every project with a BOQ or transport spend.
+    Served from cache for TRANSPORT_ANALYSIS_CACHE_SECONDS unless use_cache is False.
+
+    Returns:
+        list: Comparisons ordered by project_id
+    """
+    cache = getattr(current_app, 'cache', None)
+    if cache is not None and use_cache:
+        try:
+            cached = cache.get(ALL_PROJECTS_CACHE_KEY)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            log.warning(f"[TransportAnalysis] Cache read failed: {e}")
+
+    comparisons = _build_comparisons()
+
+    if cache is not None:
+        try:
+            cache.set(ALL_PROJECTS_CACHE_KEY, comparisons, timeout=TRANSPORT_ANALYSIS_CACHE_SECONDS)
+        except Exception as e:
+            log.warning(f"[TransportAnalysis] Cache write failed: {e}")
+    return comparisons
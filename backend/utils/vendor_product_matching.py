@@ -0,0 +1,84 @@
+"""
+Set-based vendor product matching for alternative vendor suggestions.
+
+A vendor product matches a requested material when the material name is a
+substring of the product name, both normalised the same way (lowercased,
+whitespace collapsed and trimmed). Product names are normalised once, in the
+generated column vendor_products.normalized_name, which carries a pg_trgm GIN
+index, so every requested material is an index lookup instead of a scan
+per OR'ed `lower(product_name) LIKE` condition.
+
+One query matches all requested materials, counts the distinct materials
+each vendor covers and ranks vendors by that count, then by the average
+trigram similarity of their best product per material.
+
+Usage:
+    from utils.vendor_product_matching import match_vendor_products
+
+    ranked = match_vendor_products(["Cement 50kg", "Steel Rod 12mm"], exclude_vendor_id=5)
+    # [VendorMatch(vendor_id, matched_materials, match_score, product_ids), ...]
+"""
+
+from collections import namedtuple
+from sqlalchemy import text
+from config.db import db
+
+VendorMatch = namedtuple('VendorMatch', ['vendor_id', 'matched_materials', 'match_score', 'product_ids'])
+
+MATCH_SQL = text(r"""
+    WITH requested AS (
+        SELECT DISTINCT term
+        FROM unnest(CAST(:names AS text[])) AS r(name)
+        CROSS JOIN LATERAL (SELECT lower(btrim(regexp_replace(r.name, '\s+', ' ', 'g'))) AS term) t
+        WHERE t.term <> ''
+    ),
+    matches AS (
+        SELECT p.vendor_id, p.product_id, rq.term, similarity(p.normalized_name, rq.term) AS score
+        FROM requested rq
+        JOIN vendor_products p
+          ON p.normalized_name LIKE '%' || replace(replace(replace(rq.term, '\', '\\'), '%', '\%'), '_', '\_') || '%' ESCAPE '\'
+        JOIN vendors v ON v.vendor_id = p.vendor_id
+        WHERE p.is_deleted = false
+          AND v.is_deleted = false
+          AND v.status = 'active'
+          AND (CAST(:exclude_vendor_id AS integer) IS NULL OR v.vendor_id <> CAST(:exclude_vendor_id AS integer))
+    ),
+    vendor_rank AS (
+        SELECT vendor_id, count(*) AS matched_materials, avg(best) AS match_score
+        FROM (
+            SELECT vendor_id, term, max(score) AS best
+            FROM matches
+            GROUP BY vendor_id, term
+        ) per_material
+        GROUP BY vendor_id
+    )
+    SELECT r.vendor_id, r.matched_materials, r.match_score,
+           array_agg(m.product_id ORDER BY m.best_score DESC, m.product_id) AS product_ids
+    FROM vendor_rank r
+    JOIN (
+        SELECT vendor_id, product_id, max(score) AS best_score
+        FROM matches
+        GROUP BY vendor_id, product_id
+    ) m ON m.vendor_id = r.vendor_id
+    GROUP BY r.vendor_id, r.matched_materials, r.match_score
+    ORDER BY r.matched_materials DESC, r.match_score DESC, r.vendor_id
+""")
+
+
+def match_vendor_products(material_names, exclude_vendor_id=None):
+    """
+    Vendors (active, not deleted) with products matching any of the material
+    names, best coverage first. Returns a list of VendorMatch; product_ids are
+    ordered by similarity to the material they matched.
+    """
+    names = [name for name in (material_names or []) if isinstance(name, str) and name.strip()]
+    if not names:
+        return []
+    rows = db.session.execute(MATCH_SQL, {
+        'names': names,
+        'exclude_vendor_id': int(exclude_vendor_id) if exclude_vendor_id else None,
+    }).all()
+    return [
+        VendorMatch(row.vendor_id, row.matched_materials, round(float(row.match_score or 0), 4), list(row.product_ids))
+        for row in rows
+    ]
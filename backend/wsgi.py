@@ -0,0 +1,12 @@
+"""
+WSGI entry point for production servers.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Socket.IO is mounted on the app's WSGI pipeline by init_socketio(), so the
+same callable serves HTTP and /socket.io.
+"""
+
+from app import create_app
+
+app = create_app()
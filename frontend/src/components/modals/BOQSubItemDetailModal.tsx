@@ -62,7 +62,7 @@ interface SubItemData {
   transport_percentage?: number;
   transport_amount?: number;
   // Nested data
-  sub_item_image?: Array<{ url: string; original_name?: string; filename?: string }>;
+  sub_item_image?: Array<{ url: string; thumbnail_url?: string; original_name?: string; filename?: string }>;
   materials?: MaterialData[];
   labour?: LabourData[];
 }
@@ -330,7 +330,7 @@ const BOQSubItemDetailModal: React.FC<BOQSubItemDetailModalProps> = ({
                             onClick={() => window.open(image.url, '_blank')}
                           >
                             <img
-                              src={image.url}
+                              src={image.thumbnail_url || image.url}
                               alt={`${matchedSubItem.sub_item_name} - ${image.original_name || image.filename || `Image ${imgIndex + 1}`}`}
                               className="w-full h-full object-cover rounded-lg border-2 border-gray-200 hover:border-purple-500 transition-all"
                             />
@@ -780,7 +780,7 @@ const BOQDetailsModal: React.FC<BOQDetailsModalProps> = ({
                                                         onClick={() => window.open(image.url, '_blank')}
                                                       >
                                                         <img
-                                                          src={image.url}
+                                                          src={image.thumbnail_url || image.url}
                                                           alt={`${subItem.sub_item_name} - ${image.original_name || image.filename}`}
                                                           className="w-full h-20 object-cover rounded-lg border border-gray-200 hover:border-green-500 transition-all"
                                                         />
@@ -4056,7 +4056,7 @@ const ProjectApprovals: React.FC = () => {
                                               onClick={() => window.open(image.url, '_blank')}
                                             >
                                               <img
-                                                src={image.url}
+                                                src={image.thumbnail_url || image.url}
                                                 alt={`${subItem.sub_item_name} - ${image.original_name || image.filename}`}
                                                 className="w-full h-20 object-cover rounded-lg border border-gray-200 hover:border-orange-500 transition-all"
                                               />
@@ -4540,7 +4540,7 @@ const ProjectApprovals: React.FC = () => {
                                               onClick={() => window.open(image.url, '_blank')}
                                             >
                                               <img
-                                                src={image.url}
+                                                src={image.thumbnail_url || image.url}
                                                 alt={`${subItem.sub_item_name} - ${image.original_name || image.filename}`}
                                                 className="w-full h-20 object-cover rounded-lg border border-gray-200 hover:border-blue-500 transition-all"
                                               />
@@ -5520,7 +5520,7 @@ const ProjectApprovals: React.FC = () => {
                                               onClick={() => window.open(image.url, '_blank')}
                                             >
                                               <img
-                                                src={image.url}
+                                                src={image.thumbnail_url || image.url}
                                                 alt={`${subItem.sub_item_name} - ${image.original_name || image.filename}`}
                                                 className="w-full h-20 object-cover rounded-lg border border-gray-200 hover:border-orange-500 transition-all"
                                               />
@@ -6185,7 +6185,7 @@ const ProjectApprovals: React.FC = () => {
                                               onClick={() => window.open(image.url, '_blank')}
                                             >
                                               <img
-                                                src={image.url}
+                                                src={image.thumbnail_url || image.url}
                                                 alt={`${subItem.sub_item_name} - ${image.original_name || image.filename}`}
                                                 className="w-full h-20 object-cover rounded-lg border border-gray-200 hover:border-blue-500 transition-all"
                                               />